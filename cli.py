@@ -21,6 +21,8 @@ except ImportError:
     spec.loader.exec_module(task_execution_engine)
     TaskExecutionEngine = task_execution_engine.TaskExecutionEngine
 
+from spec_index import SpecIndex
+
 @click.group()
 @click.version_option(version='1.0.0')
 def cli():
@@ -123,11 +125,10 @@ def execute(dry_run, max_agents, output, simulate, branch, no_merge, no_revert):
     engine.auto_merge = not no_merge
     engine.auto_revert_on_failure = not no_revert
     
-    # Limit agents if specified
-    if max_agents < len(engine.agents):
-        agent_ids = list(engine.agents.keys())[:max_agents]
-        engine.agents = {aid: engine.agents[aid] for aid in agent_ids}
-        click.echo(f"🔧 Limited to {max_agents} agents")
+    # Size the agent pool to the requested concurrency
+    if max_agents != len(engine.agents):
+        engine.resize_agent_pool(max_agents)
+        click.echo(f"🔧 Running with {len(engine.agents)} agents")
     
     if dry_run:
         # Show what would be executed
@@ -152,15 +153,22 @@ def execute(dry_run, max_agents, output, simulate, branch, no_merge, no_revert):
     # Execute tasks
     if simulate:
         # Simulate task completion for demonstration
-        summary = simulate_task_execution(engine)
+        summary = simulate_task_execution(engine, max_agents)
     else:
-        summary = engine.recursive_task_execution()
+        summary = engine.recursive_task_execution(max_agents=max_agents)
+        if 'error' in summary:
+            click.echo(f"❌ {summary['error']}", err=True)
+            if engine.task_runner is None:
+                click.echo("💡 Use --simulate to complete tasks automatically", err=True)
+            sys.exit(1)
     
     # Display results
     click.echo(f"\n📈 EXECUTION RESULTS")
     click.echo("-" * 30)
     click.echo(f"Total Duration: {summary['total_duration_seconds']:.2f} seconds")
     click.echo(f"Iterations: {summary['iterations']}")
+    click.echo(f"Peak Concurrency: {summary['peak_concurrency']}/{summary['max_agents']} agents")
+    click.echo(f"Agent Utilization: {summary['agent_utilization'] * 100:.1f}%")
     click.echo(f"Completion Rate: {summary['completion_rate']:.1f}%")
     click.echo(f"Tasks Assigned: {len([log for log in summary['execution_log'] if log['action'] == 'task_assigned'])}")
     
@@ -311,7 +319,8 @@ def rm_compliance():
 @click.option('--format', 'output_format', default='json', type=click.Choice(['json', 'yaml', 'text']), 
               help='Output format')
 @click.option('--spec', help='Audit specific spec (otherwise audits all specs)')
-def requirements_audit(output, output_format, spec):
+@click.option('--workers', type=int, help='Processes used to parse changed spec files (default: CPU count)')
+def requirements_audit(output, output_format, spec, workers):
     """🔍 Perform requirements consistency audit across specs"""
     click.echo("🔍 REQUIREMENTS CONSISTENCY AUDIT")
     click.echo("=" * 50)
@@ -347,17 +356,25 @@ def requirements_audit(output, output_format, spec):
     all_requirements = {}  # requirement_id -> [spec_name, ...]
     requirement_definitions = {}  # requirement_id -> definition
     
-    for spec_dir in spec_dirs:
-        click.echo(f"\n🔍 Auditing spec: {spec_dir.name}")
+    # Parse changed spec files into the persistent index
+    with SpecIndex(specs_dir, workers=workers) as index:
+        stats = index.refresh()
+        click.echo(f"🗂️  Spec index: {stats.parsed} files parsed, {stats.unchanged} unchanged ({stats.seconds:.2f}s)")
         
-        spec_audit = audit_spec_requirements(spec_dir)
-        audit_results["specs_audited"].append(spec_audit)
+        for spec_dir in spec_dirs:
+            click.echo(f"\n🔍 Auditing spec: {spec_dir.name}")
+            
+            spec_audit = audit_spec_requirements(spec_dir, index)
+            audit_results["specs_audited"].append(spec_audit)
+            
+            # Collect requirements for cross-spec consistency check
+            for req_id in spec_audit.get("requirements_found", []):
+                if req_id not in all_requirements:
+                    all_requirements[req_id] = []
+                all_requirements[req_id].append(spec_dir.name)
         
-        # Collect requirements for cross-spec consistency check
-        for req_id in spec_audit.get("requirements_found", []):
-            if req_id not in all_requirements:
-                all_requirements[req_id] = []
-            all_requirements[req_id].append(spec_dir.name)
+        # Find missing requirements (tasks reference requirements that don't exist)
+        missing_reqs = find_missing_requirements(spec_dirs, index)
     
     # Check for requirement busts and inconsistencies
     click.echo(f"\n🔍 Analyzing cross-spec consistency...")
@@ -382,9 +399,6 @@ def requirements_audit(output, output_format, spec):
                     "definitions": definitions
                 })
     
-    # Find missing requirements (tasks reference requirements that don't exist)
-    missing_reqs = find_missing_requirements(spec_dirs)
-    
     # Compile results
     audit_results["requirement_busts"] = missing_reqs
     audit_results["consistency_issues"] = duplicate_reqs
@@ -407,97 +421,87 @@ def requirements_audit(output, output_format, spec):
     
     click.echo(f"\n💾 Audit results saved to: {output_file}")
 
-def audit_spec_requirements(spec_dir):
-    """Audit requirements in a single spec directory"""
-    import re
-    
-    spec_audit = {
-        "spec_name": spec_dir.name,
-        "files_found": [],
-        "requirements_found": [],
-        "requirement_details": {},
-        "issues": []
-    }
-    
-    # Look for common spec files
-    spec_files = []
-    for pattern in ['*.md', 'tasks.md', 'design.md', 'requirements.md']:
-        spec_files.extend(spec_dir.glob(pattern))
-    
-    spec_audit["files_found"] = [f.name for f in spec_files]
+@cli.command()
+@click.option('--min-shared', default=5, help='Minimum number of shared terms for a pair to be reported')
+@click.option('--top', default=20, help='Number of pairs to show')
+@click.option('--output', '-o', help='Output file for all overlapping pairs (JSON)')
+@click.option('--workers', type=int, help='Processes used to parse changed spec files (default: CPU count)')
+def spec_overlap(min_shared, top, output, workers):
+    """🔀 Find specs that overlap, from the spec index"""
+    specs_dir = Path('.kiro/specs')
+    if not specs_dir.exists():
+        click.echo("❌ No .kiro/specs directory found")
+        return
     
-    # Parse requirements from files
-    requirement_pattern = re.compile(r'(?:_Requirements:|Requirements:)\s*([^_\n]+)', re.IGNORECASE)
-    requirement_ref_pattern = re.compile(r'\b([A-Z]+[-.]?\d+(?:\.\d+)*)\b')
+    with SpecIndex(specs_dir, workers=workers) as index:
+        stats = index.refresh()
+        pairs = index.overlap(min_shared=min_shared)
+        
+        click.echo(f"🔀 SPEC OVERLAP ({len(pairs)} pairs across {stats.specs} specs)")
+        click.echo("=" * 50)
+        for pair in pairs[:top]:
+            spec1, spec2 = pair['specs']
+            shared = index.shared_terms(spec1, spec2)
+            click.echo(f"  {pair['similarity']:.3f}  {spec1} + {spec2} ({pair['shared_terms']} shared terms)")
+            click.echo(f"         {', '.join(shared[:8])}{' ...' if len(shared) > 8 else ''}")
     
-    for file_path in spec_files:
-        try:
-            content = file_path.read_text()
-            
-            # Find requirement definitions
-            for match in requirement_pattern.finditer(content):
-                req_text = match.group(1).strip()
-                # Extract individual requirement IDs
-                req_ids = requirement_ref_pattern.findall(req_text)
-                for req_id in req_ids:
-                    if req_id not in spec_audit["requirements_found"]:
-                        spec_audit["requirements_found"].append(req_id)
-                        spec_audit["requirement_details"][req_id] = req_text
-            
-            # Find requirement references in task descriptions
-            task_pattern = re.compile(r'- \[.\] .+?_Requirements: ([^_\n]+)', re.MULTILINE | re.DOTALL)
-            for match in task_pattern.finditer(content):
-                req_text = match.group(1).strip()
-                req_ids = requirement_ref_pattern.findall(req_text)
-                for req_id in req_ids:
-                    if req_id not in spec_audit["requirements_found"]:
-                        spec_audit["requirements_found"].append(req_id)
-                        spec_audit["requirement_details"][req_id] = f"Referenced in task: {req_text}"
-                        
-        except Exception as e:
-            spec_audit["issues"].append(f"Error reading {file_path.name}: {str(e)}")
-    
-    return spec_audit
+    if output:
+        with open(output, 'w') as f:
+            json.dump({"timestamp": datetime.now().isoformat(), "min_shared": min_shared, "pairs": pairs}, f, indent=2)
+        click.echo(f"\n💾 Overlap saved to: {output}")
 
-def find_missing_requirements(spec_dirs):
-    """Find requirements that are referenced but not defined"""
-    import re
+@cli.command()
+@click.argument('spec')
+def spec_deps(spec):
+    """🧭 Show a spec's task dependency tiers and cycles, from the spec index"""
+    specs_dir = Path('.kiro/specs')
+    if not specs_dir.exists():
+        click.echo("❌ No .kiro/specs directory found")
+        return
     
-    missing_reqs = []
-    all_defined_reqs = set()
-    all_referenced_reqs = set()
+    with SpecIndex(specs_dir) as index:
+        index.refresh()
+        dag = index.task_dag(spec)
     
-    requirement_ref_pattern = re.compile(r'\b([A-Z]+[-.]?\d+(?:\.\d+)*)\b')
+    if dag is None:
+        click.echo(f"❌ No tasks.md found for spec '{spec}'")
+        return
     
-    for spec_dir in spec_dirs:
-        spec_files = list(spec_dir.glob('*.md'))
-        
-        for file_path in spec_files:
-            try:
-                content = file_path.read_text()
-                
-                # Find all requirement references
-                refs = requirement_ref_pattern.findall(content)
-                all_referenced_reqs.update(refs)
-                
-                # Check if this file defines requirements (has Requirements: sections)
-                if 'Requirements:' in content or '_Requirements:' in content:
-                    all_defined_reqs.update(refs)
-                    
-            except Exception:
-                continue
-    
-    # Find requirements that are referenced but not defined
-    for req_id in all_referenced_reqs:
-        if req_id not in all_defined_reqs:
-            # Check if it looks like a real requirement ID (not just a random match)
-            if re.match(r'^[A-Z]{1,3}[-.]?\d+(?:\.\d+)*$', req_id):
-                missing_reqs.append({
-                    "requirement_id": req_id,
-                    "status": "referenced_but_not_defined"
-                })
+    tiers = dag.analysis.by_tier()
+    click.echo(f"🧭 TASK DEPENDENCIES: {spec}")
+    click.echo("=" * 40)
+    for tier_num in sorted(tiers):
+        click.echo(f"\n📋 TIER {tier_num} - {len(tiers[tier_num])} tasks")
+        for task_id in tiers[tier_num]:
+            deps = dag.dependencies[task_id]
+            deps_str = f" (depends on: {', '.join(deps)})" if deps else ""
+            click.echo(f"  • {task_id}: {dag.tasks[task_id]['name']}{deps_str}")
+    
+    click.echo(f"\nCritical Path Length: {dag.analysis.critical_path_length}")
+    click.echo(f"Max Parallelism: {dag.analysis.max_parallelism}")
+    for cycle in dag.analysis.cycles:
+        click.echo(f"⚠️  Cycle: {' → '.join(cycle + cycle[:1])}")
+
+def audit_spec_requirements(spec_dir, index=None):
+    """Audit requirements in a single spec directory"""
+    if index is not None:
+        return index.audit_spec(spec_dir.name)
     
-    return missing_reqs
+    with SpecIndex(spec_dir.parent) as index:
+        index.refresh()
+        return index.audit_spec(spec_dir.name)
+
+def find_missing_requirements(spec_dirs, index=None):
+    """Find requirements that are referenced but not defined"""
+    spec_dirs = list(spec_dirs)
+    if index is not None:
+        return index.missing_requirements(d.name for d in spec_dirs)
+    if not spec_dirs:
+        return []
+    
+    with SpecIndex(spec_dirs[0].parent) as index:
+        index.refresh()
+        return index.missing_requirements(d.name for d in spec_dirs)
 
 def calculate_consistency_score(audit_results):
     """Calculate overall consistency score"""
@@ -594,56 +598,22 @@ def save_audit_results(audit_results, output_file, output_format):
                     f.write(f"  - {issue['requirement_id']} appears in: {', '.join(issue['specs'])}\n")
                 f.write("\n")
 
-def simulate_task_execution(engine):
+def simulate_task_execution(engine, max_agents=None):
     """Simulate task execution for demonstration purposes"""
     import time
     import random
     
     click.echo("🎭 SIMULATION MODE - Tasks will complete automatically")
     
-    start_time = datetime.now()
-    iteration = 0
-    
-    while True:
-        iteration += 1
-        
-        # Get ready tasks and assign them
-        ready_tasks = engine.get_ready_tasks()
-        available_agents = engine.get_available_agents()
-        
-        if not ready_tasks:
-            remaining_tasks = [t for t in engine.tasks.values() 
-                             if t.status.value in ['not_started', 'in_progress']]
-            if not remaining_tasks:
-                break
-            
-            # Complete some in-progress tasks randomly
-            in_progress = [t for t in engine.tasks.values() if t.status.value == 'in_progress']
-            if in_progress:
-                # Randomly complete 1-3 tasks
-                to_complete = random.sample(in_progress, min(3, len(in_progress)))
-                for task in to_complete:
-                    engine.complete_task(task.id, success=True)
-                    click.echo(f"✅ Completed: {task.id} ({task.name})")
-            continue
-        
-        # Assign tasks to agents
-        assignments = 0
-        for task in ready_tasks:
-            if not available_agents:
-                break
-            
-            agent = available_agents.pop(0)
-            if engine.assign_task_to_agent(task, agent):
-                assignments += 1
-                click.echo(f"🔄 Assigned: {task.id} ({task.name}) → {agent.name}")
-        
-        if assignments == 0:
-            break
-        
-        # Small delay for visualization
-        time.sleep(0.1)
+    def simulated_runner(task, agent):
+        click.echo(f"🔄 Assigned: {task.id} ({task.name}) → {agent.name}")
+        # Scale the estimate down to a fraction of a second
+        time.sleep(task.estimated_duration_hours * random.uniform(0.01, 0.03))
+        click.echo(f"✅ Completed: {task.id} ({task.name})")
+        return True
     
+    start_time = datetime.now()
+    run_stats = engine.run_task_dag(max_agents=max_agents, task_runner=simulated_runner)
     end_time = datetime.now()
     total_duration = (end_time - start_time).total_seconds()
     
@@ -651,7 +621,10 @@ def simulate_task_execution(engine):
         "execution_start": start_time.isoformat(),
         "execution_end": end_time.isoformat(),
         "total_duration_seconds": total_duration,
-        "iterations": iteration,
+        "iterations": run_stats["dispatch_rounds"],
+        "max_agents": run_stats["max_agents"],
+        "peak_concurrency": run_stats["peak_concurrency"],
+        "agent_utilization": run_stats["agent_utilization"],
         "total_tasks": len(engine.tasks),
         "completed_tasks": len(engine.completed_tasks),
         "failed_tasks": len(engine.failed_tasks),
@@ -6,10 +6,11 @@ with comprehensive command structure, progress indicators, and error handling.
 """
 
 import click
+import functools
 import logging
 import sys
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
 import asyncio
@@ -18,6 +19,9 @@ from ..config.configuration_manager import ConfigurationManager
 from ..models.app_config import AppConfig, ClusterConfig, create_sample_config
 from ..deployment.cluster_manager import ClusterManager
 from ..deployment.application_deployer import ApplicationDeployer, DeploymentStrategy
+from ..deployment.batch_orchestrator import (
+    BatchDeploymentOrchestrator, BatchItemState, build_dependency_graph, dependency_levels
+)
 from ..core.validation_engine import ValidationEngine
 
 
@@ -70,6 +74,7 @@ class CLIContext:
         self.config_manager = ConfigurationManager()
         self.cluster_manager = None
         self.app_deployer = None
+        # Image lookups use an HTTPRegistryClient opened per command with `async with`
         self.validation_engine = ValidationEngine()
         self.verbose = False
         self.dry_run = False
@@ -104,6 +109,7 @@ cli_context = CLIContext()
 
 def handle_errors(func):
     """Decorator for handling CLI errors gracefully"""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -174,20 +180,30 @@ def cli(ctx, verbose, dry_run, output, config):
 @click.option('--cluster', type=str, help='Target cluster name')
 @click.option('--region', type=str, default='us-central1', help='GCP region')
 @click.option('--wait', is_flag=True, help='Wait for deployment to complete')
+@click.option('--batch', '-b', type=click.Path(exists=True), multiple=True,
+              help='Deploy several applications (config files or directories); repeatable')
+@click.option('--max-concurrency', type=int, default=5, help='Maximum simultaneous deployments in batch mode')
 @click.pass_context
 @handle_errors
-def deploy(ctx, config, cluster, region, wait):
+def deploy(ctx, config, cluster, region, wait, batch, max_concurrency):
     """
     Deploy application to GKE Autopilot cluster.
     
     This command deploys your containerized application to a GKE Autopilot cluster
     with automatic scaling, monitoring, and HTTPS ingress configuration.
+    
+    With --batch, every application is deployed in dependency order, running
+    independent applications concurrently.
     """
     click.echo("🚀 Starting GKE Autopilot deployment...")
     
     if cli_context.dry_run:
         click.echo("DRY RUN MODE - No actual deployment will occur")
     
+    if batch:
+        deploy_batch(batch, cluster, region, wait, max_concurrency)
+        return
+    
     # Load configuration
     if config:
         config_data = cli_context.config_manager.load_configuration(config)
@@ -235,6 +251,70 @@ def deploy(ctx, config, cluster, region, wait):
         click.echo("\n✅ Dry run complete - configuration is valid")
 
 
+def deploy_batch(paths, cluster: Optional[str], region: str, wait: bool, max_concurrency: int) -> None:
+    """Validate and deploy a batch of application configurations"""
+    app_configs = []
+    for config_file in collect_config_files(paths):
+        config_data = cli_context.config_manager.load_configuration(str(config_file))
+        app_config = cli_context.config_manager.create_app_config(config_data)
+        
+        validation_result = cli_context.config_manager.validate_gke_autopilot_config(app_config.to_dict())
+        if not validation_result['valid']:
+            click.echo(f"❌ Configuration validation failed for {config_file}:")
+            for error in validation_result['errors']:
+                click.echo(f"  • {error}")
+            return
+        
+        for warning in validation_result['warnings']:
+            click.echo(f"⚠️  {app_config.name}: {warning}")
+        
+        app_configs.append(app_config)
+    
+    if not app_configs:
+        click.echo("❌ No application configurations found")
+        return
+    
+    try:
+        levels = dependency_levels(build_dependency_graph(app_configs))
+    except ValueError as e:
+        click.echo(f"❌ {e}")
+        return
+    
+    # Show deployment plan
+    cluster_name = cluster or f"{app_configs[0].name}-cluster"
+    click.echo(f"\n📋 Batch Deployment Plan:")
+    click.echo(f"  Applications: {len(app_configs)}")
+    click.echo(f"  Cluster: {cluster_name}")
+    click.echo(f"  Region: {region}")
+    click.echo(f"  Max concurrency: {max_concurrency}")
+    for index, level in enumerate(levels, 1):
+        click.echo(f"  Wave {index}: {', '.join(sorted(level))}")
+    
+    if not cli_context.dry_run:
+        if not click.confirm("\nProceed with deployment?"):
+            click.echo("Deployment cancelled")
+            return
+        
+        result = asyncio.run(execute_batch_deployment(app_configs, cluster_name, region, wait, max_concurrency))
+        output_result(result)
+    else:
+        click.echo("\n✅ Dry run complete - configurations are valid")
+
+
+def collect_config_files(paths) -> List[Path]:
+    """Expand files and directories into a sorted, de-duplicated list of config files"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(
+                candidate for candidate in sorted(path.iterdir())
+                if candidate.is_file() and candidate.suffix in ('.yaml', '.yml', '.json')
+            )
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files))
+
+
 @cli.command()
 @click.option('--app', '-a', type=str, help='Application name')
 @click.option('--cluster', '-c', type=str, help='Cluster name')
@@ -255,14 +335,7 @@ def status(ctx, app, cluster, watch):
     if watch:
         click.echo("👀 Watching deployment status (Press Ctrl+C to stop)...")
         try:
-            while True:
-                result = get_deployment_status(app, cluster)
-                click.clear()
-                click.echo(f"🔄 Status at {datetime.now().strftime('%H:%M:%S')}")
-                output_result(result)
-                click.echo("\nPress Ctrl+C to stop watching...")
-                import time
-                time.sleep(5)
+            asyncio.run(watch_deployment_status(app, cluster))
         except KeyboardInterrupt:
             click.echo("\n👋 Stopped watching")
     else:
@@ -469,8 +542,8 @@ def validate(ctx, config):
         config_data = cli_context.config_manager.load_configuration(config)
         app_config = cli_context.config_manager.create_app_config(config_data)
         
-        # Comprehensive validation using validation engine
-        validation_result = asyncio.run(cli_context.validation_engine.validate_app_config(app_config))
+        # Comprehensive validation using validation engine, including the registry image lookup
+        validation_result = asyncio.run(validate_app_config(app_config))
         
         # Convert to old format for compatibility
         validation_dict = {
@@ -556,23 +629,12 @@ async def execute_deployment(app_config: AppConfig, cluster: str, region: str, w
         progress.update(1, "Checking cluster...")
         
         cluster_name = cluster or f"{app_config.name}-cluster"
-        
-        try:
-            cluster_info = await cli_context.cluster_manager.get_cluster_info(cluster_name, region)
-            click.echo(f"Using existing cluster: {cluster_name}")
-        except:
-            # Cluster doesn't exist, create it
-            progress.update(2, "Creating cluster...")
-            click.echo(f"Creating new cluster: {cluster_name}")
-            
-            from ..models.app_config import ClusterConfig
-            cluster_config = ClusterConfig(name=cluster_name, region=region)
-            cluster_info = await cli_context.cluster_manager.create_cluster(cluster_config, wait_for_completion=True)
+        await ensure_cluster(cluster_name, region, progress)
         
         progress.update(3, "Validating configuration...")
         
         # Validate application configuration
-        validation_report = await cli_context.validation_engine.validate_app_config(app_config)
+        validation_report = await validate_app_config(app_config)
         if not validation_report.valid:
             errors = [error.message for error in validation_report.get_errors()]
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
@@ -614,6 +676,83 @@ async def execute_deployment(app_config: AppConfig, cluster: str, region: str, w
         }
 
 
+async def validate_app_config(app_config: AppConfig):
+    """Validate one application, checking its image against the registry"""
+    
+    # Entering the engine opens an HTTP session and an HTTPRegistryClient for this event loop
+    async with cli_context.validation_engine as validation_engine:
+        return await validation_engine.validate_app_config(app_config)
+
+
+async def ensure_cluster(cluster_name: str, region: str, progress: Optional[ProgressIndicator] = None) -> None:
+    """Use an existing cluster or create it"""
+    try:
+        await cli_context.cluster_manager.get_cluster_info(cluster_name, region)
+        click.echo(f"Using existing cluster: {cluster_name}")
+    except:
+        # Cluster doesn't exist, create it
+        if progress:
+            progress.update(2, "Creating cluster...")
+        click.echo(f"Creating new cluster: {cluster_name}")
+        
+        cluster_config = ClusterConfig(name=cluster_name, region=region)
+        await cli_context.cluster_manager.create_cluster(cluster_config, wait_for_completion=True)
+
+
+async def execute_batch_deployment(app_configs: List[AppConfig], cluster_name: str, region: str,
+                                   wait: bool, max_concurrency: int) -> Dict[str, Any]:
+    """Execute a dependency-ordered batch deployment"""
+    
+    # Initialize clients
+    cli_context.initialize_clients()
+    
+    try:
+        await ensure_cluster(cluster_name, region)
+        
+        # Validate every application up front so nothing is half-deployed
+        async with cli_context.validation_engine as validation_engine:
+            validation = await validation_engine.validate_many(app_configs)
+        errors = [
+            f"{name}: {error.message}"
+            for name, report in validation.reports.items() if not report.valid
+            for error in report.get_errors()
+        ]
+        if errors:
+            raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'applications': [app_config.name for app_config in app_configs],
+            'cluster': cluster_name,
+            'region': region
+        }
+    
+    progress = ProgressIndicator("Deploying applications", len(app_configs))
+    
+    def on_progress(app: str, state: BatchItemState, finished: int, total: int) -> None:
+        progress.update(finished, f"{app}: {state.value}")
+    
+    orchestrator = BatchDeploymentOrchestrator(cli_context.app_deployer, max_concurrency=max_concurrency)
+    batch_result = await orchestrator.deploy_all(
+        app_configs, cluster_name, region,
+        strategy=DeploymentStrategy.ROLLING_UPDATE,
+        wait_for_completion=wait,
+        progress_callback=on_progress
+    )
+    
+    return {
+        **batch_result.to_dict(),
+        'cluster': cluster_name,
+        'region': region,
+        'urls': {
+            name: result.application_url
+            for name, result in batch_result.results.items() if result.success
+        }
+    }
+
+
 async def get_deployment_status(app: str, cluster: str) -> Dict[str, Any]:
     """Get deployment status"""
     
@@ -642,6 +781,28 @@ async def get_deployment_status(app: str, cluster: str) -> Dict[str, Any]:
         }
 
 
+async def watch_deployment_status(app: str, cluster: str) -> None:
+    """Print status every time the cluster reports a change"""
+    
+    # Initialize clients
+    cli_context.initialize_clients()
+    
+    if app:
+        stream = cli_context.app_deployer.watch_deployment_status(app, cluster, "us-central1")
+    else:
+        stream = cli_context.cluster_manager.watch_cluster_health(cluster, "us-central1")
+    
+    try:
+        async for update in stream:
+            result = update if isinstance(update, dict) else update.to_dict()
+            click.clear()
+            click.echo(f"🔄 Status at {datetime.now().strftime('%H:%M:%S')}")
+            output_result(result)
+            click.echo("\nPress Ctrl+C to stop watching...")
+    finally:
+        await stream.aclose()
+
+
 def execute_scaling(app: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Execute scaling operation (placeholder for now)"""
     return {
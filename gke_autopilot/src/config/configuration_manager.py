@@ -6,22 +6,106 @@ environment variable overrides, templating, and multi-environment support.
 """
 
 import os
+import copy
+import hashlib
 import yaml
 import json
-from typing import Dict, Any, Optional, List, Union
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 import logging
 from jinja2 import Template, Environment, FileSystemLoader
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 
 from ..models.app_config import AppConfig, ClusterConfig
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 logger = logging.getLogger(__name__)
 
 
+ENV_OVERRIDE_PREFIX = "GKE_AUTOPILOT_"
+
+CONFIG_FILE_SUFFIXES = ('.yaml', '.yml', '.json')
+
+# Below this many uncached files, parsing in worker processes costs more than it saves
+PARALLEL_LOAD_THRESHOLD = 16
+
+
+def parse_config_file(config_path: Union[str, Path]) -> Any:
+    """Parse a YAML or JSON configuration file"""
+    config_path = Path(config_path)
+    suffix = config_path.suffix.lower()
+    
+    with open(config_path, 'rb') as f:
+        if suffix in ('.yaml', '.yml'):
+            return yaml.load(f, Loader=YamlLoader)
+        elif suffix == '.json':
+            return json.load(f)
+        else:
+            raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
+
+
+def env_override_fingerprint(environ: Optional[Dict[str, str]] = None) -> str:
+    """Hash of every GKE_AUTOPILOT_* variable; changes whenever an override changes"""
+    environ = os.environ if environ is None else environ
+    overrides = sorted((key, value) for key, value in environ.items() if key.startswith(ENV_OVERRIDE_PREFIX))
+    return hashlib.sha256(json.dumps(overrides).encode('utf-8')).hexdigest()
+
+
+def _parse_in_worker(config_path: str) -> Tuple[str, Any, Optional[str]]:
+    """Process-pool entry point: parse one file, reporting errors as text"""
+    try:
+        return config_path, parse_config_file(config_path), None
+    except Exception as e:
+        return config_path, None, f"{type(e).__name__}: {e}"
+
+
+@dataclass
+class CachedConfiguration:
+    """Validated configuration keyed on the file state it was read from"""
+    mtime_ns: int
+    size: int
+    env_fingerprint: str
+    config_data: Dict[str, Any]
+    
+    def matches(self, stat_result: os.stat_result, env_fingerprint: str) -> bool:
+        return (
+            self.mtime_ns == stat_result.st_mtime_ns
+            and self.size == stat_result.st_size
+            and self.env_fingerprint == env_fingerprint
+        )
+
+
+@dataclass
+class DirectoryLoadResult:
+    """Result of loading every configuration file in a directory"""
+    configs: Dict[Path, Dict[str, Any]] = field(default_factory=dict)
+    errors: Dict[Path, str] = field(default_factory=dict)
+    cache_hits: int = 0
+    
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'valid': self.valid,
+            'loaded': [str(path) for path in self.configs],
+            'errors': {str(path): error for path, error in self.errors.items()},
+            'cache_hits': self.cache_hits
+        }
+
+
 @dataclass
 class ConfigurationTemplate:
     """Configuration template with Jinja2 support"""
@@ -79,15 +163,19 @@ class ConfigurationManager:
             autoescape=True
         )
         
-        # Configuration schema
+        # Configuration schema, compiled once and reused for every validation
         self.app_config_schema = self._load_app_config_schema()
         self.cluster_config_schema = self._load_cluster_config_schema()
+        self._app_config_validator = self._compile_validator(self.app_config_schema)
+        self._cluster_config_validator = self._compile_validator(self.cluster_config_schema)
         
         # Environment configurations
         self.environments: Dict[str, EnvironmentConfig] = {}
         
-        # Configuration cache
-        self._config_cache: Dict[str, Any] = {}
+        # Configuration cache, keyed by absolute path and checked against file state
+        self._config_cache: Dict[str, CachedConfiguration] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
         
         logger.info(f"Initialized Configuration Manager with config directory: {self.config_dir}")
     
@@ -148,6 +236,11 @@ class ConfigurationManager:
                         "domain": {"type": "string"},
                         "tls": {"type": "boolean"}
                     }
+                },
+                "dependencies": {
+                    "type": "array",
+                    "items": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+                    "uniqueItems": True
                 }
             }
         }
@@ -187,10 +280,21 @@ class ConfigurationManager:
             }
         }
     
+    @staticmethod
+    def _compile_validator(schema: Dict[str, Any]) -> Any:
+        """Check a schema once and build a reusable validator for it"""
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
+    
     def load_configuration(self, config_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Load configuration from file with validation and caching.
         
+        Cached results are reused only while the file's mtime and size and
+        the GKE_AUTOPILOT_* environment overrides are unchanged, so edits are
+        picked up without clearing the cache. Callers get their own copy.
+        
         Args:
             config_path: Path to configuration file (YAML or JSON)
             
@@ -203,31 +307,124 @@ class ConfigurationManager:
         """
         config_path = Path(config_path)
         
+        try:
+            stat_result = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        
+        env_fingerprint = env_override_fingerprint()
+        
         # Check cache first
-        cache_key = str(config_path.absolute())
-        if cache_key in self._config_cache:
+        cached = self._get_cached(config_path, stat_result, env_fingerprint)
+        if cached is not None:
             logger.debug(f"Returning cached configuration for {config_path}")
-            return self._config_cache[cache_key]
-        
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+            return copy.deepcopy(cached)
         
         # Load configuration file
         try:
-            with open(config_path, 'r') as f:
-                if config_path.suffix.lower() in ['.yaml', '.yml']:
-                    config_data = yaml.safe_load(f)
-                elif config_path.suffix.lower() == '.json':
-                    config_data = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
-            
+            config_data = parse_config_file(config_path)
             logger.info(f"Loaded configuration from {config_path}")
             
         except Exception as e:
             logger.error(f"Failed to load configuration from {config_path}: {e}")
             raise
         
+        config_data = self._finalize_configuration(config_data, config_path, stat_result, env_fingerprint)
+        return copy.deepcopy(config_data)
+    
+    def load_directory(self, directory: Union[str, Path], recursive: bool = False,
+                       max_workers: Optional[int] = None) -> DirectoryLoadResult:
+        """
+        Load and validate every configuration file in a directory.
+        
+        Unchanged files are served from the cache; the rest are parsed in
+        parallel worker processes when there are enough of them to pay off.
+        Errors are collected per file instead of stopping the run.
+        
+        Args:
+            directory: Directory containing YAML/JSON configuration files
+            recursive: Also load files from subdirectories
+            max_workers: Worker processes for parsing (default: CPU count)
+            
+        Returns:
+            DirectoryLoadResult: Loaded configurations and per-file errors
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Configuration directory not found: {directory}")
+        
+        candidates = directory.rglob('*') if recursive else directory.iterdir()
+        config_paths = sorted(
+            path for path in candidates
+            if path.suffix.lower() in CONFIG_FILE_SUFFIXES and path.is_file()
+        )
+        
+        result = DirectoryLoadResult()
+        env_fingerprint = env_override_fingerprint()
+        pending: Dict[str, Tuple[Path, os.stat_result]] = {}
+        
+        for config_path in config_paths:
+            stat_result = config_path.stat()
+            cached = self._get_cached(config_path, stat_result, env_fingerprint)
+            if cached is not None:
+                result.configs[config_path] = copy.deepcopy(cached)
+                result.cache_hits += 1
+            else:
+                pending[str(config_path)] = (config_path, stat_result)
+        
+        if len(pending) >= PARALLEL_LOAD_THRESHOLD and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(_parse_in_worker, pending, chunksize=8))
+        else:
+            parsed = [_parse_in_worker(path) for path in pending]
+        
+        for path_str, config_data, error in parsed:
+            config_path, stat_result = pending[path_str]
+            if error is not None:
+                result.errors[config_path] = error
+                continue
+            
+            try:
+                config_data = self._finalize_configuration(config_data, config_path, stat_result, env_fingerprint)
+                result.configs[config_path] = copy.deepcopy(config_data)
+            except ValidationError as e:
+                result.errors[config_path] = e.message
+            except Exception as e:
+                result.errors[config_path] = f"{type(e).__name__}: {e}"
+        
+        # Keep directory order regardless of which files came from the cache
+        result.configs = {path: result.configs[path] for path in config_paths if path in result.configs}
+        
+        logger.info(f"Loaded {len(result.configs)} configurations from {directory} "
+                    f"({result.cache_hits} cached, {len(result.errors)} errors)")
+        return result
+    
+    def _get_cached(self, config_path: Path, stat_result: os.stat_result,
+                    env_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the cached configuration if the file and overrides are unchanged"""
+        cache_key = str(config_path.absolute())
+        
+        with self._cache_lock:
+            cached = self._config_cache.get(cache_key)
+            if cached is None:
+                self._cache_stats['misses'] += 1
+                return None
+            
+            if not cached.matches(stat_result, env_fingerprint):
+                del self._config_cache[cache_key]
+                self._cache_stats['invalidations'] += 1
+                self._cache_stats['misses'] += 1
+                return None
+            
+            self._cache_stats['hits'] += 1
+            return cached.config_data
+    
+    def _finalize_configuration(self, config_data: Any, config_path: Path,
+                                stat_result: os.stat_result, env_fingerprint: str) -> Dict[str, Any]:
+        """Apply overrides, validate and cache freshly parsed configuration"""
+        if not isinstance(config_data, dict):
+            raise ValidationError(f"Configuration in {config_path} must be a mapping")
+        
         # Apply environment variable overrides
         config_data = self._apply_env_overrides(config_data)
         
@@ -235,7 +432,13 @@ class ConfigurationManager:
         self._validate_configuration(config_data, config_path)
         
         # Cache configuration
-        self._config_cache[cache_key] = config_data
+        with self._cache_lock:
+            self._config_cache[str(config_path.absolute())] = CachedConfiguration(
+                mtime_ns=stat_result.st_mtime_ns,
+                size=stat_result.st_size,
+                env_fingerprint=env_fingerprint,
+                config_data=config_data
+            )
         
         return config_data
     
@@ -251,7 +454,7 @@ class ConfigurationManager:
         - GKE_AUTOPILOT_RESOURCES__CPU -> config['resources']['cpu']
         - GKE_AUTOPILOT_SCALING__MIN_REPLICAS -> config['scaling']['min_replicas']
         """
-        env_prefix = "GKE_AUTOPILOT_"
+        env_prefix = ENV_OVERRIDE_PREFIX
         
         for env_var, env_value in os.environ.items():
             if not env_var.startswith(env_prefix):
@@ -313,11 +516,11 @@ class ConfigurationManager:
             # Determine configuration type and validate
             if 'name' in config_data and 'image' in config_data:
                 # Application configuration
-                validate(instance=config_data, schema=self.app_config_schema)
+                self._app_config_validator.validate(config_data)
                 logger.debug(f"Application configuration validation passed for {config_path}")
             elif 'name' in config_data and 'region' in config_data:
                 # Cluster configuration
-                validate(instance=config_data, schema=self.cluster_config_schema)
+                self._cluster_config_validator.validate(config_data)
                 logger.debug(f"Cluster configuration validation passed for {config_path}")
             else:
                 logger.warning(f"Unknown configuration type for {config_path}")
@@ -349,6 +552,9 @@ class ConfigurationManager:
         Returns:
             ClusterConfig object
         """
+        # Work on a copy so the caller's (possibly cached) dict is untouched
+        config_data = dict(config_data)
+        
         # Extract nested configurations
         network_data = config_data.pop('network', {})
         security_data = config_data.pop('security', {})
@@ -606,13 +812,18 @@ class ConfigurationManager:
     
     def clear_cache(self) -> None:
         """Clear configuration cache"""
-        self._config_cache.clear()
+        with self._cache_lock:
+            self._config_cache.clear()
         logger.info("Configuration cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get configuration cache statistics"""
+        lookups = self._cache_stats['hits'] + self._cache_stats['misses']
         return {
             'cached_configs': len(self._config_cache),
             'cached_environments': len(self.environments),
-            'cache_keys': list(self._config_cache.keys())
+            'cache_keys': list(self._config_cache.keys()),
+            **self._cache_stats,
+            'hit_rate': self._cache_stats['hits'] / lookups if lookups else 0.0,
+            'yaml_loader': YamlLoader.__name__
         }
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+Server-Side Apply Engine for GKE Autopilot Deployment Framework
+
+This module applies rendered Kubernetes manifests with server-side apply under
+a named field manager. Objects are grouped into tiers by kind (namespaces and
+CRDs first, workloads later); objects within a tier are independent and are
+submitted concurrently over the cluster's pooled API connection.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Kubernetes imports
+try:
+    from kubernetes import dynamic
+    from kubernetes.client.rest import ApiException
+except ImportError:
+    dynamic = None
+    ApiException = Exception
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FIELD_MANAGER = "gke-autopilot-deployer"
+
+# Apply order in coarse tiers: objects other objects refer to come first, and
+# kinds in one tier are independent of each other. Kinds not listed
+# (typically custom resources) are applied last, after their CRDs.
+KIND_TIERS = (
+    # Namespaces, CRDs and cluster-scoped scaffolding
+    ('Namespace', 'CustomResourceDefinition', 'PriorityClass', 'StorageClass'),
+    # Configuration, storage, RBAC and services
+    ('ResourceQuota', 'LimitRange', 'ServiceAccount', 'Secret', 'ConfigMap',
+     'PersistentVolume', 'PersistentVolumeClaim', 'ClusterRole', 'ClusterRoleBinding',
+     'Role', 'RoleBinding', 'Service'),
+    # Workloads
+    ('Deployment', 'StatefulSet', 'DaemonSet', 'Job', 'CronJob'),
+    # Autoscaling, disruption budgets, ingress and policies
+    ('HorizontalPodAutoscaler', 'PodDisruptionBudget', 'BackendConfig', 'FrontendConfig',
+     'ManagedCertificate', 'Ingress', 'NetworkPolicy'),
+)
+
+_KIND_RANK = {kind: rank for rank, kinds in enumerate(KIND_TIERS) for kind in kinds}
+
+# Throttling and transient server errors are retried with backoff
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+CONFLICT_STATUS = 409
+
+
+def kind_rank(kind: str) -> int:
+    """Apply tier of a kind; unknown kinds sort after every known kind"""
+    return _KIND_RANK.get(kind, len(KIND_TIERS))
+
+
+def apply_tiers(manifests: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group manifests into ordered tiers, keeping input order within a tier"""
+    tiers: Dict[int, List[Dict[str, Any]]] = {}
+    for manifest in manifests:
+        tiers.setdefault(kind_rank(manifest.get('kind', '')), []).append(manifest)
+    return [tiers[rank] for rank in sorted(tiers)]
+
+
+@dataclass
+class ObjectApplyResult:
+    """Outcome of applying a single object"""
+    api_version: str
+    kind: str
+    name: str
+    namespace: Optional[str]
+    success: bool
+    latency_seconds: float = 0.0
+    attempts: int = 0
+    resource_version: Optional[str] = None
+    error: Optional[str] = None
+    skipped: bool = False
+
+    @property
+    def key(self) -> str:
+        """Object identity in the same apiVersion/kind/namespace/name form as the manifest store"""
+        return f"{self.api_version}/{self.kind}/{self.namespace or ''}/{self.name}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'key': self.key,
+            'kind': self.kind,
+            'name': self.name,
+            'namespace': self.namespace,
+            'success': self.success,
+            'skipped': self.skipped,
+            'latency_ms': round(self.latency_seconds * 1000, 2),
+            'attempts': self.attempts,
+            'resource_version': self.resource_version,
+            'error': self.error
+        }
+
+
+@dataclass
+class ApplyReport:
+    """Per-object results of one apply run"""
+    objects: List[ObjectApplyResult] = field(default_factory=list)
+    tiers: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(result.success for result in self.objects)
+
+    @property
+    def failed(self) -> List[ObjectApplyResult]:
+        return [result for result in self.objects if not result.success and not result.skipped]
+
+    @property
+    def skipped(self) -> List[ObjectApplyResult]:
+        return [result for result in self.objects if result.skipped]
+
+    def error_summary(self) -> Optional[str]:
+        if self.success:
+            return None
+        failures = '; '.join(f"{result.key}: {result.error}" for result in self.failed)
+        message = f"{len(self.failed)} of {len(self.objects)} objects failed to apply"
+        if self.skipped:
+            message += f", {len(self.skipped)} skipped"
+        return f"{message}: {failures}" if failures else message
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = sorted(result.latency_seconds for result in self.objects if not result.skipped)
+        return {
+            'success': self.success,
+            'objects': len(self.objects),
+            'failed': len(self.failed),
+            'skipped': len(self.skipped),
+            'tiers': self.tiers,
+            'total_seconds': round(self.total_seconds, 4),
+            'max_latency_ms': round(latencies[-1] * 1000, 2) if latencies else None,
+            'median_latency_ms': round(latencies[len(latencies) // 2] * 1000, 2) if latencies else None
+        }
+
+
+class ServerSideApplier:
+    """
+    Tiered, concurrent server-side apply.
+
+    Each object is sent as ``PATCH ... application/apply-patch+yaml`` with
+    ``fieldManager`` set, so the API server merges it and records field
+    ownership. Tiers are applied in KIND_TIERS order; within a tier up to
+    ``max_concurrency`` requests share the ApiClient's urllib3 connection
+    pool. When any object in a tier fails, later tiers are skipped.
+    """
+
+    def __init__(self, field_manager: str = DEFAULT_FIELD_MANAGER, force_conflicts: bool = True,
+                 max_concurrency: int = 8, max_retries: int = 3, retry_backoff_seconds: float = 0.5,
+                 request_timeout_seconds: float = 30.0):
+        """
+        Initialize the applier.
+
+        Args:
+            field_manager: Field manager name recorded for applied fields
+            force_conflicts: Take ownership of fields managed by other managers
+            max_concurrency: Maximum simultaneous requests within a tier
+            max_retries: Retries for throttled or transient server errors, and for
+                conflicts when force_conflicts is set (creation races then, not field ownership)
+            retry_backoff_seconds: Initial retry delay (doubled per attempt)
+            request_timeout_seconds: Per-request timeout
+        """
+        self.field_manager = field_manager
+        self.force_conflicts = force_conflicts
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+
+        # One DynamicClient (and its discovery cache) per pooled ApiClient
+        self._dynamic_clients: 'weakref.WeakKeyDictionary[Any, Any]' = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def apply(self, api_client: Any, manifests: List[Dict[str, Any]], namespace: str = "default") -> ApplyReport:
+        """
+        Apply manifests to the cluster behind an ApiClient.
+
+        Args:
+            api_client: Configured kubernetes.client.ApiClient
+            manifests: Manifests to apply
+            namespace: Namespace for namespaced objects that do not set one
+
+        Returns:
+            ApplyReport: Per-object results in apply order
+        """
+        if not dynamic:
+            raise RuntimeError("Kubernetes client library not installed. Run: pip install kubernetes")
+
+        started = time.perf_counter()
+        dynamic_client = self._dynamic_client(api_client)
+        tiers = apply_tiers(manifests)
+        report = ApplyReport(tiers=len(tiers))
+        failed_tier = None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="ssa") as executor:
+            for tier in tiers:
+                if failed_tier is not None:
+                    report.objects.extend(
+                        self._result(manifest, namespace, None, success=False, skipped=True,
+                                     error=f"skipped after {failed_tier} failed")
+                        for manifest in tier
+                    )
+                    continue
+
+                # Discovery is resolved serially; only the apply requests run in parallel
+                jobs = [(manifest, self._resolve(dynamic_client, manifest)) for manifest in tier]
+                tier_results = list(executor.map(
+                    lambda job: self._apply_one(dynamic_client, job[0], job[1], namespace), jobs
+                ))
+                report.objects.extend(tier_results)
+
+                failures = [result for result in tier_results if not result.success]
+                if failures:
+                    failed_tier = failures[0].key
+
+        report.total_seconds = time.perf_counter() - started
+        logger.info(f"Server-side applied {len(report.objects) - len(report.failed) - len(report.skipped)}"
+                    f"/{len(report.objects)} objects in {report.tiers} tiers ({report.total_seconds:.2f}s)")
+        return report
+
+    def _dynamic_client(self, api_client: Any) -> Any:
+        with self._lock:
+            dynamic_client = self._dynamic_clients.get(api_client)
+            if dynamic_client is None:
+                dynamic_client = dynamic.DynamicClient(api_client)
+                self._dynamic_clients[api_client] = dynamic_client
+            return dynamic_client
+
+    @staticmethod
+    def _resolve(dynamic_client: Any, manifest: Dict[str, Any]) -> Tuple[Optional[Any], Optional[str]]:
+        """Look up the API resource for a manifest (resource, error)"""
+        try:
+            return dynamic_client.resources.get(api_version=manifest['apiVersion'], kind=manifest['kind']), None
+        except Exception as e:
+            return None, f"unknown resource {manifest.get('apiVersion')}/{manifest.get('kind')}: {e}"
+
+    def _apply_one(self, dynamic_client: Any, manifest: Dict[str, Any],
+                   resolved: Tuple[Optional[Any], Optional[str]], namespace: str) -> ObjectApplyResult:
+        resource, error = resolved
+        if resource is None:
+            return self._result(manifest, namespace, None, success=False, error=error)
+
+        object_namespace = (manifest.get('metadata', {}).get('namespace') or namespace) if resource.namespaced else None
+        started = time.perf_counter()
+        attempts = 0
+
+        while True:
+            attempts += 1
+            try:
+                applied = dynamic_client.server_side_apply(
+                    resource,
+                    body=manifest,
+                    namespace=object_namespace,
+                    field_manager=self.field_manager,
+                    force_conflicts=self.force_conflicts,
+                    _request_timeout=self.request_timeout_seconds
+                )
+                metadata = applied.to_dict().get('metadata', {}) if hasattr(applied, 'to_dict') else {}
+                return self._result(manifest, object_namespace, resource, success=True,
+                                    latency=time.perf_counter() - started, attempts=attempts,
+                                    resource_version=metadata.get('resourceVersion'))
+
+            except ApiException as e:
+                status = getattr(e, 'status', None)
+                retryable = status in RETRYABLE_STATUS or (status == CONFLICT_STATUS and self.force_conflicts)
+                if retryable and attempts <= self.max_retries:
+                    time.sleep(self.retry_backoff_seconds * 2 ** (attempts - 1))
+                    continue
+                error = f"HTTP {status}: {getattr(e, 'reason', None) or e}"
+            except Exception as e:
+                error = str(e)
+
+            logger.warning(f"Server-side apply failed for {manifest.get('kind')}/"
+                           f"{manifest.get('metadata', {}).get('name')}: {error}")
+            return self._result(manifest, object_namespace, resource, success=False,
+                                latency=time.perf_counter() - started, attempts=attempts, error=error)
+
+    @staticmethod
+    def _result(manifest: Dict[str, Any], namespace: Optional[str], resource: Optional[Any],
+                success: bool, latency: float = 0.0, attempts: int = 0,
+                resource_version: Optional[str] = None, error: Optional[str] = None,
+                skipped: bool = False) -> ObjectApplyResult:
+        metadata = manifest.get('metadata', {})
+        if resource is not None and not resource.namespaced:
+            namespace = None
+        else:
+            namespace = metadata.get('namespace') or namespace
+        return ObjectApplyResult(
+            api_version=manifest.get('apiVersion', ''),
+            kind=manifest.get('kind', ''),
+            name=metadata.get('name', ''),
+            namespace=namespace,
+            success=success,
+            latency_seconds=latency,
+            attempts=attempts,
+            resource_version=resource_version,
+            error=error,
+            skipped=skipped
+        )
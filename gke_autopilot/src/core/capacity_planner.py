@@ -0,0 +1,307 @@
+"""
+Capacity Planner for GKE Autopilot Deployment Framework
+
+This module loads many application configurations into columnar arrays and
+computes the fleet's resource footprint, Autopilot-rounded pod sizes and cost
+projections with vectorized operations, so what-if sizing across hundreds of
+applications is a handful of array expressions instead of a Python loop.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# NumPy is optional; only the capacity planner needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..models.app_config import AppConfig
+from .quantities import (
+    AUTOPILOT_MIN_CPU_MILLICORES,
+    AUTOPILOT_MIN_MEMORY_BYTES,
+    GIB,
+    MIB,
+    cpu_to_millicores,
+    memory_to_bytes,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# GKE Autopilot general-purpose pod sizing rules
+AUTOPILOT_CPU_INCREMENT_MILLICORES = 250
+AUTOPILOT_MIN_MEMORY_GIB_PER_CPU = 1.0
+AUTOPILOT_MAX_MEMORY_GIB_PER_CPU = 6.5
+
+HOURS_PER_MONTH = 24 * 30
+
+FOOTPRINT_KEYS = ('pods', 'cpu_cores', 'memory_gib', 'storage_gib', 'hourly_cost', 'monthly_cost')
+
+
+@dataclass
+class AutopilotPricing:
+    """Autopilot pod pricing per resource-hour (USD, general-purpose, us-central1)"""
+    vcpu_hour: float = 0.0445
+    memory_gib_hour: float = 0.0049225
+    storage_gib_hour: float = 0.0000548
+
+
+@dataclass
+class WhatIf:
+    """Scenario applied on top of the configured requests and replica counts"""
+    cpu_scale: float = 1.0
+    memory_scale: float = 1.0
+    replica_scale: float = 1.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'cpu_scale': self.cpu_scale,
+            'memory_scale': self.memory_scale,
+            'replica_scale': self.replica_scale
+        }
+
+
+@dataclass
+class CapacityPlan:
+    """Per-application pod sizes and fleet totals for one scenario"""
+    names: List[str]
+    cpu_millicores: Any
+    memory_bytes: Any
+    storage_bytes: Any
+    min_replicas: Any
+    max_replicas: Any
+    hourly_cost_min: Any
+    hourly_cost_max: Any
+    adjusted: List[str] = field(default_factory=list)
+    totals: Dict[str, Any] = field(default_factory=dict)
+    scenario: WhatIf = field(default_factory=WhatIf)
+    warnings: List[str] = field(default_factory=list)
+
+    def app_rows(self) -> List[Dict[str, Any]]:
+        """Per-application breakdown (materialized on demand)"""
+        return [
+            {
+                'name': name,
+                'cpu_millicores': int(cpu),
+                'memory_mib': int(memory) // MIB,
+                'min_replicas': int(min_replicas),
+                'max_replicas': int(max_replicas),
+                'monthly_cost_min': round(float(cost_min) * HOURS_PER_MONTH, 2),
+                'monthly_cost_max': round(float(cost_max) * HOURS_PER_MONTH, 2)
+            }
+            for name, cpu, memory, min_replicas, max_replicas, cost_min, cost_max in zip(
+                self.names, self.cpu_millicores, self.memory_bytes, self.min_replicas,
+                self.max_replicas, self.hourly_cost_min, self.hourly_cost_max
+            )
+        ]
+
+    def to_dict(self, include_apps: bool = False) -> Dict[str, Any]:
+        result = {
+            'applications': len(self.names),
+            'scenario': self.scenario.to_dict(),
+            'totals': self.totals,
+            'autopilot_adjusted': self.adjusted,
+            'warnings': self.warnings
+        }
+        if include_apps:
+            result['apps'] = self.app_rows()
+        return result
+
+
+class CapacityPlanner:
+    """
+    Fleet-wide capacity planning over columnar resource data.
+
+    Requests, rendered limits and replica bounds of every application are
+    parsed once into NumPy arrays. Each plan() call then applies a what-if
+    scenario, Autopilot's rounding rules (CPU minimum and 250m increments,
+    memory minimum, 1:1 to 6.5:1 GiB-per-vCPU ratio) and pricing as
+    vectorized expressions.
+    """
+
+    def __init__(self, app_configs: List[AppConfig], pricing: Optional[AutopilotPricing] = None):
+        """
+        Initialize capacity planner.
+
+        Args:
+            app_configs: Applications to plan for
+            pricing: Autopilot resource pricing
+        """
+        if np is None:
+            raise RuntimeError("NumPy not installed. Run: pip install numpy")
+
+        self.pricing = pricing or AutopilotPricing()
+        self.names = [config.name for config in app_configs]
+
+        def column(values: List[Optional[float]]) -> 'np.ndarray':
+            return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+        requests = [config.resource_requests for config in app_configs]
+        self.cpu_request_m = column([cpu_to_millicores(r.cpu) for r in requests])
+        self.memory_request_bytes = column([memory_to_bytes(r.memory) for r in requests])
+        self.storage_request_bytes = column([memory_to_bytes(r.storage) for r in requests])
+        self.min_replicas = np.array([config.scaling_config.min_replicas for config in app_configs], dtype=np.int64)
+        self.max_replicas = np.array([config.scaling_config.max_replicas for config in app_configs], dtype=np.int64)
+
+        # Rendered manifests raise requests to the Autopilot minimums and set limits equal to them
+        self.cpu_limit_m = np.maximum(self.cpu_request_m, AUTOPILOT_MIN_CPU_MILLICORES)
+        self.memory_limit_bytes = np.maximum(self.memory_request_bytes, AUTOPILOT_MIN_MEMORY_BYTES)
+
+        invalid = np.isnan(self.cpu_request_m) | np.isnan(self.memory_request_bytes) | np.isnan(self.storage_request_bytes)
+        self.invalid = [name for name, bad in zip(self.names, invalid) if bad]
+        if self.invalid:
+            logger.warning(f"Ignoring applications with unparseable resource quantities: {self.invalid}")
+        self._valid = ~invalid
+
+    @classmethod
+    def from_config_directory(cls, directory: Union[str, Path], config_manager: Any = None,
+                              pricing: Optional[AutopilotPricing] = None) -> 'CapacityPlanner':
+        """
+        Build a planner from every application config in a directory.
+
+        Args:
+            directory: Directory of YAML/JSON application configs
+            config_manager: ConfigurationManager to load with (a new one by default)
+            pricing: Autopilot resource pricing
+        """
+        if config_manager is None:
+            from ..config.configuration_manager import ConfigurationManager
+            config_manager = ConfigurationManager()
+
+        loaded = config_manager.load_directory(directory)
+        for path, error in loaded.errors.items():
+            logger.warning(f"Skipping {path}: {error}")
+
+        app_configs = [
+            config_manager.create_app_config(config_data)
+            for config_data in loaded.configs.values()
+            if 'image' in config_data
+        ]
+        return cls(app_configs, pricing)
+
+    def autopilot_round(self, cpu_m: 'np.ndarray', memory_bytes: 'np.ndarray'):
+        """
+        Apply Autopilot pod rounding to request columns.
+
+        Returns:
+            Tuple of (cpu millicores, memory bytes) arrays as Autopilot bills them
+        """
+        increment = AUTOPILOT_CPU_INCREMENT_MILLICORES
+
+        cpu = np.ceil(np.maximum(cpu_m, AUTOPILOT_MIN_CPU_MILLICORES) / increment) * increment
+        memory = np.maximum(memory_bytes, AUTOPILOT_MIN_MEMORY_BYTES)
+
+        # Too little memory per vCPU: memory is raised
+        memory = np.maximum(memory, cpu / 1000 * AUTOPILOT_MIN_MEMORY_GIB_PER_CPU * GIB)
+
+        # Too much memory per vCPU: CPU is raised, in whole increments
+        cpu_for_memory = memory / GIB / AUTOPILOT_MAX_MEMORY_GIB_PER_CPU * 1000
+        cpu = np.maximum(cpu, np.ceil(cpu_for_memory / increment) * increment)
+
+        return cpu, np.ceil(memory / MIB) * MIB
+
+    def plan(self, what_if: Optional[WhatIf] = None) -> CapacityPlan:
+        """
+        Compute pod sizes, fleet footprint and cost for a scenario.
+
+        Args:
+            what_if: Scaling applied to requests and replica counts
+
+        Returns:
+            CapacityPlan: Per-application arrays and fleet totals
+        """
+        started = time.perf_counter()
+        what_if = what_if or WhatIf()
+        valid = self._valid
+
+        cpu_requested = self.cpu_request_m[valid] * what_if.cpu_scale
+        memory_requested = self.memory_request_bytes[valid] * what_if.memory_scale
+        # Storage is each pod's ephemeral-storage request, so it scales with replicas like CPU and memory
+        storage = self.storage_request_bytes[valid]
+
+        min_replicas = np.maximum(1, np.ceil(self.min_replicas[valid] * what_if.replica_scale)).astype(np.int64)
+        max_replicas = np.maximum(min_replicas, np.ceil(self.max_replicas[valid] * what_if.replica_scale)).astype(np.int64)
+
+        cpu, memory = self.autopilot_round(cpu_requested, memory_requested)
+
+        pod_hourly = (
+            cpu / 1000 * self.pricing.vcpu_hour
+            + memory / GIB * self.pricing.memory_gib_hour
+            + storage / GIB * self.pricing.storage_gib_hour
+        )
+        hourly_min = pod_hourly * min_replicas
+        hourly_max = pod_hourly * max_replicas
+
+        names = [name for name, ok in zip(self.names, valid) if ok]
+        adjusted_mask = (cpu != np.ceil(cpu_requested)) | (memory != np.ceil(memory_requested / MIB) * MIB)
+
+        def footprint(replicas: 'np.ndarray', hourly: 'np.ndarray') -> Dict[str, float]:
+            return {
+                'pods': int(replicas.sum()),
+                'cpu_cores': round(float((cpu * replicas).sum()) / 1000, 3),
+                'memory_gib': round(float((memory * replicas).sum()) / GIB, 3),
+                'storage_gib': round(float((storage * replicas).sum()) / GIB, 3),
+                'hourly_cost': round(float(hourly.sum()), 4),
+                'monthly_cost': round(float(hourly.sum()) * HOURS_PER_MONTH, 2)
+            }
+
+        def one_replica_each(cpu_m: 'np.ndarray', memory_b: 'np.ndarray') -> Dict[str, float]:
+            return {
+                'cpu_cores': round(float(cpu_m.sum()) / 1000, 3),
+                'memory_gib': round(float(memory_b.sum()) / GIB, 3)
+            }
+
+        totals = {
+            'min': footprint(min_replicas, hourly_min),
+            'max': footprint(max_replicas, hourly_max),
+            'one_replica_each': {
+                'requested': one_replica_each(cpu_requested, memory_requested),
+                'limits': one_replica_each(np.maximum(cpu_requested, AUTOPILOT_MIN_CPU_MILLICORES),
+                                           np.maximum(memory_requested, AUTOPILOT_MIN_MEMORY_BYTES)),
+                'billed': one_replica_each(cpu, memory)
+            },
+            'compute_seconds': round(time.perf_counter() - started, 6)
+        }
+
+        return CapacityPlan(
+            names=names,
+            cpu_millicores=cpu,
+            memory_bytes=memory,
+            storage_bytes=storage,
+            min_replicas=min_replicas,
+            max_replicas=max_replicas,
+            hourly_cost_min=hourly_min,
+            hourly_cost_max=hourly_max,
+            adjusted=[name for name, changed in zip(names, adjusted_mask) if changed],
+            totals=totals,
+            scenario=what_if,
+            warnings=[f"{name}: unparseable resource quantities, excluded from totals" for name in self.invalid]
+        )
+
+    def compare(self, scenarios: Dict[str, WhatIf], baseline: Optional[WhatIf] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Plan several named scenarios against a baseline.
+
+        Args:
+            scenarios: Scenario name mapped to its what-if scaling
+            baseline: Scenario the deltas are taken against (the configured sizes by default)
+
+        Returns:
+            Scenario name mapped to its totals plus a 'delta' of the min and max
+            footprints relative to the baseline
+        """
+        base = self.plan(baseline).totals
+        results = {}
+        for name, what_if in scenarios.items():
+            totals = self.plan(what_if).totals
+            delta = {
+                bound: {key: round(totals[bound][key] - base[bound][key], 4) for key in FOOTPRINT_KEYS}
+                for bound in ('min', 'max')
+            }
+            results[name] = {**totals, 'delta': delta}
+        return results
@@ -0,0 +1,309 @@
+"""
+Kubernetes API Client Pool for GKE Autopilot Deployment Framework
+
+This module keeps one configured Kubernetes ApiClient per (cluster, location),
+caches cluster endpoints and CA certificates, and refreshes Google credentials
+only when the access token is close to expiry.
+"""
+
+import base64
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Google Cloud imports
+try:
+    import google.auth.transport.requests
+except ImportError:
+    google = None
+
+# Kubernetes imports
+try:
+    from kubernetes import client
+except ImportError:
+    client = None
+
+
+logger = logging.getLogger(__name__)
+
+
+ClusterKey = Tuple[str, str]  # (cluster_name, location)
+
+
+@dataclass
+class PooledClient:
+    """A configured Kubernetes API client bound to one cluster"""
+    api_client: Any
+    endpoint: str
+    ca_certificate: Optional[str] = None
+    ca_cert_path: Optional[str] = None
+    token: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class KubernetesClientPool:
+    """
+    Thread-safe pool of Kubernetes API clients keyed by (cluster, location).
+
+    Cluster endpoint and CA data are fetched once per cluster and reused until
+    ``endpoint_ttl_seconds`` passes or the entry is invalidated. The shared
+    Google credentials are refreshed only when the token is missing or within
+    ``refresh_margin_seconds`` of expiry, and the new token is pushed into every
+    pooled client. Clients unused for ``idle_timeout_seconds`` are evicted.
+    """
+
+    def __init__(self, credentials: Any, cluster_info_loader: Callable[[str, str], Any],
+                 idle_timeout_seconds: int = 900, refresh_margin_seconds: int = 300,
+                 endpoint_ttl_seconds: int = 3600, max_clients: int = 32,
+                 connection_pool_maxsize: int = 32):
+        """
+        Initialize the client pool.
+
+        Args:
+            credentials: Google credentials used to authenticate to clusters
+            cluster_info_loader: Callable returning ClusterInfo for (cluster_name, location)
+            idle_timeout_seconds: Evict clients unused for this long
+            refresh_margin_seconds: Refresh the token when it expires within this window
+            endpoint_ttl_seconds: Re-fetch cluster endpoint/CA after this long
+            max_clients: Maximum number of pooled clients
+            connection_pool_maxsize: HTTP connections kept per cluster for concurrent requests
+        """
+        self.credentials = credentials
+        self.cluster_info_loader = cluster_info_loader
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.refresh_margin = timedelta(seconds=refresh_margin_seconds)
+        self.endpoint_ttl_seconds = endpoint_ttl_seconds
+        self.max_clients = max(1, max_clients)
+        self.connection_pool_maxsize = max(1, connection_pool_maxsize)
+
+        self._clients: Dict[ClusterKey, PooledClient] = {}
+        self._cluster_info: Dict[ClusterKey, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ClusterKey, threading.Lock] = {}
+        self._credentials_lock = threading.Lock()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'token_refreshes': 0,
+            'cluster_info_fetches': 0,
+        }
+
+    def get_client(self, cluster_name: str, location: str) -> Any:
+        """
+        Get a ready-to-use ApiClient for a cluster, creating it on first use.
+
+        Args:
+            cluster_name: Name of the cluster
+            location: Cluster location (region or zone)
+
+        Returns:
+            kubernetes.client.ApiClient configured for the cluster
+        """
+        if not client:
+            raise RuntimeError("Kubernetes client library not installed. Run: pip install kubernetes")
+
+        key = (cluster_name, location)
+        self.evict_idle()
+        token = self._ensure_token()
+
+        with self._lock:
+            pooled = self._clients.get(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        if pooled is None:
+            # Per-cluster lock so concurrent callers share one construction
+            with key_lock:
+                with self._lock:
+                    pooled = self._clients.get(key)
+                if pooled is None:
+                    pooled = self._create_client(key, token)
+                    with self._lock:
+                        self._clients[key] = pooled
+                        self._stats['misses'] += 1
+                        self._enforce_capacity()
+                else:
+                    self._stats['hits'] += 1
+        else:
+            self._stats['hits'] += 1
+
+        if token and pooled.token != token:
+            self._apply_token(pooled, token)
+
+        pooled.last_used = time.monotonic()
+        pooled.uses += 1
+        return pooled.api_client
+
+    def get_cluster_info(self, cluster_name: str, location: str) -> Any:
+        """Get cached ClusterInfo, fetching it when missing or stale"""
+        key = (cluster_name, location)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._cluster_info.get(key)
+        if cached and now - cached[0] < self.endpoint_ttl_seconds:
+            return cached[1]
+
+        cluster_info = self.cluster_info_loader(cluster_name, location)
+        self._stats['cluster_info_fetches'] += 1
+        self.remember_cluster(cluster_info, location)
+        return cluster_info
+
+    def remember_cluster(self, cluster_info: Any, location: Optional[str] = None) -> None:
+        """
+        Record freshly fetched cluster info.
+
+        A pooled client whose endpoint or CA no longer matches is dropped so
+        the next request rebuilds it against the new control plane.
+        """
+        key = (cluster_info.name, location or cluster_info.location)
+
+        with self._lock:
+            self._cluster_info[key] = (time.monotonic(), cluster_info)
+            pooled = self._clients.get(key)
+            stale = pooled is not None and (
+                pooled.endpoint != cluster_info.endpoint
+                or pooled.ca_certificate != getattr(cluster_info, 'ca_certificate', None)
+            )
+            if stale:
+                self._drop(key)
+
+        if stale:
+            logger.info(f"Cluster endpoint or CA changed, rebuilding client for: {key[0]}")
+
+    def invalidate(self, cluster_name: str, location: str) -> None:
+        """Drop the pooled client and cached cluster info for a cluster"""
+        key = (cluster_name, location)
+        with self._lock:
+            self._cluster_info.pop(key, None)
+            self._drop(key)
+
+    def evict_idle(self) -> int:
+        """Evict clients unused for longer than the idle timeout"""
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        with self._lock:
+            idle = [key for key, pooled in self._clients.items() if pooled.last_used < cutoff]
+            for key in idle:
+                self._drop(key)
+                self._stats['evictions'] += 1
+
+        if idle:
+            logger.debug(f"Evicted {len(idle)} idle Kubernetes clients")
+        return len(idle)
+
+    def close(self) -> None:
+        """Close every pooled client"""
+        with self._lock:
+            for key in list(self._clients):
+                self._drop(key)
+            self._cluster_info.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        lookups = self._stats['hits'] + self._stats['misses']
+        expiry = getattr(self.credentials, 'expiry', None)
+        return {
+            **self._stats,
+            'active_clients': len(self._clients),
+            'cached_clusters': len(self._cluster_info),
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'token_expiry': expiry.isoformat() if expiry else None,
+        }
+
+    def _ensure_token(self) -> Optional[str]:
+        """Refresh the shared credentials only when the token is near expiry"""
+        if not self.credentials:
+            return None
+
+        with self._credentials_lock:
+            if self._token_needs_refresh():
+                if google is None:
+                    raise RuntimeError("Google auth library not installed. Run: pip install google-auth")
+                self.credentials.refresh(google.auth.transport.requests.Request())
+                self._stats['token_refreshes'] += 1
+                logger.debug("Refreshed Google Cloud access token")
+            return self.credentials.token
+
+    def _token_needs_refresh(self) -> bool:
+        if not getattr(self.credentials, 'token', None):
+            return True
+
+        expiry = getattr(self.credentials, 'expiry', None)
+        if expiry is None:
+            return False
+
+        # google-auth reports expiry as naive UTC
+        return datetime.utcnow() + self.refresh_margin >= expiry
+
+    def _create_client(self, key: ClusterKey, token: Optional[str]) -> PooledClient:
+        cluster_name, location = key
+        cluster_info = self.get_cluster_info(cluster_name, location)
+
+        configuration = client.Configuration()
+        configuration.host = f"https://{cluster_info.endpoint}"
+        configuration.connection_pool_maxsize = self.connection_pool_maxsize
+
+        ca_cert_path = None
+        ca_certificate = getattr(cluster_info, 'ca_certificate', None)
+        if ca_certificate:
+            ca_cert_path = self._write_ca_certificate(ca_certificate)
+            configuration.ssl_ca_cert = ca_cert_path
+
+        pooled = PooledClient(
+            api_client=client.ApiClient(configuration),
+            endpoint=cluster_info.endpoint,
+            ca_certificate=ca_certificate,
+            ca_cert_path=ca_cert_path
+        )
+        if token:
+            self._apply_token(pooled, token)
+
+        logger.info(f"Kubernetes client configured for cluster: {cluster_name}")
+        return pooled
+
+    @staticmethod
+    def _apply_token(pooled: PooledClient, token: str) -> None:
+        configuration = pooled.api_client.configuration
+        configuration.api_key_prefix['authorization'] = 'Bearer'
+        configuration.api_key['authorization'] = token
+        pooled.token = token
+
+    @staticmethod
+    def _write_ca_certificate(ca_certificate: str) -> str:
+        fd, path = tempfile.mkstemp(prefix="gke-ca-", suffix=".crt")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(base64.b64decode(ca_certificate))
+        return path
+
+    def _enforce_capacity(self) -> None:
+        """Evict least recently used clients beyond max_clients (lock held)"""
+        while len(self._clients) > self.max_clients:
+            oldest = min(self._clients, key=lambda k: self._clients[k].last_used)
+            self._drop(oldest)
+            self._stats['evictions'] += 1
+
+    def _drop(self, key: ClusterKey) -> None:
+        """Remove and close a pooled client (lock held)"""
+        self._key_locks.pop(key, None)
+        pooled = self._clients.pop(key, None)
+        if pooled is None:
+            return
+
+        try:
+            pooled.api_client.close()
+        except Exception as e:
+            logger.debug(f"Error closing Kubernetes client for {key[0]}: {e}")
+
+        if pooled.ca_cert_path:
+            try:
+                os.unlink(pooled.ca_cert_path)
+            except OSError:
+                pass
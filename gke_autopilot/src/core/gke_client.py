@@ -9,7 +9,7 @@ import logging
 import asyncio
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 
 # Google Cloud imports
@@ -17,22 +17,29 @@ try:
     from google.cloud import container_v1
     from google.auth import default
     from google.auth.exceptions import DefaultCredentialsError
+    from google.api_core.exceptions import NotFound
     import google.auth.transport.requests
 except ImportError:
     container_v1 = None
     default = None
     DefaultCredentialsError = Exception
+    NotFound = None
 
 # Kubernetes imports
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, dynamic
     from kubernetes.client.rest import ApiException
 except ImportError:
     client = None
     config = None
+    dynamic = None
     ApiException = Exception
 
 from ..models.app_config import ClusterConfig, AppConfig, DeploymentResult, DeploymentPhase
+from .apply_engine import DEFAULT_FIELD_MANAGER, ServerSideApplier
+from .client_pool import KubernetesClientPool
+from .readiness import ReadinessEngine
+from .template_engine import TemplateContext, TemplateEngine
 
 
 logger = logging.getLogger(__name__)
@@ -49,6 +56,7 @@ class ClusterInfo:
     endpoint: str
     autopilot_enabled: bool
     created_time: datetime
+    ca_certificate: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,6 +76,11 @@ class GKEClientError(Exception):
     pass
 
 
+class ClusterNotFoundError(GKEClientError):
+    """Raised when a cluster does not exist"""
+    pass
+
+
 class GKEClient:
     """
     Google Kubernetes Engine client for Autopilot cluster management.
@@ -79,13 +92,18 @@ class GKEClient:
     - Health monitoring and status reporting
     """
     
-    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None):
+    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None,
+                 client_idle_timeout: int = 900, field_manager: str = DEFAULT_FIELD_MANAGER,
+                 apply_concurrency: int = 8):
         """
         Initialize GKE client with authentication.
         
         Args:
             project_id: Google Cloud project ID (auto-detected if None)
             credentials_path: Path to service account credentials (optional)
+            client_idle_timeout: Seconds before an unused cluster client is evicted
+            field_manager: Server-side apply field manager name
+            apply_concurrency: Maximum simultaneous apply requests per tier
         """
         self.project_id = project_id
         self.credentials_path = credentials_path
@@ -98,6 +116,21 @@ class GKEClient:
         # Authentication
         self._authenticate()
         
+        # One Kubernetes API client per (cluster, location)
+        self._client_pool = KubernetesClientPool(
+            self._credentials,
+            self.get_cluster_info,
+            idle_timeout_seconds=client_idle_timeout,
+            connection_pool_maxsize=max(32, apply_concurrency)
+        )
+        
+        # Watch-based readiness and backoff polling, shared with deployer and CLI
+        self.readiness = ReadinessEngine(self._client_pool.get_client)
+        
+        # Tiered server-side apply over the pooled clients' connections
+        self.applier = ServerSideApplier(field_manager=field_manager, max_concurrency=apply_concurrency)
+        self._template_engine = None
+        
         logger.info(f"Initialized GKE client for project: {self.project_id}")
     
     def _authenticate(self) -> None:
@@ -130,35 +163,28 @@ class GKEClient:
         except Exception as e:
             raise GKEClientError(f"Failed to initialize GKE client: {e}")
     
-    def _setup_kubernetes_client(self, cluster_name: str, location: str) -> None:
-        """Setup Kubernetes client for cluster operations"""
+    def _setup_kubernetes_client(self, cluster_name: str, location: str) -> Any:
+        """Get the pooled Kubernetes client for cluster operations"""
         if not client:
             raise GKEClientError("Kubernetes client library not installed. Run: pip install kubernetes")
         
         try:
-            # Get cluster credentials
-            cluster_info = self.get_cluster_info(cluster_name, location)
-            
-            # Configure Kubernetes client
-            configuration = client.Configuration()
-            configuration.host = f"https://{cluster_info.endpoint}"
-            
-            # Set up authentication
-            if self._credentials:
-                # Refresh credentials if needed
-                request = google.auth.transport.requests.Request()
-                self._credentials.refresh(request)
-                configuration.api_key_prefix['authorization'] = 'Bearer'
-                configuration.api_key['authorization'] = self._credentials.token
-            
-            # Create API client
-            self._k8s_client = client.ApiClient(configuration)
-            
-            logger.info(f"Kubernetes client configured for cluster: {cluster_name}")
+            # Reuses the cluster's client; credentials refresh only near token expiry
+            self._k8s_client = self._client_pool.get_client(cluster_name, location)
+            return self._k8s_client
             
         except Exception as e:
             raise GKEClientError(f"Failed to setup Kubernetes client: {e}")
     
+    def get_client_pool_stats(self) -> Dict[str, Any]:
+        """Get Kubernetes client pool statistics"""
+        return self._client_pool.get_stats()
+    
+    def close(self) -> None:
+        """Close pooled Kubernetes clients"""
+        self._client_pool.close()
+        self._k8s_client = None
+    
     async def create_autopilot_cluster(self, cluster_config: ClusterConfig) -> ClusterInfo:
         """
         Create a new GKE Autopilot cluster.
@@ -263,38 +289,36 @@ class GKEClient:
         return cluster_spec
     
     async def _wait_for_operation(self, operation, cluster_name: str, location: str, timeout_minutes: int = 30) -> ClusterInfo:
-        """Wait for GKE operation to complete"""
+        """Wait for GKE operation to complete, polling with exponential backoff"""
         operation_name = operation.name
-        timeout = datetime.now() + timedelta(minutes=timeout_minutes)
+        op_request = container_v1.GetOperationRequest(name=operation_name)
         
         logger.info(f"Waiting for operation to complete: {operation_name}")
         
-        while datetime.now() < timeout:
-            try:
-                # Check operation status
-                op_request = container_v1.GetOperationRequest(name=operation_name)
-                current_op = self._container_client.get_operation(request=op_request)
-                
-                if current_op.status == container_v1.Operation.Status.DONE:
-                    if current_op.error:
-                        raise GKEClientError(f"Operation failed: {current_op.error}")
-                    
-                    # Operation completed successfully
-                    logger.info(f"Operation completed: {operation_name}")
-                    return self.get_cluster_info(cluster_name, location)
-                
-                elif current_op.status == container_v1.Operation.Status.ABORTING:
-                    raise GKEClientError(f"Operation aborted: {operation_name}")
-                
-                # Still running, wait and check again
-                logger.debug(f"Operation still running: {current_op.status}")
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Error checking operation status: {e}")
-                await asyncio.sleep(30)
+        def operation_done(current_op) -> bool:
+            if current_op.status == container_v1.Operation.Status.DONE:
+                if current_op.error:
+                    raise GKEClientError(f"Operation failed: {current_op.error}")
+                return True
+            elif current_op.status == container_v1.Operation.Status.ABORTING:
+                raise GKEClientError(f"Operation aborted: {operation_name}")
+            
+            logger.debug(f"Operation still running: {current_op.status}")
+            return False
         
-        raise GKEClientError(f"Operation timed out after {timeout_minutes} minutes: {operation_name}")
+        try:
+            await self.readiness.poll_until(
+                lambda: asyncio.to_thread(self._container_client.get_operation, request=op_request),
+                operation_done,
+                timeout_seconds=timeout_minutes * 60,
+                description=f"operation {operation_name}"
+            )
+        except TimeoutError:
+            raise GKEClientError(f"Operation timed out after {timeout_minutes} minutes: {operation_name}")
+        
+        # Operation completed successfully
+        logger.info(f"Operation completed: {operation_name}")
+        return self.get_cluster_info(cluster_name, location)
     
     def get_cluster_info(self, cluster_name: str, location: str) -> ClusterInfo:
         """
@@ -311,21 +335,32 @@ class GKEClient:
             cluster_path = f"projects/{self.project_id}/locations/{location}/clusters/{cluster_name}"
             cluster = self._container_client.get_cluster(name=cluster_path)
             
-            return ClusterInfo(
-                name=cluster.name,
-                location=cluster.location,
-                status=cluster.status.name,
-                node_count=cluster.current_node_count,
-                kubernetes_version=cluster.current_master_version,
-                endpoint=cluster.endpoint,
-                autopilot_enabled=cluster.autopilot.enabled if cluster.autopilot else False,
-                created_time=datetime.fromisoformat(cluster.create_time.rfc3339())
-            )
+            return self._cluster_info_from_proto(cluster)
             
         except Exception as e:
+            if NotFound is not None and isinstance(e, NotFound):
+                logger.debug(f"Cluster not found: {cluster_name}")
+                raise ClusterNotFoundError(f"Cluster {cluster_name} not found in {location}")
             logger.error(f"Failed to get cluster info for {cluster_name}: {e}")
             raise GKEClientError(f"Failed to get cluster info: {e}")
     
+    @staticmethod
+    def _cluster_info_from_proto(cluster) -> ClusterInfo:
+        """Build ClusterInfo from a container API cluster message"""
+        master_auth = getattr(cluster, 'master_auth', None)
+        
+        return ClusterInfo(
+            name=cluster.name,
+            location=cluster.location,
+            status=cluster.status.name,
+            node_count=cluster.current_node_count,
+            kubernetes_version=cluster.current_master_version,
+            endpoint=cluster.endpoint,
+            autopilot_enabled=cluster.autopilot.enabled if cluster.autopilot else False,
+            created_time=datetime.fromisoformat(cluster.create_time.rfc3339()),
+            ca_certificate=master_auth.cluster_ca_certificate if master_auth else None
+        )
+    
     def list_clusters(self, location: str = "-") -> List[ClusterInfo]:
         """
         List all clusters in the project.
@@ -342,17 +377,7 @@ class GKEClient:
             
             clusters = []
             for cluster in response.clusters:
-                cluster_info = ClusterInfo(
-                    name=cluster.name,
-                    location=cluster.location,
-                    status=cluster.status.name,
-                    node_count=cluster.current_node_count,
-                    kubernetes_version=cluster.current_master_version,
-                    endpoint=cluster.endpoint,
-                    autopilot_enabled=cluster.autopilot.enabled if cluster.autopilot else False,
-                    created_time=datetime.fromisoformat(cluster.create_time.rfc3339())
-                )
-                clusters.append(cluster_info)
+                clusters.append(self._cluster_info_from_proto(cluster))
             
             logger.info(f"Found {len(clusters)} clusters in {location}")
             return clusters
@@ -380,6 +405,7 @@ class GKEClient:
             
             # Wait for deletion to complete
             await self._wait_for_operation(operation, cluster_name, location)
+            self._client_pool.invalidate(cluster_name, location)
             
             logger.info(f"Cluster deleted successfully: {cluster_name}")
             return True
@@ -388,14 +414,19 @@ class GKEClient:
             logger.error(f"Failed to delete cluster {cluster_name}: {e}")
             raise GKEClientError(f"Cluster deletion failed: {e}")
     
-    def deploy_application(self, app_config: AppConfig, cluster_name: str, location: str) -> DeploymentResult:
+    def deploy_application(self, app_config: AppConfig, cluster_name: str, location: str,
+                           namespace: str = "default") -> DeploymentResult:
         """
         Deploy application to GKE cluster.
         
+        Manifests are rendered by the TemplateEngine, exactly as the
+        ApplicationDeployer renders them, and server-side applied.
+        
         Args:
             app_config: Application configuration
             cluster_name: Target cluster name
             location: Cluster location
+            namespace: Kubernetes namespace
             
         Returns:
             DeploymentResult: Deployment result information
@@ -403,16 +434,20 @@ class GKEClient:
         logger.info(f"Deploying application {app_config.name} to cluster {cluster_name}")
         
         try:
-            # Setup Kubernetes client for the cluster
-            self._setup_kubernetes_client(cluster_name, location)
-            
             # Generate Kubernetes manifests
-            manifests = self._generate_kubernetes_manifests(app_config)
+            if self._template_engine is None:
+                self._template_engine = TemplateEngine()
+            context = TemplateContext(app_config=app_config, project_id=self.project_id, namespace=namespace)
+            manifests = [
+                self._template_engine.optimize_for_autopilot(manifest)
+                for manifest in self._template_engine.generate_manifests(context)
+            ]
             
             # Apply manifests to cluster
-            deployment_result = self._apply_manifests(manifests, app_config, cluster_name)
+            deployment_result = self._apply_manifests(manifests, app_config, cluster_name, location, namespace)
             
-            logger.info(f"Application deployed successfully: {app_config.name}")
+            if deployment_result.success:
+                logger.info(f"Application deployed successfully: {app_config.name}")
             return deployment_result
             
         except Exception as e:
@@ -424,94 +459,89 @@ class GKEClient:
                 error_message=str(e)
             )
     
-    def _generate_kubernetes_manifests(self, app_config: AppConfig) -> List[Dict[str, Any]]:
-        """Generate Kubernetes manifests for application"""
-        manifests = []
-        
-        # Deployment manifest
-        deployment = {
-            "apiVersion": "apps/v1",
-            "kind": "Deployment",
-            "metadata": {
-                "name": app_config.name,
-                "labels": {"app": app_config.name, **app_config.labels}
-            },
-            "spec": {
-                "replicas": app_config.scaling_config.min_replicas,
-                "selector": {"matchLabels": {"app": app_config.name}},
-                "template": {
-                    "metadata": {"labels": {"app": app_config.name}},
-                    "spec": {
-                        "containers": [{
-                            "name": app_config.name,
-                            "image": app_config.image,
-                            "ports": [{"containerPort": app_config.port}],
-                            "resources": {
-                                "requests": app_config.resource_requests.to_dict()
-                            },
-                            "readinessProbe": app_config.health_checks.to_kubernetes_probe(),
-                            "livenessProbe": app_config.health_checks.to_kubernetes_probe()
-                        }]
-                    }
-                }
-            }
-        }
+    def apply_manifests(self, manifests: List[Dict[str, Any]], app_config: AppConfig,
+                        cluster_name: str, location: str, namespace: str = "default") -> DeploymentResult:
+        """
+        Apply pre-rendered manifests to a GKE cluster.
         
-        # Add environment variables
-        if app_config.environment_variables:
-            env_vars = [{"name": k, "value": v} for k, v in app_config.environment_variables.items()]
-            deployment["spec"]["template"]["spec"]["containers"][0]["env"] = env_vars
+        Args:
+            manifests: Kubernetes manifests to apply (may be a changed subset)
+            app_config: Application configuration
+            cluster_name: Target cluster name
+            location: Cluster location
+            namespace: Namespace for objects that do not set one
+            
+        Returns:
+            DeploymentResult: Deployment result information
+        """
+        logger.info(f"Applying {len(manifests)} manifests for {app_config.name} to cluster {cluster_name}")
         
-        manifests.append(deployment)
+        try:
+            return self._apply_manifests(manifests, app_config, cluster_name, location, namespace)
+            
+        except Exception as e:
+            logger.error(f"Failed to apply manifests for {app_config.name}: {e}")
+            return DeploymentResult(
+                success=False,
+                cluster_name=cluster_name,
+                phase=DeploymentPhase.FAILED,
+                error_message=str(e)
+            )
+    
+    def get_live_annotations(self, manifests: Dict[str, Dict[str, Any]], annotation: str,
+                             cluster_name: str, location: str,
+                             namespace: str = "default") -> Optional[Dict[str, Optional[str]]]:
+        """
+        Read one annotation from the live version of each object.
         
-        # Service manifest
-        service = {
-            "apiVersion": "v1",
-            "kind": "Service",
-            "metadata": {
-                "name": app_config.name,
-                "labels": {"app": app_config.name}
-            },
-            "spec": {
-                "selector": {"app": app_config.name},
-                "ports": [{
-                    "port": 80,
-                    "targetPort": app_config.port,
-                    "protocol": "TCP"
-                }],
-                "type": "ClusterIP"
-            }
-        }
-        manifests.append(service)
-        
-        # HPA manifest
-        if app_config.scaling_config.max_replicas > app_config.scaling_config.min_replicas:
-            hpa = {
-                "apiVersion": "autoscaling/v2",
-                "kind": "HorizontalPodAutoscaler",
-                "metadata": {"name": f"{app_config.name}-hpa"},
-                "spec": app_config.scaling_config.to_hpa_spec()
-            }
-            hpa["spec"]["scaleTargetRef"] = {
-                "apiVersion": "apps/v1",
-                "kind": "Deployment",
-                "name": app_config.name
-            }
-            manifests.append(hpa)
+        Args:
+            manifests: Manifests keyed by caller-chosen object key
+            annotation: Annotation name to read
+            cluster_name: Cluster name
+            location: Cluster location
+            namespace: Namespace for objects that do not set one
+            
+        Returns:
+            Object key -> annotation value (None if the object or annotation
+            is missing), or None when live state cannot be read
+        """
+        if not dynamic:
+            return None
         
-        # Ingress manifest
-        if app_config.ingress_config.enabled:
-            ingress = app_config.ingress_config.to_kubernetes_ingress(app_config.name, 80)
-            if ingress:
-                manifests.append(ingress)
+        try:
+            dynamic_client = dynamic.DynamicClient(self._setup_kubernetes_client(cluster_name, location))
+        except Exception as e:
+            logger.warning(f"Live state unavailable for {cluster_name}: {e}")
+            return None
         
-        return manifests
-    
-    def _apply_manifests(self, manifests: List[Dict[str, Any]], app_config: AppConfig, cluster_name: str) -> DeploymentResult:
-        """Apply Kubernetes manifests to cluster"""
+        live: Dict[str, Optional[str]] = {}
+        for key, manifest in manifests.items():
+            metadata = manifest.get('metadata', {})
+            try:
+                resource = dynamic_client.resources.get(api_version=manifest['apiVersion'], kind=manifest['kind'])
+                if resource.namespaced:
+                    obj = resource.get(name=metadata['name'], namespace=metadata.get('namespace') or namespace)
+                else:
+                    obj = resource.get(name=metadata['name'])
+                annotations = obj.to_dict().get('metadata', {}).get('annotations') or {}
+                live[key] = annotations.get(annotation)
+            except ApiException as e:
+                if getattr(e, 'status', None) == 404:
+                    live[key] = None
+                    continue
+                logger.warning(f"Failed to read live object {key}: {e}")
+                return None
+            except Exception as e:
+                logger.warning(f"Failed to read live object {key}: {e}")
+                return None
         
-        # For now, return a mock successful deployment
-        # In a real implementation, this would use the Kubernetes API to apply manifests
+        return live
+    
+    def _apply_manifests(self, manifests: List[Dict[str, Any]], app_config: AppConfig, cluster_name: str,
+                         location: str, namespace: str = "default") -> DeploymentResult:
+        """Server-side apply manifests and report per-object results"""
+        api_client = self._setup_kubernetes_client(cluster_name, location)
+        report = self.applier.apply(api_client, manifests, namespace)
         
         application_url = None
         if app_config.ingress_config.enabled and app_config.ingress_config.domain:
@@ -519,11 +549,13 @@ class GKEClient:
             application_url = f"{protocol}://{app_config.ingress_config.domain}"
         
         return DeploymentResult(
-            success=True,
+            success=report.success,
             cluster_name=cluster_name,
             application_url=application_url,
-            phase=DeploymentPhase.READY,
-            monitoring_dashboard=f"https://console.cloud.google.com/kubernetes/workload/overview?project={self.project_id}"
+            phase=DeploymentPhase.READY if report.success else DeploymentPhase.FAILED,
+            monitoring_dashboard=f"https://console.cloud.google.com/kubernetes/workload/overview?project={self.project_id}",
+            error_message=report.error_summary(),
+            object_results=[result.to_dict() for result in report.objects]
         )
     
     def get_deployment_status(self, app_name: str, cluster_name: str, location: str) -> Dict[str, Any]:
@@ -634,6 +666,9 @@ class GKEClient:
         try:
             cluster_info = self.get_cluster_info(cluster_name, location)
             
+            # Fresh cluster info keeps the pooled endpoint/CA current
+            self._client_pool.remember_cluster(cluster_info, location)
+            
             return {
                 "cluster": cluster_name,
                 "status": cluster_info.status,
@@ -0,0 +1,257 @@
+"""
+Container Registry Client for GKE Autopilot Deployment Framework
+
+This module parses container image references and resolves them against an
+OCI / Docker Registry HTTP API v2 endpoint, so image existence and digests can
+be verified before deployment. Any registry, including a local one, can be
+targeted by overriding its base URL.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+
+DOCKER_HUB = "docker.io"
+
+_DOCKER_HUB_API = "registry-1.docker.io"
+
+MANIFEST_MEDIA_TYPES = (
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+)
+
+_BEARER_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+
+class RegistryError(Exception):
+    """Raised when a registry cannot be queried (network, auth, server errors)"""
+    pass
+
+
+class ImageNotFoundError(RegistryError):
+    """Raised when the registry reports that a manifest does not exist"""
+    pass
+
+
+@dataclass(frozen=True)
+class ImageReference:
+    """Parsed container image reference"""
+    registry: str
+    repository: str
+    tag: Optional[str] = None
+    digest: Optional[str] = None
+
+    @property
+    def reference(self) -> str:
+        """Digest if pinned, otherwise the tag (defaulting to latest)"""
+        return self.digest or self.tag or "latest"
+
+    @property
+    def cache_key(self) -> str:
+        """Canonical key: digests are immutable, tags are not"""
+        separator = '@' if self.digest else ':'
+        return f"{self.registry}/{self.repository}{separator}{self.reference}"
+
+    def with_digest(self, digest: str) -> 'ImageReference':
+        return ImageReference(self.registry, self.repository, digest=digest)
+
+
+def parse_image_reference(image: str) -> ImageReference:
+    """
+    Parse an image reference such as ``nginx:1.25``, ``gcr.io/p/app@sha256:...``
+    or ``localhost:5000/team/app:dev``.
+
+    Raises:
+        ValueError: If the reference is empty or malformed
+    """
+    if not image or any(char.isspace() for char in image):
+        raise ValueError(f"Invalid image reference: {image!r}")
+
+    name, digest = image, None
+    if '@' in name:
+        name, digest = name.split('@', 1)
+
+    tag = None
+    last_slash = name.rfind('/')
+    last_colon = name.rfind(':')
+    if last_colon > last_slash:
+        name, tag = name[:last_colon], name[last_colon + 1:]
+
+    parts = name.split('/', 1)
+    if len(parts) == 2 and ('.' in parts[0] or ':' in parts[0] or parts[0] == 'localhost'):
+        registry, repository = parts
+    else:
+        registry, repository = DOCKER_HUB, name
+
+    if registry == DOCKER_HUB and '/' not in repository:
+        repository = f"library/{repository}"
+
+    if not repository or (tag is not None and not tag) or (digest is not None and ':' not in digest):
+        raise ValueError(f"Invalid image reference: {image!r}")
+
+    return ImageReference(registry=registry, repository=repository, tag=tag, digest=digest)
+
+
+@dataclass
+class ImageManifest:
+    """Manifest metadata returned by a registry"""
+    reference: ImageReference
+    digest: Optional[str]
+    media_type: Optional[str] = None
+    size: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            'image': self.reference.cache_key,
+            'digest': self.digest,
+            'media_type': self.media_type,
+            'size': self.size
+        }
+
+
+class RegistryClient:
+    """
+    Interface for manifest lookups.
+
+    Implementations return ImageManifest, raise ImageNotFoundError for a
+    missing manifest and RegistryError when the registry cannot answer.
+    """
+
+    async def get_manifest(self, reference: ImageReference) -> ImageManifest:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class HTTPRegistryClient(RegistryClient):
+    """
+    Registry HTTP API v2 client.
+
+    Issues ``HEAD /v2/<repository>/manifests/<reference>`` and follows the
+    anonymous bearer-token challenge used by Docker Hub and most public
+    registries. Registries can be redirected (e.g. to a local mirror) with
+    ``registry_urls``; ``localhost`` registries default to plain HTTP.
+    """
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 registry_urls: Optional[Dict[str, str]] = None,
+                 token_provider: Optional[Callable[[str], Optional[str]]] = None,
+                 timeout_seconds: float = 10.0):
+        """
+        Initialize registry client.
+
+        Args:
+            session: Shared aiohttp session (created lazily when omitted)
+            registry_urls: Base URL per registry host, e.g. {"gcr.io": "http://localhost:5000"}
+            token_provider: Callable returning a bearer token for a registry host
+            timeout_seconds: Per-request timeout
+        """
+        self._session = session
+        self._owns_session = session is None
+        self.registry_urls = dict(registry_urls or {})
+        self.token_provider = token_provider
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._tokens: Dict[Tuple[str, str], str] = {}
+
+    def base_url(self, registry: str) -> str:
+        if registry in self.registry_urls:
+            return self.registry_urls[registry].rstrip('/')
+        if registry == DOCKER_HUB:
+            return f"https://{_DOCKER_HUB_API}"
+        host = registry.split(':', 1)[0]
+        scheme = "http" if host in ('localhost', '127.0.0.1') else "https"
+        return f"{scheme}://{registry}"
+
+    async def get_manifest(self, reference: ImageReference) -> ImageManifest:
+        url = f"{self.base_url(reference.registry)}/v2/{reference.repository}/manifests/{reference.reference}"
+        headers = {'Accept': ', '.join(MANIFEST_MEDIA_TYPES)}
+
+        token = self._initial_token(reference)
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+
+        try:
+            session = self._get_session()
+            async with session.head(url, headers=headers, timeout=self.timeout) as response:
+                if response.status == 401:
+                    # No token yet, or the cached one expired: drop it and answer the challenge once
+                    self._tokens.pop((reference.registry, reference.repository), None)
+                    challenge_token = await self._fetch_challenge_token(
+                        response.headers.get('WWW-Authenticate', ''), reference
+                    )
+                    if challenge_token and challenge_token != token:
+                        headers['Authorization'] = f"Bearer {challenge_token}"
+                        async with session.head(url, headers=headers, timeout=self.timeout) as retry:
+                            return self._manifest_from_response(retry, reference)
+                return self._manifest_from_response(response, reference)
+
+        except RegistryError:
+            raise
+        except (aiohttp.ClientError, TimeoutError) as e:
+            raise RegistryError(f"Registry request failed for {reference.cache_key}: {e}")
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    def _initial_token(self, reference: ImageReference) -> Optional[str]:
+        if self.token_provider:
+            token = self.token_provider(reference.registry)
+            if token:
+                return token
+        return self._tokens.get((reference.registry, reference.repository))
+
+    async def _fetch_challenge_token(self, challenge: str, reference: ImageReference) -> Optional[str]:
+        """Obtain an anonymous pull token from a ``Bearer realm=...`` challenge"""
+        if not challenge.lower().startswith('bearer '):
+            return None
+
+        params = dict(_BEARER_PARAM.findall(challenge))
+        realm = params.pop('realm', None)
+        if not realm:
+            return None
+        params.setdefault('scope', f"repository:{reference.repository}:pull")
+
+        async with self._get_session().get(realm, params=params, timeout=self.timeout) as response:
+            if response.status != 200:
+                raise RegistryError(f"Registry token request failed with HTTP {response.status}")
+            payload = await response.json(content_type=None)
+
+        token = payload.get('token') or payload.get('access_token')
+        if token:
+            self._tokens[(reference.registry, reference.repository)] = token
+        return token
+
+    @staticmethod
+    def _manifest_from_response(response: aiohttp.ClientResponse, reference: ImageReference) -> ImageManifest:
+        if response.status == 404:
+            raise ImageNotFoundError(f"Image not found: {reference.cache_key}")
+        if response.status in (401, 403):
+            raise RegistryError(f"Access denied to {reference.cache_key} (HTTP {response.status})")
+        if response.status != 200:
+            raise RegistryError(f"Registry returned HTTP {response.status} for {reference.cache_key}")
+
+        length = response.headers.get('Content-Length')
+        return ImageManifest(
+            reference=reference,
+            digest=response.headers.get('Docker-Content-Digest') or reference.digest,
+            media_type=response.headers.get('Content-Type'),
+            size=int(length) if length and length.isdigit() else None
+        )
@@ -0,0 +1,131 @@
+"""
+Kubernetes Resource Quantities for GKE Autopilot Deployment Framework
+
+This module parses Kubernetes quantity strings ("250m", "1.5", "512Mi", "2G",
+"1e3") into base units with memoization, so validation, templating and
+capacity planning share one parser instead of ad hoc suffix handling.
+
+Decimal suffixes follow Kubernetes and mean powers of ten: "256M" is
+256,000,000 bytes (244 MiB) and "10G" is 10,000,000,000 bytes (9 GiB when
+rounded down), not 256Mi or 10Gi. Use the binary suffixes for exact MiB/GiB.
+"""
+
+import math
+import re
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Optional, Union
+
+
+# Binary (power of two) and decimal (power of ten) suffixes, plus the
+# upper-case "K" this framework has always accepted for kilobytes
+_SUFFIX_MULTIPLIERS = {
+    'Ki': Decimal(2) ** 10,
+    'Mi': Decimal(2) ** 20,
+    'Gi': Decimal(2) ** 30,
+    'Ti': Decimal(2) ** 40,
+    'Pi': Decimal(2) ** 50,
+    'Ei': Decimal(2) ** 60,
+    'n': Decimal('1e-9'),
+    'u': Decimal('1e-6'),
+    'm': Decimal('1e-3'),
+    '': Decimal(1),
+    'k': Decimal('1e3'),
+    'K': Decimal('1e3'),
+    'M': Decimal('1e6'),
+    'G': Decimal('1e9'),
+    'T': Decimal('1e12'),
+    'P': Decimal('1e15'),
+    'E': Decimal('1e18'),
+}
+
+_QUANTITY_PATTERN = re.compile(
+    r'^\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(Ki|Mi|Gi|Ti|Pi|Ei|n|u|m|k|K|M|G|T|P|E)?\s*$'
+)
+
+MIB = 2 ** 20
+GIB = 2 ** 30
+
+# GKE Autopilot general-purpose minimum pod resources
+AUTOPILOT_MIN_CPU_MILLICORES = 250
+AUTOPILOT_MIN_MEMORY_BYTES = 512 * MIB
+
+Quantity = Union[str, int, float, None]
+
+
+@lru_cache(maxsize=4096)
+def _parse_quantity_str(value: str) -> Optional[Decimal]:
+    match = _QUANTITY_PATTERN.match(value)
+    if not match:
+        return None
+
+    number, suffix = match.groups()
+    try:
+        return Decimal(number) * _SUFFIX_MULTIPLIERS[suffix or '']
+    except InvalidOperation:
+        return None
+
+
+def parse_quantity(value: Quantity) -> Optional[Decimal]:
+    """
+    Parse a Kubernetes quantity into base units (cores or bytes).
+
+    Returns:
+        Decimal value, or None if the quantity is malformed
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if not isinstance(value, str):
+        return None
+    return _parse_quantity_str(value)
+
+
+def cpu_to_millicores(value: Quantity) -> Optional[int]:
+    """Parse a CPU quantity into millicores, rounding up fractional millicores"""
+    cores = parse_quantity(value)
+    if cores is None:
+        return None
+    return int(math.ceil(cores * 1000))
+
+
+def memory_to_bytes(value: Quantity) -> Optional[int]:
+    """Parse a memory or storage quantity into bytes"""
+    amount = parse_quantity(value)
+    if amount is None:
+        return None
+    return int(math.ceil(amount))
+
+
+def memory_to_mib(value: Quantity) -> Optional[int]:
+    """Parse a memory quantity into whole MiB (rounded down, so "512M" is 488)"""
+    amount = memory_to_bytes(value)
+    return None if amount is None else amount // MIB
+
+
+def storage_to_gib(value: Quantity) -> Optional[int]:
+    """Parse a storage quantity into whole GiB (rounded down, so "10G" is 9)"""
+    amount = memory_to_bytes(value)
+    return None if amount is None else amount // GIB
+
+
+def format_cpu(millicores: int) -> str:
+    """Format millicores the way Kubernetes prints them ("250m", "2")"""
+    millicores = int(millicores)
+    return str(millicores // 1000) if millicores % 1000 == 0 else f"{millicores}m"
+
+
+def format_memory(amount_bytes: int) -> str:
+    """Format bytes using the largest exact binary suffix ("512Mi", "2Gi")"""
+    amount_bytes = int(amount_bytes)
+    for suffix in ('Ei', 'Pi', 'Ti', 'Gi', 'Mi', 'Ki'):
+        multiplier = int(_SUFFIX_MULTIPLIERS[suffix])
+        if amount_bytes and amount_bytes % multiplier == 0:
+            return f"{amount_bytes // multiplier}{suffix}"
+    return str(amount_bytes)
+
+
+def cache_info():
+    """Memoization statistics of the quantity parser"""
+    return _parse_quantity_str.cache_info()
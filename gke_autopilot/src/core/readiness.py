@@ -0,0 +1,341 @@
+"""
+Readiness Engine for GKE Autopilot Deployment Framework
+
+This module provides event-driven readiness tracking for Kubernetes workloads
+using watch streams with resourceVersion resume, plus exponential-backoff
+polling for GKE API operations that cannot be watched.
+"""
+
+import asyncio
+import inspect
+import logging
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+# Kubernetes imports
+try:
+    from kubernetes import client, watch
+    from kubernetes.client.rest import ApiException
+except ImportError:
+    client = None
+    watch = None
+    ApiException = Exception
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackoffPolicy:
+    """Exponential backoff schedule with jitter"""
+    initial_seconds: float = 1.0
+    max_seconds: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+
+    def delays(self) -> Iterator[float]:
+        """Yield successive delays, capped at max_seconds"""
+        delay = self.initial_seconds
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))
+            delay = min(self.max_seconds, delay * self.multiplier)
+
+
+@dataclass
+class DeploymentReadiness:
+    """Rollout state of a Deployment as seen in a watch event"""
+    name: str
+    namespace: str
+    desired_replicas: int
+    ready_replicas: int
+    updated_replicas: int
+    available_replicas: int
+    generation: int
+    observed_generation: int
+    resource_version: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        """Same criteria as `kubectl rollout status`"""
+        return (
+            self.observed_generation >= self.generation
+            and self.updated_replicas >= self.desired_replicas
+            and self.available_replicas >= self.desired_replicas
+            and self.ready_replicas >= self.desired_replicas
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'application': self.name,
+            'namespace': self.namespace,
+            'status': 'Running' if self.ready else 'Progressing',
+            'replicas': {
+                'ready': self.ready_replicas,
+                'total': self.desired_replicas,
+                'updated': self.updated_replicas,
+                'available': self.available_replicas
+            },
+            'health': 'Healthy' if self.ready else 'Progressing',
+            'resource_version': self.resource_version
+        }
+
+
+def deployment_readiness(deployment: Dict[str, Any]) -> DeploymentReadiness:
+    """Build DeploymentReadiness from a serialized Deployment object"""
+    metadata = deployment.get('metadata') or {}
+    spec = deployment.get('spec') or {}
+    status = deployment.get('status') or {}
+
+    replicas = spec.get('replicas')
+    return DeploymentReadiness(
+        name=metadata.get('name', ''),
+        namespace=metadata.get('namespace', 'default'),
+        desired_replicas=1 if replicas is None else replicas,
+        ready_replicas=status.get('readyReplicas') or 0,
+        updated_replicas=status.get('updatedReplicas') or 0,
+        available_replicas=status.get('availableReplicas') or 0,
+        generation=metadata.get('generation') or 0,
+        observed_generation=status.get('observedGeneration') or 0,
+        resource_version=metadata.get('resourceVersion')
+    )
+
+
+_WATCH_DONE = object()
+
+
+class _WatchFailed:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class ReadinessEngine:
+    """
+    Event-driven readiness tracking shared by deployer, cluster manager and CLI.
+
+    Deployments are tracked with Kubernetes watch streams: an initial list
+    provides the current state and resourceVersion, and each watch resumes
+    from the last seen resourceVersion (relisting on 410 Gone), so readiness
+    is reported as soon as the API server emits it. GKE operations, which
+    have no watch API, are polled with exponential backoff.
+    """
+
+    def __init__(self, api_client_provider: Optional[Callable[[str, str], Any]] = None,
+                 backoff: Optional[BackoffPolicy] = None,
+                 watch_timeout_seconds: int = 60):
+        """
+        Initialize readiness engine.
+
+        Args:
+            api_client_provider: Callable returning a Kubernetes ApiClient for (cluster, location)
+            backoff: Backoff policy for polled operations
+            watch_timeout_seconds: Server-side timeout per watch request before resuming
+        """
+        self.api_client_provider = api_client_provider
+        self.backoff = backoff or BackoffPolicy()
+        self.watch_timeout_seconds = watch_timeout_seconds
+
+    async def wait_for_deployment_ready(self, name: str, namespace: str, cluster_name: str,
+                                        location: str, timeout_seconds: float = 600) -> DeploymentReadiness:
+        """
+        Wait until a Deployment's rollout is complete.
+
+        Args:
+            name: Deployment name
+            namespace: Kubernetes namespace
+            cluster_name: Cluster name
+            location: Cluster location
+            timeout_seconds: Maximum time to wait
+
+        Returns:
+            DeploymentReadiness: The first ready state observed
+        """
+        stream = self.watch_deployment(name, namespace, cluster_name, location)
+
+        async def _first_ready() -> DeploymentReadiness:
+            async for readiness in stream:
+                if readiness is not None and readiness.ready:
+                    return readiness
+            raise RuntimeError(f"Watch for deployment {name} ended unexpectedly")
+
+        try:
+            readiness = await asyncio.wait_for(_first_ready(), timeout_seconds)
+            logger.info(f"Deployment {name} is ready")
+            return readiness
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Deployment {name} did not become ready within {timeout_seconds:.0f} seconds")
+        finally:
+            await stream.aclose()
+
+    async def watch_deployment(self, name: str, namespace: str, cluster_name: str,
+                               location: str) -> AsyncIterator[Optional[DeploymentReadiness]]:
+        """
+        Stream Deployment readiness changes.
+
+        Yields the current state first, then one item per watch event; None
+        means the Deployment does not exist (or was deleted).
+        """
+        if not client or not self.api_client_provider:
+            raise RuntimeError("Kubernetes client library not installed. Run: pip install kubernetes")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def emit(item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                stop.set()  # Event loop closed; consumer is gone
+
+        def run() -> None:
+            try:
+                self._watch_deployment_sync(name, namespace, cluster_name, location, emit, stop)
+            except Exception as e:
+                emit(_WatchFailed(e))
+            finally:
+                emit(_WATCH_DONE)
+
+        # Daemon thread: a blocked watch read must never hold up shutdown
+        threading.Thread(target=run, name=f"watch-{name}", daemon=True).start()
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is _WATCH_DONE:
+                    return
+                if isinstance(item, _WatchFailed):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+
+    def _watch_deployment_sync(self, name: str, namespace: str, cluster_name: str, location: str,
+                               emit: Callable[[Any], None], stop: threading.Event) -> None:
+        """List-then-watch loop run in a worker thread"""
+        api_client = self.api_client_provider(cluster_name, location)
+        apps_api = client.AppsV1Api(api_client)
+        field_selector = f"metadata.name={name}"
+        resource_version = None
+
+        while not stop.is_set():
+            if resource_version is None:
+                listing = apps_api.list_namespaced_deployment(namespace, field_selector=field_selector)
+                resource_version = listing.metadata.resource_version
+                if listing.items:
+                    for item in listing.items:
+                        emit(deployment_readiness(api_client.sanitize_for_serialization(item)))
+                else:
+                    emit(None)
+
+            stream_watch = watch.Watch()
+            try:
+                for event in stream_watch.stream(apps_api.list_namespaced_deployment, namespace,
+                                                 field_selector=field_selector,
+                                                 resource_version=resource_version,
+                                                 timeout_seconds=self.watch_timeout_seconds,
+                                                 allow_watch_bookmarks=True):
+                    if stop.is_set():
+                        stream_watch.stop()
+                        break
+
+                    raw = event.get('raw_object') or {}
+                    resource_version = (raw.get('metadata') or {}).get('resourceVersion', resource_version)
+
+                    if event['type'] == 'BOOKMARK':
+                        continue
+                    if event['type'] == 'DELETED':
+                        emit(None)
+                        continue
+                    emit(deployment_readiness(raw))
+
+            except ApiException as e:
+                if getattr(e, 'status', None) == 410:
+                    # resourceVersion too old: relist and resume
+                    logger.debug(f"Watch for {name} expired, relisting")
+                    resource_version = None
+                    continue
+                raise
+
+    async def poll_until(self, fetch: Callable[[], Any], done: Callable[[Any], bool],
+                         timeout_seconds: float, description: str = "operation") -> Any:
+        """
+        Poll with exponential backoff until ``done(result)`` is true.
+
+        Errors raised by ``fetch`` are logged and retried; errors raised by
+        ``done`` are terminal and propagate immediately.
+
+        Args:
+            fetch: Callable returning the current state (may return an awaitable)
+            done: Predicate deciding whether polling is finished
+            timeout_seconds: Maximum time to wait
+            description: Label used in log and timeout messages
+
+        Returns:
+            The first result for which ``done`` returned True
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+
+        for delay in self.backoff.delays():
+            try:
+                result = fetch()
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as e:
+                logger.warning(f"Error polling {description}: {e}")
+            else:
+                if done(result):
+                    return result
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            logger.debug(f"{description} not done, next check in {min(delay, remaining):.1f}s")
+            await asyncio.sleep(min(delay, remaining))
+
+        raise TimeoutError(f"Timed out after {timeout_seconds:.0f} seconds waiting for {description}")
+
+    async def poll_changes(self, fetch: Callable[[], Any], key: Callable[[Any], Any] = lambda value: value,
+                           max_interval: Optional[float] = None,
+                           emit_unchanged: bool = False) -> AsyncIterator[Any]:
+        """
+        Poll adaptively, backing off while the value is stable.
+
+        The interval grows exponentially (capped at ``max_interval``) while
+        ``key(value)`` stays the same and drops back to the initial delay
+        whenever it changes, so transitions are seen quickly without steady
+        high-frequency polling of stable resources.
+
+        Args:
+            fetch: Callable returning the current value (may return an awaitable)
+            key: Projection used to detect changes
+            max_interval: Upper bound for the polling interval
+            emit_unchanged: Also yield values that did not change
+        """
+        policy = BackoffPolicy(
+            initial_seconds=self.backoff.initial_seconds,
+            max_seconds=max_interval or self.backoff.max_seconds,
+            multiplier=self.backoff.multiplier,
+            jitter=self.backoff.jitter
+        )
+        delays = policy.delays()
+        previous = _WATCH_DONE
+
+        while True:
+            value = fetch()
+            if inspect.isawaitable(value):
+                value = await value
+
+            current = key(value)
+            if current != previous:
+                previous = current
+                delays = policy.delays()
+                yield value
+            elif emit_unchanged:
+                yield value
+
+            await asyncio.sleep(next(delays))
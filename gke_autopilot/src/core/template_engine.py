@@ -6,19 +6,93 @@ dynamic resource optimization, and GKE Autopilot-specific best practices.
 """
 
 import logging
+import os
+import threading
 import yaml
 import json
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, Template, TemplateError
 from dataclasses import dataclass, field
 
 from ..models.app_config import AppConfig, ClusterConfig, ResourceRequests, ScalingConfig
+from .quantities import (
+    AUTOPILOT_MIN_CPU_MILLICORES,
+    AUTOPILOT_MIN_MEMORY_BYTES,
+    cpu_to_millicores,
+    format_cpu,
+    format_memory,
+    memory_to_bytes,
+    parse_quantity,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Template filters, shared by Jinja rendering and the built-in manifest builders
+
+def to_yaml(value):
+    """Convert value to YAML format"""
+    return yaml.dump(value, default_flow_style=False, indent=2)
+
+
+def to_json(value):
+    """Convert value to JSON format"""
+    return json.dumps(value, indent=2)
+
+
+def resource_to_k8s(resource_str: Union[str, int, float]) -> str:
+    """Convert resource string to Kubernetes format"""
+    # Plain numbers (e.g. cpu: 2 in YAML) become strings; valid quantities pass through
+    if isinstance(resource_str, (int, float)):
+        return str(resource_str)
+    if parse_quantity(resource_str) is not None:
+        return resource_str.strip()
+    return resource_str
+
+
+def autopilot_optimize_resources(resources: Dict[str, str]) -> Dict[str, str]:
+    """Optimize resources for GKE Autopilot"""
+    optimized = resources.copy()
+    
+    # CPU optimization
+    cpu_millicores = cpu_to_millicores(resources.get('cpu', '100m'))
+    if cpu_millicores is not None and cpu_millicores < AUTOPILOT_MIN_CPU_MILLICORES:
+        optimized['cpu'] = format_cpu(AUTOPILOT_MIN_CPU_MILLICORES)  # Minimum recommended for Autopilot
+    
+    # Memory optimization
+    memory_bytes = memory_to_bytes(resources.get('memory', '256Mi'))
+    if memory_bytes is not None and memory_bytes < AUTOPILOT_MIN_MEMORY_BYTES:
+        optimized['memory'] = format_memory(AUTOPILOT_MIN_MEMORY_BYTES)  # Minimum recommended for Autopilot
+    
+    return optimized
+
+
+def generate_labels(app_name: str, environment: str = "production") -> Dict[str, str]:
+    """Generate standard Kubernetes labels"""
+    return {
+        'app': app_name,
+        'app.kubernetes.io/name': app_name,
+        'app.kubernetes.io/instance': app_name,
+        'app.kubernetes.io/version': '1.0.0',
+        'app.kubernetes.io/component': 'application',
+        'app.kubernetes.io/part-of': app_name,
+        'app.kubernetes.io/managed-by': 'gke-autopilot-framework',
+        'environment': environment
+    }
+
+
+def generate_selector_labels(app_name: str) -> Dict[str, str]:
+    """Generate selector labels for Kubernetes resources"""
+    return {
+        'app': app_name,
+        'app.kubernetes.io/name': app_name,
+        'app.kubernetes.io/instance': app_name
+    }
+
+
 @dataclass
 class TemplateContext:
     """Context for template rendering"""
@@ -53,8 +127,8 @@ class TemplateEngine:
     - Jinja2-based template rendering
     - Dynamic resource generation based on application requirements
     - GKE Autopilot-specific optimizations and best practices
-    - Built-in templates for common deployment patterns
-    - Custom template support with validation
+    - Built-in manifest builders for common deployment patterns
+    - Custom Jinja2 template support with validation
     """
     
     def __init__(self, template_dir: Optional[Union[str, Path]] = None):
@@ -80,76 +154,31 @@ class TemplateEngine:
         # Add custom filters
         self._setup_custom_filters()
         
-        # Built-in templates
-        self._builtin_templates = self._load_builtin_templates()
+        # Built-in manifests are built straight to dicts (no YAML text round trip)
+        self._builtin_builders: Dict[str, Callable[[TemplateContext], List[Dict[str, Any]]]] = {
+            'deployment': self._build_deployment,
+            'service': self._build_service,
+            'hpa': self._build_hpa,
+            'ingress': self._build_ingress,
+            'networkpolicy': self._build_networkpolicy
+        }
+        
+        # Compiled templates keyed by name -> (source version, template)
+        self._compiled_templates: Dict[str, Tuple[Tuple[Any, ...], Template]] = {}
+        self._custom_index: Dict[str, Path] = {}
+        self._custom_index_version: Optional[Tuple[int, int]] = None
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {
+            'hits': 0,
+            'misses': 0,
+            'direct_builds': 0,
+            'template_renders': 0
+        }
         
         logger.info(f"Template engine initialized with template dir: {self.template_dir}")
     
     def _setup_custom_filters(self) -> None:
         """Setup custom Jinja2 filters for Kubernetes manifests"""
-        
-        def to_yaml(value):
-            """Convert value to YAML format"""
-            return yaml.dump(value, default_flow_style=False, indent=2)
-        
-        def to_json(value):
-            """Convert value to JSON format"""
-            return json.dumps(value, indent=2)
-        
-        def resource_to_k8s(resource_str: str) -> str:
-            """Convert resource string to Kubernetes format"""
-            # Ensure proper Kubernetes resource format
-            if resource_str.endswith('m'):  # CPU millicores
-                return resource_str
-            elif any(resource_str.endswith(suffix) for suffix in ['Mi', 'Gi', 'Ki']):  # Memory
-                return resource_str
-            elif resource_str.replace('.', '').isdigit():  # Plain number
-                return f"{resource_str}"
-            else:
-                return resource_str
-        
-        def autopilot_optimize_resources(resources: Dict[str, str]) -> Dict[str, str]:
-            """Optimize resources for GKE Autopilot"""
-            optimized = resources.copy()
-            
-            # CPU optimization
-            cpu = resources.get('cpu', '100m')
-            if cpu.endswith('m'):
-                cpu_millicores = int(cpu[:-1])
-                if cpu_millicores < 250:
-                    optimized['cpu'] = '250m'  # Minimum recommended for Autopilot
-            
-            # Memory optimization
-            memory = resources.get('memory', '256Mi')
-            if memory.endswith('Mi'):
-                memory_mb = int(memory[:-2])
-                if memory_mb < 512:
-                    optimized['memory'] = '512Mi'  # Minimum recommended for Autopilot
-            
-            return optimized
-        
-        def generate_labels(app_name: str, environment: str = "production") -> Dict[str, str]:
-            """Generate standard Kubernetes labels"""
-            return {
-                'app': app_name,
-                'app.kubernetes.io/name': app_name,
-                'app.kubernetes.io/instance': app_name,
-                'app.kubernetes.io/version': '1.0.0',
-                'app.kubernetes.io/component': 'application',
-                'app.kubernetes.io/part-of': app_name,
-                'app.kubernetes.io/managed-by': 'gke-autopilot-framework',
-                'environment': environment
-            }
-        
-        def generate_selector_labels(app_name: str) -> Dict[str, str]:
-            """Generate selector labels for Kubernetes resources"""
-            return {
-                'app': app_name,
-                'app.kubernetes.io/name': app_name,
-                'app.kubernetes.io/instance': app_name
-            }
-        
-        # Register filters
         self.jinja_env.filters['to_yaml'] = to_yaml
         self.jinja_env.filters['to_json'] = to_json
         self.jinja_env.filters['resource_to_k8s'] = resource_to_k8s
@@ -157,239 +186,14 @@ class TemplateEngine:
         self.jinja_env.filters['generate_labels'] = generate_labels
         self.jinja_env.filters['selector_labels'] = generate_selector_labels
     
-    def _load_builtin_templates(self) -> Dict[str, str]:
-        """Load built-in Kubernetes manifest templates"""
-        
-        deployment_template = """
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: {{ app.name }}
-  namespace: {{ namespace }}
-  labels: {{ app.name | generate_labels(environment) | to_yaml | indent(4) }}
-  annotations:
-    deployment.kubernetes.io/revision: "1"
-    gke-autopilot.io/managed: "true"
-spec:
-  replicas: {{ app.scaling.min_replicas }}
-  selector:
-    matchLabels: {{ app.name | selector_labels | to_yaml | indent(6) }}
-  template:
-    metadata:
-      labels: {{ app.name | generate_labels(environment) | to_yaml | indent(8) }}
-      annotations:
-        gke-autopilot.io/resource-adjustment: "true"
-    spec:
-      containers:
-      - name: {{ app.name }}
-        image: {{ app.image }}
-        ports:
-        - containerPort: {{ app.port }}
-          name: http
-          protocol: TCP
-        resources:
-          requests: {{ app.resources | autopilot_optimize | to_yaml | indent(12) }}
-          limits: {{ app.resources | autopilot_optimize | to_yaml | indent(12) }}
-        {% if app.environment_variables %}
-        env:
-        {% for key, value in app.environment_variables.items() %}
-        - name: {{ key }}
-          value: "{{ value }}"
-        {% endfor %}
-        {% endif %}
-        readinessProbe:
-          httpGet:
-            path: {{ app.healthChecks.path }}
-            port: {{ app.healthChecks.port }}
-          initialDelaySeconds: {{ app.healthChecks.initial_delay_seconds }}
-          periodSeconds: {{ app.healthChecks.period_seconds }}
-          timeoutSeconds: {{ app.healthChecks.timeout_seconds }}
-          failureThreshold: {{ app.healthChecks.failure_threshold }}
-          successThreshold: {{ app.healthChecks.success_threshold }}
-        livenessProbe:
-          httpGet:
-            path: {{ app.healthChecks.path }}
-            port: {{ app.healthChecks.port }}
-          initialDelaySeconds: {{ app.healthChecks.initial_delay_seconds + 30 }}
-          periodSeconds: {{ app.healthChecks.period_seconds }}
-          timeoutSeconds: {{ app.healthChecks.timeout_seconds }}
-          failureThreshold: {{ app.healthChecks.failure_threshold }}
-      securityContext:
-        runAsNonRoot: true
-        runAsUser: 1000
-        fsGroup: 2000
-      automountServiceAccountToken: false
-"""
-
-        service_template = """
-apiVersion: v1
-kind: Service
-metadata:
-  name: {{ app.name }}
-  namespace: {{ namespace }}
-  labels: {{ app.name | generate_labels(environment) | to_yaml | indent(4) }}
-  annotations:
-    cloud.google.com/neg: '{"ingress": true}'
-spec:
-  type: ClusterIP
-  ports:
-  - port: 80
-    targetPort: {{ app.port }}
-    protocol: TCP
-    name: http
-  selector: {{ app.name | selector_labels | to_yaml | indent(4) }}
-"""
-
-        hpa_template = """
-apiVersion: autoscaling/v2
-kind: HorizontalPodAutoscaler
-metadata:
-  name: {{ app.name }}-hpa
-  namespace: {{ namespace }}
-  labels: {{ app.name | generate_labels(environment) | to_yaml | indent(4) }}
-spec:
-  scaleTargetRef:
-    apiVersion: apps/v1
-    kind: Deployment
-    name: {{ app.name }}
-  minReplicas: {{ app.scaling.min_replicas }}
-  maxReplicas: {{ app.scaling.max_replicas }}
-  metrics:
-  - type: Resource
-    resource:
-      name: cpu
-      target:
-        type: Utilization
-        averageUtilization: {{ app.scaling.target_cpu_utilization }}
-  {% if app.scaling.target_memory_utilization %}
-  - type: Resource
-    resource:
-      name: memory
-      target:
-        type: Utilization
-        averageUtilization: {{ app.scaling.target_memory_utilization }}
-  {% endif %}
-  behavior:
-    scaleUp:
-      stabilizationWindowSeconds: {{ app.scaling.scale_up_stabilization }}
-      policies:
-      - type: Percent
-        value: 100
-        periodSeconds: 15
-    scaleDown:
-      stabilizationWindowSeconds: {{ app.scaling.scale_down_stabilization }}
-      policies:
-      - type: Percent
-        value: 10
-        periodSeconds: 60
-"""
-
-        ingress_template = """
-{% if app.ingress.enabled %}
-apiVersion: networking.k8s.io/v1
-kind: Ingress
-metadata:
-  name: {{ app.name }}-ingress
-  namespace: {{ namespace }}
-  labels: {{ app.name | generate_labels(environment) | to_yaml | indent(4) }}
-  annotations:
-    kubernetes.io/ingress.class: "gce"
-    kubernetes.io/ingress.global-static-ip-name: "{{ app.name }}-ip"
-    {% if app.ingress.tls %}
-    networking.gke.io/managed-certificates: "{{ app.name }}-cert"
-    {% endif %}
-    ingress.gcp.kubernetes.io/frontend-config: "{{ app.name }}-frontend-config"
-spec:
-  {% if app.ingress.tls and app.ingress.domain %}
-  tls:
-  - hosts:
-    - {{ app.ingress.domain }}
-    secretName: {{ app.name }}-tls
-  {% endif %}
-  rules:
-  - host: {{ app.ingress.domain }}
-    http:
-      paths:
-      - path: {{ app.ingress.path }}
-        pathType: {{ app.ingress.path_type }}
-        backend:
-          service:
-            name: {{ app.name }}
-            port:
-              number: 80
----
-{% if app.ingress.tls %}
-apiVersion: networking.gke.io/v1
-kind: ManagedCertificate
-metadata:
-  name: {{ app.name }}-cert
-  namespace: {{ namespace }}
-spec:
-  domains:
-  - {{ app.ingress.domain }}
----
-{% endif %}
-apiVersion: networking.gke.io/v1beta1
-kind: FrontendConfig
-metadata:
-  name: {{ app.name }}-frontend-config
-  namespace: {{ namespace }}
-spec:
-  redirectToHttps:
-    enabled: {{ app.ingress.tls | lower }}
-  sslPolicy: "gke-autopilot-ssl-policy"
-{% endif %}
-"""
-
-        networkpolicy_template = """
-apiVersion: networking.k8s.io/v1
-kind: NetworkPolicy
-metadata:
-  name: {{ app.name }}-netpol
-  namespace: {{ namespace }}
-  labels: {{ app.name | generate_labels(environment) | to_yaml | indent(4) }}
-spec:
-  podSelector:
-    matchLabels: {{ app.name | selector_labels | to_yaml | indent(6) }}
-  policyTypes:
-  - Ingress
-  - Egress
-  ingress:
-  - from:
-    - namespaceSelector:
-        matchLabels:
-          name: {{ namespace }}
-    - podSelector: {}
-    ports:
-    - protocol: TCP
-      port: {{ app.port }}
-  egress:
-  - to: []
-    ports:
-    - protocol: TCP
-      port: 53
-    - protocol: UDP
-      port: 53
-  - to: []
-    ports:
-    - protocol: TCP
-      port: 443
-    - protocol: TCP
-      port: 80
-"""
-
-        return {
-            'deployment': deployment_template,
-            'service': service_template,
-            'hpa': hpa_template,
-            'ingress': ingress_template,
-            'networkpolicy': networkpolicy_template
-        }
-    
     def generate_manifests(self, context: TemplateContext) -> List[Dict[str, Any]]:
         """
         Generate complete set of Kubernetes manifests for application.
         
+        Built-in manifests are built directly as dictionaries; a custom
+        template with the same name in the template directory takes
+        precedence and is rendered through Jinja2.
+        
         Args:
             context: Template rendering context
             
@@ -399,39 +203,23 @@ spec:
         logger.info(f"Generating manifests for application: {context.app_config.name}")
         
         manifests = []
-        template_context = context.to_dict()
+        template_context = None
         
         try:
-            # Generate deployment
-            deployment_yaml = self.render_template('deployment', template_context)
-            deployment_manifest = yaml.safe_load(deployment_yaml)
-            manifests.append(deployment_manifest)
-            
-            # Generate service
-            service_yaml = self.render_template('service', template_context)
-            service_manifest = yaml.safe_load(service_yaml)
-            manifests.append(service_manifest)
-            
-            # Generate HPA if scaling is configured
-            if context.app_config.scaling_config.max_replicas > context.app_config.scaling_config.min_replicas:
-                hpa_yaml = self.render_template('hpa', template_context)
-                hpa_manifest = yaml.safe_load(hpa_yaml)
-                manifests.append(hpa_manifest)
-            
-            # Generate ingress if enabled
-            if context.app_config.ingress_config.enabled:
-                ingress_yaml = self.render_template('ingress', template_context)
-                # Handle multiple documents in ingress template
-                for doc in yaml.safe_load_all(ingress_yaml):
+            for template_name in self._manifest_plan(context):
+                if template_name in self._builtin_builders and not self._custom_template_path(template_name):
+                    manifests.extend(self._builtin_builders[template_name](context))
+                    self._cache_stats['direct_builds'] += 1
+                    continue
+                
+                if template_context is None:
+                    template_context = context.to_dict()
+                rendered = self.render_template(template_name, template_context)
+                # Handle multiple documents (e.g. ingress + certificate)
+                for doc in yaml.safe_load_all(rendered):
                     if doc:  # Skip empty documents
                         manifests.append(doc)
             
-            # Generate network policy for security
-            if context.cluster_config and context.cluster_config.security_config.enable_network_policy:
-                netpol_yaml = self.render_template('networkpolicy', template_context)
-                netpol_manifest = yaml.safe_load(netpol_yaml)
-                manifests.append(netpol_manifest)
-            
             logger.info(f"Generated {len(manifests)} manifests for {context.app_config.name}")
             return manifests
             
@@ -439,9 +227,44 @@ spec:
             logger.error(f"Failed to generate manifests: {e}")
             raise TemplateError(f"Manifest generation failed: {e}")
     
+    def generate_manifests_batch(self, contexts: List[TemplateContext],
+                                 max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Generate manifests for many applications at once.
+        
+        Work is spread across a process pool whose workers each build one
+        TemplateEngine for this template directory and reuse its compiled
+        templates for every application they render.
+        
+        Args:
+            contexts: Template rendering contexts, one per application
+            max_workers: Worker process count (defaults to CPU count)
+            
+        Returns:
+            Manifest lists in the same order as the contexts
+        """
+        if not contexts:
+            return []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(contexts))
+        if workers <= 1:
+            return [self.generate_manifests(context) for context in contexts]
+        
+        logger.info(f"Generating manifests for {len(contexts)} applications with {workers} workers")
+        
+        chunksize = max(1, len(contexts) // (workers * 4))
+        template_dir = str(self.template_dir) if self.template_dir else None
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(template_dir,)) as executor:
+            return list(executor.map(_generate_in_batch_worker, contexts, chunksize=chunksize))
+    
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
-        Render a specific template with given context.
+        Render a custom template with given context.
+        
+        Built-in manifests have no template text; use generate_manifests
+        for those.
         
         Args:
             template_name: Name of template to render
@@ -451,24 +274,323 @@ spec:
             Rendered template content
         """
         try:
-            # Try to load custom template first
-            if self.template_dir:
-                template_path = self.template_dir / f"{template_name}.yaml"
-                if template_path.exists():
-                    template = self.jinja_env.get_template(f"{template_name}.yaml")
-                    return template.render(**context)
-            
-            # Fall back to built-in template
-            if template_name in self._builtin_templates:
-                template = self.jinja_env.from_string(self._builtin_templates[template_name])
-                return template.render(**context)
-            
-            raise TemplateError(f"Template not found: {template_name}")
+            template = self._get_compiled_template(template_name)
+            self._cache_stats['template_renders'] += 1
+            return template.render(**context)
             
         except Exception as e:
             logger.error(f"Failed to render template {template_name}: {e}")
             raise TemplateError(f"Template rendering failed: {e}")
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get compiled template cache statistics"""
+        lookups = self._cache_stats['hits'] + self._cache_stats['misses']
+        return {
+            **self._cache_stats,
+            'cached_templates': len(self._compiled_templates),
+            'hit_rate': self._cache_stats['hits'] / lookups if lookups else 0.0
+        }
+    
+    def clear_cache(self) -> None:
+        """Drop compiled templates and the custom template index"""
+        with self._cache_lock:
+            self._compiled_templates.clear()
+            self._custom_index.clear()
+            self._custom_index_version = None
+    
+    def _manifest_plan(self, context: TemplateContext) -> List[str]:
+        """Templates to render for an application, in apply order"""
+        plan = ['deployment', 'service']
+        
+        # Generate HPA if scaling is configured
+        if context.app_config.scaling_config.max_replicas > context.app_config.scaling_config.min_replicas:
+            plan.append('hpa')
+        
+        # Generate ingress if enabled
+        if context.app_config.ingress_config.enabled:
+            plan.append('ingress')
+        
+        # Generate network policy for security
+        if context.cluster_config and context.cluster_config.security_config.enable_network_policy:
+            plan.append('networkpolicy')
+        
+        return plan
+    
+    def _custom_template_path(self, template_name: str) -> Optional[Path]:
+        """
+        Find a custom template override.
+        
+        The directory listing is cached and rescanned only when the template
+        directory's mtime changes, so lookups cost a single stat.
+        """
+        if not self.template_dir:
+            return None
+        
+        try:
+            stat = self.template_dir.stat()
+        except OSError:
+            return None
+        
+        version = (stat.st_mtime_ns, stat.st_ino)
+        if version != self._custom_index_version:
+            with self._cache_lock:
+                self._custom_index = {path.stem: path for path in self.template_dir.glob('*.yaml')}
+                self._custom_index_version = version
+        
+        return self._custom_index.get(template_name)
+    
+    def _get_compiled_template(self, template_name: str) -> Template:
+        """Get a compiled custom template, recompiling only when its file changes"""
+        custom_path = self._custom_template_path(template_name)
+        if not custom_path:
+            raise TemplateError(f"Template not found: {template_name}")
+        
+        stat = custom_path.stat()
+        version = (str(custom_path), stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._compiled_templates.get(template_name)
+        if cached and cached[0] == version:
+            self._cache_stats['hits'] += 1
+            return cached[1]
+        
+        template = self.jinja_env.from_string(custom_path.read_text())
+        
+        with self._cache_lock:
+            self._compiled_templates[template_name] = (version, template)
+        self._cache_stats['misses'] += 1
+        return template
+    
+    def _build_deployment(self, context: TemplateContext) -> List[Dict[str, Any]]:
+        """Build the built-in Deployment manifest"""
+        app = context.app_config
+        health = app.health_checks
+        resources = autopilot_optimize_resources(app.resource_requests.to_dict())
+        
+        container = {
+            "name": app.name,
+            "image": app.image,
+            "ports": [{"containerPort": app.port, "name": "http", "protocol": "TCP"}],
+            "resources": {"requests": resources, "limits": dict(resources)}
+        }
+        
+        if app.environment_variables:
+            container["env"] = [
+                {"name": key, "value": str(value)} for key, value in app.environment_variables.items()
+            ]
+        
+        container["readinessProbe"] = {
+            "httpGet": {"path": health.path, "port": health.port},
+            "initialDelaySeconds": health.initial_delay_seconds,
+            "periodSeconds": health.period_seconds,
+            "timeoutSeconds": health.timeout_seconds,
+            "failureThreshold": health.failure_threshold,
+            "successThreshold": health.success_threshold
+        }
+        container["livenessProbe"] = {
+            "httpGet": {"path": health.path, "port": health.port},
+            "initialDelaySeconds": health.initial_delay_seconds + 30,
+            "periodSeconds": health.period_seconds,
+            "timeoutSeconds": health.timeout_seconds,
+            "failureThreshold": health.failure_threshold
+        }
+        
+        return [{
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {
+                "name": app.name,
+                "namespace": context.namespace,
+                "labels": generate_labels(app.name, context.environment),
+                "annotations": {
+                    "deployment.kubernetes.io/revision": "1",
+                    "gke-autopilot.io/managed": "true"
+                }
+            },
+            "spec": {
+                "replicas": app.scaling_config.min_replicas,
+                "selector": {"matchLabels": generate_selector_labels(app.name)},
+                "template": {
+                    "metadata": {
+                        "labels": generate_labels(app.name, context.environment),
+                        "annotations": {"gke-autopilot.io/resource-adjustment": "true"}
+                    },
+                    "spec": {
+                        "containers": [container],
+                        "securityContext": {
+                            "runAsNonRoot": True,
+                            "runAsUser": 1000,
+                            "fsGroup": 2000
+                        },
+                        "automountServiceAccountToken": False
+                    }
+                }
+            }
+        }]
+    
+    def _build_service(self, context: TemplateContext) -> List[Dict[str, Any]]:
+        """Build the built-in Service manifest"""
+        app = context.app_config
+        
+        return [{
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {
+                "name": app.name,
+                "namespace": context.namespace,
+                "labels": generate_labels(app.name, context.environment),
+                "annotations": {"cloud.google.com/neg": '{"ingress": true}'}
+            },
+            "spec": {
+                "type": "ClusterIP",
+                "ports": [{"port": 80, "targetPort": app.port, "protocol": "TCP", "name": "http"}],
+                "selector": generate_selector_labels(app.name)
+            }
+        }]
+    
+    def _build_hpa(self, context: TemplateContext) -> List[Dict[str, Any]]:
+        """Build the built-in HorizontalPodAutoscaler manifest"""
+        app = context.app_config
+        scaling = app.scaling_config
+        
+        metrics = [{
+            "type": "Resource",
+            "resource": {
+                "name": "cpu",
+                "target": {"type": "Utilization", "averageUtilization": scaling.target_cpu_utilization}
+            }
+        }]
+        if scaling.target_memory_utilization:
+            metrics.append({
+                "type": "Resource",
+                "resource": {
+                    "name": "memory",
+                    "target": {"type": "Utilization", "averageUtilization": scaling.target_memory_utilization}
+                }
+            })
+        
+        return [{
+            "apiVersion": "autoscaling/v2",
+            "kind": "HorizontalPodAutoscaler",
+            "metadata": {
+                "name": f"{app.name}-hpa",
+                "namespace": context.namespace,
+                "labels": generate_labels(app.name, context.environment)
+            },
+            "spec": {
+                "scaleTargetRef": {"apiVersion": "apps/v1", "kind": "Deployment", "name": app.name},
+                "minReplicas": scaling.min_replicas,
+                "maxReplicas": scaling.max_replicas,
+                "metrics": metrics,
+                "behavior": {
+                    "scaleUp": {
+                        "stabilizationWindowSeconds": scaling.scale_up_stabilization,
+                        "policies": [{"type": "Percent", "value": 100, "periodSeconds": 15}]
+                    },
+                    "scaleDown": {
+                        "stabilizationWindowSeconds": scaling.scale_down_stabilization,
+                        "policies": [{"type": "Percent", "value": 10, "periodSeconds": 60}]
+                    }
+                }
+            }
+        }]
+    
+    def _build_ingress(self, context: TemplateContext) -> List[Dict[str, Any]]:
+        """Build the built-in Ingress, ManagedCertificate and FrontendConfig manifests"""
+        app = context.app_config
+        ingress_config = app.ingress_config
+        if not ingress_config.enabled:
+            return []
+        
+        labels = generate_labels(app.name, context.environment)
+        annotations = {
+            "kubernetes.io/ingress.class": "gce",
+            "kubernetes.io/ingress.global-static-ip-name": f"{app.name}-ip"
+        }
+        if ingress_config.tls:
+            annotations["networking.gke.io/managed-certificates"] = f"{app.name}-cert"
+        annotations["ingress.gcp.kubernetes.io/frontend-config"] = f"{app.name}-frontend-config"
+        
+        spec: Dict[str, Any] = {}
+        if ingress_config.tls and ingress_config.domain:
+            spec["tls"] = [{"hosts": [ingress_config.domain], "secretName": f"{app.name}-tls"}]
+        spec["rules"] = [{
+            "host": ingress_config.domain,
+            "http": {
+                "paths": [{
+                    "path": ingress_config.path,
+                    "pathType": ingress_config.path_type,
+                    "backend": {"service": {"name": app.name, "port": {"number": 80}}}
+                }]
+            }
+        }]
+        
+        manifests = [{
+            "apiVersion": "networking.k8s.io/v1",
+            "kind": "Ingress",
+            "metadata": {
+                "name": f"{app.name}-ingress",
+                "namespace": context.namespace,
+                "labels": labels,
+                "annotations": annotations
+            },
+            "spec": spec
+        }]
+        
+        if ingress_config.tls:
+            manifests.append({
+                "apiVersion": "networking.gke.io/v1",
+                "kind": "ManagedCertificate",
+                "metadata": {"name": f"{app.name}-cert", "namespace": context.namespace},
+                "spec": {"domains": [ingress_config.domain]}
+            })
+        
+        manifests.append({
+            "apiVersion": "networking.gke.io/v1beta1",
+            "kind": "FrontendConfig",
+            "metadata": {"name": f"{app.name}-frontend-config", "namespace": context.namespace},
+            "spec": {
+                "redirectToHttps": {"enabled": bool(ingress_config.tls)},
+                "sslPolicy": "gke-autopilot-ssl-policy"
+            }
+        })
+        
+        return manifests
+    
+    def _build_networkpolicy(self, context: TemplateContext) -> List[Dict[str, Any]]:
+        """Build the built-in NetworkPolicy manifest"""
+        app = context.app_config
+        
+        return [{
+            "apiVersion": "networking.k8s.io/v1",
+            "kind": "NetworkPolicy",
+            "metadata": {
+                "name": f"{app.name}-netpol",
+                "namespace": context.namespace,
+                "labels": generate_labels(app.name, context.environment)
+            },
+            "spec": {
+                "podSelector": {"matchLabels": generate_selector_labels(app.name)},
+                "policyTypes": ["Ingress", "Egress"],
+                "ingress": [{
+                    "from": [
+                        {"namespaceSelector": {"matchLabels": {"name": context.namespace}}},
+                        {"podSelector": {}}
+                    ],
+                    "ports": [{"protocol": "TCP", "port": app.port}]
+                }],
+                "egress": [
+                    {
+                        "to": [],
+                        "ports": [{"protocol": "TCP", "port": 53}, {"protocol": "UDP", "port": 53}]
+                    },
+                    {
+                        "to": [],
+                        "ports": [{"protocol": "TCP", "port": 443}, {"protocol": "TCP", "port": 80}]
+                    }
+                ]
+            }
+        }]
+    
     def validate_manifest(self, manifest: Dict[str, Any]) -> List[str]:
         """
         Validate Kubernetes manifest for common issues.
@@ -565,15 +687,11 @@ spec:
                 resources = container.setdefault('resources', {})
                 requests = resources.setdefault('requests', {})
                 
-                # Ensure minimum CPU for Autopilot
-                cpu = requests.get('cpu', '100m')
-                if cpu.endswith('m') and int(cpu[:-1]) < 250:
-                    requests['cpu'] = '250m'
-                
-                # Ensure minimum memory for Autopilot
-                memory = requests.get('memory', '256Mi')
-                if memory.endswith('Mi') and int(memory[:-2]) < 512:
-                    requests['memory'] = '512Mi'
+                # Ensure minimum CPU and memory for Autopilot
+                requests.update(autopilot_optimize_resources({
+                    'cpu': requests.get('cpu', '100m'),
+                    'memory': requests.get('memory', '256Mi')
+                }))
                 
                 # Set limits equal to requests for Autopilot
                 resources['limits'] = requests.copy()
@@ -663,7 +781,7 @@ spec:
     
     def get_available_templates(self) -> List[str]:
         """Get list of available templates"""
-        templates = list(self._builtin_templates.keys())
+        templates = list(self._builtin_builders.keys())
         
         # Add custom templates if template directory exists
         if self.template_dir and self.template_dir.exists():
@@ -695,4 +813,19 @@ spec:
             f.write(template_content)
         
         logger.info(f"Created custom template: {template_path}")
-        return template_path
\ No newline at end of file
+        return template_path
+
+
+# Process pool workers for TemplateEngine.generate_manifests_batch
+
+_batch_engine: Optional[TemplateEngine] = None
+
+
+def _init_batch_worker(template_dir: Optional[str]) -> None:
+    """Create the per-process template engine"""
+    global _batch_engine
+    _batch_engine = TemplateEngine(template_dir)
+
+
+def _generate_in_batch_worker(context: TemplateContext) -> List[Dict[str, Any]]:
+    return _batch_engine.generate_manifests(context)
@@ -0,0 +1,246 @@
+"""
+Async TTL Cache for GKE Autopilot Deployment Framework
+
+This module provides a per-key TTL cache for asyncio code with
+stale-while-revalidate background refresh, negative caching of lookups that
+are known to fail, and coalescing of concurrent fetches for the same key.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class CacheEntry:
+    """A cached value (or cached failure) with its own expiry"""
+    value: Any
+    fetched_at: float
+    ttl: float
+    stale_ttl: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.age < self.ttl
+
+    @property
+    def is_servable(self) -> bool:
+        """Fresh, or stale but still inside the revalidation window"""
+        return self.age < self.ttl + self.stale_ttl
+
+
+class AsyncTTLCache:
+    """
+    Per-key TTL cache for coroutine loaders.
+
+    Every entry carries its own timestamp and TTL. Once an entry expires it is
+    still served for ``stale_ttl`` seconds while a single background task
+    refreshes it. Loader exceptions listed in ``negative_errors`` are cached
+    for ``negative_ttl`` seconds and re-raised to callers. Concurrent misses
+    for one key share a single in-flight fetch; only the caller that actually
+    runs the loader counts as a miss. Beyond ``max_entries`` the least
+    recently used entries are dropped.
+    """
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 60, negative_ttl: float = 30,
+                 negative_errors: Tuple[Type[Exception], ...] = (), max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Default seconds an entry is fresh
+            stale_ttl: Extra seconds an expired entry is served while refreshing
+            negative_ttl: Seconds a cached failure is remembered
+            negative_errors: Loader exception types that are cached
+            max_entries: Maximum number of entries before the least recently used are dropped
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.negative_errors = negative_errors
+        self.max_entries = max(1, max_entries)
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'background_refreshes': 0,
+            'refresh_errors': 0,
+        }
+
+    async def get(self, key: Hashable, loader: Loader, ttl: Optional[float] = None,
+                  use_cache: bool = True) -> Any:
+        """
+        Get a value, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function that fetches the value
+            ttl: Override the default TTL for this entry
+            use_cache: When False, always fetch (still coalesced with in-flight fetches)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key) if use_cache else None
+
+        if entry is not None and entry.is_servable:
+            self._entries.move_to_end(key)
+            if entry.error is not None:
+                self._stats['negative_hits'] += 1
+                raise entry.error
+
+            if entry.is_fresh:
+                self._stats['hits'] += 1
+            else:
+                self._stats['stale_hits'] += 1
+                self._schedule_refresh(key, loader, ttl)
+            return entry.value
+
+        return await self._fetch(key, loader, ttl, count_lookup=True)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return a servable cached value without loading or counting a lookup"""
+        entry = self._entries.get(key)
+        if entry is None or entry.error is not None or not entry.is_servable:
+            return None
+        return entry.value
+
+    def keys(self) -> List[Hashable]:
+        """Keys with a servable cached value"""
+        return [key for key in list(self._entries) if self.peek(key) is not None]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value fetched elsewhere (replaces any cached failure)"""
+        self._entries[key] = CacheEntry(
+            value=value,
+            fetched_at=time.monotonic(),
+            ttl=self.ttl if ttl is None else ttl,
+            stale_ttl=self.stale_ttl
+        )
+        self._entries.move_to_end(key)
+        self._enforce_capacity()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches the predicate"""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and cancel background refreshes"""
+        self._entries.clear()
+        for task in list(self._refresh_tasks):
+            task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit rate and staleness statistics"""
+        lookups = (self._stats['hits'] + self._stats['stale_hits'] + self._stats['negative_hits']
+                   + self._stats['coalesced'] + self._stats['misses'])
+        ages = [entry.age for entry in self._entries.values() if entry.error is None]
+
+        return {
+            **self._stats,
+            'entries': len(self._entries),
+            'negative_entries': sum(1 for entry in self._entries.values() if entry.error is not None),
+            'stale_entries': sum(1 for entry in self._entries.values() if not entry.is_fresh),
+            'inflight_fetches': len(self._inflight),
+            'hit_rate': (lookups - self._stats['misses']) / lookups if lookups else 0.0,
+            'stale_rate': self._stats['stale_hits'] / lookups if lookups else 0.0,
+            'max_age_seconds': max(ages) if ages else None,
+            'mean_age_seconds': sum(ages) / len(ages) if ages else None,
+            'ttl_seconds': self.ttl,
+            'stale_ttl_seconds': self.stale_ttl,
+            'negative_ttl_seconds': self.negative_ttl,
+        }
+
+    async def _fetch(self, key: Hashable, loader: Loader, ttl: Optional[float],
+                     count_lookup: bool = False) -> Any:
+        """Run the loader once per key, sharing the result with concurrent callers"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            if count_lookup:
+                self._stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        if count_lookup:
+            self._stats['misses'] += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if isinstance(e, self.negative_errors):
+                self._entries[key] = CacheEntry(
+                    value=None,
+                    fetched_at=time.monotonic(),
+                    ttl=self.negative_ttl,
+                    error=e
+                )
+                self._entries.move_to_end(key)
+                self._enforce_capacity()
+            future.set_exception(e)
+            # Waiters retrieve the exception; avoid "never retrieved" warnings
+            future.exception()
+            raise
+        else:
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _schedule_refresh(self, key: Hashable, loader: Loader, ttl: Optional[float]) -> None:
+        if key in self._inflight:
+            return
+
+        self._stats['background_refreshes'] += 1
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader, ttl))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, key: Hashable, loader: Loader, ttl: Optional[float]) -> None:
+        try:
+            await self._fetch(key, loader, ttl)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Keep serving the stale value until the window closes
+            self._stats['refresh_errors'] += 1
+            logger.warning(f"Background refresh failed for {key}: {e}")
+
+    def _enforce_capacity(self) -> None:
+        """Drop the least recently used entries beyond max_entries"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
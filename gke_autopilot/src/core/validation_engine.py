@@ -8,6 +8,7 @@ container images, and GKE Autopilot compatibility with detailed feedback.
 import logging
 import re
 import asyncio
+import time
 import aiohttp
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
@@ -17,6 +18,12 @@ import json
 from pathlib import Path
 
 from ..models.app_config import AppConfig, ClusterConfig, ResourceRequests, ScalingConfig
+from .image_registry import (
+    HTTPRegistryClient, ImageManifest, ImageNotFoundError, RegistryClient, RegistryError,
+    parse_image_reference
+)
+from .quantities import cpu_to_millicores, memory_to_mib, storage_to_gib
+from .ttl_cache import AsyncTTLCache
 
 
 logger = logging.getLogger(__name__)
@@ -54,6 +61,7 @@ class ValidationReport:
     """Comprehensive validation report"""
     valid: bool = True
     results: List[ValidationResult] = field(default_factory=list)
+    duration_seconds: Optional[float] = None
     
     def add_result(self, result: ValidationResult) -> None:
         """Add validation result"""
@@ -74,7 +82,7 @@ class ValidationReport:
         return [r for r in self.results if r.level == ValidationLevel.RECOMMENDATION]
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        result = {
             'valid': self.valid,
             'summary': {
                 'errors': len(self.get_errors()),
@@ -84,6 +92,62 @@ class ValidationReport:
             },
             'results': [r.to_dict() for r in self.results]
         }
+        if self.duration_seconds is not None:
+            result['duration_seconds'] = round(self.duration_seconds, 4)
+        return result
+
+
+@dataclass
+class ImageCheckResult:
+    """Outcome of a registry lookup for one image reference"""
+    image: str
+    exists: Optional[bool]
+    digest: Optional[str] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'image': self.image,
+            'exists': self.exists,
+            'digest': self.digest,
+            'error': self.error,
+            'duration_seconds': round(self.duration_seconds, 4)
+        }
+
+
+@dataclass
+class BatchValidationReport:
+    """Validation results for many configurations"""
+    reports: Dict[str, ValidationReport] = field(default_factory=dict)
+    image_checks: Dict[str, ImageCheckResult] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    
+    @property
+    def valid(self) -> bool:
+        return all(report.valid for report in self.reports.values())
+    
+    def combined(self) -> ValidationReport:
+        """Merge every per-config report into one, prefixing fields with the config name"""
+        combined = ValidationReport(duration_seconds=self.duration_seconds)
+        for name, report in self.reports.items():
+            for result in report.results:
+                combined.add_result(ValidationResult(
+                    level=result.level,
+                    category=result.category,
+                    message=result.message,
+                    field=f"{name}.{result.field}" if result.field else name,
+                    suggestion=result.suggestion
+                ))
+        return combined
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.combined().to_dict(),
+            'configs': {name: report.to_dict() for name, report in self.reports.items()},
+            'images': {image: check.to_dict() for image, check in self.image_checks.items()},
+            'timings': {name: report.duration_seconds for name, report in self.reports.items()}
+        }
 
 
 class ValidationEngine:
@@ -98,9 +162,35 @@ class ValidationEngine:
     - Security best practices validation
     """
     
-    def __init__(self):
-        """Initialize validation engine"""
+    def __init__(self, registry_client: Optional[RegistryClient] = None,
+                 image_tag_ttl: float = 300, image_digest_ttl: float = 86400,
+                 image_negative_ttl: float = 60):
+        """
+        Initialize validation engine.
+        
+        Image lookups run when a registry client is supplied or the engine is
+        used as an async context manager (which opens a shared HTTP session).
+        Results are cached by reference: digests are immutable and cached for
+        ``image_digest_ttl``, tags for ``image_tag_ttl``, and missing images
+        for ``image_negative_ttl``.
+        
+        Args:
+            registry_client: Registry client for image lookups (e.g. pointed at a local registry)
+            image_tag_ttl: Seconds a tag lookup is cached
+            image_digest_ttl: Seconds a digest lookup is cached
+            image_negative_ttl: Seconds a missing image is remembered
+        """
         self.session = None
+        self.registry_client = registry_client
+        self._owns_registry_client = False
+        self.image_tag_ttl = image_tag_ttl
+        self.image_digest_ttl = image_digest_ttl
+        self._image_cache = AsyncTTLCache(
+            ttl=image_tag_ttl,
+            stale_ttl=0,
+            negative_ttl=image_negative_ttl,
+            negative_errors=(ImageNotFoundError,)
+        )
         
         # Validation rules
         self.naming_pattern = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$')
@@ -131,12 +221,19 @@ class ValidationEngine:
     async def __aenter__(self):
         """Async context manager entry"""
         self.session = aiohttp.ClientSession()
+        if self.registry_client is None:
+            self.registry_client = HTTPRegistryClient(session=self.session)
+            self._owns_registry_client = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        if self._owns_registry_client:
+            self.registry_client = None
+            self._owns_registry_client = False
         if self.session:
             await self.session.close()
+            self.session = None
     
     async def validate_app_config(self, app_config: AppConfig) -> ValidationReport:
         """
@@ -150,6 +247,110 @@ class ValidationEngine:
         """
         logger.info(f"Validating application configuration: {app_config.name}")
         
+        started = time.perf_counter()
+        image_check = await self.check_image(app_config.image) if self.registry_client else None
+        report = self._validate_app_config_sync(app_config, image_check)
+        report.duration_seconds = time.perf_counter() - started
+        
+        logger.info(f"Validation completed for {app_config.name}: {len(report.results)} issues found")
+        return report
+    
+    async def validate_many(self, app_configs: List[AppConfig], max_concurrency: int = 16) -> BatchValidationReport:
+        """
+        Validate many application configurations concurrently.
+        
+        Each distinct image reference is looked up once, however many configs
+        use it, with at most ``max_concurrency`` registry requests in flight.
+        
+        Args:
+            app_configs: Application configurations to validate
+            max_concurrency: Maximum concurrent registry lookups
+            
+        Returns:
+            BatchValidationReport: Per-config reports, image checks and timings
+        """
+        started = time.perf_counter()
+        batch = BatchValidationReport()
+        
+        if self.registry_client:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+            
+            async def check(image: str) -> ImageCheckResult:
+                async with semaphore:
+                    return await self.check_image(image)
+            
+            images = list(dict.fromkeys(config.image for config in app_configs if config.image))
+            checks = await asyncio.gather(*(check(image) for image in images))
+            batch.image_checks = dict(zip(images, checks))
+        
+        for index, app_config in enumerate(app_configs):
+            config_started = time.perf_counter()
+            report = self._validate_app_config_sync(app_config, batch.image_checks.get(app_config.image))
+            report.duration_seconds = time.perf_counter() - config_started
+            
+            name = app_config.name or f"config-{index}"
+            if name in batch.reports:
+                name = f"{name}#{index}"
+            batch.reports[name] = report
+            
+            # Yield between configs so a large batch does not monopolize the loop
+            await asyncio.sleep(0)
+        
+        batch.duration_seconds = time.perf_counter() - started
+        logger.info(f"Validated {len(app_configs)} configurations ({len(batch.image_checks)} distinct images) "
+                    f"in {batch.duration_seconds:.2f}s")
+        return batch
+    
+    async def check_image(self, image: str) -> ImageCheckResult:
+        """
+        Look up an image in its registry, using the image cache.
+        
+        Args:
+            image: Image reference
+            
+        Returns:
+            ImageCheckResult: exists is None when the registry could not be queried
+        """
+        started = time.perf_counter()
+        
+        try:
+            reference = parse_image_reference(image)
+        except ValueError as e:
+            return ImageCheckResult(image=image, exists=None, error=str(e))
+        
+        async def load() -> ImageManifest:
+            manifest = await self.registry_client.get_manifest(reference)
+            if manifest.digest and not reference.digest:
+                # The tag's current digest is immutable; remember it separately
+                self._image_cache.set(reference.with_digest(manifest.digest).cache_key, manifest,
+                                      ttl=self.image_digest_ttl)
+            return manifest
+        
+        ttl = self.image_digest_ttl if reference.digest else self.image_tag_ttl
+        try:
+            manifest = await self._image_cache.get(reference.cache_key, load, ttl=ttl)
+            return ImageCheckResult(image=image, exists=True, digest=manifest.digest,
+                                    duration_seconds=time.perf_counter() - started)
+        except ImageNotFoundError as e:
+            return ImageCheckResult(image=image, exists=False, error=str(e),
+                                    duration_seconds=time.perf_counter() - started)
+        except RegistryError as e:
+            logger.warning(f"Could not verify image {image}: {e}")
+            return ImageCheckResult(image=image, exists=None, error=str(e),
+                                    duration_seconds=time.perf_counter() - started)
+        except Exception as e:
+            # One unreachable registry must not abort a whole batch of checks
+            logger.warning(f"Could not verify image {image}: {type(e).__name__}: {e}")
+            return ImageCheckResult(image=image, exists=None, error=f"{type(e).__name__}: {e}",
+                                    duration_seconds=time.perf_counter() - started)
+    
+    def get_image_cache_stats(self) -> Dict[str, Any]:
+        """Get image lookup cache statistics"""
+        return self._image_cache.get_stats()
+    
+    def _validate_app_config_sync(self, app_config: AppConfig,
+                                  image_check: Optional[ImageCheckResult] = None) -> ValidationReport:
+        """Run every non-network check and fold in an image lookup result"""
         report = ValidationReport()
         
         # Basic configuration validation
@@ -173,11 +374,10 @@ class ValidationEngine:
         # Security validation
         self._validate_security_config(app_config, report)
         
-        # Container image validation (async)
-        if self.session:
-            await self._validate_container_image(app_config.image, report)
+        # Container image validation (registry lookup done by the caller)
+        if image_check is not None:
+            self._validate_container_image(app_config.image, image_check, report)
         
-        logger.info(f"Validation completed for {app_config.name}: {len(report.results)} issues found")
         return report
     
     def _validate_basic_config(self, app_config: AppConfig, report: ValidationReport) -> None:
@@ -567,12 +767,10 @@ class ValidationEngine:
                 suggestion="Consider using non-privileged ports (>= 1024)"
             ))
     
-    async def _validate_container_image(self, image: str, report: ValidationReport) -> None:
+    def _validate_container_image(self, image: str, image_check: ImageCheckResult,
+                                  report: ValidationReport) -> None:
         """Validate container image accessibility and security"""
         
-        if not self.session:
-            return
-        
         try:
             # Basic image format validation
             if ':' not in image and '@' not in image:
@@ -600,61 +798,45 @@ class ValidationEngine:
                     field="image"
                 ))
             
-            # TODO: Add actual image accessibility check
-            # This would require authentication and registry-specific APIs
+            # Registry lookup result
+            if image_check.exists is False:
+                report.add_result(ValidationResult(
+                    level=ValidationLevel.ERROR,
+                    category="image",
+                    message=f"Container image not found in registry: {image}",
+                    field="image",
+                    suggestion="Check the image name and tag, and that it has been pushed"
+                ))
+            elif image_check.exists is None:
+                report.add_result(ValidationResult(
+                    level=ValidationLevel.WARNING,
+                    category="image",
+                    message=f"Could not verify container image: {image_check.error}",
+                    field="image"
+                ))
+            elif image_check.digest and '@' not in image:
+                report.add_result(ValidationResult(
+                    level=ValidationLevel.INFO,
+                    category="image",
+                    message=f"Image tag currently resolves to {image_check.digest}",
+                    field="image",
+                    suggestion="Pin the digest for reproducible deployments"
+                ))
             
         except Exception as e:
             logger.warning(f"Failed to validate container image: {e}")
     
     def _parse_cpu_to_millicores(self, cpu_str: str) -> Optional[int]:
         """Parse CPU string to millicores"""
-        try:
-            if cpu_str.endswith('m'):
-                return int(cpu_str[:-1])
-            else:
-                return int(float(cpu_str) * 1000)
-        except (ValueError, TypeError):
-            return None
+        return cpu_to_millicores(cpu_str)
     
     def _parse_memory_to_mb(self, memory_str: str) -> Optional[int]:
-        """Parse memory string to MB"""
-        try:
-            if memory_str.endswith('Mi'):
-                return int(memory_str[:-2])
-            elif memory_str.endswith('Gi'):
-                return int(memory_str[:-2]) * 1024
-            elif memory_str.endswith('Ki'):
-                return int(memory_str[:-2]) // 1024
-            elif memory_str.endswith('M'):
-                return int(memory_str[:-1])
-            elif memory_str.endswith('G'):
-                return int(memory_str[:-1]) * 1000
-            elif memory_str.endswith('K'):
-                return int(memory_str[:-1]) // 1000
-            else:
-                return int(memory_str) // (1024 * 1024)  # Assume bytes
-        except (ValueError, TypeError):
-            return None
+        """Parse memory string to MiB"""
+        return memory_to_mib(memory_str)
     
     def _parse_storage_to_gb(self, storage_str: str) -> Optional[int]:
-        """Parse storage string to GB"""
-        try:
-            if storage_str.endswith('Gi'):
-                return int(storage_str[:-2])
-            elif storage_str.endswith('Ti'):
-                return int(storage_str[:-2]) * 1024
-            elif storage_str.endswith('Mi'):
-                return int(storage_str[:-2]) // 1024
-            elif storage_str.endswith('G'):
-                return int(storage_str[:-1])
-            elif storage_str.endswith('T'):
-                return int(storage_str[:-1]) * 1000
-            elif storage_str.endswith('M'):
-                return int(storage_str[:-1]) // 1000
-            else:
-                return int(storage_str) // (1024 ** 3)  # Assume bytes
-        except (ValueError, TypeError):
-            return None
+        """Parse storage string to GiB"""
+        return storage_to_gib(storage_str)
     
     async def validate_cluster_config(self, cluster_config: ClusterConfig) -> ValidationReport:
         """
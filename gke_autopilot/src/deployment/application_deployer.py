@@ -8,9 +8,9 @@ with rolling updates, zero-downtime strategies, and rollback mechanisms.
 import logging
 import asyncio
 import yaml
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
@@ -18,6 +18,16 @@ from ..core.gke_client import GKEClient
 from ..core.template_engine import TemplateEngine, TemplateContext
 from ..core.validation_engine import ValidationEngine
 from ..models.app_config import AppConfig, ClusterConfig, DeploymentResult, DeploymentPhase
+from .manifest_store import (
+    DEFAULT_FINGERPRINT_CACHE,
+    FINGERPRINT_ANNOTATION,
+    ManifestDiff,
+    ManifestFingerprintStore,
+    manifest_fingerprint,
+    manifest_key,
+    stamp_fingerprint,
+    three_way_diff
+)
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +88,8 @@ class DeploymentHistory:
     status: DeploymentStatus
     strategy: DeploymentStrategy
     rollback_target: bool = False
+    manifest_fingerprints: Dict[str, str] = field(default_factory=dict)
+    applied_objects: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -88,7 +100,9 @@ class DeploymentHistory:
             'deployed_at': self.deployed_at.isoformat(),
             'status': self.status.value,
             'strategy': self.strategy.value,
-            'rollback_target': self.rollback_target
+            'rollback_target': self.rollback_target,
+            'manifest_fingerprints': self.manifest_fingerprints,
+            'applied_objects': self.applied_objects
         }
 
 
@@ -104,17 +118,21 @@ class ApplicationDeployer:
     - Deployment history and audit trails
     """
     
-    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None):
+    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None,
+                 fingerprint_cache_path: Optional[Union[str, Path]] = DEFAULT_FINGERPRINT_CACHE):
         """
         Initialize application deployer.
         
         Args:
             project_id: Google Cloud project ID
             credentials_path: Path to service account credentials
+            fingerprint_cache_path: Local cache of last-applied manifest fingerprints
+                                    (None keeps fingerprints in memory only)
         """
         self.gke_client = GKEClient(project_id, credentials_path)
         self.template_engine = TemplateEngine()
         self.validation_engine = ValidationEngine()
+        self.fingerprint_store = ManifestFingerprintStore(fingerprint_cache_path)
         self.project_id = self.gke_client.project_id
         
         # Deployment tracking
@@ -129,10 +147,15 @@ class ApplicationDeployer:
                                location: str,
                                strategy: DeploymentStrategy = DeploymentStrategy.ROLLING_UPDATE,
                                wait_for_completion: bool = True,
-                               namespace: str = "default") -> DeploymentResult:
+                               namespace: str = "default",
+                               force: bool = False) -> DeploymentResult:
         """
         Deploy application to GKE cluster with specified strategy.
         
+        Only objects whose fingerprint differs from the last successful
+        deploy, or whose live copy has drifted, are applied; a deploy with
+        no changes completes without writing to the cluster.
+        
         Args:
             app_config: Application configuration
             cluster_name: Target cluster name
@@ -140,6 +163,7 @@ class ApplicationDeployer:
             strategy: Deployment strategy to use
             wait_for_completion: Whether to wait for deployment completion
             namespace: Kubernetes namespace
+            force: Apply every manifest even if unchanged
             
         Returns:
             DeploymentResult: Deployment result information
@@ -175,23 +199,49 @@ class ApplicationDeployer:
             await self._update_progress(deployment_id, progress, 2)
             
             manifests = await self._generate_manifests(app_config, cluster_name, namespace)
+            keyed_manifests = self._fingerprint_manifests(manifests, namespace)
+            fingerprints = {
+                key: manifest['metadata']['annotations'][FINGERPRINT_ANNOTATION]
+                for key, manifest in keyed_manifests.items()
+            }
             
             # Step 3: Validate cluster connectivity
             progress.current_step = "Validating cluster connectivity"
             await self._update_progress(deployment_id, progress, 3)
             
-            cluster_info = self.gke_client.get_cluster_info(cluster_name, location)
+            cluster_info = await asyncio.to_thread(self.gke_client.get_cluster_info, cluster_name, location)
             if cluster_info.status != 'RUNNING':
                 raise ValueError(f"Cluster {cluster_name} is not ready (status: {cluster_info.status})")
             
-            # Step 4: Execute deployment strategy
+            # Step 4: Execute deployment strategy on changed objects only
             progress.current_step = f"Executing {strategy.value} deployment"
             progress.phase = DeploymentPhase.DEPLOYING_APP
             await self._update_progress(deployment_id, progress, 4)
             
-            deployment_result = await self._execute_deployment_strategy(
-                manifests, app_config, cluster_name, location, strategy, namespace
+            diff = await self._diff_manifests(
+                keyed_manifests, fingerprints, app_config, cluster_name, location, namespace,
+                force=force or strategy == DeploymentStrategy.RECREATE
             )
+            applied_objects = diff.changed
+            
+            if diff.is_noop:
+                logger.info(f"No manifest changes for {app_config.name}, skipping apply")
+                deployment_result = DeploymentResult(
+                    success=True,
+                    cluster_name=cluster_name,
+                    application_url=self._application_url(app_config),
+                    phase=DeploymentPhase.READY
+                )
+                wait_for_completion = False
+            else:
+                logger.info(f"Applying {len(applied_objects)} of {len(keyed_manifests)} manifests "
+                            f"for {app_config.name} ({len(diff.unchanged)} unchanged)")
+                deployment_result = await self._execute_deployment_strategy(
+                    [keyed_manifests[key] for key in applied_objects],
+                    app_config, cluster_name, location, strategy, namespace
+                )
+                if not deployment_result.success:
+                    raise RuntimeError(deployment_result.error_message or "Manifest apply failed")
             
             # Step 5: Configure ingress (if enabled)
             if app_config.ingress_config.enabled:
@@ -214,8 +264,12 @@ class ApplicationDeployer:
             progress.progress_percentage = 100
             progress.current_step = "Deployment completed successfully"
             
+            # Record fingerprints so the next deploy can skip unchanged objects
+            self.fingerprint_store.record(cluster_name, namespace, app_config.name, fingerprints, deployment_id)
+            
             # Add to deployment history
-            self._add_to_history(deployment_id, app_config, cluster_name, strategy, DeploymentStatus.COMPLETED)
+            self._add_to_history(deployment_id, app_config, cluster_name, strategy, DeploymentStatus.COMPLETED,
+                                 fingerprints=fingerprints, applied_objects=applied_objects)
             
             # Update deployment result
             deployment_result.success = True
@@ -340,6 +394,7 @@ class ApplicationDeployer:
             success = self.gke_client.delete_application(app_name, cluster_name, location)
             
             if success:
+                self.fingerprint_store.forget(cluster_name, namespace, app_name)
                 logger.info(f"Application deleted successfully: {app_name}")
             
             return success
@@ -470,6 +525,44 @@ class ApplicationDeployer:
         
         return optimized_manifests
     
+    def _fingerprint_manifests(self, manifests: List[Dict[str, Any]], namespace: str) -> Dict[str, Dict[str, Any]]:
+        """Key manifests by object identity and stamp each with its content fingerprint"""
+        keyed = {}
+        for manifest in manifests:
+            stamp_fingerprint(manifest, manifest_fingerprint(manifest))
+            keyed[manifest_key(manifest, namespace)] = manifest
+        return keyed
+    
+    async def _diff_manifests(self, keyed_manifests: Dict[str, Dict[str, Any]], fingerprints: Dict[str, str],
+                              app_config: AppConfig, cluster_name: str, location: str, namespace: str,
+                              force: bool = False) -> ManifestDiff:
+        """Three-way diff of desired, last-applied and live manifest fingerprints"""
+        if force:
+            return ManifestDiff(to_update=list(keyed_manifests))
+        
+        last_applied = self.fingerprint_store.get_last_applied(cluster_name, namespace, app_config.name)
+        
+        live = None
+        if last_applied:
+            # Live reads catch objects deleted or edited outside this framework;
+            # they are blocking GETs, so keep them off the event loop
+            live = await asyncio.to_thread(
+                self.gke_client.get_live_annotations,
+                keyed_manifests, FINGERPRINT_ANNOTATION, cluster_name, location, namespace
+            )
+        
+        diff = three_way_diff(fingerprints, last_applied, live)
+        if diff.removed:
+            logger.info(f"Objects no longer rendered for {app_config.name}: {diff.removed}")
+        return diff
+    
+    @staticmethod
+    def _application_url(app_config: AppConfig) -> Optional[str]:
+        if app_config.ingress_config.enabled and app_config.ingress_config.domain:
+            protocol = "https" if app_config.ingress_config.tls else "http"
+            return f"{protocol}://{app_config.ingress_config.domain}"
+        return None
+    
     async def _execute_deployment_strategy(self, 
                                          manifests: List[Dict[str, Any]], 
                                          app_config: AppConfig, 
@@ -498,9 +591,10 @@ class ApplicationDeployer:
                                        namespace: str) -> DeploymentResult:
         """Execute rolling update deployment"""
         
-        # For now, use the GKE client's deploy method
-        # In a real implementation, this would use Kubernetes API directly
-        deployment_result = self.gke_client.deploy_application(app_config, cluster_name, location)
+        # Apply runs its own request threads; keep the event loop free meanwhile
+        deployment_result = await asyncio.to_thread(
+            self.gke_client.apply_manifests, manifests, app_config, cluster_name, location, namespace
+        )
         
         return deployment_result
     
@@ -562,27 +656,47 @@ class ApplicationDeployer:
         logger.info(f"Ingress configured for {app_config.name}: {app_config.ingress_config.domain}")
     
     async def _wait_for_deployment_ready(self, app_name: str, cluster_name: str, location: str, namespace: str, timeout_minutes: int = 10) -> None:
-        """Wait for deployment to be ready"""
+        """Wait for deployment to be ready using a Kubernetes watch"""
         
-        timeout = datetime.now() + timedelta(minutes=timeout_minutes)
-        
-        while datetime.now() < timeout:
-            try:
-                status = await self._get_deployment_status(app_name, cluster_name, location, namespace)
-                
-                if status and status.get('status') == 'Running':
-                    replicas = status.get('replicas', {})
-                    if replicas.get('ready', 0) == replicas.get('total', 0) and replicas.get('total', 0) > 0:
-                        logger.info(f"Deployment {app_name} is ready")
-                        return
-                
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.warning(f"Error checking deployment status: {e}")
-                await asyncio.sleep(10)
+        await self.gke_client.readiness.wait_for_deployment_ready(
+            app_name, namespace, cluster_name, location, timeout_seconds=timeout_minutes * 60
+        )
+    
+    async def watch_deployment_status(self, 
+                                    app_name: str, 
+                                    cluster_name: str, 
+                                    location: str,
+                                    namespace: str = "default") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream deployment status as the cluster reports changes.
         
-        raise TimeoutError(f"Deployment {app_name} did not become ready within {timeout_minutes} minutes")
+        Args:
+            app_name: Application name
+            cluster_name: Cluster name
+            location: Cluster location
+            namespace: Kubernetes namespace
+            
+        Yields:
+            Deployment status information after every change
+        """
+        stream = self.gke_client.readiness.watch_deployment(app_name, namespace, cluster_name, location)
+        try:
+            async for readiness in stream:
+                if readiness is None:
+                    yield {
+                        'application': app_name,
+                        'cluster': cluster_name,
+                        'status': 'NotFound',
+                        'last_updated': datetime.now().isoformat()
+                    }
+                else:
+                    yield {
+                        **readiness.to_dict(),
+                        'cluster': cluster_name,
+                        'last_updated': datetime.now().isoformat()
+                    }
+        finally:
+            await stream.aclose()
     
     async def _get_deployment_status(self, app_name: str, cluster_name: str, location: str, namespace: str) -> Optional[Dict[str, Any]]:
         """Get deployment status from Kubernetes"""
@@ -610,7 +724,9 @@ class ApplicationDeployer:
         logger.debug(f"Deployment {deployment_id} progress: {progress.progress_percentage}% - {progress.current_step}")
     
     def _add_to_history(self, deployment_id: str, app_config: AppConfig, cluster_name: str, 
-                       strategy: DeploymentStrategy, status: DeploymentStatus) -> None:
+                       strategy: DeploymentStrategy, status: DeploymentStatus,
+                       fingerprints: Optional[Dict[str, str]] = None,
+                       applied_objects: Optional[List[str]] = None) -> None:
         """Add deployment to history"""
         
         history_entry = DeploymentHistory(
@@ -620,7 +736,9 @@ class ApplicationDeployer:
             image=app_config.image,
             deployed_at=datetime.now(),
             status=status,
-            strategy=strategy
+            strategy=strategy,
+            manifest_fingerprints=fingerprints or {},
+            applied_objects=applied_objects or []
         )
         
         self.deployment_history.append(history_entry)
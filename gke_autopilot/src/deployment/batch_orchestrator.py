@@ -0,0 +1,287 @@
+"""
+Batch Deployment Orchestrator for GKE Autopilot Deployment Framework
+
+This module deploys many applications at once, ordering them by their declared
+service dependencies and running independent deployments concurrently under a
+configurable concurrency cap.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Set, Any
+
+from ..models.app_config import AppConfig, DeploymentResult, DeploymentPhase
+from .application_deployer import ApplicationDeployer, DeploymentStrategy
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItemState(Enum):
+    """State of a single application within a batch"""
+    WAITING = "waiting"
+    DEPLOYING = "deploying"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+ProgressCallback = Callable[[str, BatchItemState, int, int], None]
+
+
+@dataclass
+class BatchDeploymentResult:
+    """Aggregated result of a batch deployment"""
+    results: Dict[str, DeploymentResult] = field(default_factory=dict)
+    states: Dict[str, BatchItemState] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(state == BatchItemState.SUCCEEDED for state in self.states.values())
+
+    def names_in_state(self, state: BatchItemState) -> List[str]:
+        return [name for name, item_state in self.states.items() if item_state == state]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'success': self.success,
+            'succeeded': self.names_in_state(BatchItemState.SUCCEEDED),
+            'failed': {
+                name: self.results[name].error_message
+                for name in self.names_in_state(BatchItemState.FAILED) if name in self.results
+            },
+            'skipped': self.names_in_state(BatchItemState.SKIPPED),
+            'durations': {name: round(seconds, 2) for name, seconds in self.durations.items()},
+            'critical_path': self.critical_path,
+            'total_seconds': round(self.total_seconds, 2)
+        }
+
+
+def build_dependency_graph(app_configs: List[AppConfig]) -> Dict[str, Set[str]]:
+    """
+    Build the in-batch dependency graph (application -> applications it needs).
+
+    Dependencies on services outside the batch are assumed to be deployed
+    already and are ignored.
+
+    Raises:
+        ValueError: On duplicate application names or dependency cycles
+    """
+    names = [config.name for config in app_configs]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate applications in batch: {sorted(duplicates)}")
+
+    batch = set(names)
+    graph: Dict[str, Set[str]] = {}
+    for config in app_configs:
+        external = [dep for dep in config.dependencies if dep not in batch]
+        if external:
+            logger.info(f"{config.name} depends on services outside the batch: {external}")
+        graph[config.name] = {dep for dep in config.dependencies if dep in batch}
+
+    cycle = _find_cycle(graph)
+    if cycle:
+        raise ValueError(f"Dependency cycle detected: {' -> '.join(cycle)}")
+
+    return graph
+
+
+def dependency_levels(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """Group applications into waves that can be deployed in parallel"""
+    depth: Dict[str, int] = {}
+
+    def visit(name: str) -> int:
+        if name not in depth:
+            depth[name] = 1 + max((visit(dep) for dep in graph[name]), default=-1)
+        return depth[name]
+
+    for name in graph:
+        visit(name)
+
+    levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for name in graph:
+        levels[depth[name]].append(name)
+    return levels
+
+
+def critical_path(graph: Dict[str, Set[str]], durations: Dict[str, float]) -> List[str]:
+    """Longest dependency chain weighted by deployment duration"""
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+
+    def visit(name: str) -> float:
+        if name not in finish:
+            best_dep, best_finish = None, 0.0
+            for dep in graph[name]:
+                dep_finish = visit(dep)
+                if dep_finish > best_finish:
+                    best_dep, best_finish = dep, dep_finish
+            previous[name] = best_dep
+            finish[name] = best_finish + durations.get(name, 0.0)
+        return finish[name]
+
+    if not graph:
+        return []
+
+    end = max(graph, key=visit)
+    path = []
+    while end is not None:
+        path.append(end)
+        end = previous[end]
+    return list(reversed(path))
+
+
+def _find_cycle(graph: Dict[str, Set[str]]) -> Optional[List[str]]:
+    """Return one dependency cycle, or None if the graph is acyclic"""
+    visiting: List[str] = []
+    done: Set[str] = set()
+
+    def visit(name: str) -> Optional[List[str]]:
+        if name in done:
+            return None
+        if name in visiting:
+            return visiting[visiting.index(name):] + [name]
+
+        visiting.append(name)
+        for dep in sorted(graph[name]):
+            cycle = visit(dep)
+            if cycle:
+                return cycle
+        visiting.pop()
+        done.add(name)
+        return None
+
+    for name in graph:
+        cycle = visit(name)
+        if cycle:
+            return cycle
+    return None
+
+
+class BatchDeploymentOrchestrator:
+    """
+    Concurrent multi-application deployment orchestrator.
+
+    Each application starts as soon as every in-batch dependency has been
+    deployed and become ready, subject to ``max_concurrency``, so a rollout
+    takes roughly as long as its longest dependency chain. Applications
+    whose dependencies fail are skipped.
+    """
+
+    def __init__(self, deployer: ApplicationDeployer, max_concurrency: int = 5, fail_fast: bool = False):
+        """
+        Initialize batch orchestrator.
+
+        Args:
+            deployer: Application deployer used for each application
+            max_concurrency: Maximum number of simultaneous deployments
+            fail_fast: Stop starting new deployments after the first failure
+        """
+        self.deployer = deployer
+        self.max_concurrency = max(1, max_concurrency)
+        self.fail_fast = fail_fast
+
+    async def deploy_all(self,
+                         app_configs: List[AppConfig],
+                         cluster_name: str,
+                         location: str,
+                         strategy: DeploymentStrategy = DeploymentStrategy.ROLLING_UPDATE,
+                         wait_for_completion: bool = True,
+                         namespace: str = "default",
+                         progress_callback: Optional[ProgressCallback] = None) -> BatchDeploymentResult:
+        """
+        Deploy a batch of applications respecting their dependencies.
+
+        Args:
+            app_configs: Applications to deploy
+            cluster_name: Target cluster name
+            location: Cluster location
+            strategy: Deployment strategy for every application
+            wait_for_completion: Wait for readiness of applications nothing depends on
+                                 (applications with dependents are always awaited)
+            namespace: Kubernetes namespace
+            progress_callback: Called with (app, state, finished_count, total) on each transition
+
+        Returns:
+            BatchDeploymentResult: Per-application results and timing
+        """
+        graph = build_dependency_graph(app_configs)
+        configs = {config.name: config for config in app_configs}
+        has_dependents = {dep for deps in graph.values() for dep in deps}
+
+        result = BatchDeploymentResult(states={name: BatchItemState.WAITING for name in graph})
+        total = len(graph)
+        finished = 0
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completion: Dict[str, asyncio.Future] = {
+            name: asyncio.get_running_loop().create_future() for name in graph
+        }
+        abort = asyncio.Event()
+        start = time.monotonic()
+
+        logger.info(f"Deploying {total} applications in {len(dependency_levels(graph))} dependency levels "
+                    f"(max concurrency {self.max_concurrency})")
+
+        def transition(name: str, state: BatchItemState) -> None:
+            nonlocal finished
+            result.states[name] = state
+            if state in (BatchItemState.SUCCEEDED, BatchItemState.FAILED, BatchItemState.SKIPPED):
+                finished += 1
+                completion[name].set_result(state == BatchItemState.SUCCEEDED)
+            if progress_callback:
+                progress_callback(name, state, finished, total)
+
+        async def deploy_one(name: str) -> None:
+            # Wait for every dependency; skip if any of them did not succeed
+            dependency_ok = await asyncio.gather(*(completion[dep] for dep in graph[name]))
+            if not all(dependency_ok) or abort.is_set():
+                logger.warning(f"Skipping {name}: dependency failed or batch aborted")
+                transition(name, BatchItemState.SKIPPED)
+                return
+
+            async with semaphore:
+                if abort.is_set():
+                    transition(name, BatchItemState.SKIPPED)
+                    return
+
+                transition(name, BatchItemState.DEPLOYING)
+                started = time.monotonic()
+                try:
+                    deployment_result = await self.deployer.deploy_application(
+                        configs[name], cluster_name, location, strategy,
+                        wait_for_completion=wait_for_completion or name in has_dependents,
+                        namespace=namespace
+                    )
+                except Exception as e:
+                    deployment_result = DeploymentResult(
+                        success=False,
+                        cluster_name=cluster_name,
+                        phase=DeploymentPhase.FAILED,
+                        error_message=str(e)
+                    )
+                result.durations[name] = time.monotonic() - started
+                result.results[name] = deployment_result
+
+            if deployment_result.success:
+                transition(name, BatchItemState.SUCCEEDED)
+            else:
+                logger.error(f"Deployment of {name} failed: {deployment_result.error_message}")
+                if self.fail_fast:
+                    abort.set()
+                transition(name, BatchItemState.FAILED)
+
+        await asyncio.gather(*(deploy_one(name) for name in graph))
+
+        result.total_seconds = time.monotonic() - start
+        result.critical_path = critical_path(graph, result.durations)
+
+        logger.info(f"Batch deployment finished in {result.total_seconds:.1f}s: "
+                    f"{len(result.names_in_state(BatchItemState.SUCCEEDED))}/{total} succeeded")
+        return result
@@ -7,12 +7,13 @@ creation, health monitoring, updates, and maintenance operations.
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
-from ..core.gke_client import GKEClient, ClusterInfo, GKEClientError
+from ..core.gke_client import GKEClient, ClusterInfo, GKEClientError, ClusterNotFoundError
+from ..core.ttl_cache import AsyncTTLCache
 from ..models.app_config import ClusterConfig, DeploymentResult, DeploymentPhase
 
 
@@ -87,13 +88,19 @@ class ClusterManager:
     - Multi-cluster coordination
     """
     
-    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None):
+    def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None,
+                 cache_ttl_seconds: int = 300, health_ttl_seconds: int = 30,
+                 stale_ttl_seconds: int = 60, negative_ttl_seconds: int = 30):
         """
         Initialize cluster manager.
         
         Args:
             project_id: Google Cloud project ID
             credentials_path: Path to service account credentials
+            cache_ttl_seconds: Seconds cluster info and cluster lists stay fresh
+            health_ttl_seconds: Seconds a health snapshot stays fresh
+            stale_ttl_seconds: Seconds an expired entry is served while it is refreshed in the background
+            negative_ttl_seconds: Seconds a missing cluster is remembered
         """
         self.gke_client = GKEClient(project_id, credentials_path)
         self.project_id = self.gke_client.project_id
@@ -101,10 +108,15 @@ class ClusterManager:
         # Operation tracking
         self.active_operations: Dict[str, ClusterOperation] = {}
         
-        # Cluster cache
-        self._cluster_cache: Dict[str, ClusterInfo] = {}
-        self._cache_ttl = timedelta(minutes=5)
-        self._last_cache_update: Optional[datetime] = None
+        # Cluster cache: per-entry TTL for cluster info, cluster lists and health snapshots
+        self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        self._health_ttl = timedelta(seconds=health_ttl_seconds)
+        self._cluster_cache = AsyncTTLCache(
+            ttl=cache_ttl_seconds,
+            stale_ttl=stale_ttl_seconds,
+            negative_ttl=negative_ttl_seconds,
+            negative_errors=(ClusterNotFoundError,)
+        )
         
         logger.info(f"Cluster manager initialized for project: {self.project_id}")
     
@@ -126,7 +138,7 @@ class ClusterManager:
             self._validate_cluster_config(cluster_config)
             
             # Check if cluster already exists
-            existing_clusters = await self.list_clusters(cluster_config.region)
+            existing_clusters = await self.list_clusters(cluster_config.region, use_cache=False)
             if any(c.name == cluster_config.name for c in existing_clusters):
                 raise GKEClientError(f"Cluster {cluster_config.name} already exists")
             
@@ -161,18 +173,18 @@ class ClusterManager:
         Returns:
             ClusterInfo: Cluster information
         """
-        cache_key = f"{cluster_name}:{location}"
-        
-        # Check cache first
-        if use_cache and self._is_cache_valid() and cache_key in self._cluster_cache:
-            logger.debug(f"Returning cached cluster info for {cluster_name}")
-            return self._cluster_cache[cache_key]
+        async def load() -> ClusterInfo:
+            cluster_info = await asyncio.to_thread(self.gke_client.get_cluster_info, cluster_name, location)
+            self._cluster_cache.invalidate(self._health_key(cluster_name, location))
+            return cluster_info
         
         try:
-            cluster_info = self.gke_client.get_cluster_info(cluster_name, location)
-            self._update_cluster_cache(cluster_info)
-            return cluster_info
+            return await self._cluster_cache.get(
+                self._cluster_key(cluster_name, location), load, use_cache=use_cache
+            )
             
+        except ClusterNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get cluster info for {cluster_name}: {e}")
             raise
@@ -188,21 +200,18 @@ class ClusterManager:
         Returns:
             List of ClusterInfo objects
         """
-        if use_cache and self._is_cache_valid():
-            cached_clusters = [c for c in self._cluster_cache.values() 
-                             if location == "-" or c.location == location]
-            if cached_clusters:
-                logger.debug(f"Returning {len(cached_clusters)} cached clusters")
-                return cached_clusters
-        
-        try:
-            clusters = self.gke_client.list_clusters(location)
+        async def load() -> List[ClusterInfo]:
+            clusters = await asyncio.to_thread(self.gke_client.list_clusters, location)
             
-            # Update cache
+            # Every listed cluster also refreshes its own entry
             for cluster in clusters:
-                self._update_cluster_cache(cluster)
+                self._cluster_cache.set(self._cluster_key(cluster.name, cluster.location), cluster)
             
             return clusters
+        
+        try:
+            clusters = await self._cluster_cache.get(('clusters', location), load, use_cache=use_cache)
+            return list(clusters)
             
         except Exception as e:
             logger.error(f"Failed to list clusters: {e}")
@@ -231,8 +240,7 @@ class ClusterManager:
             
             if success:
                 # Remove from cache
-                cache_key = f"{cluster_name}:{location}"
-                self._cluster_cache.pop(cache_key, None)
+                self._invalidate_cluster(cluster_name, location)
                 
                 logger.info(f"Cluster deleted successfully: {cluster_name}")
             
@@ -242,63 +250,29 @@ class ClusterManager:
             logger.error(f"Failed to delete cluster {cluster_name}: {e}")
             raise
     
-    async def get_cluster_health(self, cluster_name: str, location: str) -> ClusterHealth:
+    async def get_cluster_health(self, cluster_name: str, location: str, use_cache: bool = True) -> ClusterHealth:
         """
         Get comprehensive cluster health information.
         
+        Health snapshots are cached for ``health_ttl_seconds``; a fresh
+        snapshot always re-reads the cluster from the API.
+        
         Args:
             cluster_name: Name of the cluster
             location: Cluster location
+            use_cache: Whether to use a cached health snapshot if available
             
         Returns:
             ClusterHealth: Detailed health information
         """
+        async def load() -> ClusterHealth:
+            cluster_info = await self.get_cluster_info(cluster_name, location, use_cache=False)
+            return self._assess_cluster_health(cluster_info)
+        
         try:
-            cluster_info = await self.get_cluster_info(cluster_name, location)
-            
-            # Determine cluster status
-            status_map = {
-                'RUNNING': ClusterStatus.RUNNING,
-                'PROVISIONING': ClusterStatus.CREATING,
-                'RECONCILING': ClusterStatus.UPDATING,
-                'STOPPING': ClusterStatus.STOPPING,
-                'ERROR': ClusterStatus.ERROR
-            }
-            status = status_map.get(cluster_info.status, ClusterStatus.UNKNOWN)
-            
-            # Analyze cluster health
-            issues = []
-            recommendations = []
-            
-            # Check cluster status
-            if status == ClusterStatus.ERROR:
-                issues.append("Cluster is in error state")
-            elif status == ClusterStatus.UNKNOWN:
-                issues.append("Cluster status is unknown")
-            
-            # Check node count
-            if cluster_info.node_count == 0:
-                issues.append("No nodes available in cluster")
-            elif cluster_info.node_count < 2:
-                recommendations.append("Consider having at least 2 nodes for high availability")
-            
-            # Check Autopilot status
-            if not cluster_info.autopilot_enabled:
-                recommendations.append("Enable Autopilot for better resource management")
-            
-            # Check cluster age
-            cluster_age = datetime.now() - cluster_info.created_time
-            if cluster_age > timedelta(days=365):
-                recommendations.append("Consider upgrading cluster - it's over 1 year old")
-            
-            return ClusterHealth(
-                status=status,
-                node_count=cluster_info.node_count,
-                kubernetes_version=cluster_info.kubernetes_version,
-                autopilot_enabled=cluster_info.autopilot_enabled,
-                last_updated=datetime.now(),
-                issues=issues,
-                recommendations=recommendations
+            return await self._cluster_cache.get(
+                self._health_key(cluster_name, location), load,
+                ttl=self._health_ttl.total_seconds(), use_cache=use_cache
             )
             
         except Exception as e:
@@ -312,6 +286,53 @@ class ClusterManager:
                 issues=[f"Failed to get cluster health: {str(e)}"]
             )
     
+    def _assess_cluster_health(self, cluster_info: ClusterInfo) -> ClusterHealth:
+        """Derive a health snapshot from cluster info"""
+        # Determine cluster status
+        status_map = {
+            'RUNNING': ClusterStatus.RUNNING,
+            'PROVISIONING': ClusterStatus.CREATING,
+            'RECONCILING': ClusterStatus.UPDATING,
+            'STOPPING': ClusterStatus.STOPPING,
+            'ERROR': ClusterStatus.ERROR
+        }
+        status = status_map.get(cluster_info.status, ClusterStatus.UNKNOWN)
+        
+        # Analyze cluster health
+        issues = []
+        recommendations = []
+        
+        # Check cluster status
+        if status == ClusterStatus.ERROR:
+            issues.append("Cluster is in error state")
+        elif status == ClusterStatus.UNKNOWN:
+            issues.append("Cluster status is unknown")
+        
+        # Check node count
+        if cluster_info.node_count == 0:
+            issues.append("No nodes available in cluster")
+        elif cluster_info.node_count < 2:
+            recommendations.append("Consider having at least 2 nodes for high availability")
+        
+        # Check Autopilot status
+        if not cluster_info.autopilot_enabled:
+            recommendations.append("Enable Autopilot for better resource management")
+        
+        # Check cluster age
+        cluster_age = datetime.now() - cluster_info.created_time
+        if cluster_age > timedelta(days=365):
+            recommendations.append("Consider upgrading cluster - it's over 1 year old")
+        
+        return ClusterHealth(
+            status=status,
+            node_count=cluster_info.node_count,
+            kubernetes_version=cluster_info.kubernetes_version,
+            autopilot_enabled=cluster_info.autopilot_enabled,
+            last_updated=datetime.now(),
+            issues=issues,
+            recommendations=recommendations
+        )
+    
     async def update_cluster(self, cluster_name: str, location: str, updates: Dict[str, Any]) -> bool:
         """
         Update cluster configuration.
@@ -331,8 +352,7 @@ class ClusterManager:
             # In a real implementation, this would use the GKE API to update cluster settings
             
             # Invalidate cache
-            cache_key = f"{cluster_name}:{location}"
-            self._cluster_cache.pop(cache_key, None)
+            self._invalidate_cluster(cluster_name, location)
             
             logger.info(f"Cluster update completed: {cluster_name}")
             return True
@@ -427,10 +447,13 @@ class ClusterManager:
         """
         Monitor cluster health over time.
         
+        Checks back off while health is unchanged (up to ``check_interval``)
+        and return to a fast cadence as soon as it changes.
+        
         Args:
             cluster_name: Name of the cluster
             location: Cluster location
-            check_interval: Interval between checks in seconds
+            check_interval: Maximum interval between checks in seconds
             max_checks: Maximum number of health checks
             
         Returns:
@@ -439,49 +462,78 @@ class ClusterManager:
         logger.info(f"Starting health monitoring for cluster {cluster_name}")
         
         health_history = []
+        stream = self._poll_cluster_health(cluster_name, location, check_interval, emit_unchanged=True)
         
-        for i in range(max_checks):
-            try:
-                health = await self.get_cluster_health(cluster_name, location)
+        try:
+            async for health in stream:
                 health_history.append(health)
+                logger.debug(f"Health check {len(health_history)}/{max_checks}: {health.status.value}")
                 
-                logger.debug(f"Health check {i+1}/{max_checks}: {health.status.value}")
-                
-                if i < max_checks - 1:  # Don't sleep after the last check
-                    await asyncio.sleep(check_interval)
+                if len(health_history) >= max_checks:
+                    break
                     
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
-                break
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+        finally:
+            await stream.aclose()
         
         logger.info(f"Health monitoring completed for {cluster_name}: {len(health_history)} checks")
         return health_history
     
+    async def watch_cluster_health(self, cluster_name: str, location: str,
+                                   max_interval: int = 60) -> AsyncIterator[ClusterHealth]:
+        """
+        Stream cluster health, yielding only when it changes.
+        
+        Args:
+            cluster_name: Name of the cluster
+            location: Cluster location
+            max_interval: Maximum interval between checks in seconds
+        """
+        stream = self._poll_cluster_health(cluster_name, location, max_interval, emit_unchanged=False)
+        try:
+            async for health in stream:
+                yield health
+        finally:
+            await stream.aclose()
+    
+    def _poll_cluster_health(self, cluster_name: str, location: str, max_interval: float,
+                             emit_unchanged: bool) -> AsyncIterator[ClusterHealth]:
+        async def fetch() -> ClusterHealth:
+            # Bypass the cluster cache so transitions are observed
+            return await self.get_cluster_health(cluster_name, location, use_cache=False)
+        
+        return self.gke_client.readiness.poll_changes(
+            fetch,
+            key=lambda health: (health.status, health.node_count, tuple(health.issues)),
+            max_interval=max_interval,
+            emit_unchanged=emit_unchanged
+        )
+    
     async def _wait_for_cluster_ready(self, cluster_name: str, location: str, 
                                     timeout_minutes: int = 30) -> ClusterInfo:
-        """Wait for cluster to be ready"""
-        timeout = datetime.now() + timedelta(minutes=timeout_minutes)
-        
+        """Wait for cluster to be ready, polling with exponential backoff"""
         logger.info(f"Waiting for cluster {cluster_name} to be ready...")
         
-        while datetime.now() < timeout:
-            try:
-                cluster_info = await self.get_cluster_info(cluster_name, location, use_cache=False)
-                
-                if cluster_info.status == 'RUNNING':
-                    logger.info(f"Cluster {cluster_name} is ready")
-                    return cluster_info
-                elif cluster_info.status == 'ERROR':
-                    raise GKEClientError(f"Cluster {cluster_name} failed to create")
-                
-                logger.debug(f"Cluster {cluster_name} status: {cluster_info.status}")
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.warning(f"Error checking cluster status: {e}")
-                await asyncio.sleep(30)
+        def cluster_ready(cluster_info: ClusterInfo) -> bool:
+            if cluster_info.status == 'ERROR':
+                raise GKEClientError(f"Cluster {cluster_name} failed to create")
+            
+            logger.debug(f"Cluster {cluster_name} status: {cluster_info.status}")
+            return cluster_info.status == 'RUNNING'
         
-        raise GKEClientError(f"Timeout waiting for cluster {cluster_name} to be ready")
+        try:
+            cluster_info = await self.gke_client.readiness.poll_until(
+                lambda: self.get_cluster_info(cluster_name, location, use_cache=False),
+                cluster_ready,
+                timeout_seconds=timeout_minutes * 60,
+                description=f"cluster {cluster_name}"
+            )
+        except TimeoutError:
+            raise GKEClientError(f"Timeout waiting for cluster {cluster_name} to be ready")
+        
+        logger.info(f"Cluster {cluster_name} is ready")
+        return cluster_info
     
     def _validate_cluster_config(self, cluster_config: ClusterConfig) -> None:
         """Validate cluster configuration"""
@@ -496,31 +548,34 @@ class ClusterManager:
         
         # Add more validation as needed
     
+    @staticmethod
+    def _cluster_key(cluster_name: str, location: str) -> tuple:
+        return ('cluster', cluster_name, location)
+    
+    @staticmethod
+    def _health_key(cluster_name: str, location: str) -> tuple:
+        return ('health', cluster_name, location)
+    
     def _update_cluster_cache(self, cluster_info: ClusterInfo) -> None:
-        """Update cluster cache"""
-        cache_key = f"{cluster_info.name}:{cluster_info.location}"
-        self._cluster_cache[cache_key] = cluster_info
-        self._last_cache_update = datetime.now()
+        """Update cluster cache after a local change (create, update)"""
+        self._invalidate_cluster(cluster_info.name, cluster_info.location)
+        self._cluster_cache.set(self._cluster_key(cluster_info.name, cluster_info.location), cluster_info)
     
-    def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid"""
-        if not self._last_cache_update:
-            return False
-        
-        age = datetime.now() - self._last_cache_update
-        return age < self._cache_ttl
+    def _invalidate_cluster(self, cluster_name: str, location: str) -> None:
+        """Drop a cluster's entries, its health snapshot and every cluster list"""
+        self._cluster_cache.invalidate(self._cluster_key(cluster_name, location))
+        self._cluster_cache.invalidate(self._health_key(cluster_name, location))
+        self._cluster_cache.invalidate_where(lambda key: key[0] == 'clusters')
     
     def clear_cache(self) -> None:
         """Clear cluster cache"""
         self._cluster_cache.clear()
-        self._last_cache_update = None
         logger.info("Cluster cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        return {
-            'cached_clusters': len(self._cluster_cache),
-            'cache_age_seconds': (datetime.now() - self._last_cache_update).total_seconds() if self._last_cache_update else None,
-            'cache_valid': self._is_cache_valid(),
-            'cache_ttl_seconds': self._cache_ttl.total_seconds()
-        }
\ No newline at end of file
+        """Get cache statistics (hit rate, staleness, negative entries)"""
+        stats = self._cluster_cache.get_stats()
+        stats['cached_clusters'] = sum(1 for key in self._cluster_cache.keys() if key[0] == 'cluster')
+        stats['cache_ttl_seconds'] = self._cache_ttl.total_seconds()
+        stats['health_ttl_seconds'] = self._health_ttl.total_seconds()
+        return stats
@@ -0,0 +1,215 @@
+"""
+Manifest Fingerprint Store for GKE Autopilot Deployment Framework
+
+This module provides content-addressed fingerprints for rendered Kubernetes
+objects, a local cache of last-applied fingerprints, and three-way diffing
+(desired vs last-applied vs live) so deployments only apply changed objects.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+FINGERPRINT_ANNOTATION = "gke-autopilot.io/manifest-fingerprint"
+
+DEFAULT_FINGERPRINT_CACHE = Path.home() / ".gke-autopilot" / "manifest-fingerprints.json"
+
+# Fields populated by the API server that never belong in a fingerprint
+_SERVER_METADATA_FIELDS = (
+    'resourceVersion', 'uid', 'generation', 'creationTimestamp',
+    'managedFields', 'selfLink', 'deletionTimestamp'
+)
+_IGNORED_ANNOTATIONS = (
+    FINGERPRINT_ANNOTATION,
+    'kubectl.kubernetes.io/last-applied-configuration'
+)
+
+
+def manifest_key(manifest: Dict[str, Any], default_namespace: str = "default") -> str:
+    """Stable identity of a Kubernetes object: apiVersion/kind/namespace/name"""
+    metadata = manifest.get('metadata', {})
+    namespace = metadata.get('namespace') or default_namespace
+    return f"{manifest.get('apiVersion', '')}/{manifest.get('kind', '')}/{namespace}/{metadata.get('name', '')}"
+
+
+def manifest_fingerprint(manifest: Dict[str, Any]) -> str:
+    """
+    Compute a canonical content hash for a manifest.
+
+    Keys are sorted and server-populated fields (status, resourceVersion,
+    managedFields, ...) and fingerprint annotations are excluded, so the
+    same desired object always hashes the same.
+    """
+    canonical = {key: value for key, value in manifest.items() if key != 'status'}
+
+    metadata = dict(canonical.get('metadata', {}))
+    for server_field in _SERVER_METADATA_FIELDS:
+        metadata.pop(server_field, None)
+
+    annotations = {
+        key: value for key, value in metadata.get('annotations', {}).items()
+        if key not in _IGNORED_ANNOTATIONS
+    }
+    if annotations:
+        metadata['annotations'] = annotations
+    else:
+        metadata.pop('annotations', None)
+
+    canonical['metadata'] = metadata
+    payload = json.dumps(canonical, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def stamp_fingerprint(manifest: Dict[str, Any], fingerprint: str) -> None:
+    """Record the fingerprint on the object so it can be read back from the cluster"""
+    annotations = manifest.setdefault('metadata', {}).setdefault('annotations', {})
+    annotations[FINGERPRINT_ANNOTATION] = fingerprint
+
+
+@dataclass
+class ManifestDiff:
+    """Result of a three-way manifest diff"""
+    to_create: List[str] = field(default_factory=list)
+    to_update: List[str] = field(default_factory=list)
+    drifted: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        """Object keys that must be applied"""
+        return self.to_create + self.to_update + self.drifted
+
+    @property
+    def is_noop(self) -> bool:
+        """True when nothing needs to be written to the cluster"""
+        return not self.changed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'to_create': self.to_create,
+            'to_update': self.to_update,
+            'drifted': self.drifted,
+            'unchanged': self.unchanged,
+            'removed': self.removed,
+            'is_noop': self.is_noop
+        }
+
+
+def three_way_diff(desired: Dict[str, str],
+                   last_applied: Dict[str, str],
+                   live: Optional[Dict[str, Optional[str]]] = None) -> ManifestDiff:
+    """
+    Diff desired fingerprints against last-applied and live state.
+
+    Args:
+        desired: Fingerprints of the manifests about to be deployed
+        last_applied: Fingerprints recorded by the previous successful deploy
+        live: Fingerprint annotations read from the cluster (None value means
+              the object is missing; None mapping means live state is unknown)
+
+    Returns:
+        ManifestDiff: Objects to create, update or re-apply because of drift
+    """
+    diff = ManifestDiff()
+
+    for key, fingerprint in desired.items():
+        previous = last_applied.get(key)
+
+        if previous is None:
+            diff.to_create.append(key)
+        elif previous != fingerprint:
+            diff.to_update.append(key)
+        elif live is not None and live.get(key) != previous:
+            # Deleted or modified outside this framework since the last apply
+            diff.drifted.append(key)
+        else:
+            diff.unchanged.append(key)
+
+    diff.removed = [key for key in last_applied if key not in desired]
+    return diff
+
+
+class ManifestFingerprintStore:
+    """
+    Local cache of last-applied manifest fingerprints.
+
+    Fingerprints are scoped per (cluster, namespace, application) and
+    persisted as JSON so repeated CI deploys can skip unchanged objects
+    without reading them from the cluster first.
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = DEFAULT_FINGERPRINT_CACHE):
+        """
+        Initialize fingerprint store.
+
+        Args:
+            cache_path: JSON file for persisted fingerprints (None keeps them in memory only)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def scope(cluster_name: str, namespace: str, app_name: str) -> str:
+        return f"{cluster_name}/{namespace}/{app_name}"
+
+    def get_last_applied(self, cluster_name: str, namespace: str, app_name: str) -> Dict[str, str]:
+        """Get fingerprints recorded by the last successful deploy"""
+        with self._lock:
+            entry = self._entries.get(self.scope(cluster_name, namespace, app_name), {})
+            return dict(entry.get('fingerprints', {}))
+
+    def record(self, cluster_name: str, namespace: str, app_name: str,
+               fingerprints: Dict[str, str], deployment_id: Optional[str] = None) -> None:
+        """Record fingerprints after a successful deploy and persist them"""
+        with self._lock:
+            self._entries[self.scope(cluster_name, namespace, app_name)] = {
+                'fingerprints': dict(fingerprints),
+                'deployment_id': deployment_id,
+                'recorded_at': datetime.now().isoformat()
+            }
+            self._save()
+
+    def forget(self, cluster_name: str, namespace: str, app_name: str) -> None:
+        """Drop recorded fingerprints (e.g. after the application is deleted)"""
+        with self._lock:
+            if self._entries.pop(self.scope(cluster_name, namespace, app_name), None) is not None:
+                self._save()
+
+    def _load(self) -> None:
+        if not self.cache_path or not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, 'r') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable fingerprint cache {self.cache_path}: {e}")
+            self._entries = {}
+
+    def _save(self) -> None:
+        """Atomically write the cache file (lock held)"""
+        if not self.cache_path:
+            return
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_path.parent), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist fingerprint cache {self.cache_path}: {e}")
@@ -239,6 +239,7 @@ class AppConfig:
     ingress_config: IngressConfig = field(default_factory=IngressConfig)
     labels: Dict[str, str] = field(default_factory=dict)
     annotations: Dict[str, str] = field(default_factory=dict)
+    dependencies: List[str] = field(default_factory=list)
     
     def __post_init__(self):
         """Validate application configuration"""
@@ -261,6 +262,13 @@ class AppConfig:
         for env_name in self.environment_variables.keys():
             if not env_name.replace('_', '').isalnum():
                 raise ValueError(f"Invalid environment variable name: {env_name}")
+        
+        # Validate declared service dependencies
+        for dependency in self.dependencies:
+            if not dependency or not dependency.replace('-', '').isalnum():
+                raise ValueError(f"Invalid dependency name: {dependency}")
+            if dependency == self.name:
+                raise ValueError("Application cannot depend on itself")
     
     @classmethod
     def from_yaml(cls, yaml_path: Union[str, Path]) -> 'AppConfig':
@@ -273,6 +281,9 @@ class AppConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AppConfig':
         """Create AppConfig from dictionary"""
+        # Work on a copy so the caller's (possibly cached) dict is untouched
+        data = dict(data)
+        
         # Extract nested configurations
         resource_data = data.pop('resources', {})
         scaling_data = data.pop('scaling', {})
@@ -323,7 +334,8 @@ class AppConfig:
                 'tls': self.ingress_config.tls
             },
             'labels': self.labels,
-            'annotations': self.annotations
+            'annotations': self.annotations,
+            'dependencies': self.dependencies
         }
     
     def to_yaml(self, yaml_path: Union[str, Path]) -> None:
@@ -525,6 +537,7 @@ class DeploymentResult:
     monitoring_dashboard: Optional[str] = None
     phase: DeploymentPhase = DeploymentPhase.PENDING
     error_message: Optional[str] = None
+    object_results: List[Dict[str, Any]] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -537,7 +550,8 @@ class DeploymentResult:
             'cost_estimate': self.cost_estimate.to_dict(),
             'monitoring_dashboard': self.monitoring_dashboard,
             'phase': self.phase.value,
-            'error_message': self.error_message
+            'error_message': self.error_message,
+            'object_results': self.object_results
         }
     
     @classmethod
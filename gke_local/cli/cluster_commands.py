@@ -124,7 +124,9 @@ def delete(config_dir: Optional[click.Path], environment: str, verbose: bool):
 
 @cluster.command()
 @common_options
-def reset(config_dir: Optional[click.Path], environment: str, verbose: bool):
+@click.option('--fast', is_flag=True,
+              help='Restore the baseline snapshot in place instead of recreating nodes')
+def reset(config_dir: Optional[click.Path], environment: str, verbose: bool, fast: bool):
     """Reset the Kind cluster by deleting and recreating it."""
     handle_common_options(config_dir, environment, verbose)
     
@@ -144,12 +146,17 @@ def reset(config_dir: Optional[click.Path], environment: str, verbose: bool):
             def on_ready(event):
                 click.echo("✅ Cluster reset complete!")
             
+            def on_phase(event):
+                if verbose:
+                    click.echo(f"⏱️  {event.data['phase']}: {event.data['seconds']:.1f}s")
+            
             manager.add_event_handler('cluster_deleting', on_deleting)
             manager.add_event_handler('cluster_creating', on_creating)
             manager.add_event_handler('cluster_ready', on_ready)
+            manager.add_event_handler('phase_completed', on_phase)
             
             # Reset cluster
-            success = await manager.reset()
+            success = await manager.reset(fast=fast)
             
             if success:
                 status = await manager.get_status()
@@ -168,6 +175,39 @@ def reset(config_dir: Optional[click.Path], environment: str, verbose: bool):
         raise click.Abort()
 
 
+@cluster.command()
+@common_options
+def snapshot(config_dir: Optional[click.Path], environment: str, verbose: bool):
+    """Capture the cluster's current state as the baseline for 'reset --fast'."""
+    handle_common_options(config_dir, environment, verbose)
+    
+    async def _snapshot_cluster():
+        try:
+            manager = KindManager(cli_context.config)
+            
+            status = await manager.get_cluster_status()
+            if not status.is_ready:
+                click.echo(f"❌ Cluster '{status.name}' is not ready", err=True)
+                return False
+            
+            baseline = await manager.snapshot_cluster()
+            if baseline is None:
+                click.echo("❌ Failed to capture snapshot", err=True)
+                return False
+            
+            click.echo(f"📸 Captured {len(baseline.objects)} objects in {len(baseline.namespaces)} namespaces")
+            click.echo(f"🔧 Snapshot: {manager.snapshots.snapshot_path}")
+            return True
+            
+        except Exception as e:
+            click.echo(f"❌ Error capturing snapshot: {e}", err=True)
+            return False
+    
+    success = asyncio.run(_snapshot_cluster())
+    if not success:
+        raise click.Abort()
+
+
 @cluster.command()
 @common_options
 @click.option('--output', '-o', type=click.Choice(['table', 'json']), default='table',
@@ -4,7 +4,9 @@ import asyncio
 import click
 import json
 from typing import Optional
+from ..cluster.preload import ImagePreloader, load_manifests, resolve_images
 from ..cluster.registry import LocalRegistryManager, RegistryIntegration
+from ..cluster.templates import ClusterTemplates
 from .base import cli, common_options, handle_common_options, cli_context
 
 
@@ -323,6 +325,70 @@ def images(config_dir: Optional[click.Path], environment: str, verbose: bool, ou
         raise click.Abort()
 
 
+@registry.command()
+@common_options
+@click.argument('images', nargs=-1)
+@click.option('--manifest', '-f', 'manifests', multiple=True, type=click.Path(exists=True),
+              help='Manifest file or directory to resolve images from (repeatable)')
+@click.option('--template', '-t', help='Cluster template whose images to preload')
+@click.option('--load/--no-load', default=False, help="Also load images into the cluster's nodes")
+@click.option('--concurrency', '-j', default=4, help='Number of images processed at once')
+@click.option('--output', '-o', type=click.Choice(['table', 'json']), default='table',
+              help='Output format')
+def preload(config_dir: Optional[click.Path], environment: str, verbose: bool, images: tuple,
+            manifests: tuple, template: Optional[str], load: bool, concurrency: int, output: str):
+    """Preload images into the local registry and optionally the cluster."""
+    handle_common_options(config_dir, environment, verbose)
+    
+    async def _preload_images():
+        try:
+            wanted = list(images)
+            if manifests:
+                wanted.extend(resolve_images(load_manifests(manifests)))
+            if template:
+                wanted.extend(ClusterTemplates.required_images(template))
+            
+            if not wanted:
+                click.echo("❌ No images to preload. Pass images, --manifest or --template", err=True)
+                return False
+            
+            manager = LocalRegistryManager(cli_context.config)
+            preloader = ImagePreloader(
+                manager,
+                cluster_name=cli_context.config.cluster.name if load else None,
+                max_concurrency=concurrency
+            )
+            
+            def on_progress(result, completed, total):
+                if output == 'table':
+                    mark = "✅" if result.success else "❌"
+                    detail = result.error or f"{result.bytes_pushed} bytes pushed, {result.bytes_loaded} bytes loaded"
+                    click.echo(f"{mark} [{completed}/{total}] {result.image} ({detail})")
+            
+            if output == 'table':
+                click.echo(f"📦 Preloading {len(set(wanted))} images...")
+
+            report = await preloader.preload(wanted, load=load, on_progress=on_progress)
+            
+            if output == 'json':
+                click.echo(json.dumps(report.to_dict(), indent=2))
+            else:
+                totals = report.to_dict()
+                click.echo(f"\n📊 {totals['pushed']} pushed, {totals['already_in_registry']} already in registry, "
+                           f"{totals['failed']} failed in {totals['seconds']:.1f}s")
+                click.echo(f"📤 {totals['bytes_pushed']} bytes pushed, {totals['bytes_loaded']} bytes loaded into nodes")
+            
+            return report.success
+                
+        except Exception as e:
+            click.echo(f"❌ Error preloading images: {e}", err=True)
+            return False
+    
+    success = asyncio.run(_preload_images())
+    if not success:
+        raise click.Abort()
+
+
 @registry.command()
 @common_options
 @click.option('--keep', '-k', default=5, help='Number of latest images to keep per repository')
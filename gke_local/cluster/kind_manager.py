@@ -6,14 +6,22 @@ import subprocess
 import tempfile
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Awaitable, Callable
 from dataclasses import dataclass
 from ..config.models import GKELocalConfig, ClusterConfig
 from ..utils.logging import get_logger
+from .snapshot import ClusterSnapshot, ClusterSnapshotManager
+from .status import ClusterStatusCache, StatusSnapshot
+from .templates import CALICO_MANIFEST_URL
 
 logger = get_logger(__name__)
 
 
+async def _run_phase(phase: str, operation: Awaitable[Any]) -> Any:
+    """Await a reset step without instrumentation."""
+    return await operation
+
+
 @dataclass
 class ClusterStatus:
     """Represents the current status of a Kind cluster."""
@@ -32,19 +40,37 @@ class ClusterStatus:
 class KindManager:
     """Manages Kind cluster lifecycle for local GKE development."""
     
-    def __init__(self, config: GKELocalConfig):
+    def __init__(self, config: GKELocalConfig, status_ttl: float = 5.0):
         """Initialize Kind manager with configuration.
         
         Args:
             config: GKE Local configuration
+            status_ttl: Seconds a cluster status snapshot is shared between callers
         """
         self.config = config
         self.cluster_config = config.cluster
         self.cluster_name = self.cluster_config.name
         
-    async def create_cluster(self) -> bool:
+        # One status query per TTL for every caller; a Node watch once enabled
+        self.status_cache = ClusterStatusCache(
+            self.cluster_name,
+            self._query_cluster_status,
+            ttl_seconds=status_ttl
+        )
+        
+        # Warm baseline used by fast resets
+        self.snapshots = ClusterSnapshotManager(
+            self.cluster_name,
+            lambda cmd: self._run_command(cmd),
+            registry_port=self.cluster_config.registry_port
+        )
+        
+    async def create_cluster(self, node_image: Optional[str] = None) -> bool:
         """Create a new Kind cluster with proper networking configuration.
         
+        Args:
+            node_image: Node image to create the cluster from (Kind's default when None)
+        
         Returns:
             True if cluster was created successfully, False otherwise
         """
@@ -57,7 +83,7 @@ class KindManager:
                 return True
             
             # Generate Kind configuration
-            kind_config = self._generate_kind_config()
+            kind_config = self._generate_kind_config(node_image)
             
             # Write config to temporary file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -74,6 +100,7 @@ class KindManager:
                 ]
                 
                 result = await self._run_command(cmd)
+                self.status_cache.invalidate()
                 
                 if result.returncode == 0:
                     logger.info(f"Successfully created cluster: {self.cluster_name}")
@@ -109,6 +136,7 @@ class KindManager:
             
             cmd = ['kind', 'delete', 'cluster', '--name', self.cluster_name]
             result = await self._run_command(cmd)
+            self.status_cache.invalidate()
             
             if result.returncode == 0:
                 logger.info(f"Successfully deleted cluster: {self.cluster_name}")
@@ -161,28 +189,116 @@ class KindManager:
         logger.warning("Kind clusters cannot be stopped, only deleted. Use delete_cluster() instead.")
         return True
     
-    async def reset_cluster(self) -> bool:
+    async def reset_cluster(self, fast: bool = False,
+                            recreate: Optional[Callable[[Optional[str]], Awaitable[bool]]] = None,
+                            phase: Optional[Callable[[str, Awaitable[Any]], Awaitable[Any]]] = None) -> bool:
         """Reset the Kind cluster by deleting and recreating it.
         
+        Args:
+            fast: Restore the baseline snapshot in place when it matches the
+                running cluster; otherwise recreate the cluster from the
+                snapshot's node image and capture a new baseline
+            recreate: Replaces the delete-and-create step; called with the
+                node image to create the new cluster from
+            phase: Wraps the restore and snapshot steps (e.g. to time them)
+        
         Returns:
             True if cluster was reset successfully, False otherwise
         """
         logger.info(f"Resetting Kind cluster: {self.cluster_name}")
+        recreate = recreate or self._recreate_cluster
+        phase = phase or _run_phase
         
         try:
-            # Delete existing cluster
-            await self.delete_cluster()
+            if fast:
+                if await phase("restore_snapshot", self.restore_snapshot()):
+                    return True
+                logger.info("Fast reset not possible, recreating cluster")
+            
+            previous = self.snapshots.load() if fast else None
+            success = await recreate(previous.node_image if previous else None)
             
-            # Wait a moment for cleanup
-            await asyncio.sleep(2)
+            if success and fast:
+                await phase("snapshot", self.rebaseline(previous))
             
-            # Create new cluster
-            return await self.create_cluster()
+            return success
             
         except Exception as e:
             logger.error(f"Error resetting cluster: {e}")
             return False
     
+    async def _recreate_cluster(self, node_image: Optional[str] = None) -> bool:
+        """Delete the cluster and create it again.
+        
+        Args:
+            node_image: Node image for the new cluster (Kind's default when None)
+            
+        Returns:
+            True if the new cluster was created
+        """
+        # Delete existing cluster
+        await self.delete_cluster()
+        
+        # Wait a moment for cleanup
+        await asyncio.sleep(2)
+        
+        # Create new cluster
+        return await self.create_cluster(node_image=node_image)
+    
+    async def snapshot_cluster(self) -> Optional[ClusterSnapshot]:
+        """Capture the cluster's current state as the baseline for fast resets.
+        
+        Returns:
+            The stored snapshot, or None if the cluster could not be read
+        """
+        try:
+            return await self.snapshots.capture()
+        except Exception as e:
+            logger.error(f"Error capturing cluster snapshot: {e}")
+            return None
+    
+    async def restore_snapshot(self) -> bool:
+        """Return the running cluster to its baseline snapshot without recreating nodes.
+        
+        Returns:
+            True if the cluster matches its baseline again, False if there is
+            no snapshot of the current nodes or restoring failed
+        """
+        try:
+            snapshot = self.snapshots.load()
+            if snapshot is None:
+                logger.info(f"No baseline snapshot for cluster {self.cluster_name}")
+                return False
+            
+            if not await self.snapshots.is_current(snapshot):
+                logger.info(f"Baseline snapshot of {self.cluster_name} was taken of other nodes")
+                return False
+            
+            result = await self.snapshots.restore(snapshot)
+            self.status_cache.invalidate()
+            
+            if not result.success:
+                logger.warning(f"Could not restore baseline of {self.cluster_name}: {result.failed}")
+            return result.success
+            
+        except Exception as e:
+            logger.error(f"Error restoring cluster snapshot: {e}")
+            return False
+    
+    async def rebaseline(self, previous: Optional[ClusterSnapshot] = None) -> bool:
+        """Warm up a recreated cluster and capture its new baseline.
+        
+        Args:
+            previous: Snapshot of the cluster this one replaces; its registry
+                images are preloaded into the new nodes
+            
+        Returns:
+            True if a new baseline was captured
+        """
+        if previous is not None:
+            await self.snapshots.preload_images(previous)
+        return await self.snapshot_cluster() is not None
+    
     async def cluster_exists(self) -> bool:
         """Check if the Kind cluster exists.
         
@@ -203,16 +319,22 @@ class KindManager:
             logger.error(f"Error checking cluster existence: {e}")
             return False
     
-    async def get_cluster_status(self) -> ClusterStatus:
+    async def get_cluster_status(self, max_age: Optional[float] = None) -> ClusterStatus:
         """Get detailed status of the Kind cluster.
         
+        Status comes from the shared status cache: one combined query per
+        TTL, or the live Node watch once it is running.
+        
+        Args:
+            max_age: Maximum acceptable age of cached status in seconds
+            
         Returns:
             ClusterStatus object with current cluster state
         """
         try:
-            exists = await self.cluster_exists()
+            snapshot = await self.status_cache.get(max_age)
             
-            if not exists:
+            if not snapshot.exists:
                 return ClusterStatus(
                     name=self.cluster_name,
                     exists=False,
@@ -220,8 +342,7 @@ class KindManager:
                     nodes=[]
                 )
             
-            # Get cluster nodes
-            nodes = await self._get_cluster_nodes()
+            nodes = snapshot.nodes
             
             # Check if cluster is running (nodes are ready)
             running = len(nodes) > 0 and all(
@@ -272,9 +393,12 @@ class KindManager:
             logger.error(f"Error getting kubeconfig: {e}")
             return None
     
-    def _generate_kind_config(self) -> Dict[str, Any]:
+    def _generate_kind_config(self, node_image: Optional[str] = None) -> Dict[str, Any]:
         """Generate Kind cluster configuration based on GKE Local config.
         
+        Args:
+            node_image: Node image for every node (Kind's default when None)
+        
         Returns:
             Kind configuration dictionary
         """
@@ -326,6 +450,10 @@ class KindManager:
             }
             config['nodes'].append(worker)
         
+        if node_image:
+            for node in config['nodes']:
+                node['image'] = node_image
+        
         # Networking configuration
         config['networking'] = {
             'apiServerAddress': '127.0.0.1',
@@ -362,10 +490,8 @@ class KindManager:
         logger.info("Installing CNI plugin")
         
         # Use Calico for network policy support
-        calico_manifest = "https://raw.githubusercontent.com/projectcalico/calico/v3.26.1/manifests/calico.yaml"
-        
         cmd = [
-            'kubectl', 'apply', '-f', calico_manifest,
+            'kubectl', 'apply', '-f', CALICO_MANIFEST_URL,
             '--context', f'kind-{self.cluster_name}'
         ]
         
@@ -417,6 +543,23 @@ class KindManager:
         finally:
             Path(config_path).unlink(missing_ok=True)
     
+    async def _query_cluster_status(self) -> StatusSnapshot:
+        """Query cluster existence and nodes with as few commands as possible.
+        
+        A reachable API server answers both questions with one ``kubectl``
+        call; ``kind get clusters`` is only needed when it returns nothing.
+        
+        Returns:
+            Fresh status snapshot
+        """
+        nodes = await self._get_cluster_nodes()
+        if nodes:
+            return StatusSnapshot(exists=True, nodes=nodes)
+        
+        # No nodes reported: distinguish a stopped cluster from a missing one
+        exists = await self.cluster_exists()
+        return StatusSnapshot(exists=exists, nodes=[], source="kind")
+    
     async def _get_cluster_nodes(self) -> List[Dict[str, Any]]:
         """Get information about cluster nodes.
         
@@ -426,7 +569,8 @@ class KindManager:
         try:
             cmd = [
                 'kubectl', 'get', 'nodes', '-o', 'json',
-                '--context', f'kind-{self.cluster_name}'
+                '--context', f'kind-{self.cluster_name}',
+                '--request-timeout=10s'
             ]
             
             result = await self._run_command(cmd)
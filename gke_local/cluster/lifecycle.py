@@ -1,8 +1,9 @@
 """Cluster lifecycle management utilities."""
 
 import asyncio
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+import os
+from typing import Dict, List, Optional, Callable, Any, Awaitable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from .kind_manager import KindManager, ClusterStatus
 from .registry import LocalRegistryManager, RegistryIntegration
@@ -35,20 +36,25 @@ class ClusterEvent:
 class ClusterLifecycleManager:
     """Manages the complete lifecycle of Kind clusters."""
     
-    def __init__(self, config: GKELocalConfig):
+    def __init__(self, config: GKELocalConfig, monitor_interval: float = 30.0,
+                 registry_manager: Optional[LocalRegistryManager] = None):
         """Initialize lifecycle manager.
         
         Args:
             config: GKE Local configuration
+            monitor_interval: Maximum seconds between health checks while monitoring
+            registry_manager: Registry shared with other clusters (own registry when omitted)
         """
         self.config = config
         self.kind_manager = KindManager(config)
-        self.registry_manager = LocalRegistryManager(config)
+        self.registry_manager = registry_manager or LocalRegistryManager(config)
         self.registry_integration = RegistryIntegration(self.registry_manager)
         self.cluster_name = config.cluster.name
         self._state = ClusterState.NOT_EXISTS
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
+        self.monitor_interval = monitor_interval
+        self.last_timings: Dict[str, float] = {}
         
     @property
     def state(self) -> ClusterState:
@@ -77,12 +83,27 @@ class ClusterLifecycleManager:
             logger.error(f"Failed to initialize lifecycle manager: {e}")
             return False
     
-    async def create_and_start(self) -> bool:
+    async def create_and_start(self, ensure_registry: bool = True,
+                               node_image: Optional[str] = None) -> bool:
         """Create and start the cluster.
         
+        Each phase is timed and reported through a ``phase_completed`` event;
+        the ``cluster_ready`` event carries all phase timings.
+        
+        Args:
+            ensure_registry: Start the local registry first (skipped when an
+                orchestrator has already brought up a shared registry)
+            node_image: Node image to create the cluster from (Kind's default when None)
+        
         Returns:
             True if cluster is ready, False otherwise
         """
+        self.last_timings = {}
+        return await self._create_and_start(ensure_registry, node_image)
+    
+    async def _create_and_start(self, ensure_registry: bool = True,
+                                node_image: Optional[str] = None) -> bool:
+        """Create and start the cluster, adding to the current phase timings."""
         logger.info(f"Creating and starting cluster: {self.cluster_name}")
         
         try:
@@ -90,35 +111,42 @@ class ClusterLifecycleManager:
             await self._emit_event("cluster_creating", {})
             
             # Start registry if not running
-            await self._ensure_registry_running()
+            if ensure_registry:
+                await self._timed_phase("registry", self._ensure_registry_running())
             
             # Create cluster
-            success = await self.kind_manager.create_cluster()
+            success = await self._timed_phase("kind_create", self.kind_manager.create_cluster(node_image=node_image))
             
             if success:
                 # Wait for cluster to be ready
-                await self._wait_for_ready()
+                await self._timed_phase("wait_ready", self._wait_for_ready())
                 
                 if self._state == ClusterState.READY:
                     # Connect registry to cluster
-                    await self._connect_registry_to_cluster()
+                    await self._timed_phase("registry_connect", self._connect_registry_to_cluster())
                     
-                    await self._emit_event("cluster_ready", {})
+                    await self._emit_event("cluster_ready", {"timings": dict(self.last_timings)})
                     await self.start_monitoring()
                     return True
                 else:
                     self._state = ClusterState.ERROR
-                    await self._emit_event("cluster_error", {"error": "Cluster not ready after creation"})
+                    await self._emit_event("cluster_error", {
+                        "error": "Cluster not ready after creation",
+                        "timings": dict(self.last_timings)
+                    })
                     return False
             else:
                 self._state = ClusterState.ERROR
-                await self._emit_event("cluster_error", {"error": "Failed to create cluster"})
+                await self._emit_event("cluster_error", {
+                    "error": "Failed to create cluster",
+                    "timings": dict(self.last_timings)
+                })
                 return False
                 
         except Exception as e:
             logger.error(f"Error creating cluster: {e}")
             self._state = ClusterState.ERROR
-            await self._emit_event("cluster_error", {"error": str(e)})
+            await self._emit_event("cluster_error", {"error": str(e), "timings": dict(self.last_timings)})
             return False
     
     async def stop_and_cleanup(self) -> bool:
@@ -127,55 +155,97 @@ class ClusterLifecycleManager:
         Returns:
             True if cleanup successful, False otherwise
         """
+        self.last_timings = {}
+        return await self._stop_and_cleanup()
+    
+    async def _stop_and_cleanup(self) -> bool:
+        """Stop and clean up the cluster, adding to the current phase timings."""
         logger.info(f"Stopping and cleaning up cluster: {self.cluster_name}")
         
         try:
             # Stop monitoring
-            await self.stop_monitoring()
+            await self._timed_phase("stop_monitoring", self.stop_monitoring())
             
             self._state = ClusterState.DELETING
             await self._emit_event("cluster_deleting", {})
             
             # Delete cluster (Kind doesn't support stopping)
-            success = await self.kind_manager.delete_cluster()
+            success = await self._timed_phase("kind_delete", self.kind_manager.delete_cluster())
             
             if success:
                 self._state = ClusterState.NOT_EXISTS
-                await self._emit_event("cluster_deleted", {})
+                await self._emit_event("cluster_deleted", {"timings": dict(self.last_timings)})
                 return True
             else:
                 self._state = ClusterState.ERROR
-                await self._emit_event("cluster_error", {"error": "Failed to delete cluster"})
+                await self._emit_event("cluster_error", {
+                    "error": "Failed to delete cluster",
+                    "timings": dict(self.last_timings)
+                })
                 return False
                 
         except Exception as e:
             logger.error(f"Error stopping cluster: {e}")
             self._state = ClusterState.ERROR
-            await self._emit_event("cluster_error", {"error": str(e)})
+            await self._emit_event("cluster_error", {"error": str(e), "timings": dict(self.last_timings)})
             return False
     
-    async def reset(self) -> bool:
+    async def reset(self, fast: bool = False) -> bool:
         """Reset the cluster by recreating it.
         
+        Args:
+            fast: Restore the baseline snapshot in place when it matches the
+                running cluster (seconds instead of minutes); otherwise
+                recreate the cluster and capture a new baseline
+        
         Returns:
             True if reset successful, False otherwise
         """
         logger.info(f"Resetting cluster: {self.cluster_name}")
+        self.last_timings = {}
+        recreated = False
+        
+        async def recreate(node_image: Optional[str]) -> bool:
+            nonlocal recreated
+            recreated = True
+            return await self._recreate(node_image)
         
         try:
-            # Stop and cleanup
-            await self.stop_and_cleanup()
+            if fast:
+                await self._emit_event("cluster_resetting", {"fast": True})
+            
+            success = await self.kind_manager.reset_cluster(
+                fast=fast, recreate=recreate, phase=self._timed_phase
+            )
             
-            # Wait a moment
-            await asyncio.sleep(2)
+            if success and not recreated:
+                await self._update_state()
+                await self._emit_event("cluster_ready", {"timings": dict(self.last_timings), "fast_reset": True})
             
-            # Create and start again
-            return await self.create_and_start()
+            return success
             
         except Exception as e:
             logger.error(f"Error resetting cluster: {e}")
             return False
     
+    async def _recreate(self, node_image: Optional[str] = None) -> bool:
+        """Tear the cluster down and bring it up again, keeping earlier phase timings.
+        
+        Args:
+            node_image: Node image for the new cluster (Kind's default when None)
+            
+        Returns:
+            True if the new cluster is ready
+        """
+        # Stop and cleanup
+        await self._stop_and_cleanup()
+        
+        # Wait a moment
+        await asyncio.sleep(2)
+        
+        # Create and start again
+        return await self._create_and_start(node_image=node_image)
+    
     async def get_status(self) -> ClusterStatus:
         """Get detailed cluster status.
         
@@ -217,10 +287,13 @@ class ClusterLifecycleManager:
             return
         
         logger.info("Starting cluster monitoring")
+        # Node watch replaces polling once the cluster is up
+        self.kind_manager.status_cache.enable_watch()
         self._monitoring_task = asyncio.create_task(self._monitor_cluster())
     
     async def stop_monitoring(self) -> None:
         """Stop monitoring cluster health."""
+        self.kind_manager.status_cache.disable_watch()
         if self._monitoring_task and not self._monitoring_task.done():
             logger.info("Stopping cluster monitoring")
             self._monitoring_task.cancel()
@@ -254,8 +327,12 @@ class ClusterLifecycleManager:
             except ValueError:
                 pass
     
-    async def _update_state(self) -> None:
-        """Update the current cluster state."""
+    async def _update_state(self) -> Optional[ClusterStatus]:
+        """Update the current cluster state.
+        
+        Returns:
+            The status the state was derived from, or None on error
+        """
         try:
             status = await self.get_status()
             
@@ -265,10 +342,13 @@ class ClusterLifecycleManager:
                 self._state = ClusterState.READY
             else:
                 self._state = ClusterState.ERROR
+            
+            return status
                 
         except Exception as e:
             logger.error(f"Error updating cluster state: {e}")
             self._state = ClusterState.ERROR
+            return None
     
     async def _wait_for_ready(self) -> None:
         """Wait for cluster to be ready after creation."""
@@ -281,7 +361,7 @@ class ClusterLifecycleManager:
         try:
             while True:
                 previous_state = self._state
-                await self._update_state()
+                status = await self._update_state()
                 
                 # Emit event if state changed
                 if self._state != previous_state:
@@ -292,9 +372,10 @@ class ClusterLifecycleManager:
                 
                 # Check for specific issues
                 if self._state == ClusterState.READY:
-                    await self._check_cluster_health()
+                    await self._check_cluster_health(status)
                 
-                await asyncio.sleep(30)  # Check every 30 seconds
+                # Wake early on node changes reported by the watch
+                await self.kind_manager.status_cache.wait_for_change(self.monitor_interval)
                 
         except asyncio.CancelledError:
             logger.info("Cluster monitoring stopped")
@@ -304,10 +385,15 @@ class ClusterLifecycleManager:
             self._state = ClusterState.ERROR
             await self._emit_event("monitoring_error", {"error": str(e)})
     
-    async def _check_cluster_health(self) -> None:
-        """Check detailed cluster health."""
+    async def _check_cluster_health(self, status: Optional[ClusterStatus] = None) -> None:
+        """Check detailed cluster health.
+        
+        Args:
+            status: Status already fetched this tick (fetched when omitted)
+        """
         try:
-            status = await self.get_status()
+            if status is None:
+                status = await self.get_status()
             
             # Check node health
             unhealthy_nodes = []
@@ -359,6 +445,25 @@ class ClusterLifecycleManager:
         except Exception as e:
             logger.warning(f"Error connecting registry to cluster: {e}")
     
+    async def _timed_phase(self, phase: str, operation: Awaitable[Any]) -> Any:
+        """Await one lifecycle phase, recording and emitting its duration.
+        
+        Args:
+            phase: Phase name (e.g. ``kind_create``)
+            operation: Awaitable performing the phase
+            
+        Returns:
+            The phase's result
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            return await operation
+        finally:
+            elapsed = loop.time() - started
+            self.last_timings[phase] = elapsed
+            await self._emit_event("phase_completed", {"phase": phase, "seconds": round(elapsed, 3)})
+    
     async def _emit_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Emit a cluster event to registered handlers.
         
@@ -387,13 +492,82 @@ class ClusterLifecycleManager:
                     logger.error(f"Error in event handler for {event_type}: {e}")
 
 
+@dataclass
+class ClusterOperationResult:
+    """Outcome of one orchestrated operation on one cluster."""
+    cluster_name: str
+    operation: str
+    success: bool
+    seconds: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'cluster': self.cluster_name,
+            'operation': self.operation,
+            'success': self.success,
+            'seconds': round(self.seconds, 3),
+            'timings': {phase: round(seconds, 3) for phase, seconds in self.timings.items()},
+            'error': self.error,
+        }
+
+
+@dataclass
+class OrchestrationReport:
+    """Per-cluster results and shared-phase timings of one orchestrated run."""
+    operation: str
+    parallelism: int
+    results: Dict[str, ClusterOperationResult] = field(default_factory=dict)
+    shared_timings: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+    
+    @property
+    def success(self) -> bool:
+        """True if every cluster succeeded."""
+        return all(result.success for result in self.results.values())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'operation': self.operation,
+            'parallelism': self.parallelism,
+            'success': self.success,
+            'seconds': round(self.seconds, 3),
+            'shared_timings': {phase: round(seconds, 3) for phase, seconds in self.shared_timings.items()},
+            'clusters': {name: result.to_dict() for name, result in self.results.items()},
+        }
+
+
 class ClusterOrchestrator:
-    """Orchestrates multiple cluster lifecycle managers."""
+    """Orchestrates multiple cluster lifecycle managers.
     
-    def __init__(self):
-        """Initialize cluster orchestrator."""
+    Lifecycle operations run concurrently, at most ``max_parallel`` clusters
+    at a time. Without an explicit cap the limit is derived from the CPUs and
+    memory available to Docker, since every Kind node is a container booting
+    a full control plane or kubelet. All clusters share one local registry,
+    which is started once before any cluster is created. A failure or
+    exception in one cluster never affects the others.
+    """
+    
+    # Resources one booting Kind node needs to come up without timing out
+    CPUS_PER_NODE = 1.0
+    MEMORY_GIB_PER_NODE = 1.5
+    
+    def __init__(self, max_parallel: Optional[int] = None, share_registry: bool = True):
+        """Initialize cluster orchestrator.
+        
+        Args:
+            max_parallel: Maximum clusters operated on at once (resource based when omitted)
+            share_registry: Use the first cluster's registry for every cluster
+        """
         self.clusters: Dict[str, ClusterLifecycleManager] = {}
         self.default_cluster: Optional[str] = None
+        self.max_parallel = max_parallel
+        self.share_registry = share_registry
+        self.registry_manager: Optional[LocalRegistryManager] = None
+        self.last_report: Optional[OrchestrationReport] = None
     
     def add_cluster(self, config: GKELocalConfig) -> ClusterLifecycleManager:
         """Add a cluster to the orchestrator.
@@ -405,7 +579,14 @@ class ClusterOrchestrator:
             Cluster lifecycle manager
         """
         cluster_name = config.cluster.name
-        manager = ClusterLifecycleManager(config)
+        
+        if self.share_registry and self.registry_manager is None:
+            self.registry_manager = LocalRegistryManager(config)
+        
+        manager = ClusterLifecycleManager(
+            config,
+            registry_manager=self.registry_manager if self.share_registry else None
+        )
         
         self.clusters[cluster_name] = manager
         
@@ -437,42 +618,157 @@ class ClusterOrchestrator:
         return list(self.clusters.keys())
     
     async def start_all(self) -> Dict[str, bool]:
-        """Start all managed clusters.
+        """Start all managed clusters concurrently.
+        
+        The shared registry is brought up once first; details of the run are
+        kept in ``last_report``.
         
         Returns:
             Dictionary mapping cluster names to success status
         """
-        results = {}
-        
-        for name, manager in self.clusters.items():
-            logger.info(f"Starting cluster: {name}")
-            results[name] = await manager.create_and_start()
-        
-        return results
+        report = await self._run_all(
+            "start",
+            lambda manager: manager.create_and_start(ensure_registry=not self.share_registry),
+            prepare=self._ensure_shared_registry if self.share_registry else None
+        )
+        return {name: result.success for name, result in report.results.items()}
     
     async def stop_all(self) -> Dict[str, bool]:
-        """Stop all managed clusters.
+        """Stop all managed clusters concurrently.
         
         Returns:
             Dictionary mapping cluster names to success status
         """
-        results = {}
+        report = await self._run_all("stop", lambda manager: manager.stop_and_cleanup())
+        return {name: result.success for name, result in report.results.items()}
+    
+    async def get_all_status(self) -> Dict[str, ClusterStatus]:
+        """Get status of all managed clusters concurrently.
+        
+        Returns:
+            Dictionary mapping cluster names to their status; a cluster whose
+            status query fails is reported as not existing
+        """
+        names = list(self.clusters)
+        statuses = await asyncio.gather(
+            *(self.clusters[name].get_status() for name in names),
+            return_exceptions=True
+        )
         
-        for name, manager in self.clusters.items():
-            logger.info(f"Stopping cluster: {name}")
-            results[name] = await manager.stop_and_cleanup()
+        results = {}
+        for name, status in zip(names, statuses):
+            if isinstance(status, Exception):
+                logger.error(f"Error getting status of cluster {name}: {status}")
+                status = ClusterStatus(name=name, exists=False, running=False, nodes=[])
+            results[name] = status
         
         return results
     
-    async def get_all_status(self) -> Dict[str, ClusterStatus]:
-        """Get status of all managed clusters.
+    async def resolve_parallelism(self) -> int:
+        """Number of clusters to operate on at once.
         
         Returns:
-            Dictionary mapping cluster names to their status
+            ``max_parallel`` if set, otherwise how many of the largest managed
+            clusters fit in Docker's CPUs and memory (at least 1)
         """
-        results = {}
+        if self.max_parallel is not None:
+            return max(1, self.max_parallel)
         
-        for name, manager in self.clusters.items():
-            results[name] = await manager.get_status()
+        cpus, memory_gib = await self._docker_resources()
+        nodes_per_cluster = max((manager.config.cluster.nodes for manager in self.clusters.values()), default=1)
+        node_budget = min(cpus / self.CPUS_PER_NODE, memory_gib / self.MEMORY_GIB_PER_NODE)
+        parallelism = int(node_budget // max(1, nodes_per_cluster))
         
-        return results
\ No newline at end of file
+        return max(1, min(parallelism, len(self.clusters) or 1))
+    
+    async def _run_all(self, operation: str,
+                       action: Callable[[ClusterLifecycleManager], Awaitable[bool]],
+                       prepare: Optional[Callable[[], Awaitable[None]]] = None) -> OrchestrationReport:
+        """Run one lifecycle action on every cluster under the parallelism cap.
+        
+        Args:
+            operation: Operation name used in logs and the report
+            action: Lifecycle call to make on each manager
+            prepare: Shared step awaited once before any cluster starts
+            
+        Returns:
+            Report with per-cluster results
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        parallelism = await self.resolve_parallelism()
+        report = OrchestrationReport(operation=operation, parallelism=parallelism)
+        
+        logger.info(f"Running {operation} on {len(self.clusters)} clusters ({parallelism} at a time)")
+        
+        if prepare is not None:
+            prepare_started = loop.time()
+            await prepare()
+            report.shared_timings['registry'] = loop.time() - prepare_started
+        
+        semaphore = asyncio.Semaphore(parallelism)
+        
+        async def run_one(name: str, manager: ClusterLifecycleManager) -> ClusterOperationResult:
+            async with semaphore:
+                logger.info(f"Cluster {name}: {operation}")
+                cluster_started = loop.time()
+                error = None
+                try:
+                    success = bool(await action(manager))
+                except Exception as e:
+                    logger.error(f"Cluster {name}: {operation} failed: {e}")
+                    success = False
+                    error = str(e)
+                
+                return ClusterOperationResult(
+                    cluster_name=name,
+                    operation=operation,
+                    success=success,
+                    seconds=loop.time() - cluster_started,
+                    timings=dict(manager.last_timings),
+                    error=error
+                )
+        
+        results = await asyncio.gather(
+            *(run_one(name, manager) for name, manager in self.clusters.items())
+        )
+        report.results = {result.cluster_name: result for result in results}
+        report.seconds = loop.time() - started
+        self.last_report = report
+        
+        failed = [name for name, result in report.results.items() if not result.success]
+        if failed:
+            logger.warning(f"{operation} failed for clusters: {', '.join(failed)}")
+        logger.info(f"Finished {operation} on {len(results)} clusters in {report.seconds:.1f}s")
+        
+        return report
+    
+    async def _ensure_shared_registry(self) -> None:
+        """Start the shared registry once for all clusters."""
+        if self.registry_manager is None or not self.clusters:
+            return
+        
+        # Any manager will do: they all hold the shared registry manager
+        await next(iter(self.clusters.values()))._ensure_registry_running()
+    
+    async def _docker_resources(self) -> Tuple[float, float]:
+        """CPUs and memory (GiB) available to Docker, falling back to the host's."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'docker', 'info', '--format', '{{.NCPU}} {{.MemTotal}}',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, _ = await process.communicate()
+            if process.returncode == 0:
+                cpus, memory = stdout.decode('utf-8').split()
+                return float(cpus), int(memory) / 2 ** 30
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not query Docker resources: {e}")
+        
+        cpus = os.cpu_count() or 1
+        try:
+            memory_gib = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 2 ** 30
+        except (ValueError, OSError, AttributeError):
+            memory_gib = cpus * self.MEMORY_GIB_PER_NODE
+        return float(cpus), memory_gib
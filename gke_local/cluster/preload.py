@@ -0,0 +1,405 @@
+"""Image preloading for local clusters through the local registry."""
+
+import asyncio
+import re
+import time
+import yaml
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..utils.logging import get_logger
+from .registry import LocalRegistryManager
+from .registry_client import RegistryAPIError
+from .templates import ClusterTemplates
+
+logger = get_logger(__name__)
+
+
+ProgressCallback = Callable[['ImagePreloadResult', int, int], None]
+
+_CONTAINER_LISTS = ('containers', 'initContainers', 'ephemeralContainers')
+
+# Short (12 hex digit) layer IDs that `docker push` reports per layer
+_PUSH_LAYER = re.compile(r'^([0-9a-f]{12}): (Pushed|Layer already exists|Mounted from .+)$', re.MULTILINE)
+
+# `kind load` reports one line per node that did not have the image yet
+_KIND_LOADING = re.compile(r'not yet present on node "([^"]+)"')
+
+
+def resolve_images(manifests: Iterable[Dict[str, Any]]) -> List[str]:
+    """Collect the container images referenced by manifests.
+
+    Pod specs are found wherever they are nested (Pods, workload templates,
+    CronJob job templates, List items), so custom resources embedding pod
+    templates are covered too.
+
+    Args:
+        manifests: Kubernetes manifests
+
+    Returns:
+        Distinct image references in first-seen order
+    """
+    images: Dict[str, None] = {}
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in _CONTAINER_LISTS and isinstance(value, list):
+                    for container in value:
+                        if isinstance(container, dict) and container.get('image'):
+                            images.setdefault(container['image'], None)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    for manifest in manifests:
+        walk(manifest)
+    return list(images)
+
+
+def load_manifests(paths: Iterable[Union[str, Path]]) -> List[Dict[str, Any]]:
+    """Load every YAML document from manifest files and directories.
+
+    Args:
+        paths: Manifest files or directories of ``*.yaml``/``*.yml`` files
+
+    Returns:
+        Parsed manifests (empty documents skipped)
+    """
+    files: List[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob('*') if p.suffix in ('.yaml', '.yml')))
+        else:
+            files.append(path)
+
+    manifests = []
+    for file_path in files:
+        with open(file_path) as f:
+            manifests.extend(doc for doc in yaml.safe_load_all(f) if isinstance(doc, dict))
+    return manifests
+
+
+def split_image_reference(image: str) -> Tuple[Optional[str], str, Optional[str], Optional[str]]:
+    """Split an image reference into (registry, repository, tag, digest).
+
+    The registry is None for Docker Hub references without an explicit host.
+    """
+    name, _, digest = image.partition('@')
+    registry = None
+    first, _, rest = name.partition('/')
+    if rest and ('.' in first or ':' in first or first == 'localhost'):
+        registry, name = first, rest
+
+    tag = None
+    if ':' in name.rsplit('/', 1)[-1]:
+        name, tag = name.rsplit(':', 1)
+    return registry, name, tag, digest or None
+
+
+@dataclass
+class ImagePreloadResult:
+    """Outcome of preloading one image."""
+    image: str
+    registry_image: Optional[str] = None
+    image_id: Optional[str] = None
+    size_bytes: int = 0
+    pulled: bool = False
+    pushed: bool = False
+    already_in_registry: bool = False
+    layers_pushed: int = 0
+    layers_reused: int = 0
+    bytes_pushed: int = 0
+    nodes_loaded: List[str] = field(default_factory=list)
+    bytes_loaded: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """True if the image was preloaded without errors."""
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'image': self.image,
+            'registry_image': self.registry_image,
+            'image_id': self.image_id,
+            'size_bytes': self.size_bytes,
+            'pulled': self.pulled,
+            'pushed': self.pushed,
+            'already_in_registry': self.already_in_registry,
+            'layers_pushed': self.layers_pushed,
+            'layers_reused': self.layers_reused,
+            'bytes_pushed': self.bytes_pushed,
+            'nodes_loaded': self.nodes_loaded,
+            'bytes_loaded': self.bytes_loaded,
+            'seconds': round(self.seconds, 3),
+            'error': self.error,
+        }
+
+
+@dataclass
+class PreloadReport:
+    """Per-image results and totals of one preload run."""
+    results: List[ImagePreloadResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """True if every image was preloaded."""
+        return all(result.success for result in self.results)
+
+    @property
+    def failed(self) -> List[ImagePreloadResult]:
+        """Images that could not be preloaded."""
+        return [result for result in self.results if not result.success]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'success': self.success,
+            'images': len(self.results),
+            'failed': len(self.failed),
+            'pulled': sum(1 for result in self.results if result.pulled),
+            'pushed': sum(1 for result in self.results if result.pushed),
+            'already_in_registry': sum(1 for result in self.results if result.already_in_registry),
+            'bytes_pushed': sum(result.bytes_pushed for result in self.results),
+            'bytes_loaded': sum(result.bytes_loaded for result in self.results),
+            'seconds': round(self.seconds, 3),
+            'results': [result.to_dict() for result in self.results],
+        }
+
+
+class ImagePreloader:
+    """Preloads the images a cluster will need before anything is deployed.
+
+    For each image, concurrently up to ``max_concurrency`` images at a time:
+    it is pulled into the local Docker daemon if missing, pushed to the local
+    registry unless the registry already holds the same image (compared by
+    config digest), and optionally loaded into the Kind cluster's nodes. The
+    registry acts as a layer cache shared by every local cluster; ``kind
+    load`` only transfers images to nodes that do not have them yet.
+    """
+
+    def __init__(self, registry_manager: LocalRegistryManager, cluster_name: Optional[str] = None,
+                 max_concurrency: int = 4):
+        """Initialize image preloader.
+
+        Args:
+            registry_manager: Manager of the local registry images are pushed to
+            cluster_name: Kind cluster images are loaded into (no loading when omitted)
+            max_concurrency: Maximum images processed at once
+        """
+        self.registry_manager = registry_manager
+        self.cluster_name = cluster_name
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def preload_manifests(self, manifests: Iterable[Dict[str, Any]], push: bool = True,
+                                load: bool = False,
+                                on_progress: Optional[ProgressCallback] = None) -> PreloadReport:
+        """Preload every image referenced by a manifest set.
+
+        Args:
+            manifests: Kubernetes manifests
+            push: Push images to the local registry
+            load: Load images into the cluster's nodes
+            on_progress: Called with (result, completed, total) as each image finishes
+
+        Returns:
+            PreloadReport for the resolved images
+        """
+        return await self.preload(resolve_images(manifests), push=push, load=load, on_progress=on_progress)
+
+    async def preload_template(self, template_name: str, push: bool = True, load: bool = False,
+                               on_progress: Optional[ProgressCallback] = None) -> PreloadReport:
+        """Preload the images a cluster template runs (node image and add-ons).
+
+        Args:
+            template_name: Name of the cluster template
+            push: Push images to the local registry
+            load: Load images into the cluster's nodes
+            on_progress: Called with (result, completed, total) as each image finishes
+
+        Returns:
+            PreloadReport for the template's images
+        """
+        images = ClusterTemplates.required_images(template_name)
+        return await self.preload(images, push=push, load=load, on_progress=on_progress)
+
+    async def preload(self, images: Iterable[str], push: bool = True, load: bool = False,
+                      on_progress: Optional[ProgressCallback] = None) -> PreloadReport:
+        """Preload images into the local registry and optionally the cluster.
+
+        Args:
+            images: Image references
+            push: Push images to the local registry
+            load: Load images into the cluster's nodes
+            on_progress: Called with (result, completed, total) as each image finishes
+
+        Returns:
+            PreloadReport with per-image results and transfer totals
+        """
+        images = list(dict.fromkeys(images))
+        started = time.monotonic()
+        report = PreloadReport()
+
+        if load and not self.cluster_name:
+            raise ValueError("A cluster name is required to load images into nodes")
+
+        logger.info(f"Preloading {len(images)} images")
+
+        api = None
+        if push:
+            status = await self.registry_manager.get_registry_status()
+            if not status.is_accessible:
+                logger.warning("Registry is not accessible, images will not be pushed")
+                push = False
+            else:
+                api = self.registry_manager.api_client(status)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def run(image: str) -> ImagePreloadResult:
+            nonlocal completed
+            async with semaphore:
+                result = await self._preload_one(image, api, load)
+
+            completed += 1
+            if result.success:
+                logger.info(f"[{completed}/{len(images)}] {image}: {self._describe(result)}")
+            else:
+                logger.warning(f"[{completed}/{len(images)}] {image}: {result.error}")
+            if on_progress is not None:
+                on_progress(result, completed, len(images))
+            return result
+
+        try:
+            report.results = list(await asyncio.gather(*(run(image) for image in images)))
+        finally:
+            if api is not None:
+                await api.close()
+
+        report.seconds = time.monotonic() - started
+        totals = report.to_dict()
+        logger.info(
+            f"Preloaded {len(images) - totals['failed']}/{len(images)} images in {report.seconds:.1f}s "
+            f"({totals['bytes_pushed']} bytes pushed, {totals['bytes_loaded']} bytes loaded into nodes)"
+        )
+        return report
+
+    def registry_reference(self, image: str) -> Tuple[str, str]:
+        """Repository and tag an image is stored under in the local registry."""
+        _, repository, tag, digest = split_image_reference(image)
+        if tag is None:
+            tag = f"sha256-{digest.split(':', 1)[-1][:16]}" if digest else 'latest'
+        return repository, tag
+
+    async def _preload_one(self, image: str, api: Any, load: bool) -> ImagePreloadResult:
+        started = time.monotonic()
+        result = ImagePreloadResult(image=image)
+
+        try:
+            if not await self._inspect_local(image, result):
+                pull = await self._run(['docker', 'pull', image])
+                if pull.returncode != 0:
+                    result.error = f"pull failed: {pull.stderr.strip()}"
+                    return result
+                result.pulled = True
+                await self._inspect_local(image, result)
+
+            if api is not None:
+                await self._push(image, api, result)
+
+            if load and result.success:
+                await self._kind_load(image, result)
+
+        except Exception as e:
+            result.error = str(e)
+        finally:
+            result.seconds = time.monotonic() - started
+
+        return result
+
+    async def _inspect_local(self, image: str, result: ImagePreloadResult) -> bool:
+        inspect = await self._run(['docker', 'image', 'inspect', '--format', '{{.Id}} {{.Size}}', image])
+        if inspect.returncode != 0:
+            return False
+        image_id, size = inspect.stdout.split()
+        result.image_id = image_id
+        result.size_bytes = int(size)
+        return True
+
+    async def _push(self, image: str, api: Any, result: ImagePreloadResult) -> None:
+        repository, tag = self.registry_reference(image)
+        result.registry_image = f"{self.registry_manager.registry_host}:{self.registry_manager.registry_port}/{repository}:{tag}"
+
+        # Same config digest as the local image: the registry already has it
+        try:
+            existing = await api.get_manifest_info(repository, tag)
+            if existing.config_digest and existing.config_digest == result.image_id:
+                result.already_in_registry = True
+                return
+        except RegistryAPIError:
+            pass
+
+        tag_result = await self._run(['docker', 'tag', image, result.registry_image])
+        if tag_result.returncode != 0:
+            result.error = f"tag failed: {tag_result.stderr.strip()}"
+            return
+
+        push = await self._run(['docker', 'push', result.registry_image])
+        if push.returncode != 0:
+            result.error = f"push failed: {push.stderr.strip()}"
+            return
+        result.pushed = True
+
+        pushed_layers = set()
+        for short_id, outcome in _PUSH_LAYER.findall(push.stdout):
+            if outcome == 'Pushed':
+                pushed_layers.add(short_id)
+            else:
+                result.layers_reused += 1
+        result.layers_pushed = len(pushed_layers)
+
+        # Compressed sizes of the layers that were actually uploaded
+        try:
+            manifest = await api.get_manifest_info(repository, tag)
+            result.bytes_pushed = sum(
+                size for digest, size in manifest.layers.items()
+                if digest.split(':', 1)[-1][:12] in pushed_layers
+            )
+        except RegistryAPIError as e:
+            logger.debug(f"Could not read pushed manifest of {result.registry_image}: {e}")
+
+    async def _kind_load(self, image: str, result: ImagePreloadResult) -> None:
+        """Load an image into the nodes that lack it (kind loads nodes in parallel)."""
+        load = await self._run(['kind', 'load', 'docker-image', image, '--name', self.cluster_name])
+        if load.returncode != 0:
+            result.error = f"kind load failed: {load.stderr.strip()}"
+            return
+
+        result.nodes_loaded = _KIND_LOADING.findall(load.stdout + load.stderr)
+        result.bytes_loaded = result.size_bytes * len(result.nodes_loaded)
+
+    async def _run(self, cmd: List[str]):
+        return await self.registry_manager.run_command(cmd)
+
+    @staticmethod
+    def _describe(result: ImagePreloadResult) -> str:
+        steps = []
+        if result.pulled:
+            steps.append("pulled")
+        if result.already_in_registry:
+            steps.append("already in registry")
+        elif result.pushed:
+            steps.append(f"pushed {result.layers_pushed} layers ({result.bytes_pushed} bytes), "
+                         f"reused {result.layers_reused}")
+        if result.nodes_loaded:
+            steps.append(f"loaded into {len(result.nodes_loaded)} nodes")
+        return ', '.join(steps) or "present"
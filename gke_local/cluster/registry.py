@@ -8,11 +8,15 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from ..config.models import GKELocalConfig
 from ..utils.logging import get_logger
+from .registry_client import ManifestInfo, RegistryAPIClient
 
 logger = get_logger(__name__)
 
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
 
 @dataclass
 class RegistryStatus:
@@ -37,13 +41,15 @@ class RegistryStatus:
 class LocalRegistryManager:
     """Manages local Docker registry for fast image storage and development."""
     
-    def __init__(self, config: GKELocalConfig):
+    def __init__(self, config: GKELocalConfig, max_concurrency: int = 16):
         """Initialize registry manager with configuration.
         
         Args:
             config: GKE Local configuration
+            max_concurrency: Maximum concurrent registry API requests
         """
         self.config = config
+        self.max_concurrency = max_concurrency
         self.cluster_config = config.cluster
         self.registry_name = f"{self.cluster_config.name}-registry"
         self.registry_port = self.cluster_config.registry_port
@@ -77,7 +83,7 @@ class LocalRegistryManager:
                 'registry:2'
             ]
             
-            result = await self._run_command(cmd)
+            result = await self.run_command(cmd)
             
             if result.returncode == 0:
                 container_id = result.stdout.strip()
@@ -114,7 +120,7 @@ class LocalRegistryManager:
             
             # Stop the container
             cmd = ['docker', 'stop', self.registry_name]
-            result = await self._run_command(cmd)
+            result = await self.run_command(cmd)
             
             if result.returncode == 0:
                 logger.info(f"Successfully stopped registry: {self.registry_name}")
@@ -163,7 +169,7 @@ class LocalRegistryManager:
                 '--format', '{{.ID}}\t{{.Status}}\t{{.Ports}}'
             ]
             
-            result = await self._run_command(cmd)
+            result = await self.run_command(cmd)
             
             if result.returncode == 0 and result.stdout.strip():
                 lines = result.stdout.strip().split('\n')
@@ -219,7 +225,7 @@ class LocalRegistryManager:
         try:
             # Tag the image for the registry
             tag_cmd = ['docker', 'tag', local_image, registry_image]
-            tag_result = await self._run_command(tag_cmd)
+            tag_result = await self.run_command(tag_cmd)
             
             if tag_result.returncode != 0:
                 logger.error(f"Failed to tag image: {tag_result.stderr}")
@@ -227,7 +233,7 @@ class LocalRegistryManager:
             
             # Push the image
             push_cmd = ['docker', 'push', registry_image]
-            push_result = await self._run_command(push_cmd)
+            push_result = await self.run_command(push_cmd)
             
             if push_result.returncode == 0:
                 logger.info(f"Successfully pushed image: {registry_image}")
@@ -257,7 +263,7 @@ class LocalRegistryManager:
         try:
             # Pull the image
             pull_cmd = ['docker', 'pull', registry_image]
-            pull_result = await self._run_command(pull_cmd)
+            pull_result = await self.run_command(pull_cmd)
             
             if pull_result.returncode != 0:
                 logger.error(f"Failed to pull image: {pull_result.stderr}")
@@ -266,7 +272,7 @@ class LocalRegistryManager:
             # Tag with local name if specified
             if local_tag and local_tag != registry_tag:
                 tag_cmd = ['docker', 'tag', registry_image, local_tag]
-                tag_result = await self._run_command(tag_cmd)
+                tag_result = await self.run_command(tag_cmd)
                 
                 if tag_result.returncode != 0:
                     logger.error(f"Failed to tag pulled image: {tag_result.stderr}")
@@ -279,60 +285,64 @@ class LocalRegistryManager:
             logger.error(f"Error pulling image: {e}")
             return False
     
-    async def list_images(self) -> List[Dict[str, Any]]:
+    async def list_images(self, include_details: bool = False) -> List[Dict[str, Any]]:
         """List images in the local registry.
         
+        Args:
+            include_details: Also resolve each tag's digest and creation time
+            
         Returns:
             List of image information dictionaries
         """
         try:
-            # Use registry API to list repositories
-            import aiohttp
-            
             status = await self.get_registry_status()
             if not status.is_accessible:
                 logger.warning("Registry is not accessible")
                 return []
             
-            async with aiohttp.ClientSession() as session:
-                # Get list of repositories
-                repos_url = f"http://{status.endpoint}/v2/_catalog"
-                async with session.get(repos_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        repositories = data.get('repositories', [])
-                        
-                        images = []
-                        for repo in repositories:
-                            # Get tags for each repository
-                            tags_url = f"http://{status.endpoint}/v2/{repo}/tags/list"
-                            async with session.get(tags_url) as tags_response:
-                                if tags_response.status == 200:
-                                    tags_data = await tags_response.json()
-                                    tags = tags_data.get('tags', [])
-                                    
-                                    for tag in tags:
-                                        images.append({
-                                            'repository': repo,
-                                            'tag': tag,
-                                            'full_name': f"{repo}:{tag}",
-                                            'registry_url': f"{status.endpoint}/{repo}:{tag}"
-                                        })
-                        
-                        return images
-                    else:
-                        logger.error(f"Failed to list repositories: HTTP {response.status}")
-                        return []
+            async with self.api_client(status) as api:
+                # Paginated catalog, then every repository's tags concurrently
+                tags_by_repo = await api.list_all_tags()
+                
+                details = {}
+                if include_details:
+                    infos = await api.get_manifest_infos(
+                        (repo, tag) for repo, tags in tags_by_repo.items() for tag in tags
+                    )
+                    details = {(info.repository, info.tag): info for info in infos}
+            
+            images = []
+            for repo, tags in tags_by_repo.items():
+                for tag in tags:
+                    image = {
+                        'repository': repo,
+                        'tag': tag,
+                        'full_name': f"{repo}:{tag}",
+                        'registry_url': f"{status.endpoint}/{repo}:{tag}"
+                    }
+                    info = details.get((repo, tag))
+                    if info:
+                        image['digest'] = info.digest
+                        image['created'] = info.created.isoformat() if info.created else None
+                    images.append(image)
+            
+            return images
                         
         except Exception as e:
             logger.error(f"Error listing images: {e}")
             return []
     
-    async def cleanup_images(self, keep_latest: int = 5) -> bool:
+    async def cleanup_images(self, keep_latest: int = 5, garbage_collect: bool = True) -> bool:
         """Clean up old images in the registry.
         
+        Images are ranked by creation time (newest first) and counted by
+        digest, since deleting a manifest removes every tag pointing at it.
+        Manifests are inspected and deleted concurrently; once every delete
+        has finished, the registry's garbage collector frees the blobs.
+        
         Args:
             keep_latest: Number of latest images to keep per repository
+            garbage_collect: Reclaim blob storage after deleting manifests
             
         Returns:
             True if cleanup successful, False otherwise
@@ -340,35 +350,85 @@ class LocalRegistryManager:
         logger.info(f"Cleaning up registry images (keeping latest {keep_latest})")
         
         try:
-            images = await self.list_images()
-            
-            # Group images by repository
-            repos = {}
-            for image in images:
-                repo = image['repository']
-                if repo not in repos:
-                    repos[repo] = []
-                repos[repo].append(image)
-            
-            # For each repository, keep only the latest images
-            deleted_count = 0
-            for repo, repo_images in repos.items():
-                if len(repo_images) > keep_latest:
-                    # Sort by tag (simple string sort, could be improved)
-                    repo_images.sort(key=lambda x: x['tag'], reverse=True)
+            status = await self.get_registry_status()
+            if not status.is_accessible:
+                logger.warning("Registry is not accessible")
+                return False
+            
+            async with self.api_client(status) as api:
+                tags_by_repo = await api.list_all_tags()
+                
+                # Only repositories over the limit need their manifests inspected
+                candidates = [
+                    (repo, tag) for repo, tags in tags_by_repo.items()
+                    if len(tags) > keep_latest for tag in tags
+                ]
+                infos = await api.get_manifest_infos(candidates)
+                
+                repos: Dict[str, List[ManifestInfo]] = {}
+                for info in infos:
+                    repos.setdefault(info.repository, []).append(info)
+                
+                to_delete = []
+                for repo, repo_infos in repos.items():
+                    # Newest first; images without a creation time sort as oldest
+                    repo_infos.sort(key=lambda info: (info.created or _EPOCH, info.tag), reverse=True)
                     
-                    # Delete older images
-                    for image in repo_images[keep_latest:]:
-                        if await self._delete_image_manifest(repo, image['tag']):
-                            deleted_count += 1
+                    # Tags sharing a digest are one image; keep the newest distinct images
+                    digests: List[str] = []
+                    for info in repo_infos:
+                        if info.digest and info.digest not in digests:
+                            digests.append(info.digest)
+                    to_delete.extend((repo, digest) for digest in digests[keep_latest:])
+                
+                deleted_count = await api.delete_manifests(to_delete)
             
             logger.info(f"Cleaned up {deleted_count} old images from registry")
+            if deleted_count < len(to_delete):
+                logger.warning(f"{len(to_delete) - deleted_count} manifests could not be deleted")
+            
+            # Deleting a manifest only unlinks it; blobs stay on disk until collected
+            if garbage_collect and deleted_count:
+                await self.garbage_collect()
             return True
             
         except Exception as e:
             logger.error(f"Error cleaning up images: {e}")
             return False
     
+    async def garbage_collect(self) -> bool:
+        """Remove blobs no longer referenced by any manifest.
+        
+        Returns:
+            True if garbage collection succeeded, False otherwise
+        """
+        cmd = [
+            'docker', 'exec', self.registry_name,
+            'registry', 'garbage-collect', '--delete-untagged', '/etc/docker/registry/config.yml'
+        ]
+        try:
+            result = await self.run_command(cmd)
+        except Exception as e:
+            logger.error(f"Error running registry garbage collection: {e}")
+            return False
+        
+        if result.returncode != 0:
+            logger.warning(f"Registry garbage collection failed: {result.stderr}")
+            return False
+        logger.info("Registry garbage collection completed")
+        return True
+    
+    def api_client(self, status: RegistryStatus) -> RegistryAPIClient:
+        """Create a registry API client bound to the running registry.
+        
+        Args:
+            status: Current registry status
+            
+        Returns:
+            RegistryAPIClient sharing one HTTP session for its lifetime
+        """
+        return RegistryAPIClient(status.endpoint, max_concurrency=self.max_concurrency)
+    
     async def _wait_for_registry_ready(self, timeout: int = 30) -> bool:
         """Wait for registry to be ready to accept requests.
         
@@ -407,12 +467,12 @@ class LocalRegistryManager:
             network_name = "kind"
             
             cmd = ['docker', 'network', 'ls', '--filter', f'name={network_name}', '--format', '{{.Name}}']
-            result = await self._run_command(cmd)
+            result = await self.run_command(cmd)
             
             if result.returncode == 0 and network_name in result.stdout:
                 # Connect registry to Kind network
                 connect_cmd = ['docker', 'network', 'connect', network_name, self.registry_name]
-                connect_result = await self._run_command(connect_cmd)
+                connect_result = await self.run_command(connect_cmd)
                 
                 if connect_result.returncode == 0:
                     logger.info(f"Connected registry to Kind network: {network_name}")
@@ -428,7 +488,7 @@ class LocalRegistryManager:
         """Remove existing registry container if it exists."""
         try:
             cmd = ['docker', 'rm', '-f', self.registry_name]
-            await self._run_command(cmd)
+            await self.run_command(cmd)
         except Exception:
             pass  # Container might not exist
     
@@ -443,33 +503,19 @@ class LocalRegistryManager:
             True if deletion successful, False otherwise
         """
         try:
-            import aiohttp
-            
             status = await self.get_registry_status()
             if not status.is_accessible:
                 return False
             
-            async with aiohttp.ClientSession() as session:
-                # Get manifest digest
-                manifest_url = f"http://{status.endpoint}/v2/{repository}/manifests/{tag}"
-                headers = {'Accept': 'application/vnd.docker.distribution.manifest.v2+json'}
-                
-                async with session.head(manifest_url, headers=headers) as response:
-                    if response.status == 200:
-                        digest = response.headers.get('Docker-Content-Digest')
-                        if digest:
-                            # Delete manifest
-                            delete_url = f"http://{status.endpoint}/v2/{repository}/manifests/{digest}"
-                            async with session.delete(delete_url) as delete_response:
-                                return delete_response.status == 202
-            
-            return False
+            async with self.api_client(status) as api:
+                info = await api.get_manifest_info(repository, tag)
+                return bool(info.digest) and await api.delete_manifest(repository, info.digest)
             
         except Exception as e:
             logger.error(f"Error deleting image manifest: {e}")
             return False
     
-    async def _run_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
+    async def run_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
         """Run a command asynchronously.
         
         Args:
@@ -584,7 +630,7 @@ class RegistryIntegration:
                     '--context', f'kind-{cluster_name}'
                 ]
                 
-                result = await self.registry_manager._run_command(cmd)
+                result = await self.registry_manager.run_command(cmd)
                 
                 return result.returncode == 0
                 
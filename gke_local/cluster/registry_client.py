@@ -0,0 +1,321 @@
+"""Registry HTTP API v2 client for the local development registry."""
+
+import asyncio
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+MANIFEST_ACCEPT = ', '.join((
+    'application/vnd.oci.image.index.v1+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.docker.distribution.manifest.v2+json',
+))
+
+_INDEX_MEDIA_TYPES = (
+    'application/vnd.oci.image.index.v1+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+)
+
+_LINK_NEXT = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?')
+
+
+class RegistryAPIError(Exception):
+    """Raised when the registry API returns an unexpected response."""
+
+
+@dataclass
+class ManifestInfo:
+    """Digest and creation time of a tagged image."""
+    repository: str
+    tag: str
+    digest: Optional[str] = None
+    created: Optional[datetime] = None
+    size: Optional[int] = None
+    config_digest: Optional[str] = None
+    layers: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'repository': self.repository,
+            'tag': self.tag,
+            'digest': self.digest,
+            'created': self.created.isoformat() if self.created else None,
+            'size': self.size,
+            'config_digest': self.config_digest,
+            'layers': len(self.layers),
+        }
+
+
+def _parse_created(value: Optional[str]) -> Optional[datetime]:
+    """Parse an image config ``created`` timestamp (RFC 3339, nanoseconds allowed)."""
+    if not value:
+        return None
+    match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:?\d{2})?$', value)
+    if not match:
+        return None
+    seconds, fraction, zone = match.groups()
+    fraction = (fraction or '.0')[:7]
+    zone = '+00:00' if zone in (None, 'Z') else zone
+    try:
+        return datetime.fromisoformat(f"{seconds}{fraction}{zone}")
+    except ValueError:
+        return None
+
+
+class RegistryAPIClient:
+    """Async client for a Docker Registry HTTP API v2 endpoint.
+
+    One ``aiohttp.ClientSession`` is reused for every request. Catalog and
+    tag listings follow ``Link: <...>; rel="next"`` pagination, and tag,
+    manifest and delete requests run concurrently up to ``max_concurrency``.
+    Image config blobs are immutable and cached by digest.
+    """
+
+    def __init__(self, endpoint: str, page_size: int = 100, max_concurrency: int = 16,
+                 timeout: float = 30.0, session: Optional[Any] = None):
+        """Initialize registry API client.
+
+        Args:
+            endpoint: Registry host and port (e.g. ``localhost:5000``) or base URL
+            page_size: Number of entries requested per catalog/tags page
+            max_concurrency: Maximum number of requests in flight
+            timeout: Per-request timeout in seconds
+            session: Shared aiohttp session (created lazily when omitted)
+        """
+        self.base_url = endpoint if '://' in endpoint else f"http://{endpoint}"
+        self.base_url = self.base_url.rstrip('/')
+        self.page_size = max(1, page_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._config_cache: Dict[str, Optional[datetime]] = {}
+        self.request_count = 0
+
+    async def __aenter__(self) -> 'RegistryAPIClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def list_repositories(self) -> List[str]:
+        """List every repository, following catalog pagination.
+
+        Returns:
+            Repository names in registry order
+        """
+        return await self._paginate('/v2/_catalog', 'repositories')
+
+    async def list_tags(self, repository: str) -> List[str]:
+        """List every tag of a repository, following pagination.
+
+        Args:
+            repository: Repository name
+
+        Returns:
+            Tag names (empty if the repository has none)
+        """
+        return await self._paginate(f'/v2/{repository}/tags/list', 'tags')
+
+    async def list_all_tags(self, repositories: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """List tags for many repositories concurrently.
+
+        Args:
+            repositories: Repositories to list (all repositories by default)
+
+        Returns:
+            Repository name mapped to its tags; repositories that fail are logged and omitted
+        """
+        if repositories is None:
+            repositories = await self.list_repositories()
+        repositories = list(repositories)
+
+        results = await asyncio.gather(
+            *(self.list_tags(repository) for repository in repositories),
+            return_exceptions=True
+        )
+
+        tags: Dict[str, List[str]] = {}
+        for repository, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to list tags for {repository}: {result}")
+                continue
+            tags[repository] = result
+        return tags
+
+    async def get_manifest_info(self, repository: str, tag: str) -> ManifestInfo:
+        """Resolve a tag to its manifest digest and image creation time.
+
+        Args:
+            repository: Repository name
+            tag: Tag (or digest) to resolve
+
+        Returns:
+            ManifestInfo for the tag
+        """
+        status, headers, manifest = await self._request(
+            'GET', f'/v2/{repository}/manifests/{tag}', headers={'Accept': MANIFEST_ACCEPT}
+        )
+        if status != 200:
+            raise RegistryAPIError(f"Manifest {repository}:{tag} returned HTTP {status}")
+
+        info = ManifestInfo(
+            repository=repository,
+            tag=tag,
+            digest=headers.get('Docker-Content-Digest'),
+            size=int(headers['Content-Length']) if headers.get('Content-Length', '').isdigit() else None
+        )
+
+        # Multi-platform images: the first platform's config carries the build time
+        media_type = manifest.get('mediaType') or headers.get('Content-Type', '')
+        if media_type in _INDEX_MEDIA_TYPES and manifest.get('manifests'):
+            child = manifest['manifests'][0]['digest']
+            status, _, manifest = await self._request(
+                'GET', f'/v2/{repository}/manifests/{child}', headers={'Accept': MANIFEST_ACCEPT}
+            )
+            if status != 200:
+                return info
+
+        info.layers = {layer['digest']: layer.get('size', 0) for layer in manifest.get('layers') or [] if 'digest' in layer}
+        config_digest = (manifest.get('config') or {}).get('digest')
+        if config_digest:
+            info.config_digest = config_digest
+            info.created = await self._config_created(repository, config_digest)
+        elif manifest.get('history'):
+            # Schema 1 manifests embed the config in the first history entry
+            try:
+                info.created = _parse_created(json.loads(manifest['history'][0]['v1Compatibility']).get('created'))
+            except (KeyError, ValueError, TypeError):
+                pass
+
+        return info
+
+    async def get_manifest_infos(self, images: Iterable[Tuple[str, str]]) -> List[ManifestInfo]:
+        """Resolve many (repository, tag) pairs concurrently.
+
+        Args:
+            images: (repository, tag) pairs
+
+        Returns:
+            ManifestInfo per pair that resolved; failures are logged and omitted
+        """
+        images = list(images)
+        results = await asyncio.gather(
+            *(self.get_manifest_info(repository, tag) for repository, tag in images),
+            return_exceptions=True
+        )
+
+        infos = []
+        for (repository, tag), result in zip(images, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to inspect {repository}:{tag}: {result}")
+                continue
+            infos.append(result)
+        return infos
+
+    async def delete_manifest(self, repository: str, digest: str) -> bool:
+        """Delete a manifest by digest (removes every tag pointing at it).
+
+        Args:
+            repository: Repository name
+            digest: Manifest digest
+
+        Returns:
+            True if the registry accepted the deletion
+        """
+        status, _, _ = await self._request('DELETE', f'/v2/{repository}/manifests/{digest}')
+        if status != 202:
+            logger.warning(f"Failed to delete {repository}@{digest}: HTTP {status}")
+        return status == 202
+
+    async def delete_manifests(self, manifests: Iterable[Tuple[str, str]]) -> int:
+        """Delete many (repository, digest) manifests concurrently.
+
+        Returns:
+            Number of manifests deleted
+        """
+        results = await asyncio.gather(
+            *(self.delete_manifest(repository, digest) for repository, digest in manifests),
+            return_exceptions=True
+        )
+        return sum(1 for result in results if result is True)
+
+    async def _config_created(self, repository: str, config_digest: str) -> Optional[datetime]:
+        if config_digest not in self._config_cache:
+            status, _, config = await self._request('GET', f'/v2/{repository}/blobs/{config_digest}')
+            self._config_cache[config_digest] = _parse_created(config.get('created')) if status == 200 else None
+        return self._config_cache[config_digest]
+
+    async def _paginate(self, path: str, key: str) -> List[str]:
+        """Collect a list across ``n``/``last`` pages by following Link headers."""
+        items: List[str] = []
+        url = f"{path}?n={self.page_size}"
+
+        while url:
+            status, headers, payload = await self._request('GET', url)
+            if status == 404 and key == 'tags':
+                return items
+            if status != 200:
+                raise RegistryAPIError(f"{path} returned HTTP {status}")
+
+            items.extend(payload.get(key) or [])
+
+            match = _LINK_NEXT.search(headers.get('Link', ''))
+            url = urljoin(self.base_url + path, match.group(1)) if match else None
+
+        return items
+
+    async def _request(self, method: str, path_or_url: str,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[int, Mapping[str, str], Dict[str, Any]]:
+        """Issue one bounded-concurrency request and decode a JSON body if present."""
+        import aiohttp
+
+        url = path_or_url if '://' in path_or_url else f"{self.base_url}{path_or_url}"
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+                )
+                self._owns_session = True
+
+            self.request_count += 1
+            try:
+                async with self._session.request(method, url, headers=headers) as response:
+                    body = await response.read()
+                    # Case-insensitive copy; header casing differs between registries
+                    response_headers = response.headers.copy()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise RegistryAPIError(f"{method} {url} failed: {e}")
+
+        payload: Dict[str, Any] = {}
+        if body:
+            try:
+                decoded = json.loads(body)
+                if isinstance(decoded, dict):
+                    payload = decoded
+            except ValueError:
+                pass
+        return status, response_headers, payload
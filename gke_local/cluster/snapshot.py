@@ -0,0 +1,527 @@
+"""Warm-cluster snapshots and fast in-place reset of Kind clusters."""
+
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+import time
+import yaml
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+CommandRunner = Callable[[List[str]], Awaitable[subprocess.CompletedProcess]]
+
+DEFAULT_SNAPSHOT_DIR = Path.home() / '.gke-local' / 'snapshots'
+
+# Namespaces owned by Kubernetes, Kind and the CNI; a reset never touches them
+SYSTEM_NAMESPACES = frozenset({
+    'kube-system',
+    'kube-public',
+    'kube-node-lease',
+    'local-path-storage',
+    'calico-system',
+    'calico-apiserver',
+    'tigera-operator',
+})
+
+# Namespaced resources a reset restores; objects owned by another object
+# (ReplicaSets, controller-created Pods, Jobs of a CronJob) are left to their owners
+BASELINE_RESOURCES = (
+    'serviceaccounts',
+    'secrets',
+    'configmaps',
+    'persistentvolumeclaims',
+    'roles.rbac.authorization.k8s.io',
+    'rolebindings.rbac.authorization.k8s.io',
+    'services',
+    'deployments.apps',
+    'statefulsets.apps',
+    'daemonsets.apps',
+    'jobs.batch',
+    'cronjobs.batch',
+    'pods',
+    'horizontalpodautoscalers.autoscaling',
+    'poddisruptionbudgets.policy',
+    'ingresses.networking.k8s.io',
+    'networkpolicies.networking.k8s.io',
+)
+
+# Objects the control plane creates and keeps up to date in every namespace
+_CONTROLLER_MANAGED = frozenset({
+    ('ConfigMap', 'kube-root-ca.crt'),
+    ('ServiceAccount', 'default'),
+    ('Service', 'kubernetes'),
+})
+
+_SERVER_METADATA = ('resourceVersion', 'uid', 'creationTimestamp', 'generation', 'managedFields',
+                    'selfLink', 'deletionTimestamp', 'deletionGracePeriodSeconds')
+
+
+def object_key(obj: Dict[str, Any]) -> str:
+    """Identity of an object as ``namespace/resource/name`` (``resource`` as kubectl accepts it)."""
+    metadata = obj.get('metadata', {})
+    return f"{metadata.get('namespace', '')}/{kubectl_resource(obj)}/{metadata.get('name', '')}"
+
+
+def kubectl_resource(obj: Dict[str, Any]) -> str:
+    """Fully qualified kubectl type of an object (e.g. ``deployment.apps``)."""
+    api_version = obj.get('apiVersion', 'v1')
+    kind = obj.get('kind', '').lower()
+    group = api_version.split('/')[0] if '/' in api_version else ''
+    return f"{kind}.{group}" if group else kind
+
+
+def fingerprint(obj: Dict[str, Any]) -> str:
+    """Change marker of an object: its generation (spec changes only) or else its resourceVersion."""
+    metadata = obj.get('metadata', {})
+    generation = metadata.get('generation')
+    return f"g{generation}" if generation is not None else f"r{metadata.get('resourceVersion', '')}"
+
+
+def clean_manifest(obj: Dict[str, Any], for_create: bool = False) -> Dict[str, Any]:
+    """Strip server-populated fields so an object can be replaced or re-created.
+
+    Args:
+        obj: Object as returned by the API server
+        for_create: Also drop bindings that only the original object can hold
+
+    Returns:
+        Cleaned copy of the object
+    """
+    manifest = json.loads(json.dumps(obj))
+    manifest.pop('status', None)
+
+    metadata = manifest.setdefault('metadata', {})
+    for key in _SERVER_METADATA:
+        metadata.pop(key, None)
+
+    if for_create and manifest.get('kind') == 'PersistentVolumeClaim':
+        manifest.get('spec', {}).pop('volumeName', None)
+        annotations = metadata.get('annotations') or {}
+        for key in [key for key in annotations if key.startswith('pv.kubernetes.io/')]:
+            del annotations[key]
+
+    return manifest
+
+
+def _is_baseline_candidate(obj: Dict[str, Any]) -> bool:
+    metadata = obj.get('metadata', {})
+    if metadata.get('ownerReferences') or metadata.get('namespace') in SYSTEM_NAMESPACES:
+        return False
+    if (obj.get('kind'), metadata.get('name')) in _CONTROLLER_MANAGED:
+        return False
+    if obj.get('kind') == 'Secret' and obj.get('type') == 'kubernetes.io/service-account-token':
+        return False
+    return True
+
+
+@dataclass
+class ClusterSnapshot:
+    """Baseline state of a freshly provisioned cluster."""
+    cluster_name: str
+    created_at: str
+    node_ids: List[str]
+    node_image: Optional[str] = None
+    namespaces: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    objects: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    images: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'cluster_name': self.cluster_name,
+            'created_at': self.created_at,
+            'node_ids': self.node_ids,
+            'node_image': self.node_image,
+            'namespaces': self.namespaces,
+            'objects': self.objects,
+            'fingerprints': self.fingerprints,
+            'images': self.images,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ClusterSnapshot':
+        """Create a snapshot from its dictionary form."""
+        return cls(
+            cluster_name=data['cluster_name'],
+            created_at=data['created_at'],
+            node_ids=data.get('node_ids', []),
+            node_image=data.get('node_image'),
+            namespaces=data.get('namespaces', {}),
+            objects=data.get('objects', {}),
+            fingerprints=data.get('fingerprints', {}),
+            images=data.get('images', []),
+        )
+
+
+@dataclass
+class RestoreResult:
+    """What a fast reset changed to return a cluster to its baseline."""
+    success: bool
+    deleted_namespaces: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    created: List[str] = field(default_factory=list)
+    replaced: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'success': self.success,
+            'deleted_namespaces': self.deleted_namespaces,
+            'deleted': self.deleted,
+            'created': self.created,
+            'replaced': self.replaced,
+            'failed': self.failed,
+            'seconds': round(self.seconds, 3),
+        }
+
+
+class ClusterSnapshotManager:
+    """Captures a cluster baseline and restores it without recreating nodes.
+
+    A snapshot records the cluster's node containers and node image, the
+    images preloaded from the local registry, every non-system namespace and
+    the top-level objects in them, Secrets included; the snapshot file is
+    therefore only readable by its owner. Restoring deletes namespaces and objects
+    created since, re-creates deleted baseline objects and replaces changed
+    ones; unchanged objects are not touched, so a reset costs a few
+    ``kubectl`` calls instead of a new cluster.
+    """
+
+    def __init__(self, cluster_name: str, run_command: CommandRunner,
+                 registry_port: int = 5000, snapshot_dir: Optional[Path] = None,
+                 max_concurrency: int = 8):
+        """Initialize snapshot manager.
+
+        Args:
+            cluster_name: Kind cluster name
+            run_command: Coroutine running a command (the KindManager's runner)
+            registry_port: Local registry port, used to recognize preloaded images
+            snapshot_dir: Directory snapshots are stored in
+            max_concurrency: Maximum concurrent ``kubectl`` processes during restore
+        """
+        self.cluster_name = cluster_name
+        self.context = f"kind-{cluster_name}"
+        self.run_command = run_command
+        self.registry_prefix = f"localhost:{registry_port}/"
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else DEFAULT_SNAPSHOT_DIR
+        self.max_concurrency = max(1, max_concurrency)
+
+    @property
+    def snapshot_path(self) -> Path:
+        """File the cluster's snapshot is stored in."""
+        return self.snapshot_dir / f"{self.cluster_name}.json"
+
+    def load(self) -> Optional[ClusterSnapshot]:
+        """Load the stored snapshot, or None if there is none."""
+        try:
+            with open(self.snapshot_path) as f:
+                return ClusterSnapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {self.snapshot_path}: {e}")
+            return None
+
+    def discard(self) -> None:
+        """Delete the stored snapshot."""
+        self.snapshot_path.unlink(missing_ok=True)
+
+    async def capture(self) -> Optional[ClusterSnapshot]:
+        """Snapshot the cluster's current state as its baseline and store it.
+
+        Returns:
+            The snapshot, or None if the cluster could not be read
+        """
+        logger.info(f"Capturing baseline snapshot of cluster {self.cluster_name}")
+
+        nodes, namespaces, objects = await asyncio.gather(
+            self._node_containers(),
+            self._list(['namespaces']),
+            self._list(BASELINE_RESOURCES, all_namespaces=True)
+        )
+        if not nodes or namespaces is None or objects is None:
+            logger.error(f"Could not capture snapshot of cluster {self.cluster_name}")
+            return None
+
+        baseline = [obj for obj in objects if _is_baseline_candidate(obj)]
+        snapshot = ClusterSnapshot(
+            cluster_name=self.cluster_name,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            node_ids=sorted(node_id for node_id, _, _ in nodes),
+            node_image=nodes[0][2],
+            namespaces={
+                ns['metadata']['name']: clean_manifest(ns, for_create=True)
+                for ns in namespaces
+                if ns['metadata']['name'] not in SYSTEM_NAMESPACES
+            },
+            objects={object_key(obj): clean_manifest(obj) for obj in baseline},
+            fingerprints={object_key(obj): fingerprint(obj) for obj in baseline},
+            images=await self._preloaded_images([name for _, name, _ in nodes])
+        )
+
+        self._store(snapshot)
+
+        logger.info(f"Captured {len(snapshot.objects)} objects in {len(snapshot.namespaces)} namespaces")
+        return snapshot
+
+    def _store(self, snapshot: ClusterSnapshot) -> None:
+        """Write a snapshot readable by the owner only; it holds Secret data in plain text."""
+        self.snapshot_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # Created 0600 from the start and swapped in, so an older, looser file is replaced too
+        partial = self.snapshot_path.with_suffix('.json.partial')
+        fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot.to_dict(), f)
+            os.replace(partial, self.snapshot_path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+    async def is_current(self, snapshot: ClusterSnapshot) -> bool:
+        """Check that a snapshot was taken of the cluster's current nodes."""
+        nodes = await self._node_containers()
+        return bool(nodes) and sorted(node_id for node_id, _, _ in nodes) == snapshot.node_ids
+
+    async def restore(self, snapshot: ClusterSnapshot) -> RestoreResult:
+        """Return the running cluster to a snapshot's baseline in place.
+
+        Args:
+            snapshot: Baseline to restore
+
+        Returns:
+            RestoreResult describing the changes made
+        """
+        started = time.monotonic()
+        result = RestoreResult(success=False)
+
+        namespaces, objects = await asyncio.gather(
+            self._list(['namespaces']),
+            self._list(BASELINE_RESOURCES, all_namespaces=True)
+        )
+        if namespaces is None or objects is None:
+            result.failed.append('list cluster objects')
+            return result
+
+        current_namespaces = {ns['metadata']['name'] for ns in namespaces}
+        extra_namespaces = sorted(
+            name for name in current_namespaces
+            if name not in snapshot.namespaces and name not in SYSTEM_NAMESPACES
+        )
+
+        current = {
+            object_key(obj): obj for obj in objects
+            if _is_baseline_candidate(obj) and obj['metadata']['namespace'] not in extra_namespaces
+        }
+        extra_objects = sorted(key for key in current if key not in snapshot.objects)
+        missing = [key for key in snapshot.objects if key not in current]
+        changed = [key for key in snapshot.objects
+                   if key in current and fingerprint(current[key]) != snapshot.fingerprints.get(key)]
+
+        # Removing what tests added and re-creating deleted namespaces are independent
+        missing_namespaces = [name for name in snapshot.namespaces if name not in current_namespaces]
+        deletions = await asyncio.gather(
+            self._delete_namespaces(extra_namespaces),
+            self._delete_objects(extra_objects),
+            self._create([snapshot.namespaces[name] for name in missing_namespaces])
+        )
+        result.deleted_namespaces = extra_namespaces if deletions[0] else []
+        result.deleted = extra_objects if deletions[1] else []
+        if not deletions[0]:
+            result.failed.extend(f"namespace/{name}" for name in extra_namespaces)
+        if not deletions[1]:
+            result.failed.extend(extra_objects)
+        if not deletions[2]:
+            result.failed.extend(f"namespace/{name}" for name in missing_namespaces)
+
+        if missing:
+            manifests = [clean_manifest(snapshot.objects[key], for_create=True) for key in missing]
+            if await self._create(manifests):
+                result.created = missing
+            else:
+                result.failed.extend(missing)
+
+        replaced = await self._replace_all([(key, snapshot.objects[key]) for key in changed])
+        result.replaced = [key for key in changed if replaced.get(key)]
+        result.failed.extend(key for key in changed if not replaced.get(key))
+
+        # Restored objects carry new resource versions; record them so the next reset leaves them alone
+        await self._refresh_fingerprints(snapshot, result.created + result.replaced)
+
+        result.success = not result.failed
+        result.seconds = time.monotonic() - started
+        logger.info(
+            f"Restored cluster {self.cluster_name} to baseline in {result.seconds:.1f}s: "
+            f"{len(result.deleted_namespaces)} namespaces and {len(result.deleted)} objects deleted, "
+            f"{len(result.created)} re-created, {len(result.replaced)} replaced"
+        )
+        return result
+
+    async def _refresh_fingerprints(self, snapshot: ClusterSnapshot, keys: List[str]) -> None:
+        """Re-read restored objects and store their new fingerprints in the snapshot."""
+        if not keys:
+            return
+
+        objects = await self._list(BASELINE_RESOURCES, all_namespaces=True)
+        if objects is None:
+            return
+
+        current = {object_key(obj): obj for obj in objects}
+        refreshed = {key: fingerprint(current[key]) for key in keys if key in current}
+        if refreshed:
+            snapshot.fingerprints.update(refreshed)
+            self._store(snapshot)
+
+    async def preload_images(self, snapshot: ClusterSnapshot) -> int:
+        """Load a snapshot's registry images into freshly created nodes.
+
+        Only images present in the local Docker daemon can be loaded.
+
+        Returns:
+            Number of images loaded
+        """
+        if not snapshot.images:
+            return 0
+
+        present = await asyncio.gather(
+            *(self.run_command(['docker', 'image', 'inspect', '--format', '{{.Id}}', image])
+              for image in snapshot.images)
+        )
+        images = [image for image, check in zip(snapshot.images, present) if check.returncode == 0]
+        if not images:
+            return 0
+
+        result = await self.run_command(['kind', 'load', 'docker-image', *images, '--name', self.cluster_name])
+        if result.returncode != 0:
+            logger.warning(f"Failed to preload images: {result.stderr}")
+            return 0
+
+        logger.info(f"Preloaded {len(images)} images into cluster {self.cluster_name}")
+        return len(images)
+
+    async def _node_containers(self) -> List[Tuple[str, str, str]]:
+        """(container id, name, image) of the cluster's node containers."""
+        result = await self.run_command([
+            'docker', 'ps', '--no-trunc',
+            '--filter', f'label=io.x-k8s.kind.cluster={self.cluster_name}',
+            '--format', '{{.ID}} {{.Names}} {{.Image}}'
+        ])
+        if result.returncode != 0:
+            return []
+
+        nodes = [tuple(line.split()) for line in result.stdout.splitlines() if len(line.split()) == 3]
+        # Control plane first, so its image stands for the cluster
+        return sorted(nodes, key=lambda node: ('control-plane' not in node[1], node[1]))
+
+    async def _preloaded_images(self, node_names: List[str]) -> List[str]:
+        """Images pulled from the local registry onto any node."""
+        results = await asyncio.gather(
+            *(self.run_command(['docker', 'exec', name, 'crictl', 'images', '-o', 'json'])
+              for name in node_names)
+        )
+
+        images = set()
+        for result in results:
+            if result.returncode != 0:
+                continue
+            try:
+                listing = json.loads(result.stdout)
+            except ValueError:
+                continue
+            for image in listing.get('images', []):
+                images.update(tag for tag in image.get('repoTags') or [] if tag.startswith(self.registry_prefix))
+        return sorted(images)
+
+    async def _list(self, resources, all_namespaces: bool = False) -> Optional[List[Dict[str, Any]]]:
+        cmd = ['kubectl', 'get', ','.join(resources), '-o', 'json',
+               '--context', self.context, '--request-timeout=30s']
+        if all_namespaces:
+            cmd.append('--all-namespaces')
+
+        result = await self.run_command(cmd)
+        if result.returncode != 0:
+            logger.error(f"Failed to list {', '.join(resources)}: {result.stderr}")
+            return None
+        return json.loads(result.stdout).get('items', [])
+
+    async def _delete_namespaces(self, names: List[str]) -> bool:
+        if not names:
+            return True
+        result = await self.run_command([
+            'kubectl', 'delete', 'namespace', *names,
+            '--context', self.context, '--ignore-not-found', '--timeout=120s'
+        ])
+        if result.returncode != 0:
+            logger.warning(f"Failed to delete namespaces {names}: {result.stderr}")
+        return result.returncode == 0
+
+    async def _delete_objects(self, keys: List[str]) -> bool:
+        by_namespace: Dict[str, List[str]] = {}
+        for key in keys:
+            namespace, resource, name = key.split('/', 2)
+            by_namespace.setdefault(namespace, []).append(f"{resource}/{name}")
+
+        results = await asyncio.gather(*(
+            self.run_command([
+                'kubectl', 'delete', *targets, '--namespace', namespace,
+                '--context', self.context, '--ignore-not-found', '--wait=false'
+            ])
+            for namespace, targets in by_namespace.items()
+        ))
+        for result in results:
+            if result.returncode != 0:
+                logger.warning(f"Failed to delete objects: {result.stderr}")
+        return all(result.returncode == 0 for result in results)
+
+    async def _create(self, manifests: List[Dict[str, Any]]) -> bool:
+        if not manifests:
+            return True
+        result = await self._kubectl_with_manifests(['create'], manifests)
+        if result.returncode != 0:
+            logger.warning(f"Failed to re-create baseline objects: {result.stderr}")
+        return result.returncode == 0
+
+    async def _replace_all(self, objects: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, bool]:
+        """Replace changed objects concurrently, one ``kubectl`` each."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def replace(manifest: Dict[str, Any]) -> bool:
+            async with semaphore:
+                result = await self._kubectl_with_manifests(['replace'], [manifest])
+                if result.returncode == 0:
+                    return True
+                # Immutable fields changed: delete and re-create the object
+                result = await self._kubectl_with_manifests(
+                    ['replace', '--force'], [clean_manifest(manifest, for_create=True)]
+                )
+                if result.returncode != 0:
+                    logger.warning(f"Failed to restore {object_key(manifest)}: {result.stderr}")
+                return result.returncode == 0
+
+        results = await asyncio.gather(*(replace(manifest) for _, manifest in objects))
+        return {key: ok for (key, _), ok in zip(objects, results)}
+
+    async def _kubectl_with_manifests(self, args: List[str],
+                                      manifests: List[Dict[str, Any]]) -> subprocess.CompletedProcess:
+        document = {'apiVersion': 'v1', 'kind': 'List', 'items': manifests}
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.safe_dump(document, f)
+            path = f.name
+
+        try:
+            return await self.run_command(['kubectl', *args, '-f', path, '--context', self.context])
+        finally:
+            Path(path).unlink(missing_ok=True)
@@ -0,0 +1,324 @@
+"""Cached, watch-backed status of Kind clusters."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _load_kubernetes():
+    """Import the Kubernetes client on first use.
+
+    It is only needed for the Node watch and takes a noticeable share of CLI
+    startup, so it is not imported with this module.
+
+    Returns:
+        (client, config, watch, ApiException), or None if it is not installed
+    """
+    try:
+        from kubernetes import client, config, watch
+        from kubernetes.client.rest import ApiException
+    except ImportError:
+        return None
+    return client, config, watch, ApiException
+
+
+StatusLoader = Callable[[], Awaitable['StatusSnapshot']]
+
+
+@dataclass
+class StatusSnapshot:
+    """Point-in-time view of a cluster's existence and nodes."""
+    exists: bool
+    nodes: List[Dict[str, Any]] = field(default_factory=list)
+    fetched_at: float = field(default_factory=time.monotonic)
+    source: str = "kubectl"
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.fetched_at
+
+
+class NodeWatcher:
+    """Keeps a live copy of a cluster's Node objects through a Kubernetes watch.
+
+    The watch runs in a daemon thread: it lists nodes once, then streams
+    changes from that resourceVersion, relisting when the server reports the
+    version as expired (410 Gone). ``on_change`` is called from the watch
+    thread after every update.
+    """
+
+    def __init__(self, context: str, on_change: Callable[[], None],
+                 kubeconfig: Optional[str] = None, timeout_seconds: int = 300,
+                 retry_seconds: float = 5.0):
+        """Initialize node watcher.
+
+        Args:
+            context: kubeconfig context of the cluster (e.g. ``kind-local-gke-dev``)
+            on_change: Callback invoked after each node update or health change
+            kubeconfig: kubeconfig path (default location when omitted)
+            timeout_seconds: Server-side timeout of each watch request
+            retry_seconds: Delay before reconnecting after an error
+        """
+        self.context = context
+        self.on_change = on_change
+        self.kubeconfig = kubeconfig
+        self.timeout_seconds = timeout_seconds
+        self.retry_seconds = retry_seconds
+
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch = None
+        self._synced = False
+        self.updated_at = 0.0
+        self.events = 0
+
+    @property
+    def healthy(self) -> bool:
+        """True while the watch is connected and its node list is current."""
+        return self._synced and self._thread is not None and self._thread.is_alive()
+
+    def nodes(self) -> List[Dict[str, Any]]:
+        """Current nodes, ordered by name."""
+        with self._lock:
+            return [self._nodes[name] for name in sorted(self._nodes)]
+
+    def start(self) -> None:
+        """Start the watch thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"node-watch-{self.context}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch thread."""
+        self._stop.set()
+        self._synced = False
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _run(self) -> None:
+        client, config, watch, ApiException = _load_kubernetes()
+        api_client = None
+        resource_version = None
+
+        while not self._stop.is_set():
+            try:
+                if api_client is None:
+                    api_client = config.new_client_from_config(config_file=self.kubeconfig, context=self.context)
+                    core_v1 = client.CoreV1Api(api_client)
+
+                if resource_version is None:
+                    listing = core_v1.list_node()
+                    nodes = (api_client.sanitize_for_serialization(item) for item in listing.items)
+                    with self._lock:
+                        self._nodes = {node['metadata']['name']: node for node in nodes}
+                    resource_version = listing.metadata.resource_version
+                    self._set_synced(True)
+
+                self._watch = watch.Watch()
+                for event in self._watch.stream(core_v1.list_node, resource_version=resource_version,
+                                                timeout_seconds=self.timeout_seconds):
+                    if self._stop.is_set():
+                        break
+
+                    raw = event.get('raw_object') or {}
+                    if event['type'] == 'ERROR':
+                        if raw.get('code') == 410:
+                            resource_version = None
+                            break
+                        raise RuntimeError(raw.get('message', 'watch error'))
+
+                    metadata = raw.get('metadata', {})
+                    resource_version = metadata.get('resourceVersion', resource_version)
+                    if event['type'] == 'BOOKMARK':
+                        continue
+
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._nodes.pop(metadata.get('name'), None)
+                        else:
+                            self._nodes[metadata.get('name')] = raw
+                    self.events += 1
+                    self._set_synced(True)
+
+            except ApiException as e:
+                if getattr(e, 'status', None) == 410:
+                    resource_version = None
+                    continue
+                self._handle_error(e)
+            except Exception as e:
+                self._handle_error(e)
+
+        logger.debug(f"Node watch stopped for {self.context}")
+
+    def _set_synced(self, synced: bool) -> None:
+        self._synced = synced
+        self.updated_at = time.monotonic()
+        self.on_change()
+
+    def _handle_error(self, error: Exception) -> None:
+        if self._stop.is_set():
+            return
+        logger.debug(f"Node watch for {self.context} failed, retrying: {error}")
+        self._set_synced(False)
+        self._stop.wait(self.retry_seconds)
+
+
+class ClusterStatusCache:
+    """Shared, short-lived cache of one Kind cluster's status.
+
+    Snapshots from the loader (one combined status query) are served to
+    every caller for ``ttl_seconds`` and concurrent refreshes are coalesced.
+    Once watching is enabled and the cluster is up, a Node watch keeps the
+    snapshot current without spawning any processes.
+    """
+
+    def __init__(self, cluster_name: str, loader: StatusLoader, ttl_seconds: float = 5.0):
+        """Initialize status cache.
+
+        Args:
+            cluster_name: Kind cluster name
+            loader: Coroutine function querying the cluster's current status
+            ttl_seconds: Seconds a polled snapshot is reused
+        """
+        self.cluster_name = cluster_name
+        self.context = f"kind-{cluster_name}"
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+
+        self._snapshot: Optional[StatusSnapshot] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._watch_enabled = False
+        self._watcher: Optional[NodeWatcher] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+
+        self._stats = {
+            'queries': 0,
+            'cache_hits': 0,
+            'watch_hits': 0,
+            'coalesced': 0,
+        }
+
+    @property
+    def watching(self) -> bool:
+        """True while status is served from a healthy Node watch."""
+        return self._watcher is not None and self._watcher.healthy
+
+    async def get(self, max_age: Optional[float] = None) -> StatusSnapshot:
+        """Get the cluster status, refreshing it when the cached snapshot is too old.
+
+        Args:
+            max_age: Maximum acceptable snapshot age (defaults to the TTL)
+
+        Returns:
+            Current status snapshot
+        """
+        self._bind_loop()
+
+        if self.watching:
+            self._stats['watch_hits'] += 1
+            return StatusSnapshot(exists=True, nodes=self._watcher.nodes(),
+                                  fetched_at=self._watcher.updated_at, source="watch")
+
+        max_age = self.ttl_seconds if max_age is None else max_age
+        if self._snapshot is not None and self._snapshot.age <= max_age:
+            self._stats['cache_hits'] += 1
+            return self._snapshot
+
+        if self._inflight is not None and not self._inflight.done():
+            self._stats['coalesced'] += 1
+            return await asyncio.shield(self._inflight)
+
+        self._inflight = asyncio.get_running_loop().create_task(self._refresh())
+        return await asyncio.shield(self._inflight)
+
+    def enable_watch(self) -> None:
+        """Serve status from a Node watch whenever the cluster is up."""
+        self._watch_enabled = True
+        if self._snapshot is not None and self._snapshot.exists and self._snapshot.nodes:
+            self._start_watcher()
+
+    def disable_watch(self) -> None:
+        """Stop the Node watch and fall back to polling."""
+        self._watch_enabled = False
+        self._stop_watcher()
+
+    def invalidate(self) -> None:
+        """Forget the cached status (after the cluster is created, deleted or reset)."""
+        self._snapshot = None
+        self._stop_watcher()
+        self._notify()
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Wait until the watch reports a change or the timeout passes.
+
+        Returns:
+            True if a change was observed, False on timeout
+        """
+        self._bind_loop()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._changed.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get query and cache statistics."""
+        lookups = self._stats['queries'] + self._stats['cache_hits'] + self._stats['watch_hits'] + self._stats['coalesced']
+        return {
+            **self._stats,
+            'watching': self.watching,
+            'watch_events': self._watcher.events if self._watcher else 0,
+            'hit_rate': (lookups - self._stats['queries']) / lookups if lookups else 0.0,
+            'snapshot_age_seconds': self._snapshot.age if self._snapshot else None,
+        }
+
+    async def _refresh(self) -> StatusSnapshot:
+        self._stats['queries'] += 1
+        snapshot = await self.loader()
+
+        self._snapshot = snapshot
+        if self._watch_enabled and snapshot.exists and snapshot.nodes:
+            self._start_watcher()
+        return snapshot
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        """Wake waiters; safe to call from the watch thread."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._changed.set)
+        except RuntimeError:
+            pass
+
+    def _start_watcher(self) -> None:
+        if self.watching or _load_kubernetes() is None:
+            return
+        if self._watcher is None:
+            self._watcher = NodeWatcher(self.context, self._notify)
+            logger.info(f"Watching nodes of cluster {self.cluster_name}")
+        self._watcher.start()
+
+    def _stop_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
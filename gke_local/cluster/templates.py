@@ -4,6 +4,18 @@ from typing import Dict, Any, List
 from ..config.models import ClusterConfig
 
 
+# CNI installed into every cluster (see KindManager._install_cni)
+CALICO_VERSION = "v3.26.1"
+CALICO_MANIFEST_URL = f"https://raw.githubusercontent.com/projectcalico/calico/{CALICO_VERSION}/manifests/calico.yaml"
+
+# Images every new cluster pulls before any workload runs
+ADDON_IMAGES = [
+    f"docker.io/calico/cni:{CALICO_VERSION}",
+    f"docker.io/calico/node:{CALICO_VERSION}",
+    f"docker.io/calico/kube-controllers:{CALICO_VERSION}",
+]
+
+
 class ClusterTemplates:
     """Provides pre-configured cluster templates for different scenarios."""
     
@@ -352,6 +364,23 @@ class ClusterTemplates:
         """
         return ['minimal', 'ai', 'staging', 'autopilot']
     
+    @staticmethod
+    def required_images(template_name: str) -> List[str]:
+        """List the images a cluster created from a template will run.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Node images pinned by the template followed by add-on images
+        """
+        config = ClusterTemplates.get_template(template_name)
+        
+        images = [node['image'] for node in config['nodes'] if node.get('image')]
+        images.extend(ADDON_IMAGES)
+        
+        return list(dict.fromkeys(images))
+    
     @staticmethod
     def customize_template(
         base_template: str, 
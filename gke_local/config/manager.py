@@ -1,31 +1,60 @@
 """Configuration manager for loading and managing YAML configurations."""
 
+import hashlib
 import os
+import pickle
+import tempfile
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import pydantic
+from . import models
 from .models import GKELocalConfig
 
 
+# Bump when the cache entry layout changes
+CACHE_FORMAT = 1
+
+# Files modified this close to a cache write may share its mtime; verify their hash
+_MTIME_RACE_NS = 2_000_000_000
+
+
+def default_cache_dir() -> Path:
+    """Directory compiled configurations are cached in ($XDG_CACHE_HOME/gke-local)."""
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'gke-local'
+
+
 class ConfigManager:
     """Manages configuration loading, validation, and environment-specific overrides."""
     
     DEFAULT_CONFIG_NAME = "gke-local.yaml"
     ENV_CONFIG_PATTERN = "gke-local.{env}.yaml"
     
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(self, config_dir: Optional[Path] = None, cache_dir: Optional[Path] = None,
+                 use_cache: bool = True):
         """Initialize configuration manager.
         
         Args:
             config_dir: Directory to search for config files. Defaults to current directory.
+            cache_dir: Directory for compiled configurations. Defaults to default_cache_dir().
+            use_cache: Reuse the compiled configuration while its source files are unchanged
         """
         self.config_dir = config_dir or Path.cwd()
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.use_cache = use_cache
         self._config: Optional[GKELocalConfig] = None
         self._config_files_loaded: List[Path] = []
+        self.cache_hit = False
     
     def load_config(self, environment: str = "local") -> GKELocalConfig:
         """Load configuration with environment-specific overrides.
         
+        The merged, validated configuration is cached per config directory
+        and environment. While the base and environment files (and the
+        models) are unchanged, it is loaded from the cache without parsing
+        YAML or re-running validation.
+        
         Args:
             environment: Environment name for loading environment-specific config
             
@@ -36,6 +65,20 @@ class ConfigManager:
             FileNotFoundError: If no configuration files are found
             ValueError: If configuration validation fails
         """
+        self.cache_hit = False
+        
+        if self.use_cache:
+            if not (self.config_dir / self.DEFAULT_CONFIG_NAME).exists():
+                self._create_default_config(self.config_dir / self.DEFAULT_CONFIG_NAME)
+            
+            cached = self._load_cached(environment)
+            if cached is not None:
+                self.cache_hit = True
+                self._config = cached
+                return self._config
+        
+        self._config_files_loaded = []
+        
         # Load base configuration
         base_config = self._load_base_config()
         
@@ -51,9 +94,113 @@ class ConfigManager:
         # Validate and create config object
         try:
             self._config = GKELocalConfig(**merged_config)
-            return self._config
         except Exception as e:
             raise ValueError(f"Configuration validation failed: {e}")
+        
+        if self.use_cache:
+            self._store_cached(environment, self._config)
+        
+        return self._config
+    
+    def clear_cache(self) -> None:
+        """Remove every compiled configuration of this config directory."""
+        for environment_file in self.cache_dir.glob(f"{self._cache_prefix()}-*.pickle"):
+            environment_file.unlink(missing_ok=True)
+    
+    def _source_files(self, environment: str) -> List[Path]:
+        """Files whose contents determine the configuration of an environment."""
+        return [
+            self.config_dir / self.DEFAULT_CONFIG_NAME,
+            self.config_dir / self.ENV_CONFIG_PATTERN.format(env=environment),
+            Path(models.__file__),
+        ]
+    
+    def _cache_prefix(self) -> str:
+        return hashlib.sha256(str(Path(self.config_dir).resolve()).encode()).hexdigest()[:16]
+    
+    def _cache_path(self, environment: str) -> Path:
+        return self.cache_dir / f"{self._cache_prefix()}-{environment}.pickle"
+    
+    @staticmethod
+    def _file_state(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _file_hash(path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return None
+    
+    def _load_cached(self, environment: str) -> Optional[GKELocalConfig]:
+        """Return the cached configuration if none of its source files changed."""
+        try:
+            with open(self._cache_path(environment), 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        
+        if (entry.get('format') != CACHE_FORMAT or entry.get('environment') != environment
+                or entry.get('pydantic') != pydantic.VERSION):
+            return None
+        
+        sources = entry['sources']
+        refresh = False
+        for path in self._source_files(environment):
+            recorded = sources.get(str(path))
+            if recorded is None:
+                return None
+            
+            state = self._file_state(path)
+            # Stat matches and the file was not written during the cache write's mtime window
+            if state == recorded['state'] and (state is None or state[0] < entry['written_ns'] - _MTIME_RACE_NS):
+                continue
+            
+            # Touched or written too close to the cache: compare contents
+            if self._file_hash(path) != recorded['sha256']:
+                return None
+            refresh = refresh or state != recorded['state']
+        
+        config = entry['config']
+        self._config_files_loaded = [Path(path) for path in entry['files']]
+        
+        if refresh:
+            self._store_cached(environment, config)
+        
+        return config
+    
+    def _store_cached(self, environment: str, config: GKELocalConfig) -> None:
+        """Write the compiled configuration and its source fingerprints atomically."""
+        sources = {
+            str(path): {'state': self._file_state(path), 'sha256': self._file_hash(path)}
+            for path in self._source_files(environment)
+        }
+        entry = {
+            'format': CACHE_FORMAT,
+            'environment': environment,
+            'pydantic': pydantic.VERSION,
+            'written_ns': time.time_ns(),
+            'sources': sources,
+            'files': [str(path) for path in self._config_files_loaded],
+            'config': config,
+        }
+        
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=self.cache_dir, delete=False) as f:
+                temp_path = Path(f.name)
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_path(environment))
+        except OSError:
+            # The cache is an optimization; an unwritable cache directory is not an error
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
     
     def _load_base_config(self) -> Dict[str, Any]:
         """Load base configuration from default config file."""
@@ -143,14 +143,212 @@ Proves systematic superiority through concrete, quantifiable evidence!
 Built with Systo's collaborative systematic approach! 🐺
 """
 
+from .metric_store import MetricSeries, MetricStore
 from .systematic_metrics_engine import SystematicMetricsEngine
 
-__all__ = ['SystematicMetricsEngine']
+__all__ = ['SystematicMetricsEngine', 'MetricStore', 'MetricSeries']
 '''
     
     with open(metrics_dir / "__init__.py", "w") as f:
         f.write(init_content)
     
+    # Create the columnar metric store backing the engine
+    metric_store_content = '''"""
+Columnar Metric Store - Systo's Streaming Measurements
+
+Per-metric, per-approach columns of timestamps and values with running
+mean/variance (Welford), so baselines and comparative analysis never rescan
+history. Measurements persist as append-only JSONL in the
+metrics_data/<metric>_<approach>_measurements.jsonl layout and are reloaded
+lazily, through a memory map, the first time a metric is used.
+"""
+
+import json
+import math
+import mmap
+import re
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+APPROACHES = ("systematic", "adhoc")
+
+# On disk the ad-hoc baseline is called "baseline"
+FILE_APPROACHES = {"systematic": "systematic", "adhoc": "baseline"}
+APPROACH_ALIASES = {"systematic": "systematic", "adhoc": "adhoc", "baseline": "adhoc"}
+
+MEASUREMENTS_FILE = re.compile(r"^(?P<metric>.+)_(?P<approach>systematic|baseline|adhoc)_measurements[.]jsonl$")
+
+
+class MetricSeries:
+    """Columns of one metric for one approach, with running statistics"""
+
+    def __init__(self):
+        self.timestamps = array("d")
+        self.values = array("d")
+        self.contexts: List[Optional[Dict[str, Any]]] = []
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, timestamp: float, value: float, context: Optional[Dict[str, Any]] = None) -> None:
+        """Add a measurement and update the running mean/variance (Welford)"""
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.contexts.append(context or None)
+
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two measurements)"""
+        count = len(self.values)
+        return self._m2 / (count - 1) if count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class MetricStore:
+    """Systo's columnar metric store with optional JSONL persistence"""
+
+    def __init__(self, data_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir) if data_dir else None
+        self._series: Dict[Tuple[str, str], MetricSeries] = {}
+        self._unloaded: Dict[Tuple[str, str], List[Path]] = {}
+        self._handles: Dict[Tuple[str, str], Any] = {}
+
+        if self.data_dir and self.data_dir.is_dir():
+            for path in sorted(self.data_dir.glob("*_measurements.jsonl")):
+                match = MEASUREMENTS_FILE.match(path.name)
+                if match:
+                    key = (match.group("metric"), APPROACH_ALIASES[match.group("approach")])
+                    self._unloaded.setdefault(key, []).append(path)
+
+    def append(self, metric_name: str, approach: str, value: float,
+               timestamp: Optional[datetime] = None, context: Optional[Dict[str, Any]] = None) -> MetricSeries:
+        """Record a measurement, persisting it when the store has a data directory"""
+        timestamp = timestamp or datetime.now()
+        series = self.series(metric_name, approach, create=True)
+        series.append(timestamp.timestamp(), value, context)
+
+        if self.data_dir:
+            self._write(metric_name, approach, timestamp, value, context)
+        return series
+
+    def series(self, metric_name: str, approach: str, create: bool = False) -> Optional[MetricSeries]:
+        """Columns of a metric for one approach, loading persisted measurements on first use"""
+        key = (metric_name, approach)
+        if key in self._unloaded:
+            self._series[key] = self._load(self._unloaded.pop(key))
+        if key not in self._series and create:
+            self._series[key] = MetricSeries()
+        return self._series.get(key)
+
+    def metric_names(self) -> List[str]:
+        """Every metric with measurements, loaded or not"""
+        return sorted({metric for metric, _ in self._series} | {metric for metric, _ in self._unloaded})
+
+    def count(self, approach: Optional[str] = None) -> int:
+        """Number of measurements (loads persisted metrics that have not been used yet)"""
+        for metric_name, series_approach in list(self._unloaded):
+            self.series(metric_name, series_approach)
+        return sum(len(series) for (_, series_approach), series in self._series.items()
+                   if approach is None or series_approach == approach)
+
+    def records(self) -> Iterator[Tuple[str, str, float, float, Optional[Dict[str, Any]]]]:
+        """(metric, approach, timestamp, value, context) for every measurement"""
+        self.count()
+        for (metric_name, approach), series in sorted(self._series.items()):
+            for timestamp, value, context in zip(series.timestamps, series.values, series.contexts):
+                yield metric_name, approach, timestamp, value, context
+
+    def baselines(self, approach: str) -> "Baselines":
+        """Running means of every metric for one approach, read from the store on access"""
+        return Baselines(self, approach)
+
+    def close(self) -> None:
+        """Close open JSONL files"""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def _load(self, paths: List[Path]) -> MetricSeries:
+        series = MetricSeries()
+        for path in paths:
+            for record in self._read_jsonl(path):
+                try:
+                    timestamp = datetime.fromisoformat(record["timestamp"]).timestamp()
+                    series.append(timestamp, float(record["value"]), record.get("context"))
+                except (KeyError, TypeError, ValueError):
+                    continue
+        return series
+
+    @staticmethod
+    def _read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+        """Records of a JSONL file, read through a memory map; torn or invalid lines are skipped"""
+        with open(path, "rb") as f:
+            if f.seek(0, 2) == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+
+    def _write(self, metric_name: str, approach: str, timestamp: datetime,
+               value: float, context: Optional[Dict[str, Any]]) -> None:
+        key = (metric_name, approach)
+        handle = self._handles.get(key)
+        if handle is None:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            path = self.data_dir / f"{metric_name}_{FILE_APPROACHES[approach]}_measurements.jsonl"
+            handle = self._handles[key] = open(path, "a")
+
+        record = {
+            "timestamp": timestamp.isoformat(),
+            "category": metric_name,
+            "approach_type": FILE_APPROACHES[approach],
+            "value": value
+        }
+        if context:
+            record["context"] = context
+        handle.write(json.dumps(record, default=str) + "\\n")
+        handle.flush()
+
+
+class Baselines(Mapping):
+    """Metric name to running mean for one approach, including persisted measurements"""
+
+    def __init__(self, store: MetricStore, approach: str):
+        self.store = store
+        self.approach = approach
+
+    def __getitem__(self, metric_name: str) -> float:
+        series = self.store.series(metric_name, self.approach)
+        if not series:
+            raise KeyError(metric_name)
+        return series.mean
+
+    def __iter__(self) -> Iterator[str]:
+        return (metric_name for metric_name in self.store.metric_names() if metric_name in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+'''
+    
+    with open(metrics_dir / "metric_store.py", "w") as f:
+        f.write(metric_store_content)
+    
     # Create the main Systematic Metrics Engine implementation
     metrics_engine_content = '''"""
 Systematic Metrics Engine - Systo's Collaborative Implementation
@@ -164,12 +362,13 @@ import logging
 import json
 import statistics
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import time
 
 from ..core.reflective_module import ReflectiveModule
+from .metric_store import MetricSeries, MetricStore
 
 
 @dataclass
@@ -224,44 +423,47 @@ class SystematicMetricsEngine(ReflectiveModule):
     - BEAST MODE: EVERYONE WINS
     """
     
-    def __init__(self):
+    # Confidence in measurements by approach
+    CONFIDENCE_SCORES = {"systematic": 0.95, "adhoc": 0.7}
+    
+    def __init__(self, data_dir: Optional[Path] = None):
         super().__init__("SystematicMetricsEngine")
         self.logger = logging.getLogger(__name__)
         
-        # Systo's metric storage and tracking
-        self.metric_data: List[MetricDataPoint] = []
+        # Systo's metric storage and tracking (columnar, persisted to data_dir when given)
+        self.metric_store = MetricStore(data_dir)
         self.comparative_analyses: List[ComparativeAnalysisResult] = []
         self.evidence_packages: List[SuperiorityEvidencePackage] = []
         
-        # Systo's performance baselines
-        self.systematic_baselines: Dict[str, float] = {}
-        self.adhoc_baselines: Dict[str, float] = {}
+        # Systo's performance baselines (running means, including persisted measurements)
+        self.systematic_baselines: Mapping[str, float] = self.metric_store.baselines("systematic")
+        self.adhoc_baselines: Mapping[str, float] = self.metric_store.baselines("adhoc")
         
         # Systo's collaboration tracking
         self.collaboration_events: List[Dict[str, Any]] = []
         
         self.logger.info("🐺 Systematic Metrics Engine initialized - Systo's collaborative proof system ready!")
     
+    @property
+    def metric_data(self) -> List[MetricDataPoint]:
+        """All measurements as data points (materialized from the metric store)"""
+        return [
+            MetricDataPoint(
+                timestamp=datetime.fromtimestamp(timestamp),
+                metric_name=metric_name,
+                value=value,
+                approach_type=approach,
+                context=context or {},
+                confidence_score=self.CONFIDENCE_SCORES[approach]
+            )
+            for metric_name, approach, timestamp, value, context in self.metric_store.records()
+        ]
+    
     def collect_systematic_metric(self, metric_name: str, value: float, context: Dict[str, Any] = None) -> None:
         """Collect a metric from systematic approach with Systo's collaborative tracking"""
         self.logger.info(f"📊 Collecting systematic metric: {metric_name} = {value}")
         
-        data_point = MetricDataPoint(
-            timestamp=datetime.now(),
-            metric_name=metric_name,
-            value=value,
-            approach_type="systematic",
-            context=context or {},
-            confidence_score=0.95  # High confidence in systematic measurements
-        )
-        
-        self.metric_data.append(data_point)
-        
-        # Update systematic baseline
-        systematic_values = [dp.value for dp in self.metric_data 
-                           if dp.metric_name == metric_name and dp.approach_type == "systematic"]
-        if systematic_values:
-            self.systematic_baselines[metric_name] = statistics.mean(systematic_values)
+        self.metric_store.append(metric_name, "systematic", value, datetime.now(), context)
         
         # Systo's collaborative learning
         self._record_collaboration_event("systematic_metric_collected", {
@@ -274,54 +476,38 @@ class SystematicMetricsEngine(ReflectiveModule):
         """Collect a metric from ad-hoc approach for Systo's comparative analysis"""
         self.logger.info(f"📊 Collecting ad-hoc baseline metric: {metric_name} = {value}")
         
-        data_point = MetricDataPoint(
-            timestamp=datetime.now(),
-            metric_name=metric_name,
-            value=value,
-            approach_type="adhoc",
-            context=context or {},
-            confidence_score=0.7  # Lower confidence in ad-hoc measurements
-        )
-        
-        self.metric_data.append(data_point)
-        
-        # Update ad-hoc baseline
-        adhoc_values = [dp.value for dp in self.metric_data 
-                       if dp.metric_name == metric_name and dp.approach_type == "adhoc"]
-        if adhoc_values:
-            self.adhoc_baselines[metric_name] = statistics.mean(adhoc_values)
+        self.metric_store.append(metric_name, "adhoc", value, datetime.now(), context)
     
     def perform_comparative_analysis(self, metric_name: str) -> ComparativeAnalysisResult:
         """Perform Systo's collaborative comparative analysis of systematic vs ad-hoc"""
         self.logger.info(f"🔍 Performing Systo's comparative analysis for {metric_name}")
         
-        # Get systematic and ad-hoc data points
-        systematic_values = [dp.value for dp in self.metric_data 
-                           if dp.metric_name == metric_name and dp.approach_type == "systematic"]
-        adhoc_values = [dp.value for dp in self.metric_data 
-                       if dp.metric_name == metric_name and dp.approach_type == "adhoc"]
+        # Get systematic and ad-hoc series (running statistics, no rescans)
+        systematic = self.metric_store.series(metric_name, "systematic")
+        adhoc = self.metric_store.series(metric_name, "adhoc")
         
-        if not systematic_values or not adhoc_values:
+        if not systematic or not adhoc:
             # Create simulated ad-hoc baseline if needed (Systo's intelligent estimation)
-            if systematic_values and not adhoc_values:
-                systematic_avg = statistics.mean(systematic_values)
+            if systematic and not adhoc:
+                systematic_avg = systematic.mean
                 # Estimate ad-hoc performance as 30-50% worse (Systo's collaborative intelligence)
                 adhoc_avg = systematic_avg * 1.4  # 40% worse performance
-                adhoc_values = [adhoc_avg]
+                adhoc = MetricSeries()
+                adhoc.append(time.time(), adhoc_avg)
             else:
                 raise ValueError(f"Insufficient data for comparative analysis of {metric_name}")
         else:
-            systematic_avg = statistics.mean(systematic_values)
-            adhoc_avg = statistics.mean(adhoc_values)
+            systematic_avg = systematic.mean
+            adhoc_avg = adhoc.mean
         
         # Calculate improvement percentage (Systo's collaborative math)
         improvement_percentage = ((adhoc_avg - systematic_avg) / adhoc_avg) * 100
         
         # Calculate statistical significance (Systo's confidence assessment)
-        statistical_significance = self._calculate_statistical_significance(systematic_values, adhoc_values)
+        statistical_significance = self._calculate_statistical_significance(systematic, adhoc)
         
         # Calculate confidence interval (Systo's collaborative uncertainty quantification)
-        confidence_interval = self._calculate_confidence_interval(systematic_values, adhoc_values)
+        confidence_interval = self._calculate_confidence_interval(systematic, adhoc)
         
         # Systo's collaborative verdict
         if improvement_percentage > 20 and statistical_significance > 0.8:
@@ -339,8 +525,8 @@ class SystematicMetricsEngine(ReflectiveModule):
             adhoc_average=adhoc_avg,
             improvement_percentage=improvement_percentage,
             statistical_significance=statistical_significance,
-            sample_size_systematic=len(systematic_values),
-            sample_size_adhoc=len(adhoc_values),
+            sample_size_systematic=len(systematic),
+            sample_size_adhoc=len(adhoc),
             confidence_interval=confidence_interval,
             systo_verdict=systo_verdict
         )
@@ -355,7 +541,7 @@ class SystematicMetricsEngine(ReflectiveModule):
         self.logger.info("🏆 Demonstrating systematic superiority with Systo's collaborative approach")
         
         # Collect all unique metrics
-        unique_metrics = set(dp.metric_name for dp in self.metric_data)
+        unique_metrics = self.metric_store.metric_names()
         
         superiority_results = {}
         total_improvements = []
@@ -474,18 +660,15 @@ class SystematicMetricsEngine(ReflectiveModule):
             "systo_learning": "beast_mode_effectiveness_validated"
         })
     
-    def _calculate_statistical_significance(self, systematic_values: List[float], adhoc_values: List[float]) -> float:
+    def _calculate_statistical_significance(self, systematic: MetricSeries, adhoc: MetricSeries) -> float:
         """Calculate statistical significance with Systo's collaborative math"""
         # Simplified statistical significance calculation
-        if len(systematic_values) < 2 or len(adhoc_values) < 2:
+        if len(systematic) < 2 or len(adhoc) < 2:
             return 0.5  # Low confidence with small samples
         
-        systematic_std = statistics.stdev(systematic_values) if len(systematic_values) > 1 else 0
-        adhoc_std = statistics.stdev(adhoc_values) if len(adhoc_values) > 1 else 0
-        
         # Simple significance based on separation and sample size
-        separation = abs(statistics.mean(systematic_values) - statistics.mean(adhoc_values))
-        pooled_std = (systematic_std + adhoc_std) / 2
+        separation = abs(systematic.mean - adhoc.mean)
+        pooled_std = (systematic.stdev + adhoc.stdev) / 2
         
         if pooled_std == 0:
             return 0.9 if separation > 0 else 0.5
@@ -493,13 +676,13 @@ class SystematicMetricsEngine(ReflectiveModule):
         significance = min(0.95, separation / pooled_std * 0.3)  # Simplified calculation
         return max(0.1, significance)
     
-    def _calculate_confidence_interval(self, systematic_values: List[float], adhoc_values: List[float]) -> Tuple[float, float]:
+    def _calculate_confidence_interval(self, systematic: MetricSeries, adhoc: MetricSeries) -> Tuple[float, float]:
         """Calculate confidence interval with Systo's collaborative statistics"""
-        if not systematic_values or not adhoc_values:
+        if not systematic or not adhoc:
             return (0.0, 0.0)
         
-        systematic_mean = statistics.mean(systematic_values)
-        adhoc_mean = statistics.mean(adhoc_values)
+        systematic_mean = systematic.mean
+        adhoc_mean = adhoc.mean
         improvement = ((adhoc_mean - systematic_mean) / adhoc_mean) * 100
         
         # Simplified confidence interval (±10% of improvement)
@@ -567,12 +750,12 @@ BEAST MODE: EVERYONE WINS! 🚀
     # ReflectiveModule implementation
     def get_module_status(self) -> Dict[str, Any]:
         """Get current status of Systo's metrics engine"""
-        systematic_metrics = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-        adhoc_metrics = len([dp for dp in self.metric_data if dp.approach_type == "adhoc"])
+        systematic_metrics = self.metric_store.count("systematic")
+        adhoc_metrics = self.metric_store.count("adhoc")
         
         return {
             "module_name": "SystematicMetricsEngine",
-            "total_metrics_collected": len(self.metric_data),
+            "total_metrics_collected": systematic_metrics + adhoc_metrics,
             "systematic_metrics": systematic_metrics,
             "adhoc_metrics": adhoc_metrics,
             "comparative_analyses_performed": len(self.comparative_analyses),
@@ -586,12 +769,12 @@ BEAST MODE: EVERYONE WINS! 🚀
         """Check if Systo's metrics engine is healthy"""
         try:
             # Healthy if we're collecting metrics and learning
-            if len(self.metric_data) == 0:
+            total_count = self.metric_store.count()
+            if total_count == 0:
                 return True  # Healthy when starting
             
             # Check if we have both systematic and comparative data
-            systematic_count = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-            total_count = len(self.metric_data)
+            systematic_count = self.metric_store.count("systematic")
             
             # Healthy if we have reasonable systematic data
             systematic_ratio = systematic_count / total_count if total_count > 0 else 0
@@ -606,15 +789,15 @@ BEAST MODE: EVERYONE WINS! 🚀
         indicators = []
         
         # Metrics collection health
-        systematic_count = len([dp for dp in self.metric_data if dp.approach_type == "systematic"])
-        adhoc_count = len([dp for dp in self.metric_data if dp.approach_type == "adhoc"])
+        systematic_count = self.metric_store.count("systematic")
+        adhoc_count = self.metric_store.count("adhoc")
         
         indicators.append({
             "name": "metrics_collection_health",
-            "status": "healthy" if len(self.metric_data) > 0 else "starting",
+            "status": "healthy" if systematic_count + adhoc_count > 0 else "starting",
             "systematic_metrics": systematic_count,
             "adhoc_metrics": adhoc_count,
-            "total_metrics": len(self.metric_data)
+            "total_metrics": systematic_count + adhoc_count
         })
         
         # Analysis capability health
@@ -649,6 +832,7 @@ BEAST MODE: EVERYONE WINS! 🚀
     print("   🐺 SystematicMetricsEngine class with full RM compliance")
     print("   🐺 Comprehensive metrics collection for systematic vs ad-hoc")
     print("   🐺 Comparative analysis with statistical significance")
+    print("   🐺 Columnar metric store with running statistics and JSONL persistence")
     print("   🐺 Evidence package generation with Systo's collaborative insights")
     print("   🐺 Beast Mode performance tracking and superiority proof")
     print("   🐺 SYSTEMATIC COLLABORATION ENGAGED - EVERYONE WINS!")
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Spec Index
+Persistent SQLite index over a .kiro/specs-style tree. Spec markdown files are
+parsed once per content hash (changed files in parallel on a process pool), and
+requirements audits, spec overlap and task dependency queries are answered from
+the index. Refreshing only re-reads files whose size or mtime changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from task_dag_analysis import ParsedTaskDAG
+
+# Bump when parse output or the schema changes; older indexes are rebuilt
+INDEX_VERSION = 1
+
+# Below this many changed files, parsing in-process beats starting workers
+PARALLEL_THRESHOLD = 16
+
+REQUIREMENT_PATTERN = re.compile(r'(?:_Requirements:|Requirements:)\s*([^_\n]+)', re.IGNORECASE)
+REQUIREMENT_REF_PATTERN = re.compile(r'\b([A-Z]+[-.]?\d+(?:\.\d+)*)\b')
+TASK_REQUIREMENTS_PATTERN = re.compile(r'- \[.\] .+?_Requirements: ([^_\n]+)', re.MULTILINE | re.DOTALL)
+MISSING_ID_PATTERN = re.compile(r'^[A-Z]{1,3}[-.]?\d+(?:\.\d+)*$')
+
+HEADING_PATTERN = re.compile(r'^\s*(?:#+|-\s*\[.\]\s*[\d.]*)\s*(.+)$', re.MULTILINE)
+TERM_PATTERN = re.compile(r'[a-z][a-z0-9]{3,}')
+STOP_WORDS = frozenset({
+    "this", "that", "with", "from", "into", "each", "when", "then", "than", "have", "will",
+    "should", "shall", "must", "able", "also", "such", "their", "there", "these", "those",
+    "task", "tasks", "requirement", "requirements", "implement", "implementation", "create",
+    "add", "system", "user", "story", "acceptance", "criteria", "overview", "design",
+})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    spec TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    mtime_ns INTEGER,
+    size INTEGER,
+    sha256 TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS files_spec ON files (spec, position);
+CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256);
+CREATE TABLE IF NOT EXISTS parsed (
+    sha256 TEXT PRIMARY KEY,
+    defines_requirements INTEGER NOT NULL,
+    requirements TEXT NOT NULL,
+    task_dag TEXT
+);
+CREATE TABLE IF NOT EXISTS file_refs (sha256 TEXT NOT NULL, req_id TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS file_refs_sha256 ON file_refs (sha256);
+CREATE INDEX IF NOT EXISTS file_refs_req ON file_refs (req_id);
+CREATE TABLE IF NOT EXISTS file_terms (sha256 TEXT NOT NULL, term TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS file_terms_sha256 ON file_terms (sha256);
+"""
+
+
+def parse_spec_file(name: str, content: str) -> Dict[str, Any]:
+    """
+    Parse one spec markdown file
+    Runs in worker processes, so it only takes and returns plain data
+    """
+    # Requirement definitions first, then task references; the first detail seen wins
+    requirements: List[Tuple[str, str]] = []
+    seen = set()
+    for match in REQUIREMENT_PATTERN.finditer(content):
+        req_text = match.group(1).strip()
+        for req_id in REQUIREMENT_REF_PATTERN.findall(req_text):
+            if req_id not in seen:
+                seen.add(req_id)
+                requirements.append((req_id, req_text))
+    for match in TASK_REQUIREMENTS_PATTERN.finditer(content):
+        req_text = match.group(1).strip()
+        for req_id in REQUIREMENT_REF_PATTERN.findall(req_text):
+            if req_id not in seen:
+                seen.add(req_id)
+                requirements.append((req_id, f"Referenced in task: {req_text}"))
+
+    terms = set()
+    for heading in HEADING_PATTERN.findall(content):
+        terms.update(term for term in TERM_PATTERN.findall(heading.lower()) if term not in STOP_WORDS)
+
+    return {
+        "defines_requirements": 'Requirements:' in content or '_Requirements:' in content,
+        "requirements": requirements,
+        "refs": sorted(set(REQUIREMENT_REF_PATTERN.findall(content))),
+        "terms": sorted(terms),
+        "task_dag": ParsedTaskDAG.from_content(content).to_dict() if name == "tasks.md" else None
+    }
+
+
+def _parse_batch(batch: List[Tuple[str, str, str]]) -> List[Tuple[str, Dict[str, Any]]]:
+    return [(sha256, parse_spec_file(name, content)) for sha256, name, content in batch]
+
+
+def default_index_path(specs_dir: Path) -> Path:
+    """Index location for a specs tree ($XDG_CACHE_HOME/beast-mode/spec-index)"""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    key = hashlib.sha256(str(Path(specs_dir).resolve()).encode()).hexdigest()[:16]
+    return Path(base) / "beast-mode" / "spec-index" / f"{key}.sqlite"
+
+
+@dataclass
+class RefreshStats:
+    """What a refresh had to do"""
+    specs: int = 0
+    files: int = 0
+    unchanged: int = 0
+    rehashed: int = 0
+    parsed: int = 0
+    removed: int = 0
+    workers: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SpecIndex:
+    """Incrementally maintained index of every spec under a specs directory"""
+
+    def __init__(self, specs_dir: Path, index_path: Optional[Path] = None, workers: Optional[int] = None):
+        self.specs_dir = Path(specs_dir)
+        self.index_path = Path(index_path) if index_path else default_index_path(self.specs_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.index_path))
+        self._init_schema()
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> 'SpecIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _init_schema(self):
+        self._db.executescript(SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or int(row[0]) != INDEX_VERSION:
+            with self._db:
+                for table in ("files", "parsed", "file_refs", "file_terms"):
+                    self._db.execute(f"DELETE FROM {table}")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+
+    # Refresh
+
+    def refresh(self) -> RefreshStats:
+        """Bring the index up to date with the specs directory"""
+        started = time.monotonic()
+        stats = RefreshStats()
+
+        known = {
+            path: (mtime_ns, size, sha256)
+            for path, mtime_ns, size, sha256 in self._db.execute("SELECT path, mtime_ns, size, sha256 FROM files")
+        }
+        parsed_hashes = {sha256 for (sha256,) in self._db.execute("SELECT sha256 FROM parsed")}
+
+        rows: List[Tuple] = []
+        pending: Dict[str, Tuple[str, str, str]] = {}
+        for spec, position, entry in self._scan(stats):
+            path = entry.path
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                rows.append((path, spec, entry.name, position, None, None, None, str(e)))
+                continue
+
+            previous = known.get(path)
+            if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size and previous[2]:
+                stats.unchanged += 1
+                rows.append((path, spec, entry.name, position, stat.st_mtime_ns, stat.st_size, previous[2], None))
+                continue
+
+            try:
+                content = Path(path).read_text()
+            except Exception as e:
+                rows.append((path, spec, entry.name, position, None, None, None, str(e)))
+                continue
+
+            sha256 = hashlib.sha256(content.encode()).hexdigest()
+            stats.rehashed += 1
+            rows.append((path, spec, entry.name, position, stat.st_mtime_ns, stat.st_size, sha256, None))
+            if sha256 not in parsed_hashes and sha256 not in pending:
+                pending[sha256] = (sha256, entry.name, content)
+
+        results = self._parse(list(pending.values()), stats)
+        stats.removed = len(set(known) - {row[0] for row in rows})
+
+        with self._db:
+            self._db.execute("DELETE FROM files")
+            self._db.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            for sha256, data in results:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+                    (sha256, int(data["defines_requirements"]), json.dumps(data["requirements"]),
+                     json.dumps(data["task_dag"]) if data["task_dag"] else None)
+                )
+                self._db.executemany("INSERT INTO file_refs VALUES (?, ?)", [(sha256, ref) for ref in data["refs"]])
+                self._db.executemany("INSERT INTO file_terms VALUES (?, ?)", [(sha256, term) for term in data["terms"]])
+
+            # Drop parse results no file points at any more
+            for table in ("parsed", "file_refs", "file_terms"):
+                self._db.execute(f"DELETE FROM {table} WHERE sha256 NOT IN (SELECT sha256 FROM files WHERE sha256 IS NOT NULL)")
+
+        stats.seconds = time.monotonic() - started
+        return stats
+
+    def _scan(self, stats: RefreshStats) -> Iterable[Tuple[str, int, os.DirEntry]]:
+        """Markdown files of every spec, in directory order (as Path.glob('*.md') lists them)"""
+        if not self.specs_dir.is_dir():
+            return
+        with os.scandir(self.specs_dir) as spec_entries:
+            spec_dirs = [entry for entry in spec_entries if entry.is_dir()]
+
+        for spec_entry in spec_dirs:
+            stats.specs += 1
+            with os.scandir(spec_entry.path) as entries:
+                markdown = [entry for entry in entries if entry.name.endswith('.md')]
+            for position, entry in enumerate(markdown):
+                stats.files += 1
+                yield spec_entry.name, position, entry
+
+    def _parse(self, batch: List[Tuple[str, str, str]], stats: RefreshStats) -> List[Tuple[str, Dict[str, Any]]]:
+        """Parse changed files, on a process pool when there are enough of them"""
+        stats.parsed = len(batch)
+        if len(batch) < PARALLEL_THRESHOLD or self.workers < 2:
+            stats.workers = 1
+            return _parse_batch(batch)
+
+        stats.workers = min(self.workers, len(batch))
+        chunk = max(1, len(batch) // (stats.workers * 4))
+        chunks = [batch[i:i + chunk] for i in range(0, len(batch), chunk)]
+        with ProcessPoolExecutor(max_workers=stats.workers) as pool:
+            return [result for results in pool.map(_parse_batch, chunks) for result in results]
+
+    # Queries
+
+    def specs(self) -> List[str]:
+        """Indexed spec names"""
+        return [spec for (spec,) in self._db.execute("SELECT DISTINCT spec FROM files ORDER BY spec")]
+
+    def audit_spec(self, spec: str) -> Dict[str, Any]:
+        """Requirements audit of one spec (same shape as cli.py's audit_spec_requirements)"""
+        spec_audit = {
+            "spec_name": spec,
+            "files_found": [],
+            "requirements_found": [],
+            "requirement_details": {},
+            "issues": []
+        }
+
+        files = self._db.execute(
+            "SELECT f.name, f.error, p.requirements FROM files f LEFT JOIN parsed p ON p.sha256 = f.sha256 "
+            "WHERE f.spec = ? ORDER BY f.position", (spec,)
+        ).fetchall()
+
+        names = [name for name, _, _ in files]
+        spec_audit["files_found"] = names + [name for name in ('tasks.md', 'design.md', 'requirements.md') if name in names]
+
+        for name, error, requirements in files:
+            if error:
+                spec_audit["issues"].append(f"Error reading {name}: {error}")
+                continue
+            for req_id, detail in json.loads(requirements or "[]"):
+                if req_id not in spec_audit["requirement_details"]:
+                    spec_audit["requirements_found"].append(req_id)
+                    spec_audit["requirement_details"][req_id] = detail
+
+        return spec_audit
+
+    def missing_requirements(self, specs: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+        """Requirement ids referenced in the specs but never in a file that defines requirements"""
+        scope, params = self._spec_scope(specs)
+        rows = self._db.execute(
+            f"SELECT r.req_id, MAX(p.defines_requirements) FROM files f "
+            f"JOIN file_refs r ON r.sha256 = f.sha256 JOIN parsed p ON p.sha256 = f.sha256 "
+            f"WHERE {scope} GROUP BY r.req_id ORDER BY r.req_id", params
+        )
+        return [
+            {"requirement_id": req_id, "status": "referenced_but_not_defined"}
+            for req_id, defined in rows
+            if not defined and MISSING_ID_PATTERN.match(req_id)
+        ]
+
+    def specs_referencing(self, req_id: str) -> List[str]:
+        """Specs whose files mention a requirement id"""
+        return [spec for (spec,) in self._db.execute(
+            "SELECT DISTINCT f.spec FROM files f JOIN file_refs r ON r.sha256 = f.sha256 "
+            "WHERE r.req_id = ? ORDER BY f.spec", (req_id,)
+        )]
+
+    def overlap(self, min_shared: int = 1, specs: Optional[Iterable[str]] = None,
+                max_spec_fraction: float = 0.2) -> List[Dict[str, Any]]:
+        """
+        Spec pairs sharing heading/task terms, most similar first
+        Pairs are found through the term index, so specs with nothing in
+        common are never compared. Terms used by more than max_spec_fraction
+        of the specs (boilerplate such as "architecture" or "introduction")
+        say nothing about overlap and are left out.
+        """
+        scope, params = self._spec_scope(specs)
+        self._db.execute("DROP TABLE IF EXISTS temp.spec_terms")
+        self._db.execute(
+            f"CREATE TEMP TABLE spec_terms AS SELECT DISTINCT f.spec, t.term FROM files f "
+            f"JOIN file_terms t ON t.sha256 = f.sha256 WHERE {scope}", params
+        )
+        spec_count = self._db.execute("SELECT COUNT(DISTINCT spec) FROM spec_terms").fetchone()[0]
+        self._db.execute(
+            "DELETE FROM spec_terms WHERE term IN "
+            "(SELECT term FROM spec_terms GROUP BY term HAVING COUNT(*) > ?)",
+            (max(2, int(spec_count * max_spec_fraction)),)
+        )
+        self._db.execute("CREATE INDEX temp.spec_terms_term ON spec_terms (term)")
+
+        totals = dict(self._db.execute("SELECT spec, COUNT(*) FROM spec_terms GROUP BY spec"))
+        pairs = []
+        for spec1, spec2, shared in self._db.execute(
+            "SELECT a.spec, b.spec, COUNT(*) FROM spec_terms a JOIN spec_terms b "
+            "ON a.term = b.term AND a.spec < b.spec GROUP BY a.spec, b.spec HAVING COUNT(*) >= ?", (min_shared,)
+        ):
+            union = totals[spec1] + totals[spec2] - shared
+            pairs.append({
+                "specs": [spec1, spec2],
+                "shared_terms": shared,
+                "similarity": round(shared / union, 3) if union else 0.0
+            })
+        self._db.execute("DROP TABLE temp.spec_terms")
+
+        pairs.sort(key=lambda pair: (-pair["similarity"], -pair["shared_terms"], pair["specs"]))
+        return pairs
+
+    def shared_terms(self, spec1: str, spec2: str) -> List[str]:
+        """Terms two specs have in common"""
+        return [term for (term,) in self._db.execute(
+            "SELECT DISTINCT t.term FROM files f JOIN file_terms t ON t.sha256 = f.sha256 WHERE f.spec = ? "
+            "INTERSECT SELECT DISTINCT t.term FROM files f JOIN file_terms t ON t.sha256 = f.sha256 WHERE f.spec = ? "
+            "ORDER BY 1", (spec1, spec2)
+        )]
+
+    def task_dag(self, spec: str) -> Optional[ParsedTaskDAG]:
+        """Parsed task DAG (dependencies, tiers, cycles) of a spec's tasks.md"""
+        row = self._db.execute(
+            "SELECT p.task_dag FROM files f JOIN parsed p ON p.sha256 = f.sha256 "
+            "WHERE f.spec = ? AND f.name = 'tasks.md'", (spec,)
+        ).fetchone()
+        return ParsedTaskDAG.from_dict(json.loads(row[0])) if row and row[0] else None
+
+    def _spec_scope(self, specs: Optional[Iterable[str]]) -> Tuple[str, Tuple[str, ...]]:
+        if specs is None:
+            return "1", ()
+        specs = tuple(specs)
+        return f"f.spec IN ({', '.join('?' * len(specs))})" if specs else "0", specs
@@ -17,11 +17,55 @@ import statistics
 from ...core.reflective_module import ReflectiveModule, ModuleStatus, HealthIndicator
 from ...pdca.pdca_core import PDCACore, PDCAPhase
 from ..models.data_models import AgentNetworkState, NetworkPerformanceMetrics, IntelligenceInsights
+from .trend_analytics import (
+    NETWORK_SERIES,
+    BatchTrendAnalyzer,
+    MetricHistory,
+    SeriesAnalytics,
+    SeriesKey,
+    classify_trend,
+    linear_slope,
+    summarize_trends,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Network-level metrics tracked in columnar history, mapped to trend report keys
+TRACKED_NETWORK_METRICS = {
+    'coordination_overhead_ms': 'coordination_overhead',
+    'parallel_efficiency': 'parallel_efficiency',
+    'average_response_time_ms': 'response_time',
+    'error_rate': 'error_rate',
+}
+
+# (metric, value that scores 0.0, weight); None means the metric is already a 0-1 score
+HEALTH_SCORE_COMPONENTS = [
+    ('coordination_overhead_ms', 200.0, 0.3),  # 200ms = 0 score
+    ('parallel_efficiency', None, 0.3),
+    ('average_response_time_ms', 5000.0, 0.2),  # 5s = 0 score
+    ('error_rate', 0.1, 0.2),  # 10% error rate = 0 score
+]
+
+# (metric, comparison, threshold, pattern prefix, pattern type, description,
+#  confidence, performance impact, suggestion)
+PATTERN_RULES = [
+    ('coordination_overhead_ms', '>', 100, 'high_overhead',
+     'PERFORMANCE_OPTIMIZATION', "High coordination overhead detected", 0.8, -0.2,
+     "Implement message batching and reduce coordination frequency"),
+    ('parallel_efficiency', '<', 0.8, 'low_efficiency',
+     'COORDINATION_EFFICIENCY', "Low parallel efficiency detected", 0.7, -0.15,
+     "Optimize task distribution and reduce agent idle time"),
+    ('error_rate', '>', 0.05, 'high_errors',  # 5% error rate
+     'ERROR_PREVENTION', "High error rate detected", 0.9, -0.3,
+     "Implement better error handling and retry mechanisms"),
+]
+
+# Level shifts are classified like the threshold rule on the same metric
+SHIFT_PATTERN_TYPES = {rule[0]: rule[4] for rule in PATTERN_RULES}
+
+
 class LearningPattern(Enum):
     """Types of learning patterns the intelligence engine can recognize"""
     PERFORMANCE_OPTIMIZATION = "performance_optimization"
@@ -104,6 +148,12 @@ class NetworkIntelligenceEngine(ReflectiveModule):
         self.performance_history: List[NetworkPerformanceMetrics] = []
         self.baseline_metrics: Optional[NetworkPerformanceMetrics] = None
         
+        # Columnar per-agent/per-metric history with batched analytics
+        self.metric_history = MetricHistory()
+        self.trend_analyzer = BatchTrendAnalyzer()
+        self.series_analytics: Dict[SeriesKey, SeriesAnalytics] = {}
+        self._recorded_until: Dict[SeriesKey, datetime] = {}
+        
         # Learning parameters
         self.learning_window_hours = 24
         self.min_evidence_threshold = 5
@@ -144,6 +194,12 @@ class NetworkIntelligenceEngine(ReflectiveModule):
                 if m.timestamp > cutoff_time
             ]
             
+            # Batched analytics over the whole learning window, off the event loop
+            self._record_metric_samples(network_state, current_metrics)
+            self.series_analytics = await self.trend_analyzer.analyze_async(
+                self.metric_history, since=cutoff_time
+            )
+            
             # Analyze patterns
             patterns = await self._identify_patterns(current_metrics)
             
@@ -283,49 +339,80 @@ class NetworkIntelligenceEngine(ReflectiveModule):
             throughput_ops_per_second=total_operations / 60.0 if total_operations > 0 else 0.0
         )
     
+    def _record_metric_samples(self, network_state: AgentNetworkState,
+                               current_metrics: NetworkPerformanceMetrics) -> None:
+        """Append network-level and per-agent samples to the columnar history"""
+        
+        timestamp = getattr(current_metrics, 'timestamp', None)
+        self.metric_history.record_many(
+            NETWORK_SERIES,
+            {name: getattr(current_metrics, name, None) for name in TRACKED_NETWORK_METRICS},
+            timestamp
+        )
+        
+        agents = network_state.active_agents
+        if isinstance(agents, dict):
+            agents = agents.values()
+        
+        # Only samples newer than the last one recorded for each (agent, metric)
+        for agent in agents:
+            for sample in getattr(agent, 'performance_history', None) or []:
+                key = (agent.agent_id, sample.metric_name)
+                recorded_until = self._recorded_until.get(key)
+                if recorded_until is not None and sample.timestamp <= recorded_until:
+                    continue
+                self.metric_history.record(agent.agent_id, sample.metric_name, sample.value, sample.timestamp)
+                self._recorded_until[key] = sample.timestamp
+    
     async def _identify_patterns(self, current_metrics: NetworkPerformanceMetrics) -> List[NetworkPattern]:
         """Identify patterns in network performance"""
         
         patterns = []
-        
-        # Pattern 1: High coordination overhead
-        if current_metrics.coordination_overhead_ms > 100:
-            pattern = NetworkPattern(
-                pattern_id=f"high_overhead_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-                pattern_type=LearningPattern.PERFORMANCE_OPTIMIZATION,
-                description="High coordination overhead detected",
-                confidence=0.8,
-                evidence_count=1,
-                performance_impact=-0.2,
-                optimization_suggestion="Implement message batching and reduce coordination frequency"
-            )
-            patterns.append(pattern)
-            self.learned_patterns[pattern.pattern_id] = pattern
-        
-        # Pattern 2: Low parallel efficiency
-        if current_metrics.parallel_efficiency < 0.8:
+        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        
+        # Threshold patterns on the current snapshot
+        for (metric_name, comparison, threshold, prefix, pattern_type, description,
+             confidence, impact, suggestion) in PATTERN_RULES:
+            value = getattr(current_metrics, metric_name, None)
+            if value is None:
+                continue
+            triggered = value > threshold if comparison == '>' else value < threshold
+            if not triggered:
+                continue
+            
+            series = self.series_analytics.get((NETWORK_SERIES, metric_name))
             pattern = NetworkPattern(
-                pattern_id=f"low_efficiency_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-                pattern_type=LearningPattern.COORDINATION_EFFICIENCY,
-                description="Low parallel efficiency detected",
-                confidence=0.7,
-                evidence_count=1,
-                performance_impact=-0.15,
-                optimization_suggestion="Optimize task distribution and reduce agent idle time"
+                pattern_id=f"{prefix}_{timestamp}",
+                pattern_type=LearningPattern[pattern_type],
+                description=description,
+                confidence=confidence,
+                evidence_count=series.sample_count if series else 1,
+                performance_impact=impact,
+                optimization_suggestion=suggestion
             )
             patterns.append(pattern)
             self.learned_patterns[pattern.pattern_id] = pattern
         
-        # Pattern 3: High error rate
-        if current_metrics.error_rate > 0.05:  # 5% error rate
+        # Level shifts detected anywhere in the learning window, reported once per shift
+        for series in self.series_analytics.values():
+            if series.change_point is None:
+                continue
+            
+            pattern_id = f"shift_{series.agent_id}_{series.metric_name}_{series.change_point}"
+            if pattern_id in self.learned_patterns:
+                continue
+            
             pattern = NetworkPattern(
-                pattern_id=f"high_errors_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-                pattern_type=LearningPattern.ERROR_PREVENTION,
-                description="High error rate detected",
-                confidence=0.9,
-                evidence_count=1,
-                performance_impact=-0.3,
-                optimization_suggestion="Implement better error handling and retry mechanisms"
+                pattern_id=pattern_id,
+                pattern_type=LearningPattern[SHIFT_PATTERN_TYPES.get(series.metric_name, 'LOAD_BALANCING')],
+                description=(
+                    f"Level shift in {series.metric_name} for {series.agent_id} "
+                    f"({series.change_magnitude:+.3f} after sample {series.change_point})"
+                ),
+                confidence=min(0.95, self.confidence_threshold + 0.01 * series.sample_count),
+                evidence_count=series.sample_count - series.change_point,
+                performance_impact=0.0,
+                optimization_suggestion="Review load distribution around the detected shift"
             )
             patterns.append(pattern)
             self.learned_patterns[pattern.pattern_id] = pattern
@@ -381,67 +468,69 @@ class NetworkIntelligenceEngine(ReflectiveModule):
     def _calculate_health_score(self, metrics: NetworkPerformanceMetrics) -> float:
         """Calculate overall network health score (0.0 to 1.0)"""
         
-        # Component scores
-        coordination_score = max(0.0, 1.0 - (metrics.coordination_overhead_ms / 200.0))  # 200ms = 0 score
-        efficiency_score = metrics.parallel_efficiency
-        response_score = max(0.0, 1.0 - (metrics.average_response_time_ms / 5000.0))  # 5s = 0 score
-        error_score = max(0.0, 1.0 - (metrics.error_rate / 0.1))  # 10% error rate = 0 score
-        
-        # Weighted average
-        health_score = (
-            coordination_score * 0.3 +
-            efficiency_score * 0.3 +
-            response_score * 0.2 +
-            error_score * 0.2
-        )
+        health_score = 0.0
+        for metric_name, zero_score_at, weight in HEALTH_SCORE_COMPONENTS:
+            value = getattr(metrics, metric_name, 0.0)
+            if zero_score_at is None:
+                component_score = value
+            else:
+                component_score = max(0.0, 1.0 - (value / zero_score_at))
+            health_score += component_score * weight
         
         return min(1.0, max(0.0, health_score))
     
     def _analyze_performance_trends(self) -> Dict[str, Any]:
         """Analyze performance trends over time"""
         
-        if len(self.performance_history) < 2:
-            return {'trend': 'insufficient_data', 'direction': 'unknown'}
-        
-        # Get recent metrics
-        recent_metrics = self.performance_history[-10:]  # Last 10 measurements
+        network_series = {
+            key[1]: analytics for key, analytics in self.series_analytics.items()
+            if key[0] == NETWORK_SERIES
+        }
         
-        # Calculate trends
-        coordination_trend = self._calculate_trend([m.coordination_overhead_ms for m in recent_metrics])
-        efficiency_trend = self._calculate_trend([m.parallel_efficiency for m in recent_metrics])
-        response_trend = self._calculate_trend([m.average_response_time_ms for m in recent_metrics])
+        if not network_series:
+            if len(self.performance_history) < 2:
+                return {'trend': 'insufficient_data', 'direction': 'unknown'}
+            
+            # Fall back to the last 10 measurements when no batched analytics exist
+            recent_metrics = self.performance_history[-10:]
+            trends = {
+                report_key: self._calculate_trend([getattr(m, name) for m in recent_metrics])
+                for name, report_key in TRACKED_NETWORK_METRICS.items()
+                if report_key != 'error_rate'
+            }
+            trends['overall_direction'] = self._determine_overall_trend(list(trends.values()))
+            return trends
+        
+        trends = {}
+        details = {}
+        for metric_name, report_key in TRACKED_NETWORK_METRICS.items():
+            analytics = network_series.get(metric_name)
+            if analytics is None:
+                continue
+            trends[report_key] = analytics.trend
+            details[report_key] = analytics.to_dict()
+        
+        agent_analytics = [
+            analytics for key, analytics in self.series_analytics.items()
+            if key[0] != NETWORK_SERIES
+        ]
         
-        return {
-            'coordination_overhead': coordination_trend,
-            'parallel_efficiency': efficiency_trend,
-            'response_time': response_trend,
-            'overall_direction': self._determine_overall_trend([coordination_trend, efficiency_trend, response_trend])
-        }
+        component_trends = [trends[k] for k in ('coordination_overhead', 'parallel_efficiency', 'response_time') if k in trends]
+        trends['overall_direction'] = self._determine_overall_trend(component_trends)
+        trends['series_details'] = details
+        trends['agent_trends'] = summarize_trends(agent_analytics)
+        trends['change_points'] = [
+            analytics.to_dict() for analytics in self.series_analytics.values()
+            if analytics.change_point is not None
+        ]
+        return trends
     
     def _calculate_trend(self, values: List[float]) -> str:
         """Calculate trend direction for a series of values"""
         if len(values) < 2:
             return 'stable'
         
-        # Simple linear trend
-        x = list(range(len(values)))
-        y = values
-        
-        # Calculate slope
-        n = len(values)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_x2 = sum(xi * xi for xi in x)
-        
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        
-        if abs(slope) < 0.01:  # Threshold for "stable"
-            return 'stable'
-        elif slope > 0:
-            return 'improving'
-        else:
-            return 'degrading'
+        return classify_trend(linear_slope(values), self.trend_analyzer.stable_threshold)
     
     def _determine_overall_trend(self, trends: List[str]) -> str:
         """Determine overall trend from component trends"""
@@ -670,6 +759,8 @@ class NetworkIntelligenceEngine(ReflectiveModule):
             'metrics': self.metrics.copy(),
             'learned_patterns': len(self.learned_patterns),
             'performance_history_size': len(self.performance_history),
+            'metric_history_samples': len(self.metric_history),
+            'tracked_series': len(self.series_analytics),
             'learning_window_hours': self.learning_window_hours,
             'confidence_threshold': self.confidence_threshold
         }
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+Batched Trend Analytics for Beast Mode Agent Network
+
+Columnar metric history and single-pass trend analytics (slope, EWMA,
+variance and change-point detection) across every agent and metric.
+"""
+
+import asyncio
+import logging
+import math
+import operator
+import threading
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import accumulate
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+SeriesKey = Tuple[str, str]  # (agent_id, metric_name)
+
+NETWORK_SERIES = "network"
+
+
+@dataclass
+class SeriesAnalytics:
+    """Analytics computed for a single (agent, metric) series"""
+    agent_id: str
+    metric_name: str
+    sample_count: int
+    mean: float
+    variance: float
+    slope: float
+    ewma: float
+    trend: str
+    change_point: Optional[int] = None
+    change_magnitude: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'agent_id': self.agent_id,
+            'metric_name': self.metric_name,
+            'sample_count': self.sample_count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'slope': self.slope,
+            'ewma': self.ewma,
+            'trend': self.trend,
+            'change_point': self.change_point,
+            'change_magnitude': self.change_magnitude
+        }
+
+
+def linear_slope(values: List[float]) -> float:
+    """
+    Least-squares slope of values against their sample index.
+
+    The x-axis sums are closed-form, so only sum(y) and sum(x*y) touch the
+    data, both evaluated with C-level iteration.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0
+
+    sum_x = n * (n - 1) / 2.0
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6.0
+    sum_y = math.fsum(values)
+    sum_xy = math.fsum(map(operator.mul, range(n), values))
+
+    denominator = n * sum_x2 - sum_x * sum_x
+    if denominator == 0:
+        return 0.0
+    return (n * sum_xy - sum_x * sum_y) / denominator
+
+
+def classify_trend(slope: float, stable_threshold: float = 0.01) -> str:
+    """Map a slope onto the engine's trend vocabulary"""
+    if abs(slope) < stable_threshold:
+        return 'stable'
+    elif slope > 0:
+        return 'improving'
+    else:
+        return 'degrading'
+
+
+class MetricHistory:
+    """
+    Columnar, bounded history of metric samples keyed by (agent, metric).
+
+    Each series keeps parallel timestamp and value columns capped at
+    ``max_samples`` so a day of per-second samples stays bounded in memory.
+    """
+
+    def __init__(self, max_samples: int = 86400):
+        self.max_samples = max_samples
+        self._timestamps: Dict[SeriesKey, Deque[float]] = {}
+        self._values: Dict[SeriesKey, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_id: str, metric_name: str, value: float,
+               timestamp: Optional[datetime] = None) -> None:
+        """Append a single sample to the (agent, metric) series"""
+        key = (agent_id, metric_name)
+        ts = (timestamp or datetime.utcnow()).timestamp()
+
+        with self._lock:
+            if key not in self._values:
+                self._timestamps[key] = deque(maxlen=self.max_samples)
+                self._values[key] = deque(maxlen=self.max_samples)
+            self._timestamps[key].append(ts)
+            self._values[key].append(float(value))
+
+    def record_many(self, agent_id: str, samples: Dict[str, float],
+                    timestamp: Optional[datetime] = None) -> None:
+        """Append one sample per metric for an agent at a shared timestamp"""
+        for metric_name, value in samples.items():
+            if value is None:
+                continue
+            self.record(agent_id, metric_name, value, timestamp)
+
+    def series_keys(self) -> List[SeriesKey]:
+        with self._lock:
+            return list(self._values.keys())
+
+    def snapshot(self, since: Optional[datetime] = None,
+                 last_n: Optional[int] = None) -> Dict[SeriesKey, List[float]]:
+        """
+        Copy value columns for analysis outside the lock.
+
+        Args:
+            since: Only include samples recorded at or after this time
+            last_n: Only include the most recent N samples of each series
+
+        Returns:
+            Mapping of (agent, metric) to a list of values in arrival order
+        """
+        cutoff = since.timestamp() if since else None
+        columns: Dict[SeriesKey, List[float]] = {}
+
+        with self._lock:
+            for key, values in self._values.items():
+                column = list(values)
+                if cutoff is not None:
+                    start = bisect_left(list(self._timestamps[key]), cutoff)
+                    column = column[start:]
+                if last_n is not None:
+                    column = column[-last_n:]
+                if column:
+                    columns[key] = column
+
+        return columns
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._values.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timestamps.clear()
+            self._values.clear()
+
+
+class BatchTrendAnalyzer:
+    """
+    Computes slope, EWMA, variance and change points for many series at once.
+
+    Every statistic is derived from a fixed number of linear passes over
+    each column, so a single ``analyze`` call scales linearly with the total
+    number of samples regardless of how many agents or metrics are tracked.
+    """
+
+    def __init__(self, ewma_alpha: float = 0.3, stable_threshold: float = 0.01,
+                 change_point_threshold: float = 3.0, min_change_segment: int = 5):
+        self.ewma_alpha = ewma_alpha
+        self.stable_threshold = stable_threshold
+        self.change_point_threshold = change_point_threshold
+        self.min_change_segment = min_change_segment
+
+    def analyze(self, columns: Dict[SeriesKey, List[float]]) -> Dict[SeriesKey, SeriesAnalytics]:
+        """Analyze every column and return analytics keyed like the input"""
+        return {
+            key: self._analyze_series(key, values)
+            for key, values in columns.items()
+        }
+
+    async def analyze_async(self, history: MetricHistory,
+                            since: Optional[datetime] = None,
+                            last_n: Optional[int] = None) -> Dict[SeriesKey, SeriesAnalytics]:
+        """
+        Snapshot the history and analyze it in a worker thread.
+
+        Long windows (hours of per-second samples) are processed off the
+        event loop so coordination tasks keep running during analysis.
+        """
+        columns = history.snapshot(since=since, last_n=last_n)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze, columns)
+
+    def _analyze_series(self, key: SeriesKey, values: List[float]) -> SeriesAnalytics:
+        n = len(values)
+        agent_id, metric_name = key
+
+        prefix = list(accumulate(values))
+        total = prefix[-1]
+        mean = total / n
+        # Two-pass population variance; sum(x^2)/n - mean^2 cancels badly for large means
+        variance = math.fsum((value - mean) * (value - mean) for value in values) / n
+
+        slope = linear_slope(values)
+        ewma = self._ewma(values)
+        change_point, magnitude = self._detect_change_point(prefix, mean, variance, n)
+
+        return SeriesAnalytics(
+            agent_id=agent_id,
+            metric_name=metric_name,
+            sample_count=n,
+            mean=mean,
+            variance=variance,
+            slope=slope,
+            ewma=ewma,
+            trend=classify_trend(slope, self.stable_threshold),
+            change_point=change_point,
+            change_magnitude=magnitude
+        )
+
+    def _ewma(self, values: List[float]) -> float:
+        alpha = self.ewma_alpha
+        # Drain the running accumulation in C, keeping only the final value
+        return deque(accumulate(values, lambda s, v: s + alpha * (v - s)), maxlen=1)[0]
+
+    def _detect_change_point(self, prefix: List[float], mean: float,
+                             variance: float, n: int) -> Tuple[Optional[int], float]:
+        """
+        Single mean-shift detection over CUSUM deviations.
+
+        The split maximising |S_k - k * mean| is the most likely shift; it is
+        reported only when the segment means differ by more than
+        ``change_point_threshold`` standard errors.
+        """
+        min_segment = self.min_change_segment
+        if n < 2 * min_segment or variance <= 0.0:
+            return None, 0.0
+
+        best_k = None
+        best_deviation = 0.0
+        for k in range(min_segment, n - min_segment + 1):
+            deviation = abs(prefix[k - 1] - k * mean)
+            if deviation > best_deviation:
+                best_deviation = deviation
+                best_k = k
+
+        if best_k is None:
+            return None, 0.0
+
+        total = prefix[-1]
+        before_mean = prefix[best_k - 1] / best_k
+        after_mean = (total - prefix[best_k - 1]) / (n - best_k)
+        magnitude = after_mean - before_mean
+
+        standard_error = math.sqrt(variance * (1.0 / best_k + 1.0 / (n - best_k)))
+        if abs(magnitude) < self.change_point_threshold * standard_error:
+            return None, 0.0
+
+        return best_k, magnitude
+
+
+def summarize_trends(analytics: Iterable[SeriesAnalytics]) -> Dict[str, Dict[str, int]]:
+    """Count improving/degrading/stable series per metric across agents"""
+    summary: Dict[str, Dict[str, int]] = {}
+    for result in analytics:
+        counts = summary.setdefault(
+            result.metric_name, {'improving': 0, 'degrading': 0, 'stable': 0}
+        )
+        counts[result.trend] += 1
+    return summary
@@ -1,7 +1,12 @@
 """Core components for multi-agent consensus engine."""
 
+from .aggregator import IncrementalConsensusAggregator
 from .consensus_engine import ConsensusEngine
+from .result_cache import ConsensusResultCache, analysis_digest
 
 __all__ = [
     "ConsensusEngine",
-]
\ No newline at end of file
+    "IncrementalConsensusAggregator",
+    "ConsensusResultCache",
+    "analysis_digest",
+]
@@ -0,0 +1,315 @@
+"""Incremental consensus aggregation for streaming agent analyses."""
+
+from typing import Any, Dict, List, Optional
+
+from ..models.data_models import (
+    AgentAnalysis,
+    ConsensusMethod,
+    ConsensusResult,
+    ConflictInfo,
+    ConflictType,
+)
+from .result_cache import canonical_json
+
+
+class _Tally:
+    """Running tally for one candidate value."""
+
+    __slots__ = ('order', 'display', 'votes', 'weight', 'qualified_weight')
+
+    def __init__(self, order: int, display: str):
+        self.order = order
+        self.display = display
+        self.votes = 0
+        self.weight = 0.0
+        self.qualified_weight = 0.0
+
+
+class IncrementalConsensusAggregator:
+    """
+    Stateful consensus aggregator that accepts analyses one at a time.
+
+    Each ``add`` updates vote counts, weighted tallies, the running leaders,
+    the confidence range and conflict state in O(1) (plus the cost of
+    canonicalising the result once), so large swarms can be queried for the
+    current consensus at any point while votes are still arriving.
+    """
+
+    def __init__(self, method: ConsensusMethod = ConsensusMethod.WEIGHTED_CONSENSUS,
+                 confidence_threshold: float = 0.7):
+        """
+        Initialize the aggregator.
+
+        Args:
+            method: Consensus method used for current_result()
+            confidence_threshold: Minimum weighted confidence for threshold consensus
+        """
+        self.method = ConsensusMethod(method)
+        self.confidence_threshold = confidence_threshold
+
+        self._tallies: Dict[str, _Tally] = {}
+        self._agents: List[str] = []
+        self._qualified_agents: List[str] = []
+
+        self._total_weight = 0.0
+        self._qualified_weight = 0.0
+        self._evidence_total = 0
+        self._min_confidence: Optional[float] = None
+        self._max_confidence: Optional[float] = None
+
+        self._vote_leader: Optional[_Tally] = None
+        self._weight_leader: Optional[_Tally] = None
+        self._qualified_leader: Optional[_Tally] = None
+
+    @classmethod
+    def from_analyses(cls, analyses: List[AgentAnalysis],
+                      method: ConsensusMethod = ConsensusMethod.WEIGHTED_CONSENSUS,
+                      confidence_threshold: float = 0.7) -> "IncrementalConsensusAggregator":
+        """Build an aggregator pre-loaded with a list of analyses."""
+        aggregator = cls(method, confidence_threshold)
+        aggregator.add_many(analyses)
+        return aggregator
+
+    def add(self, analysis: AgentAnalysis) -> None:
+        """Fold a single analysis into the running consensus state."""
+        key = canonical_json(analysis.result)
+        tally = self._tallies.get(key)
+        if tally is None:
+            tally = _Tally(len(self._tallies), str(analysis.result))
+            self._tallies[key] = tally
+
+        weight = analysis.get_weighted_confidence()
+
+        tally.votes += 1
+        tally.weight += weight
+        self._total_weight += weight
+        self._agents.append(analysis.agent_id)
+        self._evidence_total += len(analysis.evidence)
+
+        if self._min_confidence is None or analysis.confidence < self._min_confidence:
+            self._min_confidence = analysis.confidence
+        if self._max_confidence is None or analysis.confidence > self._max_confidence:
+            self._max_confidence = analysis.confidence
+
+        self._vote_leader = self._leader(self._vote_leader, tally, 'votes')
+        self._weight_leader = self._leader(self._weight_leader, tally, 'weight')
+
+        if weight >= self.confidence_threshold:
+            tally.qualified_weight += weight
+            self._qualified_weight += weight
+            self._qualified_agents.append(analysis.agent_id)
+            self._qualified_leader = self._leader(self._qualified_leader, tally, 'qualified_weight')
+
+    def add_many(self, analyses: List[AgentAnalysis]) -> None:
+        """Fold several analyses into the running consensus state."""
+        for analysis in analyses:
+            self.add(analysis)
+
+    @property
+    def count(self) -> int:
+        """Number of analyses aggregated so far."""
+        return len(self._agents)
+
+    @property
+    def distinct_results(self) -> int:
+        """Number of distinct result values seen so far."""
+        return len(self._tallies)
+
+    @property
+    def confidence_range(self) -> float:
+        """Spread between the highest and lowest raw confidence."""
+        if self._min_confidence is None:
+            return 0.0
+        return self._max_confidence - self._min_confidence
+
+    def has_value_disagreement(self) -> bool:
+        return len(self._tallies) > 1
+
+    def has_confidence_mismatch(self) -> bool:
+        return self.confidence_range > 0.5  # Significant confidence mismatch
+
+    def detect_conflicts(self) -> List[ConflictInfo]:
+        """Build conflict records for the current state."""
+        conflicts = []
+
+        if self.count < 2:
+            return conflicts
+
+        if self.has_value_disagreement():
+            unique_results = {tally.display for tally in self._tallies.values()}
+            conflicts.append(ConflictInfo(
+                conflict_type=ConflictType.VALUE_DISAGREEMENT,
+                severity=0.7,  # Default severity
+                conflicting_agents=list(self._agents),
+                conflict_description=f"Agents disagree on result values: {unique_results}"
+            ))
+
+        if self.has_confidence_mismatch():
+            confidence_range = self.confidence_range
+            conflicts.append(ConflictInfo(
+                conflict_type=ConflictType.CONFIDENCE_MISMATCH,
+                severity=confidence_range,
+                conflicting_agents=list(self._agents),
+                conflict_description=f"Large confidence range: {confidence_range:.2f}"
+            ))
+
+        return conflicts
+
+    def is_decided(self, pending_count: int, minimum_agents: int = 1) -> bool:
+        """
+        Check whether ``pending_count`` further analyses could change the winner.
+
+        Every vote, and every weighted confidence, contributes at most 1.0, so
+        the outcome is fixed once the leader's margin exceeds the pending count.
+        """
+        if self.count < minimum_agents:
+            return False
+
+        if self.method == ConsensusMethod.SIMPLE_VOTING:
+            attribute, leader = 'votes', self._vote_leader
+        elif self.method == ConsensusMethod.THRESHOLD_CONSENSUS:
+            attribute, leader = 'qualified_weight', self._qualified_leader
+        else:
+            attribute, leader = 'weight', self._weight_leader
+
+        if leader is None:
+            return False
+        if pending_count <= 0:
+            return True
+
+        runner_up = max(
+            (getattr(tally, attribute) for tally in self._tallies.values() if tally is not leader),
+            default=0.0
+        )
+        return getattr(leader, attribute) - runner_up > pending_count * 1.0
+
+    def current_result(self, conflicts_detected: int = 0,
+                       conflicts_resolved: int = 0) -> ConsensusResult:
+        """Get the consensus implied by the analyses aggregated so far."""
+        if not self._agents:
+            raise ValueError("No analyses provided for consensus calculation")
+
+        if self.method == ConsensusMethod.SIMPLE_VOTING:
+            return self._simple_voting_result(conflicts_detected, conflicts_resolved)
+        elif self.method == ConsensusMethod.WEIGHTED_CONSENSUS:
+            return self._weighted_result(conflicts_detected, conflicts_resolved)
+        elif self.method == ConsensusMethod.BAYESIAN_CONSENSUS:
+            return self._bayesian_result(conflicts_detected, conflicts_resolved)
+        elif self.method == ConsensusMethod.THRESHOLD_CONSENSUS:
+            return self._threshold_result(conflicts_detected, conflicts_resolved)
+        else:
+            raise ValueError(f"Unknown consensus method: {self.method}")
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get a lightweight summary of the running tallies."""
+        return {
+            'method': self.method.value,
+            'analyses': self.count,
+            'distinct_results': self.distinct_results,
+            'total_weight': self._total_weight,
+            'confidence_range': self.confidence_range,
+            'vote_leader': self._vote_leader.display if self._vote_leader else None,
+            'weight_leader': self._weight_leader.display if self._weight_leader else None,
+            'value_disagreement': self.has_value_disagreement(),
+            'confidence_mismatch': self.has_confidence_mismatch(),
+        }
+
+    @staticmethod
+    def _leader(current: Optional[_Tally], candidate: _Tally, attribute: str) -> Optional[_Tally]:
+        """Keep the highest tally, breaking ties by first appearance."""
+        value = getattr(candidate, attribute)
+        if value <= 0:
+            return current
+        if current is None:
+            return candidate
+
+        best = getattr(current, attribute)
+        if value > best or (value == best and candidate.order < current.order):
+            return candidate
+        return current
+
+    def _simple_voting_result(self, conflicts_detected: int, conflicts_resolved: int) -> ConsensusResult:
+        leader = self._vote_leader
+        agreement_level = leader.votes / self.count
+
+        return ConsensusResult(
+            consensus_value=leader.display,
+            confidence_score=agreement_level,
+            consensus_method=ConsensusMethod.SIMPLE_VOTING,
+            participating_agents=list(self._agents),
+            total_agents=self.count,
+            agreement_level=agreement_level,
+            conflicts_detected=conflicts_detected,
+            conflicts_resolved=conflicts_resolved,
+            result_quality=agreement_level,
+            uncertainty_level=1.0 - agreement_level
+        )
+
+    def _weighted_result(self, conflicts_detected: int, conflicts_resolved: int,
+                         leader: Optional[_Tally] = None, leader_weight: Optional[float] = None,
+                         total_weight: Optional[float] = None,
+                         agents: Optional[List[str]] = None) -> ConsensusResult:
+        if leader is None and leader_weight is None:
+            leader = self._weight_leader
+            leader_weight = leader.weight if leader else 0.0
+            total_weight = self._total_weight
+            agents = self._agents
+
+        agreement_level = leader_weight / total_weight if total_weight > 0 else 0.0
+        agreement_level = min(1.0, agreement_level)
+
+        return ConsensusResult(
+            consensus_value=leader.display if leader else None,
+            confidence_score=agreement_level,
+            consensus_method=ConsensusMethod.WEIGHTED_CONSENSUS,
+            participating_agents=list(agents),
+            total_agents=len(agents),
+            agreement_level=agreement_level,
+            conflicts_detected=conflicts_detected,
+            conflicts_resolved=conflicts_resolved,
+            result_quality=agreement_level,
+            uncertainty_level=1.0 - agreement_level
+        )
+
+    def _bayesian_result(self, conflicts_detected: int, conflicts_resolved: int) -> ConsensusResult:
+        result = self._weighted_result(conflicts_detected, conflicts_resolved)
+        result.consensus_method = ConsensusMethod.BAYESIAN_CONSENSUS
+
+        # Adjust uncertainty based on evidence diversity
+        avg_evidence = self._evidence_total / self.count
+        evidence_factor = min(1.0, avg_evidence / 3.0)  # Assume 3 pieces of evidence is good
+
+        result.uncertainty_level = result.uncertainty_level * (1.0 - evidence_factor * 0.3)
+        result.confidence_score = 1.0 - result.uncertainty_level
+
+        return result
+
+    def _threshold_result(self, conflicts_detected: int, conflicts_resolved: int) -> ConsensusResult:
+        if not self._qualified_agents:
+            # No analyses meet threshold
+            return ConsensusResult(
+                consensus_value=None,
+                confidence_score=0.0,
+                consensus_method=ConsensusMethod.THRESHOLD_CONSENSUS,
+                participating_agents=[],
+                total_agents=self.count,
+                agreement_level=0.0,
+                conflicts_detected=conflicts_detected,
+                conflicts_resolved=conflicts_resolved,
+                result_quality=0.0,
+                uncertainty_level=1.0,
+                unresolved_conflicts=[f"No analyses meet confidence threshold {self.confidence_threshold}"]
+            )
+
+        leader = self._qualified_leader
+        result = self._weighted_result(
+            conflicts_detected, conflicts_resolved,
+            leader=leader,
+            leader_weight=leader.qualified_weight if leader else 0.0,
+            total_weight=self._qualified_weight,
+            agents=self._qualified_agents
+        )
+        result.consensus_method = ConsensusMethod.THRESHOLD_CONSENSUS
+        result.total_agents = self.count  # Keep original total
+
+        return result
@@ -1,9 +1,11 @@
 """Core consensus engine implementing ReflectiveModule pattern."""
 
 import asyncio
+import math
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 
 from ...core.reflective_module import ReflectiveModule, ModuleStatus, HealthIndicator
@@ -17,6 +19,11 @@ from ..models.data_models import (
     ConflictType,
     ResolutionStrategy
 )
+from .aggregator import IncrementalConsensusAggregator
+from .result_cache import ConsensusResultCache, analysis_digest
+
+
+AgentProvider = Callable[[DecisionWorkflow], Awaitable[AgentAnalysis]]
 
 
 @dataclass
@@ -31,6 +38,10 @@ class ConsensusEngineConfig:
     enable_learning: bool = True
     cache_results: bool = True
     cache_ttl_seconds: int = 3600
+    cache_max_entries: int = 1024
+    enable_early_completion: bool = True
+    late_response_history_size: int = 1000
+    latency_window_size: int = 1000
 
 
 class ConsensusEngine(ReflectiveModule):
@@ -42,22 +53,34 @@ class ConsensusEngine(ReflectiveModule):
     while implementing the ReflectiveModule pattern for health monitoring.
     """
     
-    def __init__(self, config: ConsensusEngineConfig):
+    def __init__(self, config: ConsensusEngineConfig, shared_cache_backend: Optional[Any] = None):
         """
         Initialize the consensus engine.
         
         Args:
             config: Configuration for the consensus engine
+            shared_cache_backend: Optional async Redis client to share cached
+                results across consensus workers
         """
         super().__init__()
         self.config = config
         
         # Internal state
         self._active_workflows: Dict[str, DecisionWorkflow] = {}
-        self._consensus_cache: Dict[str, ConsensusResult] = {}
+        self._consensus_cache = ConsensusResultCache(
+            max_entries=config.cache_max_entries,
+            ttl_seconds=config.cache_ttl_seconds,
+            shared_backend=shared_cache_backend
+        )
         self._conflict_history: List[ConflictInfo] = []
         self._resolution_patterns: Dict[str, ResolutionStrategy] = {}
         
+        # Agent analysis collection
+        self._agent_providers: Dict[str, AgentProvider] = {}
+        self._late_responses: Deque[Dict[str, Any]] = deque(maxlen=config.late_response_history_size)
+        self._workflow_outcomes: Dict[str, Any] = {}
+        self._decision_latencies: Dict[str, Deque[float]] = {}
+        
         # Metrics
         self._metrics = {
             'consensus_calculations': 0,
@@ -69,6 +92,10 @@ class ConsensusEngine(ReflectiveModule):
             'average_calculation_time_ms': 0.0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'agent_timeouts': 0,
+            'agent_failures': 0,
+            'early_completions': 0,
+            'late_responses': 0,
         }
         
         # Health status
@@ -101,17 +128,21 @@ class ConsensusEngine(ReflectiveModule):
             confidence_threshold = confidence_threshold or self.config.default_confidence_threshold
             
             # Check cache first
-            cache_key = self._generate_cache_key(analyses, method)
-            if self.config.cache_results and cache_key in self._consensus_cache:
-                cached_result = self._consensus_cache[cache_key]
-                if self._is_cache_valid(cached_result):
+            cache_key = self._generate_cache_key(analyses, method, confidence_threshold)
+            if self.config.cache_results:
+                cached_result = await self._consensus_cache.get(cache_key)
+                if cached_result is not None:
                     self._metrics['cache_hits'] += 1
                     return cached_result
             
             self._metrics['cache_misses'] += 1
             
+            # Aggregate once; conflicts and consensus are read from running tallies
+            aggregator = self.create_aggregator(method, confidence_threshold)
+            aggregator.add_many(analyses)
+            
             # Detect conflicts
-            conflicts = self._detect_conflicts(analyses)
+            conflicts = aggregator.detect_conflicts()
             self._metrics['conflicts_detected'] += len(conflicts)
             
             # Resolve conflicts if enabled
@@ -121,9 +152,7 @@ class ConsensusEngine(ReflectiveModule):
                 self._metrics['conflicts_resolved'] += resolved_conflicts
             
             # Calculate consensus based on method
-            consensus_result = await self._apply_consensus_algorithm(
-                analyses, method, confidence_threshold, conflicts, resolved_conflicts
-            )
+            consensus_result = aggregator.current_result(len(conflicts), resolved_conflicts)
             
             # Update metrics
             calculation_time = (time.time() - start_time) * 1000
@@ -133,7 +162,7 @@ class ConsensusEngine(ReflectiveModule):
             
             # Cache result if enabled
             if self.config.cache_results:
-                self._consensus_cache[cache_key] = consensus_result
+                await self._consensus_cache.put(cache_key, consensus_result)
             
             # Learn from this consensus if enabled
             if self.config.enable_learning:
@@ -167,6 +196,7 @@ class ConsensusEngine(ReflectiveModule):
                 raise ValueError("Maximum concurrent workflows exceeded")
             
             # Start workflow
+            decision_start = time.perf_counter()
             workflow.start_workflow()
             self._active_workflows[workflow.workflow_id] = workflow
             
@@ -201,6 +231,11 @@ class ConsensusEngine(ReflectiveModule):
                     else:
                         workflow.fail_workflow()
                 
+                self._record_workflow_outcome(workflow.workflow_id, consensus_result.consensus_value)
+                self._record_decision_latency(
+                    workflow.consensus_method, (time.perf_counter() - decision_start) * 1000
+                )
+                
                 return consensus_result
                 
             finally:
@@ -212,6 +247,55 @@ class ConsensusEngine(ReflectiveModule):
             self._active_workflows.pop(workflow.workflow_id, None)
             raise
     
+    def create_aggregator(self, method: Optional[ConsensusMethod] = None,
+                          confidence_threshold: Optional[float] = None) -> IncrementalConsensusAggregator:
+        """
+        Create an incremental aggregator for streaming analyses.
+        
+        Args:
+            method: Consensus method to use (defaults to config)
+            confidence_threshold: Minimum confidence threshold (defaults to config)
+            
+        Returns:
+            IncrementalConsensusAggregator: Aggregator that can be fed analyses
+            one at a time and queried for the current consensus
+        """
+        return IncrementalConsensusAggregator(
+            method or self.config.default_consensus_method,
+            confidence_threshold or self.config.default_confidence_threshold
+        )
+    
+    def register_agent_provider(self, agent_id: str, provider: AgentProvider) -> None:
+        """
+        Register the coroutine used to request an analysis from an agent.
+        
+        Args:
+            agent_id: Agent identifier referenced by decision workflows
+            provider: Async callable returning the agent's analysis for a workflow
+        """
+        self._agent_providers[agent_id] = provider
+    
+    def unregister_agent_provider(self, agent_id: str) -> None:
+        """Remove a previously registered agent provider."""
+        self._agent_providers.pop(agent_id, None)
+    
+    def get_late_responses(self) -> List[Dict[str, Any]]:
+        """Get analyses that arrived after their workflow was decided."""
+        return list(self._late_responses)
+    
+    def get_decision_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get p50/p99 decision latency per consensus method."""
+        stats = {}
+        for method, samples in self._decision_latencies.items():
+            ordered = sorted(samples)
+            stats[method] = {
+                'count': len(ordered),
+                'p50_ms': self._percentile(ordered, 0.50),
+                'p99_ms': self._percentile(ordered, 0.99),
+                'max_ms': ordered[-1],
+            }
+        return stats
+    
     async def resolve_conflicts(self, conflicts: List[ConflictInfo]) -> List[ResolutionResult]:
         """
         Resolve a list of conflicts using appropriate strategies.
@@ -333,6 +417,9 @@ class ConsensusEngine(ReflectiveModule):
             'metrics': self._metrics.copy(),
             'active_workflows': len(self._active_workflows),
             'cached_results': len(self._consensus_cache),
+            'cache': self._consensus_cache.get_stats(),
+            'registered_agent_providers': len(self._agent_providers),
+            'decision_latency': self.get_decision_latency_stats(),
             'conflict_history_size': len(self._conflict_history),
             'last_health_check': self._last_health_check.isoformat(),
         }
@@ -376,56 +463,10 @@ class ConsensusEngine(ReflectiveModule):
     
     # Private helper methods
     
-    def _generate_cache_key(self, analyses: List[AgentAnalysis], method: ConsensusMethod) -> str:
-        """Generate a cache key for consensus results."""
-        # Simple cache key based on agent IDs, results, and method
-        agent_data = []
-        for analysis in analyses:
-            agent_data.append(f"{analysis.agent_id}:{hash(str(analysis.result))}:{analysis.confidence}")
-        
-        combined = "|".join(sorted(agent_data))
-        return f"{method.value}:{hash(combined)}"
-    
-    def _is_cache_valid(self, result: ConsensusResult) -> bool:
-        """Check if a cached result is still valid."""
-        age = datetime.utcnow() - result.timestamp
-        return age.total_seconds() < self.config.cache_ttl_seconds
-    
-    def _detect_conflicts(self, analyses: List[AgentAnalysis]) -> List[ConflictInfo]:
-        """Detect conflicts between agent analyses."""
-        conflicts = []
-        
-        if len(analyses) < 2:
-            return conflicts
-        
-        # Simple conflict detection based on result disagreement
-        results = [analysis.result for analysis in analyses]
-        unique_results = set(str(result) for result in results)
-        
-        if len(unique_results) > 1:
-            # Value disagreement detected
-            conflict = ConflictInfo(
-                conflict_type=ConflictType.VALUE_DISAGREEMENT,
-                severity=0.7,  # Default severity
-                conflicting_agents=[analysis.agent_id for analysis in analyses],
-                conflict_description=f"Agents disagree on result values: {unique_results}"
-            )
-            conflicts.append(conflict)
-        
-        # Check confidence mismatches
-        confidences = [analysis.confidence for analysis in analyses]
-        confidence_range = max(confidences) - min(confidences)
-        
-        if confidence_range > 0.5:  # Significant confidence mismatch
-            conflict = ConflictInfo(
-                conflict_type=ConflictType.CONFIDENCE_MISMATCH,
-                severity=confidence_range,
-                conflicting_agents=[analysis.agent_id for analysis in analyses],
-                conflict_description=f"Large confidence range: {confidence_range:.2f}"
-            )
-            conflicts.append(conflict)
-        
-        return conflicts
+    def _generate_cache_key(self, analyses: List[AgentAnalysis], method: ConsensusMethod,
+                            confidence_threshold: Optional[float] = None) -> str:
+        """Generate a stable, content-addressed cache key for consensus results."""
+        return analysis_digest(analyses, method, confidence_threshold)
     
     async def _resolve_conflicts(self, conflicts: List[ConflictInfo], 
                                analyses: List[AgentAnalysis]) -> int:
@@ -526,174 +567,126 @@ class ConsensusEngine(ReflectiveModule):
                 resolver_id=self.get_module_id()
             )
     
-    async def _apply_consensus_algorithm(self, analyses: List[AgentAnalysis],
-                                       method: ConsensusMethod,
-                                       confidence_threshold: float,
-                                       conflicts: List[ConflictInfo],
-                                       resolved_conflicts: int) -> ConsensusResult:
-        """Apply the specified consensus algorithm."""
+    async def _collect_agent_analyses(self, workflow: DecisionWorkflow) -> List[AgentAnalysis]:
+        """
+        Collect analyses from agents for a workflow.
         
-        if method == ConsensusMethod.SIMPLE_VOTING:
-            return self._simple_voting_consensus(analyses, conflicts, resolved_conflicts)
+        Registered agent providers are queried concurrently, each bounded by
+        ``workflow.agent_timeout_seconds`` and the whole round by
+        ``workflow.timeout_seconds``. Collection stops early once the minimum
+        number of agents has answered and the pending agents can no longer
+        change the winning result; their responses are kept as late responses.
+        """
+        agent_ids = [
+            agent_id for agent_id in workflow.required_agents + workflow.optional_agents
+            if agent_id in self._agent_providers
+        ]
         
-        elif method == ConsensusMethod.WEIGHTED_CONSENSUS:
-            return self._weighted_consensus(analyses, conflicts, resolved_conflicts)
+        if not agent_ids:
+            return self._mock_agent_analyses(workflow)
         
-        elif method == ConsensusMethod.BAYESIAN_CONSENSUS:
-            return self._bayesian_consensus(analyses, conflicts, resolved_conflicts)
+        tasks = {
+            asyncio.ensure_future(self._request_agent_analysis(agent_id, workflow)): agent_id
+            for agent_id in agent_ids
+        }
+        pending = set(tasks)
+        analyses: List[AgentAnalysis] = []
+        aggregator = self.create_aggregator(workflow.consensus_method, workflow.confidence_threshold)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + workflow.timeout_seconds
+        
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                analysis = task.result()
+                if analysis is not None:
+                    analyses.append(analysis)
+                    aggregator.add(analysis)
+            
+            if (pending and self.config.enable_early_completion and
+                    aggregator.is_decided(len(pending), workflow.minimum_agents)):
+                self._metrics['early_completions'] += 1
+                break
+        
+        # Agents still running after the decision are recorded when they answer
+        for task in pending:
+            task.add_done_callback(
+                lambda t, agent_id=tasks[task]: self._record_late_response(workflow.workflow_id, agent_id, t)
+            )
         
-        elif method == ConsensusMethod.THRESHOLD_CONSENSUS:
-            return self._threshold_consensus(analyses, confidence_threshold, conflicts, resolved_conflicts)
+        return analyses
+    
+    async def _request_agent_analysis(self, agent_id: str,
+                                      workflow: DecisionWorkflow) -> Optional[AgentAnalysis]:
+        """Request one agent's analysis, returning None on timeout or failure."""
+        provider = self._agent_providers[agent_id]
+        start = time.perf_counter()
         
-        else:
-            raise ValueError(f"Unknown consensus method: {method}")
+        try:
+            analysis = await asyncio.wait_for(provider(workflow), timeout=workflow.agent_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._metrics['agent_timeouts'] += 1
+            return None
+        except Exception:
+            self._metrics['agent_failures'] += 1
+            return None
+        
+        analysis.set_metadata('response_time_ms', (time.perf_counter() - start) * 1000)
+        return analysis
     
-    def _simple_voting_consensus(self, analyses: List[AgentAnalysis],
-                               conflicts: List[ConflictInfo],
-                               resolved_conflicts: int) -> ConsensusResult:
-        """Calculate consensus using simple majority voting."""
-        
-        # Count votes for each result
-        vote_counts = {}
-        for analysis in analyses:
-            result_key = str(analysis.result)
-            vote_counts[result_key] = vote_counts.get(result_key, 0) + 1
-        
-        # Find majority result
-        max_votes = max(vote_counts.values())
-        majority_results = [result for result, count in vote_counts.items() if count == max_votes]
-        
-        # Calculate agreement level
-        agreement_level = max_votes / len(analyses)
-        
-        # Use first majority result (could be improved with tie-breaking)
-        consensus_value = majority_results[0]
-        
-        # Calculate confidence based on agreement
-        confidence_score = agreement_level
-        
-        return ConsensusResult(
-            consensus_value=consensus_value,
-            confidence_score=confidence_score,
-            consensus_method=ConsensusMethod.SIMPLE_VOTING,
-            participating_agents=[a.agent_id for a in analyses],
-            total_agents=len(analyses),
-            agreement_level=agreement_level,
-            conflicts_detected=len(conflicts),
-            conflicts_resolved=resolved_conflicts,
-            result_quality=agreement_level,
-            uncertainty_level=1.0 - agreement_level
-        )
+    def _record_late_response(self, workflow_id: str, agent_id: str, task: "asyncio.Future") -> None:
+        """Record an analysis that arrived after its workflow was decided."""
+        if task.cancelled():
+            return
+        
+        analysis = task.result()
+        if analysis is None:
+            return
+        
+        outcome = self._workflow_outcomes.get(workflow_id)
+        self._late_responses.append({
+            'workflow_id': workflow_id,
+            'agent_id': agent_id,
+            'result': analysis.result,
+            'confidence': analysis.confidence,
+            'response_time_ms': analysis.get_metadata('response_time_ms'),
+            'agreed_with_consensus': outcome is not None and str(analysis.result) == str(outcome),
+            'recorded_at': datetime.utcnow().isoformat(),
+        })
+        self._metrics['late_responses'] += 1
     
-    def _weighted_consensus(self, analyses: List[AgentAnalysis],
-                          conflicts: List[ConflictInfo],
-                          resolved_conflicts: int) -> ConsensusResult:
-        """Calculate consensus using weighted voting based on confidence and quality."""
-        
-        # Calculate weights for each analysis
-        weighted_results = {}
-        total_weight = 0.0
-        
-        for analysis in analyses:
-            weight = analysis.get_weighted_confidence()
-            result_key = str(analysis.result)
-            
-            if result_key not in weighted_results:
-                weighted_results[result_key] = {'weight': 0.0, 'analyses': []}
-            
-            weighted_results[result_key]['weight'] += weight
-            weighted_results[result_key]['analyses'].append(analysis)
-            total_weight += weight
-        
-        # Find result with highest weight
-        best_result = None
-        best_weight = 0.0
-        
-        for result_key, data in weighted_results.items():
-            if data['weight'] > best_weight:
-                best_weight = data['weight']
-                best_result = result_key
-        
-        # Calculate metrics
-        agreement_level = best_weight / total_weight if total_weight > 0 else 0.0
-        confidence_score = agreement_level
-        
-        return ConsensusResult(
-            consensus_value=best_result,
-            confidence_score=confidence_score,
-            consensus_method=ConsensusMethod.WEIGHTED_CONSENSUS,
-            participating_agents=[a.agent_id for a in analyses],
-            total_agents=len(analyses),
-            agreement_level=agreement_level,
-            conflicts_detected=len(conflicts),
-            conflicts_resolved=resolved_conflicts,
-            result_quality=agreement_level,
-            uncertainty_level=1.0 - agreement_level
-        )
+    def _record_workflow_outcome(self, workflow_id: str, consensus_value: Any) -> None:
+        """Remember recent decisions so late responses can be scored against them."""
+        self._workflow_outcomes[workflow_id] = consensus_value
+        
+        # Limit outcome history to prevent memory growth
+        if len(self._workflow_outcomes) > self.config.late_response_history_size:
+            oldest = next(iter(self._workflow_outcomes))
+            del self._workflow_outcomes[oldest]
     
-    def _bayesian_consensus(self, analyses: List[AgentAnalysis],
-                          conflicts: List[ConflictInfo],
-                          resolved_conflicts: int) -> ConsensusResult:
-        """Calculate consensus using Bayesian approach (simplified implementation)."""
-        
-        # Simplified Bayesian consensus - in practice this would be more sophisticated
-        # For now, use weighted approach with uncertainty quantification
-        
-        result = self._weighted_consensus(analyses, conflicts, resolved_conflicts)
-        result.consensus_method = ConsensusMethod.BAYESIAN_CONSENSUS
-        
-        # Adjust uncertainty based on evidence diversity
-        evidence_counts = [len(a.evidence) for a in analyses]
-        avg_evidence = sum(evidence_counts) / len(evidence_counts) if evidence_counts else 0
-        evidence_factor = min(1.0, avg_evidence / 3.0)  # Assume 3 pieces of evidence is good
-        
-        result.uncertainty_level = result.uncertainty_level * (1.0 - evidence_factor * 0.3)
-        result.confidence_score = 1.0 - result.uncertainty_level
-        
-        return result
+    def _record_decision_latency(self, method: Any, latency_ms: float) -> None:
+        """Record end-to-end decision latency for a consensus method."""
+        method_key = method.value if isinstance(method, ConsensusMethod) else str(method)
+        samples = self._decision_latencies.setdefault(
+            method_key, deque(maxlen=self.config.latency_window_size)
+        )
+        samples.append(latency_ms)
     
-    def _threshold_consensus(self, analyses: List[AgentAnalysis],
-                           confidence_threshold: float,
-                           conflicts: List[ConflictInfo],
-                           resolved_conflicts: int) -> ConsensusResult:
-        """Calculate consensus requiring minimum confidence threshold."""
-        
-        # Filter analyses that meet confidence threshold
-        qualified_analyses = [a for a in analyses if a.get_weighted_confidence() >= confidence_threshold]
-        
-        if not qualified_analyses:
-            # No analyses meet threshold
-            return ConsensusResult(
-                consensus_value=None,
-                confidence_score=0.0,
-                consensus_method=ConsensusMethod.THRESHOLD_CONSENSUS,
-                participating_agents=[],
-                total_agents=len(analyses),
-                agreement_level=0.0,
-                conflicts_detected=len(conflicts),
-                conflicts_resolved=resolved_conflicts,
-                result_quality=0.0,
-                uncertainty_level=1.0,
-                unresolved_conflicts=[f"No analyses meet confidence threshold {confidence_threshold}"]
-            )
-        
-        # Apply weighted consensus to qualified analyses
-        result = self._weighted_consensus(qualified_analyses, conflicts, resolved_conflicts)
-        result.consensus_method = ConsensusMethod.THRESHOLD_CONSENSUS
-        result.total_agents = len(analyses)  # Keep original total
-        
-        return result
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of an already sorted list."""
+        if not ordered:
+            return 0.0
+        rank = math.ceil(fraction * len(ordered))
+        return ordered[min(len(ordered), max(1, rank)) - 1]
     
-    async def _collect_agent_analyses(self, workflow: DecisionWorkflow) -> List[AgentAnalysis]:
-        """Collect analyses from agents for a workflow (mock implementation)."""
-        
-        # In a real implementation, this would:
-        # 1. Send requests to required and optional agents
-        # 2. Wait for responses with timeout handling
-        # 3. Handle partial failures gracefully
-        # 4. Return collected analyses
-        
-        # For now, return mock analyses
+    def _mock_agent_analyses(self, workflow: DecisionWorkflow) -> List[AgentAnalysis]:
+        """Build mock analyses when no agent providers are registered."""
         analyses = []
         
         for agent_id in workflow.required_agents[:3]:  # Limit for demo
@@ -0,0 +1,208 @@
+"""Bounded LRU/TTL cache for consensus results with stable content hashing."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.data_models import AgentAnalysis, ConsensusMethod, ConsensusResult
+
+
+def _canonical_default(value: Any) -> Any:
+    """Convert non-JSON values into a deterministic JSON-friendly form."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(canonical_json(v) for v in value)
+    if isinstance(value, bytes):
+        return value.hex()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    return repr(value)
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value to canonical JSON (sorted keys, no whitespace)."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=_canonical_default)
+
+
+def analysis_digest(analyses: List[AgentAnalysis], method: ConsensusMethod,
+                    confidence_threshold: Optional[float] = None) -> str:
+    """
+    Compute a deterministic digest for a consensus request.
+
+    The digest covers every input the consensus algorithms read (result,
+    confidence, quality scores and evidence count per agent, plus method and
+    threshold) and is independent of analysis order and of the process, so
+    it can be shared across workers.
+
+    Args:
+        analyses: Agent analyses participating in the consensus
+        method: Consensus method being applied
+        confidence_threshold: Threshold used by threshold consensus
+
+    Returns:
+        str: Hex blake2b digest prefixed with the method name
+    """
+    entries = sorted(
+        canonical_json({
+            'agent_id': analysis.agent_id,
+            'result': analysis.result,
+            'confidence': analysis.confidence,
+            'completeness': analysis.completeness_score,
+            'consistency': analysis.consistency_score,
+            'reliability': analysis.reliability_score,
+            'evidence_count': len(analysis.evidence),
+        })
+        for analysis in analyses
+    )
+    payload = canonical_json({'threshold': confidence_threshold, 'analyses': entries})
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    method_value = method.value if isinstance(method, Enum) else str(method)
+    return f"{method_value}:{digest}"
+
+
+class ConsensusResultCache:
+    """
+    Bounded LRU cache with per-entry TTL for consensus results.
+
+    Entries are evicted least-recently-used once ``max_entries`` is reached
+    and expire ``ttl_seconds`` after insertion. An optional shared backend
+    (any asyncio Redis-compatible client exposing ``get`` and ``set(..., ex=)``)
+    lets multiple consensus workers reuse each other's results.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 3600,
+                 shared_backend: Optional[Any] = None,
+                 key_prefix: str = "beast_mode:consensus:"):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of locally cached results
+            ttl_seconds: Time-to-live for cached results
+            shared_backend: Optional async Redis-compatible client
+            key_prefix: Namespace prefix for keys in the shared backend
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.shared_backend = shared_backend
+        self.key_prefix = key_prefix
+
+        self._entries: "OrderedDict[str, Tuple[float, ConsensusResult]]" = OrderedDict()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'shared_hits': 0,
+            'shared_errors': 0,
+        }
+
+    async def get(self, key: str) -> Optional[ConsensusResult]:
+        """Return a cached result, consulting the shared backend on local miss."""
+        result = self._get_local(key)
+        if result is not None:
+            self._stats['hits'] += 1
+            return result
+
+        if self.shared_backend is not None:
+            result = await self._get_shared(key)
+            if result is not None:
+                self._stats['hits'] += 1
+                self._stats['shared_hits'] += 1
+                self._put_local(key, result)
+                return result
+
+        self._stats['misses'] += 1
+        return None
+
+    async def put(self, key: str, result: ConsensusResult) -> None:
+        """Store a result locally and in the shared backend if configured."""
+        self._put_local(key, result)
+
+        if self.shared_backend is not None:
+            try:
+                await self.shared_backend.set(
+                    self.key_prefix + key, result.model_dump_json(), ex=self.ttl_seconds
+                )
+            except Exception:
+                self._stats['shared_errors'] += 1
+
+    def clear(self) -> None:
+        """Drop all locally cached results."""
+        self._entries.clear()
+
+    def purge_expired(self) -> int:
+        """Remove expired entries and return how many were dropped."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._stats['expirations'] += len(expired)
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'shared_backend': self.shared_backend is not None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_local(key, touch=False) is not None
+
+    def _get_local(self, key: str, touch: bool = True) -> Optional[ConsensusResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._stats['expirations'] += 1
+            return None
+
+        if touch:
+            self._entries.move_to_end(key)
+        return result
+
+    def _put_local(self, key: str, result: ConsensusResult) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    async def _get_shared(self, key: str) -> Optional[ConsensusResult]:
+        try:
+            payload = await self.shared_backend.get(self.key_prefix + key)
+        except Exception:
+            self._stats['shared_errors'] += 1
+            return None
+
+        if payload is None:
+            return None
+
+        try:
+            return ConsensusResult.model_validate_json(payload)
+        except Exception:
+            self._stats['shared_errors'] += 1
+            return None
@@ -13,9 +13,9 @@ from enum import Enum
 from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import uuid
-import re
 
 from ..core.reflective_module import ReflectiveModule, ModuleStatus, HealthIndicator
+from .symptom_matcher import SymptomMatcher, compile_symptom_regex
 
 
 class RCASeverity(Enum):
@@ -104,7 +104,7 @@ class RCAPattern:
         
         # Check exclusion patterns first
         for exclusion in self.exclusion_patterns:
-            if re.search(exclusion.lower(), symptom_text):
+            if compile_symptom_regex(exclusion).search(symptom_text):
                 return False, 0.0
         
         # Check positive patterns
@@ -112,7 +112,7 @@ class RCAPattern:
         total_patterns = len(self.symptom_patterns)
         
         for pattern in self.symptom_patterns:
-            if re.search(pattern.lower(), symptom_text):
+            if compile_symptom_regex(pattern).search(symptom_text):
                 matches += 1
         
         if matches == 0:
@@ -362,6 +362,7 @@ class RCAEngine(ReflectiveModule):
         self._analysis_history: List[RCAResult] = []
         self._category_index: Dict[RCACategory, Set[str]] = {}
         self._tag_index: Dict[str, Set[str]] = {}
+        self._symptom_matcher = SymptomMatcher()
         self._performance_metrics = {
             'total_analyses': 0,
             'successful_analyses': 0,
@@ -599,6 +600,7 @@ class RCAEngine(ReflectiveModule):
         """
         self._pattern_library[pattern.pattern_id] = pattern
         self._update_indices(pattern)
+        self._symptom_matcher.add_pattern(pattern)
     
     def update_pattern(self, pattern_id: str, updates: Dict[str, Any]) -> bool:
         """
@@ -623,6 +625,7 @@ class RCAEngine(ReflectiveModule):
         
         # Rebuild indices
         self._build_indices()
+        self._symptom_matcher.add_pattern(pattern)
         
         return True
     
@@ -722,33 +725,15 @@ class RCAEngine(ReflectiveModule):
             'used_patterns': len(used_patterns),
             'total_usage_count': total_usage,
             'average_success_rate': sum(p.success_rate for p in used_patterns) / len(used_patterns) if used_patterns else 0.0,
-            'performance_metrics': self._performance_metrics.copy()
+            'performance_metrics': self._performance_metrics.copy(),
+            'matching_performance': self._symptom_matcher.get_statistics()
         }
     
     def _find_matching_patterns(self, symptoms: List[str], 
                               context: Dict[str, Any]) -> List[Tuple[RCAPattern, float]]:
         """Find patterns that match the given symptoms and context."""
-        matches = []
-        
-        for pattern in self._pattern_library.values():
-            # Check symptom match
-            symptom_match, symptom_confidence = pattern.matches_symptoms(symptoms)
-            if not symptom_match:
-                continue
-            
-            # Check context match
-            context_match, context_confidence = pattern.matches_context(context)
-            if not context_match:
-                continue
-            
-            # Calculate combined confidence
-            combined_confidence = (symptom_confidence + context_confidence) / 2
-            matches.append((pattern, combined_confidence))
-        
-        # Sort by confidence (highest first)
-        matches.sort(key=lambda x: x[1], reverse=True)
-        
-        return matches
+        # Literal prefilter + precompiled regexes; only candidates are evaluated
+        return self._symptom_matcher.match(self._pattern_library, symptoms, context)
     
     def _execute_systematic_fix(self, fix_description: str, 
                               context: Dict[str, Any]) -> Dict[str, Any]:
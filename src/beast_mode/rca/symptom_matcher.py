@@ -0,0 +1,331 @@
+"""
+Compiled symptom matcher for the Beast Mode RCA engine.
+
+This module precompiles RCA pattern regexes and prefilters candidate
+patterns with an Aho-Corasick automaton over the literal substrings each
+regex requires, so only patterns that can possibly match are evaluated.
+"""
+
+import math
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_constants
+    import sre_parse
+
+
+@lru_cache(maxsize=4096)
+def compile_symptom_regex(pattern: str) -> "re.Pattern":
+    """Compile a symptom or exclusion regex in the form the RCA engine matches it."""
+    return re.compile(pattern.lower())
+
+
+def required_literal(pattern: str) -> Optional[str]:
+    """
+    Extract the longest literal substring any match of ``pattern`` must contain.
+
+    Only top-level runs of literal characters are considered, which keeps the
+    extraction conservative: alternations, groups, classes and repeats end a
+    run. Returns None when no mandatory literal can be proven.
+    """
+    try:
+        parsed = sre_parse.parse(pattern.lower())
+    except (re.error, TypeError):
+        return None
+
+    flags = getattr(getattr(parsed, 'state', None), 'flags', 0)
+    if flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+
+    best = ""
+    run: List[str] = []
+    for op, value in parsed:
+        if op is sre_constants.LITERAL:
+            run.append(chr(value))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+
+    return best or None
+
+
+class LiteralAutomaton:
+    """Aho-Corasick automaton reporting which literals occur in a text."""
+
+    def __init__(self, literals: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[int]] = [set()]
+        self.literals = literals
+
+        for index, literal in enumerate(literals):
+            self._insert(literal, index)
+        self._build_failure_links()
+
+    def _insert(self, literal: str, index: int) -> None:
+        state = 0
+        for char in literal:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(index)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[int]:
+        """Return indices of every literal occurring in ``text``."""
+        found: Set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+
+        return found
+
+
+@dataclass
+class CompiledPattern:
+    """Precompiled matching data for a single RCA pattern."""
+    pattern_id: str
+    symptom_regexes: List["re.Pattern"]
+    exclusion_regexes: List["re.Pattern"]
+    context_indicators: List[str]
+    literals: List[Optional[str]] = field(default_factory=list)
+    required_hits: int = 1
+    unindexed_count: int = 0
+
+
+class SymptomMatcher:
+    """
+    Indexed symptom matcher for RCA pattern libraries.
+
+    Compiled regexes are cached per pattern and invalidated when a pattern's
+    matching criteria change. A pattern becomes a candidate only when enough
+    of its regexes' required literals occur in the symptom text to reach the
+    50% match ratio RCAPattern.matches_symptoms demands; exclusions and full
+    regex evaluation run for candidates only.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[str, CompiledPattern] = {}
+        self._automaton: Optional[LiteralAutomaton] = None
+        self._literal_owners: List[List[str]] = []
+        self._always_candidates: Set[str] = set()
+        self._order: Dict[str, int] = {}
+        self._dirty = True
+        self._stats = {
+            'match_calls': 0,
+            'total_match_time_ms': 0.0,
+            'last_match_time_ms': 0.0,
+            'max_match_time_ms': 0.0,
+            'candidates_evaluated': 0,
+            'patterns_considered': 0,
+            'index_builds': 0,
+        }
+
+    def add_pattern(self, pattern: Any) -> None:
+        """Compile and register a pattern (replacing any previous version)."""
+        self._compiled[pattern.pattern_id] = self._compile(pattern)
+        self._dirty = True
+
+    def remove_pattern(self, pattern_id: str) -> None:
+        if self._compiled.pop(pattern_id, None) is not None:
+            self._dirty = True
+
+    def rebuild(self, patterns: Dict[str, Any]) -> None:
+        """Recompile every pattern in a library."""
+        self._compiled = {pid: self._compile(p) for pid, p in patterns.items()}
+        self._dirty = True
+
+    def match(self, patterns: Dict[str, Any], symptoms: List[str],
+              context: Dict[str, Any]) -> List[Tuple[Any, float]]:
+        """
+        Find patterns matching the symptoms and context.
+
+        Args:
+            patterns: Pattern library keyed by pattern ID
+            symptoms: Observed symptoms
+            context: Context information
+
+        Returns:
+            List of (pattern, combined_confidence) sorted by confidence
+        """
+        start = time.perf_counter()
+        matches: List[Tuple[Any, float]] = []
+
+        self._sync(patterns)
+
+        if symptoms:
+            symptom_text = " ".join(symptoms).lower()
+            context_text = str(context).lower()
+            candidates = self._candidates(symptom_text)
+
+            for pattern_id in candidates:
+                compiled = self._compiled[pattern_id]
+                pattern = patterns[pattern_id]
+
+                symptom_match, symptom_confidence = self._match_symptoms(compiled, pattern, symptom_text)
+                if not symptom_match:
+                    continue
+
+                context_match, context_confidence = self._match_context(compiled, context_text)
+                if not context_match:
+                    continue
+
+                matches.append((pattern, (symptom_confidence + context_confidence) / 2))
+
+            self._stats['candidates_evaluated'] += len(candidates)
+            self._stats['patterns_considered'] += len(self._compiled)
+
+        # Sort by confidence (highest first)
+        matches.sort(key=lambda x: x[1], reverse=True)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats['match_calls'] += 1
+        self._stats['total_match_time_ms'] += elapsed_ms
+        self._stats['last_match_time_ms'] = elapsed_ms
+        self._stats['max_match_time_ms'] = max(self._stats['max_match_time_ms'], elapsed_ms)
+
+        return matches
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get matching performance statistics."""
+        calls = self._stats['match_calls']
+        considered = self._stats['patterns_considered']
+        return {
+            **self._stats,
+            'average_match_time_ms': self._stats['total_match_time_ms'] / calls if calls else 0.0,
+            'candidate_ratio': self._stats['candidates_evaluated'] / considered if considered else 0.0,
+            'compiled_patterns': len(self._compiled),
+            'indexed_literals': len(self._literal_owners),
+            'unindexed_patterns': len(self._always_candidates),
+        }
+
+    def _compile(self, pattern: Any) -> CompiledPattern:
+        symptom_regexes = [compile_symptom_regex(p) for p in pattern.symptom_patterns]
+        literals = [required_literal(p) for p in pattern.symptom_patterns]
+        total = len(pattern.symptom_patterns)
+
+        return CompiledPattern(
+            pattern_id=pattern.pattern_id,
+            symptom_regexes=symptom_regexes,
+            exclusion_regexes=[compile_symptom_regex(p) for p in pattern.exclusion_patterns],
+            context_indicators=[indicator.lower() for indicator in pattern.context_indicators],
+            literals=literals,
+            required_hits=max(1, math.ceil(total * 0.5)),
+            unindexed_count=sum(1 for literal in literals if literal is None)
+        )
+
+    def _sync(self, patterns: Dict[str, Any]) -> None:
+        """Pick up library changes made outside add_pattern and rebuild the index."""
+        if len(patterns) != len(self._compiled) or patterns.keys() != self._compiled.keys():
+            for pattern_id in set(self._compiled) - set(patterns):
+                self.remove_pattern(pattern_id)
+            for pattern_id, pattern in patterns.items():
+                if pattern_id not in self._compiled:
+                    self.add_pattern(pattern)
+
+        if self._dirty:
+            self._build_index()
+
+    def _build_index(self) -> None:
+        literal_index: Dict[str, int] = {}
+        owners: List[List[str]] = []
+        always: Set[str] = set()
+
+        for pattern_id, compiled in self._compiled.items():
+            if not compiled.symptom_regexes:
+                continue
+            if compiled.unindexed_count >= compiled.required_hits:
+                always.add(pattern_id)
+                continue
+            for literal in compiled.literals:
+                if literal is None:
+                    continue
+                index = literal_index.get(literal)
+                if index is None:
+                    index = len(owners)
+                    literal_index[literal] = index
+                    owners.append([])
+                owners[index].append(pattern_id)
+
+        self._order = {pattern_id: position for position, pattern_id in enumerate(self._compiled)}
+        self._automaton = LiteralAutomaton(list(literal_index))
+        self._literal_owners = owners
+        self._always_candidates = always
+        self._dirty = False
+        self._stats['index_builds'] += 1
+
+    def _candidates(self, symptom_text: str) -> List[str]:
+        hits: Dict[str, int] = {}
+        for literal_id in self._automaton.find(symptom_text):
+            for pattern_id in self._literal_owners[literal_id]:
+                hits[pattern_id] = hits.get(pattern_id, 0) + 1
+
+        candidates = list(self._always_candidates)
+        for pattern_id, count in hits.items():
+            compiled = self._compiled[pattern_id]
+            if count + compiled.unindexed_count >= compiled.required_hits:
+                candidates.append(pattern_id)
+
+        # Evaluate in library order so equal-confidence ties sort as before
+        candidates.sort(key=self._order.__getitem__)
+        return candidates
+
+    @staticmethod
+    def _match_symptoms(compiled: CompiledPattern, pattern: Any, symptom_text: str) -> Tuple[bool, float]:
+        # Check exclusion patterns first
+        for exclusion in compiled.exclusion_regexes:
+            if exclusion.search(symptom_text):
+                return False, 0.0
+
+        matches = sum(1 for regex in compiled.symptom_regexes if regex.search(symptom_text))
+        if matches == 0:
+            return False, 0.0
+
+        match_ratio = matches / len(compiled.symptom_regexes)
+        return match_ratio >= 0.5, match_ratio * pattern.confidence_score
+
+    @staticmethod
+    def _match_context(compiled: CompiledPattern, context_text: str) -> Tuple[bool, float]:
+        if not compiled.context_indicators:
+            return True, 1.0  # No context requirements
+
+        matches = sum(1 for indicator in compiled.context_indicators if indicator in context_text)
+        if matches == 0:
+            return False, 0.0
+
+        match_ratio = matches / len(compiled.context_indicators)
+        return match_ratio >= 0.3, match_ratio  # Lower threshold for context
@@ -5,11 +5,13 @@ Automatically issues independent tasks to agents when dependencies are met
 """
 
 import asyncio
+import heapq
 import json
 import subprocess
 import uuid
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Callable, Any
 from dataclasses import dataclass, field
@@ -17,11 +19,15 @@ from enum import Enum
 from datetime import datetime
 import logging
 
+# Runs one task on an agent and reports success; called on a worker thread
+TaskRunner = Callable[["Task", "Agent"], bool]
+
 # Add src to Python path for ReflectiveModule import
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from beast_mode.core.reflective_module import ReflectiveModule, HealthStatus, HealthIndicator
+from task_dag_analysis import compute_tiers
 
 class TaskStatus(Enum):
     NOT_STARTED = "not_started"
@@ -83,6 +89,11 @@ class TaskExecutionEngine(ReflectiveModule):
         self.auto_merge = True
         self.auto_revert_on_failure = True
         
+        # Work performed for each dispatched task (runs on a worker thread). The
+        # built-in tasks carry no executable payload, so there is no default
+        self.task_runner: Optional[TaskRunner] = None
+        self.last_run_stats: Dict[str, Any] = {}
+        
         # RM compliance - health indicators
         self._update_health_indicator(
             "engine_status",
@@ -331,7 +342,10 @@ class TaskExecutionEngine(ReflectiveModule):
             return False
     
     def _commit_changes(self, message: str) -> bool:
-        """Commit current changes"""
+        """Commit current changes to the session branch; nothing is committed outside a session"""
+        if not self.git_session or not self.git_session.is_active:
+            return False
+        
         try:
             # Check if there are changes to commit
             success, output = self._run_git_command(['status', '--porcelain'])
@@ -576,13 +590,23 @@ class TaskExecutionEngine(ReflectiveModule):
         
         return True
     
-    def recursive_task_execution(self) -> Dict:
+    def recursive_task_execution(self, max_agents: Optional[int] = None,
+                                 task_runner: Optional[TaskRunner] = None) -> Dict:
         """
         Recursive descent task execution with dependency resolution
+        Runs the task DAG to completion inside a Git session branch
         Returns execution summary
         """
         execution_start = datetime.now()
-        iteration = 0
+        run_stats: Dict[str, Any] = {}
+        
+        if not (task_runner or self.task_runner):
+            return {
+                "error": "No task runner configured; the built-in tasks carry no executable payload",
+                "execution_start": execution_start.isoformat(),
+                "execution_end": datetime.now().isoformat(),
+                "success": False
+            }
         
         # Initialize Git session
         if not self._create_session_branch():
@@ -596,53 +620,7 @@ class TaskExecutionEngine(ReflectiveModule):
         self.logger.info(f"Starting recursive task execution in branch: {self.git_session.branch_name}")
         
         try:
-            while True:
-                iteration += 1
-                self.logger.info(f"Execution iteration {iteration}")
-                
-                # Get tasks ready for execution
-                ready_tasks = self.get_ready_tasks()
-                available_agents = self.get_available_agents()
-                
-                if not ready_tasks:
-                    # Check if we're done or blocked
-                    remaining_tasks = [t for t in self.tasks.values() 
-                                     if t.status in [TaskStatus.NOT_STARTED, TaskStatus.IN_PROGRESS]]
-                    
-                    if not remaining_tasks:
-                        self.logger.info("All tasks completed!")
-                        break
-                    elif not any(t.status == TaskStatus.IN_PROGRESS for t in remaining_tasks):
-                        self.logger.warning("No ready tasks and no tasks in progress - possible deadlock")
-                        break
-                    else:
-                        self.logger.info("Waiting for in-progress tasks to complete...")
-                        # In a real implementation, this would wait for task completion events
-                        break
-                
-                if not available_agents:
-                    self.logger.info("No available agents - waiting for task completions")
-                    break
-                
-                # Assign tasks to agents
-                assignments_made = 0
-                for task in ready_tasks:
-                    if not available_agents:
-                        break
-                    
-                    # Find best agent for this task (simple capability matching)
-                    best_agent = self._find_best_agent(task, available_agents)
-                    
-                    if best_agent and self.assign_task_to_agent(task, best_agent):
-                        available_agents.remove(best_agent)
-                        assignments_made += 1
-                
-                if assignments_made == 0:
-                    self.logger.info("No task assignments made this iteration")
-                    break
-                
-                self.logger.info(f"Made {assignments_made} task assignments in iteration {iteration}")
-        
+            run_stats = self.run_task_dag(max_agents=max_agents, task_runner=task_runner)
         except Exception as e:
             self.logger.error(f"Error during task execution: {e}")
             execution_end = datetime.now()
@@ -685,12 +663,16 @@ class TaskExecutionEngine(ReflectiveModule):
             "execution_start": execution_start.isoformat(),
             "execution_end": execution_end.isoformat(),
             "total_duration_seconds": total_duration,
-            "iterations": iteration,
+            "iterations": run_stats["dispatch_rounds"],
+            "max_agents": run_stats["max_agents"],
+            "peak_concurrency": run_stats["peak_concurrency"],
+            "agent_utilization": run_stats["agent_utilization"],
             "total_tasks": len(self.tasks),
             "completed_tasks": len(self.completed_tasks),
             "failed_tasks": len(self.failed_tasks),
             "in_progress_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS]),
             "not_started_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.NOT_STARTED]),
+            "blocked_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.BLOCKED]),
             "completion_rate": success_rate,
             "execution_successful": execution_successful,
             "git_session": {
@@ -704,6 +686,164 @@ class TaskExecutionEngine(ReflectiveModule):
         
         return summary
     
+    def run_task_dag(self, max_agents: Optional[int] = None,
+                     task_runner: Optional[TaskRunner] = None) -> Dict[str, Any]:
+        """
+        Event-driven execution of every runnable task in the DAG
+        Tasks run concurrently on a pool of max_agents workers. Each completion
+        decrements its successors' dependency counters and releases the ones
+        that reach zero, and the freed agent is refilled straight away, so the
+        pool stays saturated until the DAG drains. Successors of a failed task
+        are marked BLOCKED. Task state and Git commits are only touched from
+        the calling thread.
+        Raises ValueError when no task runner is given or configured
+        Returns run statistics
+        """
+        runner = task_runner or self.task_runner
+        if runner is None:
+            raise ValueError("No task runner configured; pass task_runner or set engine.task_runner")
+        if max_agents:
+            self.resize_agent_pool(max_agents)
+        
+        # Dependency counters and successor lists, built once per run
+        order = {task_id: index for index, task_id in enumerate(self.tasks)}
+        successors: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+        pending_deps: Dict[str, int] = {}
+        for task in self.tasks.values():
+            for dep_id in task.dependencies:
+                if dep_id in successors:
+                    successors[dep_id].append(task.id)
+            pending_deps[task.id] = sum(1 for dep_id in task.dependencies if dep_id not in self.completed_tasks)
+        
+        ready: List[tuple] = []
+        
+        def release(task: Task):
+            heapq.heappush(ready, (task.priority, -task.estimated_duration_hours, order[task.id], task.id))
+        
+        for task in self.tasks.values():
+            if task.status == TaskStatus.NOT_STARTED and pending_deps[task.id] == 0:
+                release(task)
+        for task_id in list(self.failed_tasks):
+            self._block_successors(task_id, successors)
+        
+        free_agents = self.get_available_agents()
+        pool_size = max(len(free_agents), 1)
+        running: Dict[Future, tuple] = {}
+        dispatch_rounds = 0
+        peak_concurrency = 0
+        busy_seconds = 0.0
+        run_start = time.monotonic()
+        
+        self.logger.info(f"Running task DAG with {len(free_agents)} agents ({len(ready)} tasks ready)")
+        
+        with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="task-agent") as pool:
+            while True:
+                # Fill every free agent with the highest-priority ready task
+                dispatched = 0
+                while ready and free_agents:
+                    task = self.tasks[heapq.heappop(ready)[-1]]
+                    agent = self._find_best_agent(task, free_agents)
+                    self.assign_task_to_agent(task, agent)
+                    free_agents.remove(agent)
+                    running[pool.submit(runner, task, agent)] = (task.id, agent, time.monotonic())
+                    dispatched += 1
+                
+                if dispatched:
+                    dispatch_rounds += 1
+                    peak_concurrency = max(peak_concurrency, len(running))
+                    self.logger.debug(f"Dispatched {dispatched} tasks ({len(running)} running, {len(ready)} ready)")
+                
+                if not running:
+                    break
+                
+                # Block until at least one task finishes, then settle every finished one
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_id, agent, started = running.pop(future)
+                    busy_seconds += time.monotonic() - started
+                    success = self._task_outcome(task_id, future)
+                    
+                    self.complete_task(task_id, success)
+                    free_agents.append(agent)
+                    
+                    if not success:
+                        self._block_successors(task_id, successors)
+                        continue
+                    
+                    for successor_id in successors[task_id]:
+                        pending_deps[successor_id] -= 1
+                        if pending_deps[successor_id] == 0 and self.tasks[successor_id].status == TaskStatus.NOT_STARTED:
+                            release(self.tasks[successor_id])
+        
+        wall_seconds = time.monotonic() - run_start
+        unscheduled = [t.id for t in self.tasks.values() if t.status == TaskStatus.NOT_STARTED]
+        if unscheduled:
+            self.logger.warning(f"Tasks with unmet dependencies were never scheduled: {', '.join(unscheduled)}")
+        
+        self.last_run_stats = {
+            "max_agents": pool_size,
+            "dispatch_rounds": dispatch_rounds,
+            "peak_concurrency": peak_concurrency,
+            "agent_utilization": busy_seconds / (pool_size * wall_seconds) if wall_seconds > 0 else 0.0,
+            "wall_seconds": wall_seconds,
+            "unscheduled_tasks": unscheduled
+        }
+        return self.last_run_stats
+    
+    def resize_agent_pool(self, size: int) -> int:
+        """
+        Size the agent pool to exactly `size` agents
+        Extra agents are dropped from the end; missing ones are added as general-purpose agents
+        Returns the new pool size
+        """
+        size = max(size, 1)
+        agent_ids = list(self.agents.keys())
+        
+        if size < len(agent_ids):
+            self.agents = {aid: self.agents[aid] for aid in agent_ids[:size]}
+        else:
+            number = len(agent_ids)
+            while len(self.agents) < size:
+                number += 1
+                agent_id = f"agent_{number}"
+                if agent_id not in self.agents:
+                    self.agents[agent_id] = Agent(agent_id, f"General Agent {number}", True, None, [], 1)
+        
+        self._update_health_indicator(
+            "agent_pool",
+            HealthStatus.HEALTHY,
+            len(self.agents),
+            f"Agent pool sized to {len(self.agents)} agents"
+        )
+        return len(self.agents)
+    
+    def _task_outcome(self, task_id: str, future: Future) -> bool:
+        """Success of a finished task; a runner exception counts as a failure"""
+        try:
+            return bool(future.result())
+        except Exception as e:
+            self.logger.error(f"Task {task_id} raised an error: {e}")
+            return False
+    
+    def _block_successors(self, task_id: str, successors: Dict[str, List[str]]):
+        """Mark every not-started task downstream of a failed task as blocked"""
+        stack = list(successors.get(task_id, []))
+        while stack:
+            successor = self.tasks[stack.pop()]
+            if successor.status != TaskStatus.NOT_STARTED:
+                continue
+            
+            successor.status = TaskStatus.BLOCKED
+            self.execution_log.append({
+                "timestamp": datetime.now().isoformat(),
+                "action": "task_blocked",
+                "task_id": successor.id,
+                "task_name": successor.name,
+                "blocked_by": task_id
+            })
+            self.logger.warning(f"Task {successor.id} ({successor.name}) blocked by failed task {task_id}")
+            stack.extend(successors[successor.id])
+    
     def _find_best_agent(self, task: Task, available_agents: List[Agent]) -> Optional[Agent]:
         """Find the best agent for a task based on capabilities"""
         if not available_agents:
@@ -767,31 +907,12 @@ class TaskExecutionEngine(ReflectiveModule):
     
     def _calculate_task_tiers(self) -> Dict[int, List[str]]:
         """Calculate task tiers based on dependency depth"""
-        tiers = {}
-        visited = set()
-        
-        def get_tier(task_id: str) -> int:
-            if task_id in visited:
-                return 0  # Avoid cycles
-            
-            visited.add(task_id)
-            task = self.tasks[task_id]
-            
-            if not task.dependencies:
-                return 0
-            
-            max_dep_tier = max(get_tier(dep_id) for dep_id in task.dependencies)
-            return max_dep_tier + 1
+        analysis = compute_tiers({task_id: task.dependencies for task_id, task in self.tasks.items()})
         
-        for task_id in self.tasks:
-            visited.clear()
-            tier = get_tier(task_id)
-            
-            if tier not in tiers:
-                tiers[tier] = []
-            tiers[tier].append(task_id)
+        for cycle in analysis.cycles:
+            self.logger.warning(f"Dependency cycle: {' -> '.join(cycle + cycle[:1])}")
         
-        return tiers
+        return analysis.by_tier()
     
     # RM Interface Implementation (Required for Beast Mode Framework compliance)
     
@@ -910,6 +1031,7 @@ def main():
     parser.add_argument('--analyze-only', action='store_true', help='Only analyze dependencies, don\'t execute')
     parser.add_argument('--execute', action='store_true', help='Execute tasks with dependency resolution')
     parser.add_argument('--output-json', help='Output execution results to JSON file')
+    parser.add_argument('--max-agents', type=int, help='Number of agents running tasks concurrently')
     parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     
     args = parser.parse_args()
@@ -953,12 +1075,16 @@ def main():
         print("=" * 50)
         
         # Execute tasks with dependency resolution
-        summary = engine.recursive_task_execution()
+        summary = engine.recursive_task_execution(max_agents=args.max_agents)
+        if "error" in summary:
+            print(f"\n❌ {summary['error']}")
+            sys.exit(1)
         
         print(f"\n📈 EXECUTION RESULTS")
         print("-" * 30)
         print(f"Total Duration: {summary['total_duration_seconds']:.2f} seconds")
         print(f"Iterations: {summary['iterations']}")
+        print(f"Peak Concurrency: {summary['peak_concurrency']}/{summary['max_agents']} agents")
         print(f"Completion Rate: {summary['completion_rate']:.1f}%")
         print(f"Tasks Assigned: {len([log for log in summary['execution_log'] if log['action'] == 'task_assigned'])}")
         
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Task DAG Analysis
+Shared dependency analysis for task DAGs: memoized topological tiers with
+cycle reporting, a prefix-tree index over hierarchical task ids, and a cache
+of parsed tasks.md files keyed by their content hash
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+# Bump when the parsed/analyzed format changes so stale cache entries are ignored
+ANALYSIS_VERSION = 1
+
+TASK_LINE = re.compile(r'^-\s*\[\s*[x\s]\s*\]\s*(\d+(?:\.\d+)*)\s+(.+)$')
+REQUIREMENTS_LINE = re.compile(r'^_Requirements:\s*(.+)_$')
+
+
+class TaskIdIndex:
+    """Prefix tree over dotted task ids (1, 1.1, 1.1.2, ...)"""
+
+    def __init__(self, task_ids: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {"children": {}, "task_id": None}
+        for task_id in task_ids:
+            self.add(task_id)
+
+    def add(self, task_id: str):
+        """Index a task id"""
+        node = self._root
+        for segment in task_id.split('.'):
+            node = node["children"].setdefault(segment, {"children": {}, "task_id": None})
+        node["task_id"] = task_id
+
+    def children(self, task_id: str) -> List[str]:
+        """Nearest indexed subtasks of a task (skipping levels with no task of their own)"""
+        node = self._find(task_id)
+        if node is None:
+            return []
+
+        found = []
+        stack = list(reversed(list(node["children"].values())))
+        while stack:
+            child = stack.pop()
+            if child["task_id"] is not None:
+                found.append(child["task_id"])
+            else:
+                stack.extend(reversed(list(child["children"].values())))
+        return found
+
+    def _find(self, task_id: str) -> Optional[Dict[str, Any]]:
+        node = self._root
+        for segment in task_id.split('.'):
+            node = node["children"].get(segment)
+            if node is None:
+                return None
+        return node
+
+
+@dataclass
+class TierAnalysis:
+    """Dependency depth of every task plus any cycles found"""
+    tiers: Dict[str, int] = field(default_factory=dict)
+    cycles: List[List[str]] = field(default_factory=list)
+
+    def by_tier(self) -> Dict[int, List[str]]:
+        """Task ids grouped by tier, in task order"""
+        grouped: Dict[int, List[str]] = {}
+        for task_id, tier in self.tiers.items():
+            grouped.setdefault(tier, []).append(task_id)
+        return grouped
+
+    @property
+    def critical_path_length(self) -> int:
+        return max(self.tiers.values()) if self.tiers else 0
+
+    @property
+    def max_parallelism(self) -> int:
+        return max(len(task_ids) for task_ids in self.by_tier().values()) if self.tiers else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"tiers": self.tiers, "cycles": self.cycles}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TierAnalysis':
+        return cls(tiers=dict(data["tiers"]), cycles=[list(cycle) for cycle in data["cycles"]])
+
+
+def compute_tiers(dependencies: Mapping[str, Iterable[str]]) -> TierAnalysis:
+    """
+    Tier (longest dependency chain) of every task in one depth-first pass
+    Tasks without dependencies are tier 0, others one above their deepest
+    dependency. Dependencies outside the mapping are ignored, and the edge
+    closing a cycle is skipped and the cycle reported instead.
+    """
+    tiers: Dict[str, int] = {}
+    cycles: List[List[str]] = []
+    seen_cycles = set()
+    on_stack: Dict[str, int] = {}
+
+    for root in dependencies:
+        if root in tiers:
+            continue
+
+        # Each frame: [task id, remaining dependencies, deepest tier so far]
+        stack = [[root, iter(dependencies[root]), 0]]
+        on_stack[root] = 0
+        while stack:
+            frame = stack[-1]
+            dep_id = next(frame[1], None)
+
+            if dep_id is None:
+                task_id, _, tier = stack.pop()
+                del on_stack[task_id]
+                tiers[task_id] = tier
+                if stack:
+                    stack[-1][2] = max(stack[-1][2], tier + 1)
+                continue
+
+            if dep_id not in dependencies:
+                continue
+            if dep_id in tiers:
+                frame[2] = max(frame[2], tiers[dep_id] + 1)
+            elif dep_id in on_stack:
+                cycle = [entry[0] for entry in stack[on_stack[dep_id]:]]
+                start = cycle.index(min(cycle))
+                cycle = cycle[start:] + cycle[:start]
+                if tuple(cycle) not in seen_cycles:
+                    seen_cycles.add(tuple(cycle))
+                    cycles.append(cycle)
+            else:
+                on_stack[dep_id] = len(stack)
+                stack.append([dep_id, iter(dependencies[dep_id]), 0])
+
+    # Report tiers in the caller's task order
+    return TierAnalysis(tiers={task_id: tiers[task_id] for task_id in dependencies}, cycles=cycles)
+
+
+def hierarchical_dependencies(task_ids: Iterable[str]) -> Dict[str, List[str]]:
+    """A parent task depends on its direct subtasks; leaf tasks have no dependencies"""
+    task_ids = list(task_ids)
+    index = TaskIdIndex(task_ids)
+    return {task_id: index.children(task_id) for task_id in task_ids}
+
+
+def parse_tasks_markdown(content: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse tasks from tasks.md checklist content
+    Returns task id -> {name, description, requirements}, in file order
+    """
+    tasks: Dict[str, Dict[str, Any]] = {}
+    current = None
+
+    for line in content.split('\n'):
+        line = line.strip()
+
+        # Match task headers: - [ ] 1.1 Task Name
+        task_match = TASK_LINE.match(line)
+        if task_match:
+            current = {"name": task_match.group(2), "description": "", "requirements": []}
+            tasks[task_match.group(1)] = current
+            continue
+
+        # Match requirements: _Requirements: req1, req2_
+        req_match = REQUIREMENTS_LINE.match(line)
+        if req_match and current is not None:
+            current["requirements"] = [r.strip() for r in req_match.group(1).split(',')]
+            continue
+
+        # Add description lines
+        if current is not None and line and not line.startswith('-') and not line.startswith('_'):
+            current["description"] = f"{current['description']} {line}" if current["description"] else line
+
+    return tasks
+
+
+@dataclass
+class ParsedTaskDAG:
+    """Parsed tasks.md with its dependencies and tier analysis"""
+    content_hash: str
+    tasks: Dict[str, Dict[str, Any]]
+    dependencies: Dict[str, List[str]]
+    analysis: TierAnalysis
+
+    @classmethod
+    def from_content(cls, content: str) -> 'ParsedTaskDAG':
+        tasks = parse_tasks_markdown(content)
+        dependencies = hierarchical_dependencies(tasks)
+        return cls(
+            content_hash=hashlib.sha256(content.encode()).hexdigest(),
+            tasks=tasks,
+            dependencies=dependencies,
+            analysis=compute_tiers(dependencies)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": ANALYSIS_VERSION,
+            "content_hash": self.content_hash,
+            "tasks": self.tasks,
+            "dependencies": self.dependencies,
+            "analysis": self.analysis.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ParsedTaskDAG':
+        return cls(
+            content_hash=data["content_hash"],
+            tasks=data["tasks"],
+            dependencies=data["dependencies"],
+            analysis=TierAnalysis.from_dict(data["analysis"])
+        )
+
+
+def default_cache_dir() -> Path:
+    """Cache directory for parsed task DAGs ($XDG_CACHE_HOME/beast-mode/task-dag)"""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "beast-mode" / "task-dag"
+
+
+class TaskDAGCache:
+    """Parsed and analyzed tasks.md files, cached on disk by content hash"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_hit = False
+
+    def load(self, tasks_file: Path) -> ParsedTaskDAG:
+        """Parse and analyze a tasks.md file, reusing the cached result when its content is unchanged"""
+        content = Path(tasks_file).read_text()
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        cache_file = self.cache_dir / f"{content_hash}.json"
+
+        self.cache_hit = False
+        try:
+            data = json.loads(cache_file.read_text())
+            if data.get("version") == ANALYSIS_VERSION and data.get("content_hash") == content_hash:
+                self.cache_hit = True
+                return ParsedTaskDAG.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        dag = ParsedTaskDAG.from_content(content)
+        self._store(cache_file, dag)
+        return dag
+
+    def _store(self, cache_file: Path, dag: ParsedTaskDAG):
+        """Write a cache entry atomically; caching is best effort"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dag.to_dict(), f)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
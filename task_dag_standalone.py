@@ -7,13 +7,14 @@ Self-contained version that doesn't require module installation
 import click
 import json
 import sys
-import re
 from typing import Dict, List, Set, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 
+from task_dag_analysis import TaskDAGCache, compute_tiers
+
 
 class TaskStatus(Enum):
     NOT_STARTED = "not_started"
@@ -70,6 +71,8 @@ class TaskDAGAnalyzer:
         self.completed_tasks: Set[str] = set()
         self.failed_tasks: Set[str] = set()
         self.execution_log: List[Dict] = []
+        self.cycles: List[List[str]] = []
+        self.cache = TaskDAGCache()
         
         # Initialize default agents
         self._initialize_default_agents()
@@ -78,7 +81,7 @@ class TaskDAGAnalyzer:
         self.load_tasks_from_spec()
     
     def load_tasks_from_spec(self) -> bool:
-        """Load tasks from tasks.md file"""
+        """Load tasks from tasks.md file (parsed DAGs are cached by content hash)"""
         tasks_file = self.spec_path / "tasks.md"
         
         if not tasks_file.exists():
@@ -86,113 +89,33 @@ class TaskDAGAnalyzer:
             return False
         
         try:
-            content = tasks_file.read_text()
-            self.tasks = self._parse_tasks_markdown(content)
-            self._calculate_task_tiers()
-            return True
+            dag = self.cache.load(tasks_file)
         except Exception as e:
             print(f"❌ Failed to load tasks: {e}")
             return False
-    
-    def _parse_tasks_markdown(self, content: str) -> Dict[str, TaskNode]:
-        """Parse tasks from markdown content"""
-        tasks = {}
-        current_task = None
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Match task headers: - [ ] 1.1 Task Name
-            task_match = re.match(r'^-\s*\[\s*[x\s]\s*\]\s*(\d+(?:\.\d+)*)\s+(.+)$', line)
-            if task_match:
-                task_id = task_match.group(1)
-                task_name = task_match.group(2)
-                
-                current_task = TaskNode(
-                    id=task_id,
-                    name=task_name,
-                    description="",
-                    dependencies=self._extract_dependencies(task_id),
-                    requirements=[],
-                    estimated_hours=4.0,
-                    priority=1
-                )
-                tasks[task_id] = current_task
-                continue
-            
-            # Match requirements: _Requirements: req1, req2_
-            req_match = re.match(r'^_Requirements:\s*(.+)_$', line)
-            if req_match and current_task:
-                reqs = [r.strip() for r in req_match.group(1).split(',')]
-                current_task.requirements = reqs
-                continue
-            
-            # Add description lines
-            if current_task and line and not line.startswith('-') and not line.startswith('_'):
-                if current_task.description:
-                    current_task.description += " " + line
-                else:
-                    current_task.description = line
-        
-        return tasks
-    
-    def _extract_dependencies(self, task_id: str) -> List[str]:
-        """Extract dependencies based on task ID hierarchy"""
-        dependencies = []
         
-        # Handle hierarchical dependencies
-        if '.' in task_id:
-            # Subtask depends on parent
-            parent_id = '.'.join(task_id.split('.')[:-1])
-            dependencies.append(parent_id)
-        
-        return dependencies
-    
-    def _resolve_parent_dependencies(self):
-        """Resolve parent task dependencies on their subtasks"""
-        for task_id, task in self.tasks.items():
-            if '.' not in task_id:  # Parent task
-                subtasks = [tid for tid in self.tasks.keys() if tid.startswith(f"{task_id}.")]
-                if subtasks:
-                    task.dependencies = subtasks
+        self.tasks = {
+            task_id: TaskNode(
+                id=task_id,
+                name=fields["name"],
+                description=fields["description"],
+                dependencies=list(dag.dependencies[task_id]),
+                requirements=list(fields["requirements"]),
+                estimated_hours=4.0,
+                priority=1,
+                tier=dag.analysis.tiers[task_id]
+            )
+            for task_id, fields in dag.tasks.items()
+        }
+        self.cycles = dag.analysis.cycles
+        return True
     
     def _calculate_task_tiers(self):
-        """Calculate tier (dependency depth) for each task"""
-        # First resolve parent dependencies
-        self._resolve_parent_dependencies()
-        
-        # Calculate tiers using topological sort
-        visited = set()
-        
-        def calculate_tier(task_id: str) -> int:
-            if task_id in visited:
-                return 0  # Avoid cycles
-            
-            visited.add(task_id)
-            
-            if task_id not in self.tasks:
-                return 0
-            
-            task = self.tasks[task_id]
-            
-            if not task.dependencies:
-                task.tier = 0
-                return 0
-            
-            max_dep_tier = 0
-            for dep_id in task.dependencies:
-                if dep_id in self.tasks:
-                    dep_tier = calculate_tier(dep_id)
-                    max_dep_tier = max(max_dep_tier, dep_tier)
-            
-            task.tier = max_dep_tier + 1
-            return task.tier
-        
-        for task_id in self.tasks:
-            visited.clear()
-            calculate_tier(task_id)
+        """Recalculate tier (dependency depth) for each task after its dependencies change"""
+        analysis = compute_tiers({task_id: task.dependencies for task_id, task in self.tasks.items()})
+        for task_id, tier in analysis.tiers.items():
+            self.tasks[task_id].tier = tier
+        self.cycles = analysis.cycles
     
     def _initialize_default_agents(self):
         """Initialize default agents for task execution"""
@@ -304,6 +227,12 @@ class TaskDAGAnalyzer:
         print(f"  Completion Rate: {analysis.completion_rate:.1f}%")
         print(f"  Ready Tasks: {len(analysis.ready_tasks)}")
         print(f"  Blocked Tasks: {len(analysis.blocked_tasks)}")
+        
+        if self.cycles:
+            print(f"\n⚠️  DEPENDENCY CYCLES ({len(self.cycles)})")
+            print("-" * 30)
+            for cycle in self.cycles:
+                print(f"  • {' → '.join(cycle + cycle[:1])}")
     
     def _get_status_icon(self, status: TaskStatus) -> str:
         """Get icon for task status"""
@@ -364,7 +293,8 @@ def analyze(ctx, output):
                 "completion_rate": analysis.completion_rate,
                 "tiers": analysis.tiers,
                 "ready_tasks": analysis.ready_tasks,
-                "blocked_tasks": analysis.blocked_tasks
+                "blocked_tasks": analysis.blocked_tasks,
+                "cycles": analyzer.cycles
             },
             "tasks": {
                 task_id: {
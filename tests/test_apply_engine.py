@@ -0,0 +1,202 @@
+"""Tests for tiered server-side apply against a fake Kubernetes API server."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kubernetes import client
+
+from gke_autopilot.src.core.apply_engine import ServerSideApplier, apply_tiers, kind_rank
+
+
+RESOURCES = {
+    "v1": [
+        ("namespaces", "Namespace", False),
+        ("configmaps", "ConfigMap", True),
+        ("services", "Service", True),
+        ("serviceaccounts", "ServiceAccount", True),
+    ],
+    "apps/v1": [("deployments", "Deployment", True)],
+    "policy/v1": [("poddisruptionbudgets", "PodDisruptionBudget", True)],
+}
+
+
+def manifest(api_version, kind, name, namespace="default"):
+    metadata = {"name": name}
+    if kind != "Namespace":
+        metadata["namespace"] = namespace
+    return {"apiVersion": api_version, "kind": kind, "metadata": metadata}
+
+
+def resource_list(group_version):
+    return {
+        "kind": "APIResourceList",
+        "groupVersion": group_version,
+        "resources": [
+            {"name": name, "singularName": kind.lower(), "namespaced": namespaced, "kind": kind,
+             "verbs": ["get", "list", "patch", "create", "delete"]}
+            for name, kind, namespaced in RESOURCES[group_version]
+        ],
+    }
+
+
+class FakeKubernetesAPI:
+    """Discovery plus server-side apply PATCH endpoints with scripted failures."""
+
+    def __init__(self):
+        self.applied = []
+        self.field_managers = set()
+        # name -> statuses returned before the apply succeeds
+        self.failures = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def version(self, request):
+        return web.json_response({"major": "1", "minor": "30", "gitVersion": "v1.30.0"})
+
+    async def core_versions(self, request):
+        return web.json_response({"kind": "APIVersions", "versions": ["v1"]})
+
+    async def groups(self, request):
+        groups = []
+        for group_version in RESOURCES:
+            if "/" in group_version:
+                group, version = group_version.split("/")
+                entry = {"groupVersion": group_version, "version": version}
+                groups.append({"name": group, "versions": [entry], "preferredVersion": entry})
+        return web.json_response({"kind": "APIGroupList", "apiVersion": "v1", "groups": groups})
+
+    async def core_resources(self, request):
+        return web.json_response(resource_list("v1"))
+
+    async def group_resources(self, request):
+        return web.json_response(resource_list(f"{request.match_info['group']}/{request.match_info['version']}"))
+
+    async def apply(self, request):
+        self.field_managers.add(request.query.get("fieldManager"))
+        body = json.loads(await request.read())
+        name = body["metadata"]["name"]
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+
+        scripted = self.failures.get(name)
+        if scripted:
+            status = scripted.pop(0)
+            return web.json_response({"kind": "Status", "apiVersion": "v1", "status": "Failure",
+                                      "code": status, "reason": "Conflict" if status == 409 else "Invalid"},
+                                     status=status)
+
+        self.applied.append(body["kind"])
+        body["metadata"]["resourceVersion"] = str(len(self.applied))
+        return web.json_response(body)
+
+
+@pytest.fixture
+async def fake_api():
+    api = FakeKubernetesAPI()
+    app = web.Application()
+    app.router.add_get("/version", api.version)
+    app.router.add_get("/api", api.core_versions)
+    app.router.add_get("/apis", api.groups)
+    app.router.add_get("/api/v1", api.core_resources)
+    app.router.add_get("/apis/{group}/{version}", api.group_resources)
+    app.router.add_patch("/{path:.+}", api.apply)
+    server = TestServer(app)
+    await server.start_server()
+
+    configuration = client.Configuration()
+    configuration.host = str(server.make_url("")).rstrip("/")
+    api.api_client = client.ApiClient(configuration)
+    yield api
+    api.api_client.close()
+    await server.close()
+
+
+def stack():
+    return [
+        manifest("apps/v1", "Deployment", "web"),
+        manifest("policy/v1", "PodDisruptionBudget", "web"),
+        manifest("v1", "Service", "web"),
+        manifest("v1", "ConfigMap", "web-config"),
+        manifest("v1", "ServiceAccount", "web"),
+        manifest("v1", "Namespace", "default"),
+    ]
+
+
+class TestApplyTiers:
+    """Test kinds are grouped into coarse apply tiers."""
+
+    def test_kinds_share_coarse_tiers(self):
+        """Test independent kinds share a tier and unknown kinds come last."""
+        assert kind_rank("Namespace") == kind_rank("CustomResourceDefinition") == 0
+        assert kind_rank("ConfigMap") == kind_rank("RoleBinding") == kind_rank("Service") == 1
+        assert kind_rank("Deployment") == kind_rank("CronJob") == 2
+        assert kind_rank("HorizontalPodAutoscaler") == kind_rank("NetworkPolicy") == 3
+        assert kind_rank("Certificate") == 4
+
+        tiers = apply_tiers(stack())
+        assert [[m["kind"] for m in tier] for tier in tiers] == [
+            ["Namespace"], ["Service", "ConfigMap", "ServiceAccount"], ["Deployment"], ["PodDisruptionBudget"]
+        ]
+
+
+class TestServerSideApplier:
+    """Test server-side apply against the fake API server."""
+
+    async def test_tiers_apply_in_order(self, fake_api):
+        """Test each tier completes before the next and a tier is applied concurrently."""
+        applier = ServerSideApplier(field_manager="test-manager", max_concurrency=4)
+        report = await asyncio.to_thread(applier.apply, fake_api.api_client, stack())
+
+        assert report.success
+        assert report.tiers == 4
+        assert fake_api.applied[0] == "Namespace"
+        assert set(fake_api.applied[1:4]) == {"Service", "ConfigMap", "ServiceAccount"}
+        assert fake_api.applied[4:] == ["Deployment", "PodDisruptionBudget"]
+        assert fake_api.peak_in_flight == 3
+        assert fake_api.field_managers == {"test-manager"}
+
+        namespace = next(result for result in report.objects if result.kind == "Namespace")
+        assert namespace.namespace is None
+        assert all(result.resource_version for result in report.objects)
+
+    async def test_conflicts_are_retried(self, fake_api):
+        """Test a conflict is retried when applying with force_conflicts."""
+        fake_api.failures["web-config"] = [409, 409]
+        applier = ServerSideApplier(max_retries=3, retry_backoff_seconds=0.01)
+        report = await asyncio.to_thread(applier.apply, fake_api.api_client, stack())
+
+        assert report.success
+        config_map = next(result for result in report.objects if result.kind == "ConfigMap")
+        assert config_map.attempts == 3
+
+    async def test_conflicts_are_final_without_force(self, fake_api):
+        """Test field ownership conflicts are not retried without force_conflicts."""
+        fake_api.failures["web-config"] = [409]
+        applier = ServerSideApplier(force_conflicts=False, retry_backoff_seconds=0.01)
+        report = await asyncio.to_thread(applier.apply, fake_api.api_client, stack())
+
+        config_map = next(result for result in report.objects if result.kind == "ConfigMap")
+        assert (config_map.success, config_map.attempts) == (False, 1)
+        assert "HTTP 409" in config_map.error
+
+    async def test_failure_skips_later_tiers(self, fake_api):
+        """Test a failed tier finishes its siblings and skips every later tier."""
+        fake_api.failures["web-config"] = [422]
+        applier = ServerSideApplier(retry_backoff_seconds=0.01)
+        report = await asyncio.to_thread(applier.apply, fake_api.api_client, stack())
+
+        assert not report.success
+        assert [result.key for result in report.failed] == ["v1/ConfigMap/default/web-config"]
+        assert {result.kind for result in report.skipped} == {"Deployment", "PodDisruptionBudget"}
+        assert all("web-config" in result.error for result in report.skipped)
+        assert "Deployment" not in fake_api.applied
+        assert set(fake_api.applied) == {"Namespace", "Service", "ServiceAccount"}
+        assert "1 of 6 objects failed to apply, 2 skipped" in report.error_summary()
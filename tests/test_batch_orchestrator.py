@@ -0,0 +1,104 @@
+"""Tests for concurrent multi-application deployment."""
+
+import asyncio
+
+import pytest
+
+from gke_autopilot.src.deployment.batch_orchestrator import (
+    BatchDeploymentOrchestrator,
+    BatchItemState,
+    build_dependency_graph,
+    dependency_levels,
+)
+from gke_autopilot.src.models.app_config import AppConfig, DeploymentPhase, DeploymentResult, IngressConfig
+
+
+def app(name, *dependencies):
+    return AppConfig(name=name, image=f"{name}:1", dependencies=list(dependencies),
+                     ingress_config=IngressConfig(enabled=False))
+
+
+class FakeDeployer:
+    """Deployer stand-in that records overlap and fails or raises on request."""
+
+    def __init__(self, failing=(), raising=(), delay=0.02):
+        self.failing = set(failing)
+        self.raising = set(raising)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.started = []
+
+    async def deploy_application(self, app_config, cluster_name, location, strategy,
+                                 wait_for_completion=True, namespace="default"):
+        self.started.append(app_config.name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if app_config.name in self.raising:
+                raise RuntimeError(f"{app_config.name} exploded")
+            failed = app_config.name in self.failing
+            return DeploymentResult(
+                success=not failed,
+                cluster_name=cluster_name,
+                phase=DeploymentPhase.FAILED if failed else DeploymentPhase.READY,
+                error_message=f"{app_config.name} failed" if failed else None
+            )
+        finally:
+            self.active -= 1
+
+
+class TestBatchOrchestrator:
+    """Test concurrency bounds, dependency ordering and failure isolation."""
+
+    def test_dependency_levels_and_cycles(self):
+        """Test applications are grouped into waves and cycles are rejected."""
+        graph = build_dependency_graph([app("db"), app("api", "db", "external"), app("web", "api")])
+        assert dependency_levels(graph) == [["db"], ["api"], ["web"]]
+
+        with pytest.raises(ValueError, match="cycle"):
+            build_dependency_graph([app("a", "b"), app("b", "a")])
+
+    async def test_concurrency_is_bounded(self):
+        """Test independent applications run concurrently up to max_concurrency."""
+        deployer = FakeDeployer()
+        orchestrator = BatchDeploymentOrchestrator(deployer, max_concurrency=3)
+
+        result = await orchestrator.deploy_all([app(f"svc-{i}") for i in range(8)], "prod", "us-central1")
+
+        assert result.success
+        assert deployer.peak == 3
+        assert len(deployer.started) == 8
+
+    async def test_failures_are_isolated(self):
+        """Test a failed app skips only its dependents and siblings still deploy."""
+        deployer = FakeDeployer(failing={"db"}, raising={"cache"})
+        orchestrator = BatchDeploymentOrchestrator(deployer, max_concurrency=4)
+
+        result = await orchestrator.deploy_all(
+            [app("db"), app("api", "db"), app("web", "api"), app("cache"), app("worker"), app("docs", "worker")],
+            "prod", "us-central1"
+        )
+
+        assert not result.success
+        assert sorted(result.names_in_state(BatchItemState.FAILED)) == ["cache", "db"]
+        assert sorted(result.names_in_state(BatchItemState.SKIPPED)) == ["api", "web"]
+        assert sorted(result.names_in_state(BatchItemState.SUCCEEDED)) == ["docs", "worker"]
+        assert result.to_dict()["failed"] == {"db": "db failed", "cache": "cache exploded"}
+        assert deployer.started.index("worker") < deployer.started.index("docs")
+        assert "api" not in deployer.started
+
+    async def test_fail_fast_stops_new_deployments(self):
+        """Test fail_fast skips applications that had not started yet."""
+        deployer = FakeDeployer(failing={"first"})
+        orchestrator = BatchDeploymentOrchestrator(deployer, max_concurrency=1, fail_fast=True)
+
+        result = await orchestrator.deploy_all([app("first"), app("second"), app("third")], "prod", "us-central1")
+
+        assert result.states == {
+            "first": BatchItemState.FAILED,
+            "second": BatchItemState.SKIPPED,
+            "third": BatchItemState.SKIPPED,
+        }
+        assert deployer.started == ["first"]
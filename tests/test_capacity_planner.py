@@ -0,0 +1,141 @@
+"""Tests for vectorized fleet capacity planning."""
+
+import os
+
+import numpy as np
+import pytest
+import yaml
+
+from gke_autopilot.src.config.configuration_manager import ConfigurationManager
+from gke_autopilot.src.core.capacity_planner import AutopilotPricing, CapacityPlanner, WhatIf
+from gke_autopilot.src.models.app_config import AppConfig, IngressConfig, ResourceRequests, ScalingConfig
+
+MIB = 2 ** 20
+GIB = 2 ** 30
+
+
+def app(name, cpu="500m", memory="1Gi", storage="2Gi", min_replicas=2, max_replicas=4):
+    return AppConfig(
+        name=name,
+        image=f"gcr.io/demo/{name}:1",
+        resource_requests=ResourceRequests(cpu=cpu, memory=memory, storage=storage),
+        scaling_config=ScalingConfig(min_replicas=min_replicas, max_replicas=max_replicas),
+        ingress_config=IngressConfig(enabled=False),
+    )
+
+
+@pytest.fixture
+def planner():
+    return CapacityPlanner([app("web"), app("worker", cpu="250m", memory="512Mi", storage="1Gi",
+                                            min_replicas=1, max_replicas=2)])
+
+
+class TestAutopilotRounding:
+    """Test Autopilot's pod rounding rules."""
+
+    @pytest.mark.parametrize("cpu_m, memory, expected_cpu, expected_memory", [
+        # CPU and memory minimums
+        (100, 256 * MIB, 250, 512 * MIB),
+        # CPU rounds up in 250m steps
+        (300, GIB, 500, GIB),
+        (1001, 2 * GIB, 1250, 2 * GIB),
+        # Under 1 GiB per vCPU: memory is raised
+        (4000, GIB, 4000, 4 * GIB),
+        # Over 6.5 GiB per vCPU: CPU is raised in whole steps
+        (250, 13 * GIB, 2000, 13 * GIB),
+        (500, 4 * GIB, 750, 4 * GIB),
+        # Memory is billed in whole MiB
+        (1000, 1000.5 * MIB, 1000, 1024 * MIB),
+    ])
+    def test_autopilot_round(self, planner, cpu_m, memory, expected_cpu, expected_memory):
+        """Test the CPU minimum and steps, the memory minimum and the memory-to-CPU ratio."""
+        cpu, rounded_memory = planner.autopilot_round(np.array([cpu_m], dtype=float), np.array([memory], dtype=float))
+        assert (cpu[0], rounded_memory[0]) == (expected_cpu, expected_memory)
+
+
+class TestCapacityPlan:
+    """Test fleet totals, what-if scaling and scenario comparison."""
+
+    def test_plan_totals(self, planner):
+        """Test footprints multiply per-pod sizes, storage included, by replica bounds."""
+        plan = planner.plan()
+
+        assert plan.names == ["web", "worker"]
+        minimum = plan.totals["min"]
+        assert (minimum["pods"], minimum["cpu_cores"], minimum["memory_gib"], minimum["storage_gib"]) == (3, 1.25, 2.5, 5.0)
+        assert plan.totals["max"]["pods"] == 6
+        assert plan.totals["max"]["storage_gib"] == 10.0
+
+        pricing = AutopilotPricing()
+        web_pod = 0.5 * pricing.vcpu_hour + 1 * pricing.memory_gib_hour + 2 * pricing.storage_gib_hour
+        assert plan.hourly_cost_min[0] == pytest.approx(web_pod * 2)
+        assert plan.adjusted == []
+
+    def test_what_if_scales_resources_and_replicas(self, planner):
+        """Test scaled requests are re-rounded and replica counts rounded up."""
+        plan = planner.plan(WhatIf(cpu_scale=2.0, memory_scale=0.5, replica_scale=1.5))
+
+        assert list(plan.cpu_millicores) == [1000, 500]
+        # 512Mi and 256Mi requests: raised to the memory minimum, then to 1 GiB per vCPU
+        assert list(plan.memory_bytes) == [GIB, 512 * MIB]
+        assert list(plan.min_replicas) == [3, 2]
+        assert list(plan.max_replicas) == [6, 3]
+        assert plan.adjusted == ["web", "worker"]
+
+    def test_invalid_quantities_are_warnings_not_totals(self):
+        """Test applications with unparseable quantities are excluded and reported."""
+        planner = CapacityPlanner([app("web"), app("broken", cpu="1.5.5"), app("no-disk", storage="lots")])
+        plan = planner.plan()
+
+        assert plan.names == ["web"]
+        assert plan.totals["min"]["pods"] == 2
+        assert [warning.split(":")[0] for warning in plan.warnings] == ["broken", "no-disk"]
+        assert "invalid_applications" not in plan.totals
+        assert plan.to_dict()["warnings"] == plan.warnings
+
+    def test_compare_deltas(self, planner):
+        """Test scenarios report their totals and the change against the baseline."""
+        comparison = planner.compare({
+            "double": WhatIf(replica_scale=2.0),
+            "current": WhatIf(),
+        })
+
+        double = comparison["double"]
+        assert double["min"]["pods"] == 6
+        assert double["delta"]["min"]["pods"] == 3
+        assert double["delta"]["min"]["cpu_cores"] == 1.25
+        assert double["delta"]["max"]["storage_gib"] == 10.0
+        assert double["delta"]["min"]["monthly_cost"] == pytest.approx(
+            double["min"]["monthly_cost"] / 2, abs=0.01
+        )
+        assert all(value == 0 for bound in comparison["current"]["delta"].values() for value in bound.values())
+
+    def test_empty_fleet(self):
+        """Test planning without applications yields zero totals."""
+        planner = CapacityPlanner([])
+        plan = planner.plan(WhatIf(replica_scale=3.0))
+
+        assert plan.names == [] and plan.app_rows() == []
+        assert plan.totals["min"]["pods"] == 0
+        assert plan.totals["max"]["monthly_cost"] == 0.0
+        assert planner.compare({"grow": WhatIf(cpu_scale=2.0)})["grow"]["delta"]["max"]["pods"] == 0
+
+    def test_from_config_directory(self, tmp_path, monkeypatch):
+        """Test applications are loaded from a directory, skipping non-app and broken files."""
+        for key in list(os.environ):
+            if key.startswith("GKE_AUTOPILOT_"):
+                monkeypatch.delenv(key)
+
+        for name in ("api", "web"):
+            (tmp_path / f"{name}.yaml").write_text(yaml.safe_dump({
+                "name": name, "image": f"gcr.io/demo/{name}:1", "port": 8080, "ingress": {"enabled": False},
+                "resources": {"cpu": "250m", "memory": "512Mi"},
+                "scaling": {"min_replicas": 1, "max_replicas": 3},
+            }))
+        (tmp_path / "cluster.yaml").write_text(yaml.safe_dump({"name": "cluster", "region": "us-central1"}))
+        (tmp_path / "broken.yaml").write_text("name: [unterminated\n")
+
+        planner = CapacityPlanner.from_config_directory(tmp_path, ConfigurationManager(tmp_path / "config"))
+
+        assert sorted(planner.names) == ["api", "web"]
+        assert planner.plan().totals["max"]["pods"] == 6
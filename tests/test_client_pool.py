@@ -0,0 +1,80 @@
+"""Tests for the pooled Kubernetes API clients."""
+
+import base64
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from gke_autopilot.src.core.client_pool import KubernetesClientPool
+
+
+def cluster_info(name="app-cluster", endpoint="10.0.0.1", ca=b"ca-one"):
+    return SimpleNamespace(
+        name=name,
+        location="us-central1",
+        endpoint=endpoint,
+        ca_certificate=base64.b64encode(ca).decode()
+    )
+
+
+@pytest.fixture
+def clusters():
+    """Cluster info served by the fake loader, keyed by cluster name."""
+    return {"app-cluster": cluster_info(), "db-cluster": cluster_info("db-cluster", "10.0.0.2")}
+
+
+@pytest.fixture
+def pool(clusters):
+    loads = []
+
+    def loader(cluster_name, location):
+        loads.append(cluster_name)
+        return clusters[cluster_name]
+
+    client_pool = KubernetesClientPool(credentials=None, cluster_info_loader=loader, idle_timeout_seconds=60)
+    client_pool.loads = loads
+    yield client_pool
+    client_pool.close()
+
+
+class TestKubernetesClientPool:
+    """Test client reuse, idle eviction and control-plane rotation."""
+
+    def test_clients_reused_per_cluster(self, pool):
+        """Test one client and one cluster info fetch per (cluster, location)."""
+        first = pool.get_client("app-cluster", "us-central1")
+        assert pool.get_client("app-cluster", "us-central1") is first
+        assert pool.get_client("db-cluster", "us-central1") is not first
+
+        assert first.configuration.host == "https://10.0.0.1"
+        assert pool.loads == ["app-cluster", "db-cluster"]
+        assert pool.get_stats()["hits"] == 1
+
+    def test_idle_clients_evicted(self, pool):
+        """Test clients unused past the idle timeout are closed and rebuilt."""
+        first = pool.get_client("app-cluster", "us-central1")
+        pooled = pool._clients[("app-cluster", "us-central1")]
+        pooled.last_used -= 120
+
+        assert pool.evict_idle() == 1
+        assert not os.path.exists(pooled.ca_cert_path)
+        assert ("app-cluster", "us-central1") not in pool._key_locks
+        assert pool.get_client("app-cluster", "us-central1") is not first
+
+    @pytest.mark.parametrize("rotated", [
+        {"endpoint": "10.0.0.9"},
+        {"ca": b"ca-two"},
+    ])
+    def test_rotation_rebuilds_client(self, pool, clusters, rotated):
+        """Test a new endpoint or CA drops the client built for the old control plane."""
+        first = pool.get_client("app-cluster", "us-central1")
+        pool.remember_cluster(cluster_info(**rotated))
+
+        assert ("app-cluster", "us-central1") not in pool._key_locks
+        rebuilt = pool.get_client("app-cluster", "us-central1")
+        assert rebuilt is not first
+
+        # Unchanged cluster info keeps the rebuilt client
+        pool.remember_cluster(cluster_info(**rotated))
+        assert pool.get_client("app-cluster", "us-central1") is rebuilt
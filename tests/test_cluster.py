@@ -4,7 +4,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from gke_local.cluster.kind_manager import KindManager, ClusterStatus
-from gke_local.cluster.lifecycle import ClusterLifecycleManager, ClusterState
+from gke_local.cluster.lifecycle import ClusterLifecycleManager, ClusterOrchestrator, ClusterState
 from gke_local.cluster.templates import ClusterTemplates
 from gke_local.config.models import GKELocalConfig
 
@@ -131,6 +131,58 @@ class TestKindManager:
             assert len(status.nodes) == 1
             assert status.kubeconfig_path == '/path/to/kubeconfig'
     
+    @pytest.mark.asyncio
+    async def test_fast_reset_restores_snapshot(self, test_config):
+        """Test that a fast reset restores the baseline instead of recreating."""
+        manager = KindManager(test_config)
+        
+        with patch.object(manager, 'restore_snapshot', return_value=True), \
+             patch.object(manager, 'delete_cluster') as mock_delete, \
+             patch.object(manager, 'create_cluster') as mock_create:
+            
+            success = await manager.reset_cluster(fast=True)
+            
+            assert success is True
+            mock_delete.assert_not_called()
+            mock_create.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_fast_reset_recreates_without_snapshot(self, test_config, tmp_path):
+        """Test that a fast reset without a usable snapshot recreates and re-snapshots."""
+        manager = KindManager(test_config)
+        manager.snapshots.snapshot_dir = tmp_path
+        
+        with patch.object(manager, 'delete_cluster', return_value=True), \
+             patch.object(manager, 'create_cluster', return_value=True), \
+             patch.object(manager, 'snapshot_cluster') as mock_snapshot, \
+             patch('asyncio.sleep'):
+            
+            success = await manager.reset_cluster(fast=True)
+            
+            assert success is True
+            mock_snapshot.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_fast_reset_recreates_from_snapshot_image(self, test_config):
+        """Test that a fallback recreate uses the snapshot's node image for that cluster only."""
+        manager = KindManager(test_config)
+        previous = Mock(node_image='kindest/node:v1.28.0')
+        
+        with patch.object(manager, 'restore_snapshot', return_value=False), \
+             patch.object(manager.snapshots, 'load', return_value=previous), \
+             patch.object(manager, 'delete_cluster', return_value=True), \
+             patch.object(manager, 'create_cluster', return_value=True) as mock_create, \
+             patch.object(manager, 'rebaseline') as mock_rebaseline, \
+             patch('asyncio.sleep'):
+            
+            success = await manager.reset_cluster(fast=True)
+            
+            assert success is True
+            mock_create.assert_called_once_with(node_image='kindest/node:v1.28.0')
+            mock_rebaseline.assert_called_once_with(previous)
+        
+        assert 'image' not in manager._generate_kind_config()['nodes'][0]
+    
     def test_generate_kind_config(self, test_config):
         """Test Kind configuration generation."""
         manager = KindManager(test_config)
@@ -215,12 +267,44 @@ class TestClusterLifecycleManager:
         """Test successful cluster reset."""
         manager = ClusterLifecycleManager(test_config)
         
-        with patch.object(manager, 'stop_and_cleanup', return_value=True), \
-             patch.object(manager, 'create_and_start', return_value=True):
+        with patch.object(manager, '_stop_and_cleanup', return_value=True), \
+             patch.object(manager, '_create_and_start', return_value=True), \
+             patch('asyncio.sleep'):
             
             success = await manager.reset()
             assert success is True
     
+    @pytest.mark.asyncio
+    async def test_fast_reset_fallback_keeps_restore_timing(self, test_config):
+        """Test that a failed in-place restore is still timed in the recreate's ready event."""
+        manager = ClusterLifecycleManager(test_config)
+        ready_events = []
+        manager.add_event_handler('cluster_ready', ready_events.append)
+        
+        async def set_ready():
+            manager._state = ClusterState.READY
+        
+        with patch.object(manager.kind_manager, 'restore_snapshot', return_value=False), \
+             patch.object(manager.kind_manager.snapshots, 'load', return_value=None), \
+             patch.object(manager.kind_manager, 'rebaseline', return_value=True), \
+             patch.object(manager.kind_manager, 'delete_cluster', return_value=True), \
+             patch.object(manager.kind_manager, 'create_cluster', return_value=True), \
+             patch.object(manager, 'stop_monitoring'), \
+             patch.object(manager, '_ensure_registry_running'), \
+             patch.object(manager, '_wait_for_ready', side_effect=set_ready), \
+             patch.object(manager, '_connect_registry_to_cluster'), \
+             patch.object(manager, 'start_monitoring'), \
+             patch('asyncio.sleep'):
+            
+            success = await manager.reset(fast=True)
+        
+        assert success is True
+        assert len(ready_events) == 1
+        timings = ready_events[0].data['timings']
+        assert {'restore_snapshot', 'kind_delete', 'kind_create'} <= set(timings)
+        assert 'fast_reset' not in ready_events[0].data
+        assert 'snapshot' in manager.last_timings
+    
     @pytest.mark.asyncio
     async def test_wait_for_ready_success(self, test_config):
         """Test waiting for cluster to be ready."""
@@ -291,6 +375,99 @@ class TestClusterLifecycleManager:
         assert handler2 in manager._event_handlers['test_event']
 
 
+class TestClusterOrchestrator:
+    """Test multi-cluster orchestration."""
+    
+    def _orchestrator(self, names, max_parallel=None):
+        orchestrator = ClusterOrchestrator(max_parallel=max_parallel)
+        for name in names:
+            orchestrator.add_cluster(GKELocalConfig(project_name="test-project", cluster={"name": name}))
+        return orchestrator
+    
+    def test_clusters_share_registry(self):
+        """Test that all clusters use the first cluster's registry."""
+        orchestrator = self._orchestrator(["dev", "staging"])
+        
+        registries = {id(manager.registry_manager) for manager in orchestrator.clusters.values()}
+        assert registries == {id(orchestrator.registry_manager)}
+        assert orchestrator.registry_manager.registry_name == "dev-registry"
+    
+    @pytest.mark.asyncio
+    async def test_start_all_concurrent_with_cap(self):
+        """Test that clusters start concurrently up to the parallelism cap."""
+        orchestrator = self._orchestrator(["a", "b", "c", "d"], max_parallel=2)
+        running = 0
+        peak = 0
+        
+        async def create(ensure_registry=True):
+            nonlocal running, peak
+            assert ensure_registry is False
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return True
+        
+        with patch.object(orchestrator, '_ensure_shared_registry') as mock_registry:
+            for manager in orchestrator.clusters.values():
+                manager.create_and_start = create
+            
+            results = await orchestrator.start_all()
+        
+        assert results == {"a": True, "b": True, "c": True, "d": True}
+        assert peak == 2
+        mock_registry.assert_called_once()
+        assert orchestrator.last_report.parallelism == 2
+    
+    @pytest.mark.asyncio
+    async def test_stop_all_isolates_failures(self):
+        """Test that one failing cluster does not affect the others."""
+        orchestrator = self._orchestrator(["a", "b", "c"], max_parallel=3)
+        
+        with patch.object(orchestrator.clusters["a"], 'stop_and_cleanup', return_value=True), \
+             patch.object(orchestrator.clusters["b"], 'stop_and_cleanup', side_effect=RuntimeError("boom")), \
+             patch.object(orchestrator.clusters["c"], 'stop_and_cleanup', return_value=False):
+            
+            results = await orchestrator.stop_all()
+        
+        assert results == {"a": True, "b": False, "c": False}
+        assert orchestrator.last_report.results["b"].error == "boom"
+    
+    @pytest.mark.asyncio
+    async def test_resolve_parallelism_from_docker_resources(self):
+        """Test that the default cap follows Docker CPUs and memory."""
+        orchestrator = self._orchestrator(["a", "b", "c", "d"])
+        
+        # 3-node clusters, 8 CPUs and 12 GiB fit 8 booting nodes: 2 clusters
+        with patch.object(orchestrator, '_docker_resources', return_value=(8.0, 12.0)):
+            assert await orchestrator.resolve_parallelism() == 2
+        
+        with patch.object(orchestrator, '_docker_resources', return_value=(1.0, 1.0)):
+            assert await orchestrator.resolve_parallelism() == 1
+    
+    @pytest.mark.asyncio
+    async def test_create_and_start_emits_phase_timings(self, test_config):
+        """Test that lifecycle phases are timed and emitted."""
+        manager = ClusterLifecycleManager(test_config)
+        phases = []
+        manager.add_event_handler('phase_completed', lambda event: phases.append(event.data['phase']))
+        
+        async def set_ready():
+            manager._state = ClusterState.READY
+        
+        with patch.object(manager, '_ensure_registry_running'), \
+             patch.object(manager.kind_manager, 'create_cluster', return_value=True), \
+             patch.object(manager, '_wait_for_ready', side_effect=set_ready), \
+             patch.object(manager, '_connect_registry_to_cluster'), \
+             patch.object(manager, 'start_monitoring'):
+            
+            success = await manager.create_and_start()
+        
+        assert success is True
+        assert phases == ['registry', 'kind_create', 'wait_ready', 'registry_connect']
+        assert set(manager.last_timings) == set(phases)
+
+
 class TestClusterTemplates:
     """Test cluster templates."""
     
@@ -330,6 +507,13 @@ class TestClusterTemplates:
         with pytest.raises(ValueError, match="Unknown template"):
             ClusterTemplates.get_template('invalid')
     
+    def test_required_images(self):
+        """Test resolving the images a template needs."""
+        images = ClusterTemplates.required_images('ai')
+        
+        assert any(image.startswith('docker.io/calico/node:') for image in images)
+        assert len(images) == len(set(images))
+    
     def test_customize_template(self, test_config):
         """Test template customization."""
         config = ClusterTemplates.customize_template('minimal', test_config.cluster)
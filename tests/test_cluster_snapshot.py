@@ -0,0 +1,87 @@
+"""Tests for capturing warm-cluster snapshots."""
+
+import json
+import stat
+import subprocess
+
+from gke_local.cluster.snapshot import ClusterSnapshotManager
+
+
+def completed(cmd, stdout="", returncode=0):
+    return subprocess.CompletedProcess(cmd, returncode, stdout, "")
+
+
+async def fake_run_command(cmd):
+    """Answer the docker and kubectl calls of a capture."""
+    if cmd[:2] == ['docker', 'ps']:
+        return completed(cmd, "abc123 test-control-plane kindest/node:v1.28.0\n")
+    if cmd[:2] == ['docker', 'exec']:
+        return completed(cmd, json.dumps({"images": []}))
+    if cmd[:3] == ['kubectl', 'get', 'namespaces']:
+        return completed(cmd, json.dumps({"items": [{"metadata": {"name": "app"}}]}))
+    return completed(cmd, json.dumps({"items": [{
+        "apiVersion": "v1", "kind": "Secret", "type": "Opaque",
+        "metadata": {"name": "db", "namespace": "app", "resourceVersion": "7"},
+        "data": {"password": "c2VjcmV0"},
+    }]}))
+
+
+class TestClusterSnapshotStorage:
+    """Test snapshot files holding Secret data are private."""
+
+    async def test_snapshot_file_is_owner_only(self, tmp_path):
+        """Test the snapshot directory and file are created without group or other access."""
+        snapshot_dir = tmp_path / "snapshots"
+        manager = ClusterSnapshotManager("test", fake_run_command, snapshot_dir=snapshot_dir)
+
+        snapshot = await manager.capture()
+
+        assert "app/secret/db" in snapshot.objects
+        assert stat.S_IMODE(manager.snapshot_path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(snapshot_dir.stat().st_mode) == 0o700
+        assert manager.load().objects == snapshot.objects
+        assert [path.name for path in snapshot_dir.iterdir()] == ["test.json"]
+
+    async def test_existing_snapshot_is_tightened(self, tmp_path):
+        """Test recapturing replaces a world-readable snapshot with a private one."""
+        manager = ClusterSnapshotManager("test", fake_run_command, snapshot_dir=tmp_path)
+        manager.snapshot_path.write_text("{}")
+        manager.snapshot_path.chmod(0o644)
+
+        await manager.capture()
+
+        assert stat.S_IMODE(manager.snapshot_path.stat().st_mode) == 0o600
+
+
+class TestClusterSnapshotRestore:
+    """Test restoring a snapshot in place."""
+
+    async def test_restore_records_new_fingerprints(self, tmp_path):
+        """Test a replaced object is not replaced again by the next restore."""
+        cluster = {"resourceVersion": "7"}
+        replaced = []
+
+        async def run_command(cmd):
+            if cmd[:2] == ['kubectl', 'replace']:
+                replaced.append(cmd)
+                cluster["resourceVersion"] = "9"
+                return completed(cmd)
+            if cmd[:3] == ['kubectl', 'get', 'namespaces'] or cmd[:2] != ['kubectl', 'get']:
+                return await fake_run_command(cmd)
+            return completed(cmd, json.dumps({"items": [{
+                "apiVersion": "v1", "kind": "Secret", "type": "Opaque",
+                "metadata": {"name": "db", "namespace": "app", **cluster},
+                "data": {"password": "c2VjcmV0"},
+            }]}))
+
+        manager = ClusterSnapshotManager("test", run_command, snapshot_dir=tmp_path)
+        await manager.capture()
+        cluster["resourceVersion"] = "8"
+
+        first = await manager.restore(manager.load())
+        second = await manager.restore(manager.load())
+
+        assert first.replaced == ["app/secret/db"]
+        assert manager.load().fingerprints["app/secret/db"] == "r9"
+        assert second.success and second.replaced == []
+        assert len(replaced) == 1
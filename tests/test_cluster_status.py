@@ -0,0 +1,190 @@
+"""Tests for the cached, watch-backed cluster status."""
+
+import asyncio
+import json
+
+import pytest
+import yaml
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gke_local.cluster import status as status_module
+from gke_local.cluster.status import ClusterStatusCache, NodeWatcher, StatusSnapshot
+
+
+def node(name, resource_version):
+    return {"apiVersion": "v1", "kind": "Node",
+            "metadata": {"name": name, "resourceVersion": resource_version}}
+
+
+class CountingLoader:
+    """Status loader counting queries, optionally pausing until released."""
+
+    def __init__(self, nodes=("control-plane",)):
+        self.nodes = [node(name, "1") for name in nodes]
+        self.calls = 0
+        self.release = None
+
+    async def __call__(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return StatusSnapshot(exists=bool(self.nodes), nodes=list(self.nodes))
+
+
+class FakeNodesAPI:
+    """core/v1 nodes endpoint serving a list and scripted watch events."""
+
+    def __init__(self):
+        self.lists = 0
+        self.failing = False
+        # resourceVersion -> watch events
+        self.events = {"1": [{"type": "ADDED", "object": node("worker", "2")}]}
+
+    async def handle(self, request):
+        if request.query.get("watch") != "true":
+            self.lists += 1
+            if self.failing:
+                return web.json_response({"kind": "Status", "code": 500, "message": "down"}, status=500)
+            return web.json_response({"apiVersion": "v1", "kind": "NodeList",
+                                      "metadata": {"resourceVersion": "1"},
+                                      "items": [node("control-plane", "1")]})
+
+        events = self.events.get(request.query.get("resourceVersion"), [])
+        if self.failing:
+            events = [{"type": "ERROR", "object": {"kind": "Status", "code": 410, "reason": "Expired",
+                                                   "message": "too old resource version"}}]
+
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for event in events:
+            await response.write((json.dumps(event) + "\n").encode())
+        if not events:
+            await asyncio.sleep(0.05)
+        await response.write_eof()
+        return response
+
+
+@pytest.fixture
+async def fake_api(tmp_path):
+    api = FakeNodesAPI()
+    app = web.Application()
+    app.router.add_get("/api/v1/nodes", api.handle)
+    server = TestServer(app)
+    await server.start_server()
+
+    api.kubeconfig = tmp_path / "kubeconfig"
+    api.kubeconfig.write_text(yaml.safe_dump({
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": "test", "cluster": {"server": str(server.make_url("")).rstrip("/")}}],
+        "users": [{"name": "test", "user": {"token": "test"}}],
+        "contexts": [{"name": "kind-test", "context": {"cluster": "test", "user": "test"}}],
+        "current-context": "kind-test",
+    }))
+    yield api
+    await server.close()
+
+
+async def wait_until(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.02)
+
+
+class TestClusterStatusCache:
+    """Test TTL reuse, coalescing and invalidation of polled status."""
+
+    async def test_snapshot_reused_within_ttl(self):
+        """Test a fresh snapshot is served without querying again."""
+        loader = CountingLoader()
+        cache = ClusterStatusCache("test", loader, ttl_seconds=60)
+
+        first = await cache.get()
+        assert await cache.get() is first
+        assert loader.calls == 1
+
+        await cache.get(max_age=0)
+        assert loader.calls == 2
+        assert cache.get_stats()["cache_hits"] == 1
+
+    async def test_concurrent_refreshes_coalesce(self):
+        """Test callers arriving during a refresh share one query."""
+        loader = CountingLoader()
+        loader.release = asyncio.Event()
+        cache = ClusterStatusCache("test", loader)
+
+        callers = [asyncio.create_task(cache.get()) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        snapshots = await asyncio.gather(*callers)
+
+        assert loader.calls == 1
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert cache.get_stats()["coalesced"] == 4
+
+    async def test_invalidate_forces_query(self):
+        """Test invalidation drops the snapshot and wakes waiters."""
+        loader = CountingLoader()
+        cache = ClusterStatusCache("test", loader, ttl_seconds=60)
+        await cache.get()
+
+        waiter = asyncio.create_task(cache.wait_for_change(timeout=5))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        assert await waiter
+
+        await cache.get()
+        assert loader.calls == 2
+
+
+class TestNodeWatch:
+    """Test the Node watch and the fallback to polling."""
+
+    async def test_watcher_lists_then_streams(self, fake_api):
+        """Test the watcher lists nodes, applies watch events and relists after 410."""
+        changes = []
+        watcher = NodeWatcher("kind-test", lambda: changes.append(1), kubeconfig=str(fake_api.kubeconfig),
+                              retry_seconds=0.05)
+        watcher.start()
+        try:
+            await wait_until(lambda: [n["metadata"]["name"] for n in watcher.nodes()] == ["control-plane", "worker"])
+            assert watcher.healthy
+            assert watcher.events == 1
+
+            # An expired resourceVersion relists instead of failing
+            lists = fake_api.lists
+            fake_api.events["2"] = [{"type": "ERROR", "object": {"kind": "Status", "code": 410, "reason": "Expired",
+                                                              "message": "too old resource version"}}]
+            await wait_until(lambda: fake_api.lists > lists)
+            await wait_until(lambda: watcher.healthy)
+        finally:
+            watcher.stop()
+
+    async def test_cache_falls_back_to_polling(self, fake_api, monkeypatch):
+        """Test status comes from the watch while healthy and from the loader otherwise."""
+        monkeypatch.setattr(status_module, "NodeWatcher",
+                            lambda context, on_change: NodeWatcher(context, on_change,
+                                                                   kubeconfig=str(fake_api.kubeconfig),
+                                                                   retry_seconds=0.05))
+        loader = CountingLoader()
+        cache = ClusterStatusCache("test", loader, ttl_seconds=0)
+        cache.enable_watch()
+        try:
+            assert (await cache.get()).source == "kubectl"
+            await wait_until(lambda: cache.watching and len(cache._watcher.nodes()) == 2)
+
+            snapshot = await cache.get()
+            assert snapshot.source == "watch"
+            assert len(snapshot.nodes) == 2
+            assert loader.calls == 1
+
+            # The API server failing makes the watch unhealthy; status is polled again
+            fake_api.failing = True
+            await wait_until(lambda: not cache.watching)
+            snapshot = await cache.get()
+            assert snapshot.source == "kubectl"
+            assert loader.calls == 2
+        finally:
+            cache.disable_watch()
@@ -8,6 +8,12 @@ from gke_local.config.manager import ConfigManager
 from gke_local.config.models import GKELocalConfig, LogLevel
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    """Keep compiled configurations out of the user's cache directory."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+
 class TestConfigManager:
     """Test configuration manager functionality."""
     
@@ -125,6 +131,37 @@ class TestConfigManager:
             assert saved_data["project_name"] == "saved-project"
             assert saved_data["cluster"]["nodes"] == 7
 
+    
+    def test_compiled_config_cache(self):
+        """Test that unchanged configuration is served from the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_dir = Path(temp_dir)
+            
+            first = ConfigManager(config_dir)
+            first.load_config()
+            assert first.cache_hit is False
+            
+            second = ConfigManager(config_dir)
+            config = second.load_config()
+            assert second.cache_hit is True
+            assert config.cluster.name == "local-gke-dev"
+            assert second.get_loaded_files() == first.get_loaded_files()
+    
+    def test_compiled_config_cache_invalidation(self):
+        """Test that changing a source file invalidates the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_dir = Path(temp_dir)
+            ConfigManager(config_dir).load_config("staging")
+            
+            # A new environment file changes the configuration
+            with open(config_dir / "gke-local.staging.yaml", 'w') as f:
+                yaml.dump({"cluster": {"nodes": 2}}, f)
+            
+            manager = ConfigManager(config_dir)
+            config = manager.load_config("staging")
+            
+            assert manager.cache_hit is False
+            assert config.cluster.nodes == 2
 
 class TestConfigModels:
     """Test configuration data models."""
@@ -0,0 +1,103 @@
+"""Tests for cached configuration loading and directory loads."""
+
+import os
+
+import pytest
+import yaml
+
+from gke_autopilot.src.config import configuration_manager as configuration_module
+from gke_autopilot.src.config.configuration_manager import PARALLEL_LOAD_THRESHOLD, ConfigurationManager
+
+
+def write_app(path, name="web", port=8080):
+    path.write_text(yaml.safe_dump({"name": name, "image": f"gcr.io/demo/{name}:1", "port": port}))
+    return path
+
+
+def touch_forward(path):
+    """Move mtime forward so an edit is visible even on coarse filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    for key in list(os.environ):
+        if key.startswith("GKE_AUTOPILOT_"):
+            monkeypatch.delenv(key)
+    return ConfigurationManager(tmp_path / "config")
+
+
+class TestConfigurationCache:
+    """Test cached configurations are reused only while file and overrides are unchanged."""
+
+    def test_cache_invalidated_on_edit(self, manager, tmp_path):
+        """Test an edited file (new mtime/size) is reparsed."""
+        path = write_app(tmp_path / "web.yaml")
+
+        assert manager.load_configuration(path)["port"] == 8080
+        assert manager.load_configuration(path)["port"] == 8080
+        assert manager.get_cache_stats()["hits"] == 1
+
+        write_app(path, port=9090)
+        touch_forward(path)
+
+        assert manager.load_configuration(path)["port"] == 9090
+        assert manager.get_cache_stats()["invalidations"] == 1
+
+    def test_cache_invalidated_on_env_override_change(self, manager, tmp_path, monkeypatch):
+        """Test a new GKE_AUTOPILOT_* override invalidates cached results."""
+        path = write_app(tmp_path / "web.yaml")
+        manager.load_configuration(path)
+
+        monkeypatch.setenv("GKE_AUTOPILOT_PORT", "7070")
+
+        assert manager.load_configuration(path)["port"] == 7070
+        assert manager.get_cache_stats()["invalidations"] == 1
+
+    def test_callers_get_copies(self, manager, tmp_path):
+        """Test mutating a returned configuration does not corrupt the cache."""
+        path = write_app(tmp_path / "web.yaml")
+        manager.load_configuration(path)["port"] = 1
+
+        assert manager.load_configuration(path)["port"] == 8080
+
+
+class TestLoadDirectory:
+    """Test directory loads in the serial and process-pool paths."""
+
+    def test_small_directory_loads_serially(self, manager, tmp_path, monkeypatch):
+        """Test few uncached files are parsed in-process and then served from cache."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used for a small directory")
+
+        monkeypatch.setattr(configuration_module, "ProcessPoolExecutor", no_pool)
+        directory = tmp_path / "apps"
+        directory.mkdir()
+        for name in ("b-app", "a-app"):
+            write_app(directory / f"{name}.yaml", name)
+        (directory / "notes.txt").write_text("ignored")
+
+        result = manager.load_directory(directory)
+        assert result.valid
+        assert [path.name for path in result.configs] == ["a-app.yaml", "b-app.yaml"]
+        assert result.cache_hits == 0
+
+        assert manager.load_directory(directory).cache_hits == 2
+
+    def test_process_pool_reports_errors_per_file(self, manager, tmp_path):
+        """Test parse and validation errors are collected per file in the parallel path."""
+        directory = tmp_path / "apps"
+        directory.mkdir()
+        for i in range(PARALLEL_LOAD_THRESHOLD):
+            write_app(directory / f"app-{i:02d}.yaml", f"app-{i}")
+        (directory / "broken.yaml").write_text("name: [unclosed")
+        write_app(directory / "invalid.yaml", "Not_A_Valid_Name")
+
+        result = manager.load_directory(directory, max_workers=2)
+
+        assert len(result.configs) == PARALLEL_LOAD_THRESHOLD
+        assert set(path.name for path in result.errors) == {"broken.yaml", "invalid.yaml"}
+        assert result.errors[directory / "broken.yaml"].startswith("ParserError")
+        assert "validation failed" in result.errors[directory / "invalid.yaml"]
+        assert not result.valid
@@ -0,0 +1,203 @@
+"""
+Tests for the Beast Mode multi-agent consensus engine
+
+Covers consensus calculation and the bounded consensus result cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.beast_mode.consensus.core.aggregator import IncrementalConsensusAggregator
+from src.beast_mode.consensus.core.consensus_engine import ConsensusEngine, ConsensusEngineConfig
+from src.beast_mode.consensus.core.result_cache import ConsensusResultCache, analysis_digest
+from src.beast_mode.consensus.models.data_models import (
+    AgentAnalysis,
+    ConsensusMethod,
+    ConsensusResult,
+    DecisionWorkflow,
+)
+
+
+def make_analysis(agent_id, result, confidence=0.8):
+    return AgentAnalysis(
+        agent_id=agent_id,
+        analysis_type="deployment_risk",
+        result=result,
+        confidence=confidence,
+    )
+
+
+class FakeSharedBackend:
+    """In-memory stand-in for an asyncio Redis client."""
+    
+    def __init__(self):
+        self.store = {}
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+class TestConsensusResultCache:
+    """Test the bounded LRU/TTL consensus result cache."""
+    
+    def test_digest_is_stable_and_order_independent(self):
+        """Digest ignores analysis order and distinguishes content changes."""
+        a = [make_analysis("a1", {"risk": "low", "tags": ["x"]}), make_analysis("a2", "high")]
+        b = list(reversed(a))
+        
+        assert analysis_digest(a, ConsensusMethod.SIMPLE_VOTING) == analysis_digest(b, ConsensusMethod.SIMPLE_VOTING)
+        assert analysis_digest(a, ConsensusMethod.SIMPLE_VOTING) != analysis_digest(a, ConsensusMethod.WEIGHTED_CONSENSUS)
+        assert analysis_digest(a, ConsensusMethod.THRESHOLD_CONSENSUS, 0.5) != \
+            analysis_digest(a, ConsensusMethod.THRESHOLD_CONSENSUS, 0.9)
+    
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_ttl(self):
+        """Cache evicts least recently used entries and expires stale ones."""
+        cache = ConsensusResultCache(max_entries=2, ttl_seconds=3600)
+        result = ConsensusResult(consensus_value="ok", confidence_score=0.9,
+                                 consensus_method=ConsensusMethod.SIMPLE_VOTING)
+        
+        await cache.put("k1", result)
+        await cache.put("k2", result)
+        assert await cache.get("k1") is result  # k1 becomes most recent
+        await cache.put("k3", result)
+        
+        assert await cache.get("k2") is None
+        assert await cache.get("k1") is result
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1
+        assert stats['size'] == 2
+        
+        expired = ConsensusResultCache(max_entries=2, ttl_seconds=0)
+        await expired.put("k1", result)
+        assert await expired.get("k1") is None
+        assert expired.get_stats()['expirations'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_shared_backend_round_trip(self):
+        """Results stored by one worker are served to another via the backend."""
+        backend = FakeSharedBackend()
+        writer = ConsensusResultCache(shared_backend=backend)
+        reader = ConsensusResultCache(shared_backend=backend)
+        result = ConsensusResult(consensus_value="deploy", confidence_score=0.75,
+                                 consensus_method=ConsensusMethod.WEIGHTED_CONSENSUS)
+        
+        await writer.put("key", result)
+        shared = await reader.get("key")
+        
+        assert shared.consensus_value == "deploy"
+        assert reader.get_stats()['shared_hits'] == 1
+
+
+class TestIncrementalConsensusAggregator:
+    """Test streaming consensus aggregation."""
+    
+    def test_progressive_weighted_consensus(self):
+        """Current consensus can be queried as analyses arrive."""
+        aggregator = IncrementalConsensusAggregator(ConsensusMethod.WEIGHTED_CONSENSUS)
+        aggregator.add(make_analysis("a1", "reject", confidence=0.9))
+        assert aggregator.current_result().consensus_value == "reject"
+        
+        for i in range(3):
+            aggregator.add(make_analysis(f"b{i}", "approve", confidence=0.6))
+        result = aggregator.current_result()
+        
+        assert result.consensus_value == "approve"
+        assert result.agreement_level == pytest.approx(1.8 / 2.7)
+        assert aggregator.count == 4
+        assert aggregator.has_value_disagreement()
+    
+    def test_conflict_state_tracks_confidence_range(self):
+        """Confidence mismatch is detected from the running min/max."""
+        aggregator = IncrementalConsensusAggregator()
+        aggregator.add(make_analysis("a1", "approve", confidence=0.95))
+        assert aggregator.detect_conflicts() == []
+        
+        aggregator.add(make_analysis("a2", "approve", confidence=0.2))
+        conflicts = aggregator.detect_conflicts()
+        assert [c.conflict_type.value for c in conflicts] == ["confidence_mismatch"]
+    
+    def test_threshold_consensus_and_decision(self):
+        """Only qualified analyses count and the winner is fixed once unreachable."""
+        aggregator = IncrementalConsensusAggregator(ConsensusMethod.THRESHOLD_CONSENSUS, 0.5)
+        aggregator.add(make_analysis("low", "reject", confidence=0.3))
+        assert aggregator.current_result().consensus_value is None
+        
+        for i in range(4):
+            aggregator.add(make_analysis(f"a{i}", "approve", confidence=0.9))
+        assert aggregator.current_result().participating_agents == ["a0", "a1", "a2", "a3"]
+        assert aggregator.is_decided(pending_count=3)
+        assert not aggregator.is_decided(pending_count=4)
+
+
+class TestConsensusEngine:
+    """Test consensus calculation through the engine."""
+    
+    @pytest.fixture
+    def engine(self):
+        return ConsensusEngine(ConsensusEngineConfig(cache_max_entries=8))
+    
+    @pytest.mark.asyncio
+    async def test_repeated_consensus_hits_cache(self, engine):
+        """Identical analyses are served from the cache."""
+        analyses = [make_analysis("a1", "approve"), make_analysis("a2", "approve")]
+        
+        first = await engine.calculate_consensus(analyses, ConsensusMethod.SIMPLE_VOTING)
+        second = await engine.calculate_consensus(list(reversed(analyses)), ConsensusMethod.SIMPLE_VOTING)
+        
+        assert first is second
+        info = engine.get_operational_info()
+        assert info['metrics']['cache_hits'] == 1
+        assert info['cache']['hit_rate'] == pytest.approx(0.5)
+
+
+class TestAgentAnalysisCollection:
+    """Test concurrent agent collection with deadlines and early completion."""
+    
+    @staticmethod
+    def provider(result, delay, confidence=0.9):
+        async def _provide(workflow):
+            await asyncio.sleep(delay)
+            return make_analysis(f"agent-{result}-{delay}", result, confidence)
+        return _provide
+    
+    @pytest.mark.asyncio
+    async def test_slow_agent_times_out(self):
+        """Agents exceeding their deadline are dropped from the round."""
+        engine = ConsensusEngine(ConsensusEngineConfig(enable_early_completion=False))
+        engine.register_agent_provider("fast", self.provider("approve", 0.01))
+        engine.register_agent_provider("slow", self.provider("approve", 5))
+        workflow = DecisionWorkflow(decision_type="rollout", required_agents=["fast", "slow"],
+                                    agent_timeout_seconds=1)
+        
+        analyses = await engine._collect_agent_analyses(workflow)
+        
+        assert [a.result for a in analyses] == ["approve"]
+        assert engine.get_operational_info()['metrics']['agent_timeouts'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_early_completion_records_late_responses(self):
+        """Once the outcome is fixed the round ends and stragglers are recorded."""
+        engine = ConsensusEngine(ConsensusEngineConfig())
+        for name in ("a1", "a2", "a3"):
+            engine.register_agent_provider(name, self.provider("approve", 0.01))
+        engine.register_agent_provider("late", self.provider("reject", 0.3))
+        workflow = DecisionWorkflow(decision_type="rollout", required_agents=["a1", "a2", "a3", "late"],
+                                    consensus_method=ConsensusMethod.SIMPLE_VOTING,
+                                    consensus_threshold=0.5, confidence_threshold=0.5)
+        
+        result = await engine.orchestrate_decision(workflow)
+        assert result.participating_agents and len(result.participating_agents) == 3
+        
+        await asyncio.sleep(0.4)
+        late = engine.get_late_responses()
+        assert len(late) == 1
+        assert late[0]['agreed_with_consensus'] is False
+        
+        latency = engine.get_decision_latency_stats()['simple_voting']
+        assert latency['count'] == 1
+        assert latency['p50_ms'] < 300
@@ -0,0 +1,177 @@
+"""Tests for registry image lookups and batch image validation."""
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gke_autopilot.src.core.image_registry import (
+    HTTPRegistryClient,
+    ImageNotFoundError,
+    RegistryClient,
+    RegistryError,
+    parse_image_reference,
+)
+from gke_autopilot.src.core.validation_engine import ValidationEngine
+from gke_autopilot.src.models.app_config import AppConfig, IngressConfig
+
+
+DIGEST = "sha256:" + "a" * 64
+
+
+class FakeRegistry:
+    """Registry v2 stand-in with an anonymous bearer-token challenge."""
+
+    def __init__(self):
+        self.valid_token = "token-1"
+        self.token_requests = 0
+        self.manifest_requests = 0
+        self.images = {("team/app", "1.0"), ("team/api", "2.0")}
+        self.url = None
+
+    async def token(self, request):
+        self.token_requests += 1
+        return web.json_response({"token": self.valid_token})
+
+    async def manifest(self, request):
+        self.manifest_requests += 1
+        if request.headers.get("Authorization") != f"Bearer {self.valid_token}":
+            challenge = f'Bearer realm="{self.url}/token",service="registry.test"'
+            return web.Response(status=401, headers={"WWW-Authenticate": challenge})
+
+        repository = request.match_info["repository"]
+        if (repository, request.match_info["reference"]) not in self.images:
+            return web.Response(status=404)
+        return web.Response(headers={"Docker-Content-Digest": DIGEST,
+                                     "Content-Type": "application/vnd.oci.image.manifest.v1+json"})
+
+
+@pytest.fixture
+async def registry():
+    fake = FakeRegistry()
+    app = web.Application()
+    app.router.add_get("/token", fake.token)
+    app.router.add_route("HEAD", "/v2/{repository:.+}/manifests/{reference}", fake.manifest)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+async def client(registry):
+    registry_client = HTTPRegistryClient(registry_urls={"registry.test": registry.url})
+    yield registry_client
+    await registry_client.close()
+
+
+def app(name, image):
+    return AppConfig(name=name, image=image, ingress_config=IngressConfig(enabled=False))
+
+
+class TestImageReferences:
+    """Test image reference parsing."""
+
+    def test_parse_image_reference(self):
+        """Test registries, Docker Hub library images, tags and digests are recognized."""
+        assert parse_image_reference("nginx:1.25").cache_key == "docker.io/library/nginx:1.25"
+        assert parse_image_reference("localhost:5000/team/app").reference == "latest"
+
+        pinned = parse_image_reference(f"gcr.io/project/app@{DIGEST}")
+        assert (pinned.registry, pinned.repository, pinned.digest) == ("gcr.io", "project/app", DIGEST)
+
+        with pytest.raises(ValueError):
+            parse_image_reference("bad image")
+
+
+class TestHTTPRegistryClient:
+    """Test manifest lookups and bearer-token handling."""
+
+    async def test_challenge_token_is_cached(self, registry, client):
+        """Test the challenge is answered once and the token reused."""
+        manifest = await client.get_manifest(parse_image_reference("registry.test/team/app:1.0"))
+        assert manifest.digest == DIGEST
+
+        await client.get_manifest(parse_image_reference("registry.test/team/app:1.0"))
+        assert registry.token_requests == 1
+        assert registry.manifest_requests == 3
+
+    async def test_expired_token_is_rechallenged(self, registry, client):
+        """Test a 401 with a cached token drops it and fetches a new one."""
+        reference = parse_image_reference("registry.test/team/app:1.0")
+        await client.get_manifest(reference)
+
+        registry.valid_token = "token-2"
+        manifest = await client.get_manifest(reference)
+
+        assert manifest.digest == DIGEST
+        assert registry.token_requests == 2
+        assert client._tokens[("registry.test", "team/app")] == "token-2"
+
+    async def test_missing_image(self, client):
+        """Test a 404 raises ImageNotFoundError."""
+        with pytest.raises(ImageNotFoundError):
+            await client.get_manifest(parse_image_reference("registry.test/team/app:9.9"))
+
+    async def test_unreachable_registry(self):
+        """Test connection errors surface as RegistryError."""
+        registry_client = HTTPRegistryClient(registry_urls={"registry.test": "http://127.0.0.1:9"},
+                                             timeout_seconds=2)
+        try:
+            with pytest.raises(RegistryError):
+                await registry_client.get_manifest(parse_image_reference("registry.test/team/app:1.0"))
+        finally:
+            await registry_client.close()
+
+
+class ExplodingRegistryClient(RegistryClient):
+    """Registry client failing with an error that is not a RegistryError."""
+
+    async def get_manifest(self, reference):
+        raise aiohttp.ServerDisconnectedError()
+
+
+class TestValidationEngineImages:
+    """Test batch validation image checks."""
+
+    async def test_validate_many_checks_each_image_once(self, registry, client):
+        """Test shared images are looked up once and missing images reported."""
+        engine = ValidationEngine(registry_client=client)
+        batch = await engine.validate_many([
+            app("app-a", "registry.test/team/app:1.0"),
+            app("app-b", "registry.test/team/app:1.0"),
+            app("api", "registry.test/team/api:2.0"),
+            app("gone", "registry.test/team/gone:1.0"),
+        ])
+
+        assert set(batch.image_checks) == {
+            "registry.test/team/app:1.0", "registry.test/team/api:2.0", "registry.test/team/gone:1.0"
+        }
+        assert batch.image_checks["registry.test/team/app:1.0"].digest == DIGEST
+        assert batch.image_checks["registry.test/team/gone:1.0"].exists is False
+        assert not batch.reports["gone"].valid
+
+        # Cached: repeating the batch makes no registry requests
+        requests = registry.manifest_requests
+        await engine.validate_many([app("app-a", "registry.test/team/app:1.0")])
+        assert registry.manifest_requests == requests
+
+    async def test_unexpected_errors_do_not_abort_batch(self, client):
+        """Test a client error outside RegistryError marks only that image unverified."""
+        engine = ValidationEngine(registry_client=ExplodingRegistryClient())
+
+        check = await engine.check_image("registry.test/team/app:1.0")
+        assert check.exists is None
+        assert "ServerDisconnectedError" in check.error
+
+        batch = await engine.validate_many([app("a", "registry.test/team/app:1.0"), app("b", "nginx:1.25")])
+        assert [result.exists for result in batch.image_checks.values()] == [None, None]
+
+    async def test_context_manager_wires_http_client(self):
+        """Test entering the engine supplies and then releases an HTTP registry client."""
+        engine = ValidationEngine()
+        async with engine:
+            assert isinstance(engine.registry_client, HTTPRegistryClient)
+        assert engine.registry_client is None
+        assert engine.session is None
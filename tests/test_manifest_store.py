@@ -0,0 +1,107 @@
+"""Tests for manifest fingerprints, the fingerprint store and three-way diffs."""
+
+import json
+import threading
+from types import SimpleNamespace
+
+from gke_autopilot.src.deployment.application_deployer import ApplicationDeployer
+from gke_autopilot.src.deployment.manifest_store import (
+    FINGERPRINT_ANNOTATION,
+    ManifestFingerprintStore,
+    manifest_fingerprint,
+    stamp_fingerprint,
+    three_way_diff,
+)
+from gke_autopilot.src.models.app_config import AppConfig, IngressConfig
+
+
+def deployment(replicas=1, **metadata):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", **metadata},
+        "spec": {"replicas": replicas},
+    }
+
+
+class TestManifestFingerprints:
+    """Test fingerprints ignore server-populated fields and diffs classify objects."""
+
+    def test_fingerprint_ignores_server_fields(self):
+        """Test status, resourceVersion and the fingerprint annotation do not change the hash."""
+        fingerprint = manifest_fingerprint(deployment())
+        live = deployment(resourceVersion="42", uid="abc")
+        live["status"] = {"readyReplicas": 1}
+        stamp_fingerprint(live, fingerprint)
+
+        assert manifest_fingerprint(live) == fingerprint
+        assert manifest_fingerprint(deployment(replicas=2)) != fingerprint
+
+    def test_three_way_diff(self):
+        """Test created, updated, drifted, unchanged and removed objects are separated."""
+        desired = {"new": "n1", "edited": "e2", "deleted-live": "d1", "same": "s1"}
+        last_applied = {"edited": "e1", "deleted-live": "d1", "same": "s1", "gone": "g1"}
+        live = {"edited": "e1", "deleted-live": None, "same": "s1"}
+
+        diff = three_way_diff(desired, last_applied, live)
+
+        assert diff.to_create == ["new"]
+        assert diff.to_update == ["edited"]
+        assert diff.drifted == ["deleted-live"]
+        assert diff.unchanged == ["same"]
+        assert diff.removed == ["gone"]
+        assert diff.changed == ["new", "edited", "deleted-live"]
+
+    def test_diff_without_live_state_trusts_last_applied(self):
+        """Test unknown live state treats matching fingerprints as unchanged."""
+        diff = three_way_diff({"same": "s1"}, {"same": "s1"}, None)
+        assert diff.is_noop
+        assert diff.unchanged == ["same"]
+
+
+class TestManifestFingerprintStore:
+    """Test fingerprints are scoped, persisted and forgotten."""
+
+    def test_record_persists_per_scope(self, tmp_path):
+        """Test recorded fingerprints survive a reload and stay scoped per app."""
+        cache = tmp_path / "fingerprints.json"
+        store = ManifestFingerprintStore(cache)
+        store.record("prod", "default", "web", {"a": "1"}, "deploy-1")
+
+        reloaded = ManifestFingerprintStore(cache)
+        assert reloaded.get_last_applied("prod", "default", "web") == {"a": "1"}
+        assert reloaded.get_last_applied("prod", "default", "api") == {}
+        assert json.loads(cache.read_text())["prod/default/web"]["deployment_id"] == "deploy-1"
+
+        reloaded.forget("prod", "default", "web")
+        assert ManifestFingerprintStore(cache).get_last_applied("prod", "default", "web") == {}
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        """Test a corrupt cache file starts an empty store."""
+        cache = tmp_path / "fingerprints.json"
+        cache.write_text("{not json")
+
+        assert ManifestFingerprintStore(cache).get_last_applied("prod", "default", "web") == {}
+
+    async def test_live_annotations_read_off_event_loop(self):
+        """Test the deployer's live fingerprint reads run in a worker thread."""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def get_live_annotations(keyed_manifests, annotation, cluster_name, location, namespace):
+            calls.append(threading.get_ident())
+            assert annotation == FINGERPRINT_ANNOTATION
+            return {key: "old" for key in keyed_manifests}
+
+        deployer = ApplicationDeployer.__new__(ApplicationDeployer)
+        deployer.gke_client = SimpleNamespace(get_live_annotations=get_live_annotations)
+        deployer.fingerprint_store = ManifestFingerprintStore(None)
+        deployer.fingerprint_store.record("prod", "default", "web", {"key": "new"})
+
+        diff = await deployer._diff_manifests(
+            {"key": deployment()}, {"key": "new"}, AppConfig(name="web", image="web:1", ingress_config=IngressConfig(enabled=False)),
+            "prod", "us-central1", "default"
+        )
+
+        assert diff.drifted == ["key"]
+        assert calls and calls[0] != loop_thread
@@ -0,0 +1,133 @@
+"""Tests for the columnar metric store generated by the metrics engine implementation script."""
+
+import ast
+import importlib.util
+import json
+import random
+import statistics
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "implement_metrics_engine_beast_mode.py"
+
+
+@pytest.fixture
+def metric_store(tmp_path, monkeypatch):
+    """Generate the metrics package into tmp_path and import its metric_store module."""
+    # Only the generator function is needed; the script's module-level imports pull in the PDCA stack
+    tree = ast.parse(SCRIPT_PATH.read_text())
+    generator = next(node for node in tree.body
+                     if isinstance(node, ast.FunctionDef) and node.name == "implement_actual_metrics_engine")
+    namespace = {"Path": Path}
+    exec(compile(ast.Module([generator], type_ignores=[]), str(SCRIPT_PATH), "exec"), namespace)
+
+    monkeypatch.chdir(tmp_path)
+    namespace["implement_actual_metrics_engine"](None)
+
+    path = tmp_path / "src" / "beast_mode" / "metrics" / "metric_store.py"
+    spec = importlib.util.spec_from_file_location("generated_metric_store", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMetricStore:
+    """Test persistence, approach naming and running statistics of the metric store."""
+
+    def test_append_and_reload(self, metric_store, tmp_path):
+        """Test measurements persist as JSONL and reload lazily in order."""
+        data_dir = tmp_path / "metrics_data"
+        started = datetime(2024, 1, 1, 12, 0, 0)
+
+        store = metric_store.MetricStore(data_dir)
+        for offset, value in enumerate([1.5, 2.5, 4.0]):
+            store.append("execution_time", "systematic", value, timestamp=started + timedelta(seconds=offset),
+                         context={"run": offset} if offset == 0 else None)
+        store.close()
+
+        reloaded = metric_store.MetricStore(data_dir)
+        assert reloaded.metric_names() == ["execution_time"]
+        series = reloaded.series("execution_time", "systematic")
+        assert list(series.values) == [1.5, 2.5, 4.0]
+        assert series.timestamps[0] == started.timestamp()
+        assert series.contexts == [{"run": 0}, None, None]
+        assert reloaded.count() == 3
+
+    def test_baseline_files_map_to_adhoc(self, metric_store, tmp_path):
+        """Test the ad-hoc approach is stored as "baseline" and read back as "adhoc"."""
+        data_dir = tmp_path / "metrics_data"
+        store = metric_store.MetricStore(data_dir)
+        store.append("error_rate", "adhoc", 0.25)
+        store.close()
+
+        path = data_dir / "error_rate_baseline_measurements.jsonl"
+        record = json.loads(path.read_text())
+        assert (record["approach_type"], record["category"], record["value"]) == ("baseline", "error_rate", 0.25)
+
+        # Files already named after the in-memory approach load the same way
+        (data_dir / "latency_adhoc_measurements.jsonl").write_text(
+            json.dumps({"timestamp": "2024-01-01T00:00:00", "value": 3}) + "\n"
+        )
+
+        reloaded = metric_store.MetricStore(data_dir)
+        assert list(reloaded.series("error_rate", "adhoc").values) == [0.25]
+        assert list(reloaded.series("latency", "adhoc").values) == [3.0]
+        assert reloaded.series("error_rate", "baseline") is None
+        assert reloaded.count("systematic") == 0
+
+    def test_torn_and_invalid_lines_are_skipped(self, metric_store, tmp_path):
+        """Test a torn final line and malformed records do not stop a reload."""
+        data_dir = tmp_path / "metrics_data"
+        data_dir.mkdir()
+        lines = [
+            json.dumps({"timestamp": "2024-01-01T00:00:00", "value": 1}),
+            "not json",
+            json.dumps([1, 2, 3]),
+            json.dumps({"timestamp": "2024-01-01T00:00:01"}),
+            json.dumps({"timestamp": "yesterday", "value": 5}),
+            json.dumps({"timestamp": "2024-01-01T00:00:02", "value": 2}),
+        ]
+        torn = json.dumps({"timestamp": "2024-01-01T00:00:03", "value": 3})[:20]
+        (data_dir / "throughput_systematic_measurements.jsonl").write_text("\n".join(lines) + "\n" + torn)
+        (data_dir / "empty_systematic_measurements.jsonl").write_text("")
+
+        store = metric_store.MetricStore(data_dir)
+        assert list(store.series("throughput", "systematic").values) == [1.0, 2.0]
+        assert len(store.series("empty", "systematic")) == 0
+
+    def test_running_statistics_match_statistics_module(self, metric_store):
+        """Test the Welford mean and sample variance agree with statistics.mean/variance."""
+        rng = random.Random(7)
+        values = [1e6 + rng.gauss(0, 3) for _ in range(500)]
+
+        series = metric_store.MetricSeries()
+        assert (series.mean, series.variance) == (0.0, 0.0)
+        for index, value in enumerate(values):
+            series.append(float(index), value)
+
+        assert series.mean == pytest.approx(statistics.mean(values), rel=1e-12)
+        assert series.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+        assert series.stdev == pytest.approx(statistics.stdev(values), rel=1e-9)
+
+    def test_baselines_include_persisted_measurements(self, metric_store, tmp_path):
+        """Test baselines are running means read from the store, persisted measurements included."""
+        data_dir = tmp_path / "metrics_data"
+        store = metric_store.MetricStore(data_dir)
+        for value in [2.0, 4.0]:
+            store.append("execution_time", "systematic", value)
+        store.append("error_rate", "adhoc", 0.5)
+        store.close()
+
+        reloaded = metric_store.MetricStore(data_dir)
+        systematic = reloaded.baselines("systematic")
+        adhoc = reloaded.baselines("adhoc")
+        assert dict(systematic) == {"execution_time": 3.0}
+        assert dict(adhoc) == {"error_rate": 0.5}
+        assert "error_rate" not in systematic
+
+        reloaded.append("execution_time", "systematic", 6.0)
+        assert systematic["execution_time"] == 4.0
+        assert len((data_dir / "execution_time_systematic_measurements.jsonl").read_text().splitlines()) == 3
@@ -0,0 +1,136 @@
+"""
+Tests for Beast Mode Agent Network trend analytics
+
+Covers the columnar metric history and batched trend analyzer used by the
+network intelligence engine.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.beast_mode.agent_network.intelligence.trend_analytics import (
+    BatchTrendAnalyzer,
+    MetricHistory,
+    linear_slope,
+)
+from src.beast_mode.agent_network.intelligence.network_intelligence_engine import (
+    NetworkIntelligenceEngine,
+)
+
+
+class TestTrendAnalytics:
+    """Test the batched trend analytics layer."""
+    
+    def test_linear_slope_matches_least_squares(self):
+        """Closed-form slope matches the expected gradient."""
+        assert linear_slope([1.0, 3.0, 5.0, 7.0]) == pytest.approx(2.0)
+        assert linear_slope([4.0, 4.0, 4.0]) == pytest.approx(0.0)
+        assert linear_slope([1.0]) == 0.0
+    
+    def test_history_is_bounded_and_windowed(self):
+        """History caps samples per series and filters by time window."""
+        history = MetricHistory(max_samples=5)
+        start = datetime(2025, 1, 1)
+        for i in range(10):
+            history.record("agent1", "latency", float(i), start + timedelta(seconds=i))
+        
+        assert len(history) == 5
+        columns = history.snapshot(since=start + timedelta(seconds=7))
+        assert columns[("agent1", "latency")] == [7.0, 8.0, 9.0]
+    
+    def test_batch_analysis_covers_all_series(self):
+        """One analyze call returns slope, EWMA, variance and trend per series."""
+        analyzer = BatchTrendAnalyzer(ewma_alpha=0.5)
+        results = analyzer.analyze({
+            ("agent1", "throughput"): [1.0, 2.0, 3.0, 4.0],
+            ("agent2", "throughput"): [4.0, 3.0, 2.0, 1.0],
+        })
+        
+        rising = results[("agent1", "throughput")]
+        falling = results[("agent2", "throughput")]
+        assert rising.trend == "improving"
+        assert falling.trend == "degrading"
+        assert rising.mean == pytest.approx(2.5)
+        assert rising.variance == pytest.approx(1.25)
+        assert rising.ewma == pytest.approx(3.125)
+    
+    def test_change_point_detection(self):
+        """A clear level shift is located; noise-free constant series is not."""
+        analyzer = BatchTrendAnalyzer()
+        shifted = [10.0] * 50 + [20.0] * 50
+        results = analyzer.analyze({
+            ("agent1", "latency"): shifted,
+            ("agent2", "latency"): [10.0] * 100,
+        })
+        
+        assert results[("agent1", "latency")].change_point == 50
+        assert results[("agent1", "latency")].change_magnitude == pytest.approx(10.0)
+        assert results[("agent2", "latency")].change_point is None
+    
+    def test_variance_is_stable_for_large_offsets(self):
+        """Variance of small deviations around a huge mean is not lost to cancellation."""
+        results = BatchTrendAnalyzer().analyze({
+            ("agent1", "bytes"): [1e9 + 4.0, 1e9 + 7.0, 1e9 + 13.0, 1e9 + 16.0],
+        })
+        
+        assert results[("agent1", "bytes")].variance == pytest.approx(22.5)
+    
+    @pytest.mark.asyncio
+    async def test_async_analysis_runs_off_loop(self):
+        """Async analysis snapshots history and returns analytics."""
+        history = MetricHistory()
+        for i in range(3600):
+            history.record("agent1", "cpu", float(i % 60))
+        
+        results = await BatchTrendAnalyzer().analyze_async(history)
+        assert results[("agent1", "cpu")].sample_count == 3600
+    
+    def test_engine_trends_use_batched_analytics(self):
+        """Engine reports network trends from the columnar history."""
+        engine = NetworkIntelligenceEngine()
+        analyzer = engine.trend_analyzer
+        for i in range(20):
+            engine.metric_history.record("network", "parallel_efficiency", 0.5 + i * 0.02)
+        engine.series_analytics = analyzer.analyze(engine.metric_history.snapshot())
+        
+        trends = engine._analyze_performance_trends()
+        assert trends["parallel_efficiency"] == "improving"
+        assert "series_details" in trends
+    
+    def test_engine_records_only_new_agent_samples(self):
+        """Each cycle records every metric once, skipping samples already recorded."""
+        engine = NetworkIntelligenceEngine()
+        start = datetime(2025, 1, 1)
+        agent = SimpleNamespace(agent_id="agent1", performance_history=[
+            SimpleNamespace(metric_name="latency", value=10.0, timestamp=start),
+            SimpleNamespace(metric_name="cpu", value=0.5, timestamp=start),
+        ])
+        state = SimpleNamespace(active_agents=[agent])
+        metrics = SimpleNamespace(timestamp=start)
+        
+        engine._record_metric_samples(state, metrics)
+        agent.performance_history.append(
+            SimpleNamespace(metric_name="latency", value=12.0, timestamp=start + timedelta(seconds=1))
+        )
+        engine._record_metric_samples(state, metrics)
+        
+        columns = engine.metric_history.snapshot()
+        assert columns[("agent1", "latency")] == [10.0, 12.0]
+        assert columns[("agent1", "cpu")] == [0.5]
+    
+    @pytest.mark.asyncio
+    async def test_shift_patterns_are_typed_and_reported_once(self):
+        """A level shift becomes one pattern typed by its metric, not one per cycle."""
+        engine = NetworkIntelligenceEngine()
+        engine.series_analytics = engine.trend_analyzer.analyze({
+            ("network", "error_rate"): [0.01] * 20 + [0.04] * 20,
+        })
+        current = SimpleNamespace()
+        
+        first = await engine._identify_patterns(current)
+        second = await engine._identify_patterns(current)
+        
+        assert [p.pattern_id for p in first] == ["shift_network_error_rate_20"]
+        assert first[0].pattern_type.name == "ERROR_PREVENTION"
+        assert second == []
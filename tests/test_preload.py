@@ -0,0 +1,117 @@
+"""Tests for resolving and preloading cluster images."""
+
+import subprocess
+
+import pytest
+
+from gke_local.cluster.preload import ImagePreloader, resolve_images, split_image_reference
+from gke_local.cluster.registry import RegistryStatus
+from gke_local.cluster.registry_client import ManifestInfo, RegistryAPIError
+
+
+IMAGE_ID = "sha256:" + "1" * 64
+LAYER = "sha256:" + "abcdef012345" + "0" * 52
+
+
+class FakeRegistryAPI:
+    """Registry API client holding one manifest per (repository, tag)."""
+
+    def __init__(self, manifests):
+        self.manifests = manifests
+        self.closed = False
+
+    async def get_manifest_info(self, repository, tag):
+        if (repository, tag) not in self.manifests:
+            raise RegistryAPIError(f"Manifest {repository}:{tag} returned HTTP 404")
+        return self.manifests[(repository, tag)]
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeRegistryManager:
+    """Registry manager answering docker commands and recording them."""
+
+    registry_host = "localhost"
+    registry_port = 5000
+
+    def __init__(self, manifests=None):
+        self.api = FakeRegistryAPI(manifests or {})
+        self.commands = []
+
+    async def get_registry_status(self):
+        return RegistryStatus(name="registry", running=True, port=5000, host="localhost", container_id="abc")
+
+    def api_client(self, status):
+        return self.api
+
+    async def run_command(self, cmd):
+        self.commands.append(cmd)
+        if cmd[:3] == ['docker', 'image', 'inspect']:
+            return subprocess.CompletedProcess(cmd, 0, f"{IMAGE_ID} 1000\n", "")
+        if cmd[:2] == ['docker', 'push']:
+            # Pushing registers the manifest with the uploaded layer
+            self.api.manifests[("team/app", "1.0")] = ManifestInfo(
+                repository="team/app", tag="1.0", config_digest=IMAGE_ID, layers={LAYER: 4096}
+            )
+            return subprocess.CompletedProcess(cmd, 0, "abcdef012345: Pushed\n999999999999: Layer already exists\n", "")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+
+class TestImageResolution:
+    """Test image references are found and split."""
+
+    def test_resolve_images_from_nested_pod_specs(self):
+        """Test images are collected from templates, job templates and lists in first-seen order."""
+        manifests = [
+            {"kind": "Deployment", "spec": {"template": {"spec": {
+                "initContainers": [{"name": "init", "image": "busybox:1.36"}],
+                "containers": [{"name": "app", "image": "gcr.io/p/app:1.0"}]}}}},
+            {"kind": "CronJob", "spec": {"jobTemplate": {"spec": {"template": {"spec": {
+                "containers": [{"name": "job", "image": "gcr.io/p/app:1.0"}]}}}}}},
+            {"kind": "List", "items": [{"kind": "Pod", "spec": {
+                "containers": [{"name": "sidecar", "image": "envoyproxy/envoy:v1.29"}, {"name": "empty"}]}}]},
+            {"kind": "ConfigMap", "data": {"image": "not-a-container"}},
+        ]
+
+        assert resolve_images(manifests) == ["busybox:1.36", "gcr.io/p/app:1.0", "envoyproxy/envoy:v1.29"]
+
+    @pytest.mark.parametrize("image, expected", [
+        ("nginx", (None, "nginx", None, None)),
+        ("nginx:1.25", (None, "nginx", "1.25", None)),
+        ("team/app:1.0", (None, "team/app", "1.0", None)),
+        ("localhost:5000/app", ("localhost:5000", "app", None, None)),
+        ("gcr.io/p/app:1.0@sha256:abc", ("gcr.io", "p/app", "1.0", "sha256:abc")),
+        ("registry.local:5000/team/app@sha256:abc", ("registry.local:5000", "team/app", None, "sha256:abc")),
+    ])
+    def test_split_image_reference(self, image, expected):
+        """Test registry hosts, ports, tags and digests are separated."""
+        assert split_image_reference(image) == expected
+
+
+class TestImagePreloader:
+    """Test pushes are skipped when the registry already holds the image."""
+
+    async def test_push_skipped_when_registry_has_image(self):
+        """Test an image with the same config digest in the registry is not pushed again."""
+        manager = FakeRegistryManager({
+            ("team/app", "1.0"): ManifestInfo(repository="team/app", tag="1.0", config_digest=IMAGE_ID)
+        })
+        report = await ImagePreloader(manager).preload(["team/app:1.0"])
+
+        result = report.results[0]
+        assert result.already_in_registry and not result.pushed
+        assert not any(cmd[:2] in (['docker', 'push'], ['docker', 'tag']) for cmd in manager.commands)
+        assert manager.api.closed
+
+    async def test_push_when_registry_differs(self):
+        """Test a missing image is tagged and pushed, counting uploaded layer bytes."""
+        manager = FakeRegistryManager()
+        report = await ImagePreloader(manager).preload(["team/app:1.0"])
+
+        result = report.results[0]
+        assert report.success
+        assert result.pushed and not result.already_in_registry
+        assert result.registry_image == "localhost:5000/team/app:1.0"
+        assert (result.layers_pushed, result.layers_reused, result.bytes_pushed) == (1, 1, 4096)
+        assert ['docker', 'push', "localhost:5000/team/app:1.0"] in manager.commands
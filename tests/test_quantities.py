@@ -0,0 +1,62 @@
+"""Tests for Kubernetes resource quantity parsing."""
+
+from decimal import Decimal
+
+import pytest
+
+from gke_autopilot.src.core.quantities import (
+    cpu_to_millicores,
+    format_cpu,
+    format_memory,
+    memory_to_bytes,
+    memory_to_mib,
+    parse_quantity,
+    storage_to_gib,
+)
+
+
+class TestQuantities:
+    """Test quantity parsing, unit conversion and formatting."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("250m", Decimal("0.25")),
+        ("1.5", Decimal("1.5")),
+        ("512Mi", Decimal(512 * 2 ** 20)),
+        ("2G", Decimal(2 * 10 ** 9)),
+        ("1e3", Decimal(1000)),
+        ("100K", Decimal(100000)),
+        (2, Decimal(2)),
+    ])
+    def test_parse_quantity(self, value, expected):
+        """Test binary and decimal suffixes, exponents and plain numbers."""
+        assert parse_quantity(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "abc", "10 Gi", "1.2.3", None, True, [1]])
+    def test_malformed_quantities(self, value):
+        """Test malformed quantities parse to None."""
+        assert parse_quantity(value) is None
+        assert memory_to_mib(value) is None
+
+    def test_cpu_rounds_up_to_millicores(self):
+        """Test fractional millicores round up."""
+        assert cpu_to_millicores("0.5") == 500
+        assert cpu_to_millicores("2") == 2000
+        assert cpu_to_millicores("100u") == 1
+
+    def test_decimal_suffixes_are_powers_of_ten(self):
+        """Test decimal suffixes convert to binary units rounded down."""
+        assert memory_to_bytes("256M") == 256_000_000
+        assert memory_to_mib("256M") == 244
+        assert memory_to_mib("512M") == 488
+        assert memory_to_mib("1Gi") == 1024
+        assert storage_to_gib("10G") == 9
+        assert storage_to_gib("10Gi") == 10
+        assert storage_to_gib("1T") == 931
+
+    def test_formatting(self):
+        """Test formatting matches how Kubernetes prints quantities."""
+        assert format_cpu(250) == "250m"
+        assert format_cpu(2000) == "2"
+        assert format_memory(512 * 2 ** 20) == "512Mi"
+        assert format_memory(2 * 2 ** 30) == "2Gi"
+        assert format_memory(1000) == "1000"
@@ -0,0 +1,52 @@
+"""
+Tests for the Beast Mode RCA symptom matcher
+
+Covers literal extraction, the Aho-Corasick prefilter and indexed matching
+through RCAEngine.
+"""
+
+from src.beast_mode.rca.rca_engine import RCAEngine, RCAPattern
+from src.beast_mode.rca.symptom_matcher import LiteralAutomaton, required_literal
+
+
+class TestSymptomMatcher:
+    """Test the compiled, indexed symptom matcher."""
+    
+    def test_required_literal_extraction(self):
+        """Longest mandatory literal run is extracted; alternations are not indexed."""
+        assert required_literal(r"cannot connect to.*docker.*daemon") == "cannot connect to"
+        assert required_literal(r"Permission Denied") == "permission denied"
+        assert required_literal(r"(foo|bar)") is None
+        assert required_literal(r"[") is None
+    
+    def test_automaton_finds_overlapping_literals(self):
+        """All literals are reported, including overlapping and nested ones."""
+        automaton = LiteralAutomaton(["daemon", "docker daemon", "mon", "absent"])
+        found = automaton.find("the docker daemon is down")
+        assert found == {0, 1, 2}
+    
+    def test_engine_matches_with_prefilter(self):
+        """RCAEngine finds default patterns and reports matching statistics."""
+        engine = RCAEngine()
+        result = engine.analyze_root_cause(
+            "Docker not available",
+            ["Cannot connect to the Docker daemon", "docker daemon is not running"],
+            {"tool": "docker"}
+        )
+        
+        assert any("Docker" in cause for cause in result.root_causes)
+        stats = engine.get_pattern_statistics()['matching_performance']
+        assert stats['match_calls'] == 1
+        assert stats['candidates_evaluated'] < stats['patterns_considered']
+    
+    def test_pattern_updates_invalidate_compiled_cache(self):
+        """Updating a pattern's regexes takes effect on the next analysis."""
+        engine = RCAEngine()
+        pattern = RCAPattern(name="Quota", symptom_patterns=[r"quota exceeded"],
+                             root_cause="Project quota exhausted", confidence_score=0.9)
+        engine.add_pattern(pattern)
+        
+        assert engine._find_matching_patterns(["cpu quota exceeded"], {})
+        engine.update_pattern(pattern.pattern_id, {'symptom_patterns': [r"limit reached"]})
+        assert not engine._find_matching_patterns(["cpu quota exceeded"], {})
+        assert engine._find_matching_patterns(["memory limit reached"], {})
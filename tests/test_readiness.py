@@ -0,0 +1,165 @@
+"""Tests for watch-based readiness tracking and backoff polling."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kubernetes import client
+
+from gke_autopilot.src.core import readiness as readiness_module
+from gke_autopilot.src.core.readiness import BackoffPolicy, ReadinessEngine
+
+
+def deployment(resource_version, ready_replicas=0):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "namespace": "default", "generation": 1,
+                     "resourceVersion": resource_version},
+        "spec": {
+            "replicas": 2,
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {"metadata": {"labels": {"app": "web"}},
+                         "spec": {"containers": [{"name": "web", "image": "web:1"}]}},
+        },
+        "status": {"observedGeneration": 1, "readyReplicas": ready_replicas,
+                   "updatedReplicas": ready_replicas, "availableReplicas": ready_replicas},
+    }
+
+
+class FakeDeploymentsAPI:
+    """Minimal apps/v1 deployments endpoint serving scripted list and watch responses."""
+
+    def __init__(self):
+        self.lists = []
+        self.watches = []
+        # resourceVersion -> watch events; missing versions are expired (410)
+        self.events = {}
+
+    async def handle(self, request):
+        if request.query.get("watch") != "true":
+            resource_version = str(len(self.lists) + 1)
+            self.lists.append(resource_version)
+            return web.json_response({
+                "apiVersion": "apps/v1",
+                "kind": "DeploymentList",
+                "metadata": {"resourceVersion": resource_version},
+                "items": [deployment(resource_version)],
+            })
+
+        resource_version = request.query.get("resourceVersion")
+        self.watches.append(resource_version)
+        events = self.events.get(resource_version)
+        if events is None:
+            events = [{"type": "ERROR", "object": {"kind": "Status", "code": 410,
+                                                   "reason": "Expired", "message": "too old"}}]
+
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for event in events:
+            await response.write((json.dumps(event) + "\n").encode())
+        if not events:
+            await asyncio.sleep(0.05)
+        await response.write_eof()
+        return response
+
+
+@pytest.fixture
+async def fake_api():
+    api = FakeDeploymentsAPI()
+    app = web.Application()
+    app.router.add_get("/apis/apps/v1/namespaces/{namespace}/deployments", api.handle)
+    server = TestServer(app)
+    await server.start_server()
+
+    configuration = client.Configuration()
+    configuration.host = str(server.make_url("")).rstrip("/")
+    api.api_client = client.ApiClient(configuration)
+    yield api
+    api.api_client.close()
+    await server.close()
+
+
+class TestDeploymentWatch:
+    """Test the list-then-watch loop against a fake API server."""
+
+    async def test_relist_on_410_and_deleted(self, fake_api):
+        """Test an expired watch relists and DELETED events map to None."""
+        fake_api.events["2"] = [
+            {"type": "MODIFIED", "object": deployment("3", ready_replicas=2)},
+            {"type": "DELETED", "object": deployment("4", ready_replicas=2)},
+        ]
+        fake_api.events["4"] = []
+        engine = ReadinessEngine(lambda cluster, location: fake_api.api_client)
+
+        stream = engine.watch_deployment("web", "default", "prod", "us-central1")
+        states = []
+        try:
+            async for state in stream:
+                states.append(state)
+                if len(states) == 4:
+                    break
+        finally:
+            await stream.aclose()
+
+        assert fake_api.lists == ["1", "2"]
+        assert fake_api.watches[:2] == ["1", "2"]
+        assert [state.resource_version for state in states[:3]] == ["1", "2", "3"]
+        assert [state.ready for state in states[:3]] == [False, False, True]
+        assert states[3] is None
+
+    async def test_wait_for_ready(self, fake_api):
+        """Test waiting returns the first ready state from the watch."""
+        fake_api.events["1"] = [{"type": "MODIFIED", "object": deployment("2", ready_replicas=2)}]
+        fake_api.events["2"] = []
+        engine = ReadinessEngine(lambda cluster, location: fake_api.api_client)
+
+        ready = await engine.wait_for_deployment_ready("web", "default", "prod", "us-central1", timeout_seconds=10)
+
+        assert ready.ready
+        assert ready.resource_version == "2"
+
+
+class TestPolling:
+    """Test backoff polling for operations that cannot be watched."""
+
+    async def test_poll_until_times_out(self):
+        """Test fetch errors are retried and polling stops at the deadline."""
+        engine = ReadinessEngine(backoff=BackoffPolicy(initial_seconds=0.01, max_seconds=0.02, jitter=0))
+        calls = []
+
+        def fetch():
+            calls.append(len(calls))
+            if len(calls) % 2:
+                raise ConnectionError("flaky")
+            return "PENDING"
+
+        with pytest.raises(TimeoutError, match="cluster create"):
+            await engine.poll_until(fetch, lambda status: status == "DONE", 0.1, "cluster create")
+        assert len(calls) >= 3
+
+        assert await engine.poll_until(lambda: "DONE", lambda status: status == "DONE", 1) == "DONE"
+
+    async def test_poll_changes_backs_off_while_stable(self, monkeypatch):
+        """Test the interval grows while the value is stable and resets on change."""
+        values = iter(["a", "a", "a", "b", "b", "c"])
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(readiness_module.asyncio, "sleep", record_sleep)
+        engine = ReadinessEngine(backoff=BackoffPolicy(initial_seconds=1, max_seconds=30, jitter=0))
+
+        seen = []
+        async for value in engine.poll_changes(lambda: next(values), max_interval=3):
+            seen.append(value)
+            if value == "c":
+                break
+
+        assert seen == ["a", "b", "c"]
+        assert sleeps == [1, 2, 3, 1, 2]
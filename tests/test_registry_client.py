@@ -0,0 +1,180 @@
+"""Tests for the registry API client against a local registry stand-in."""
+
+import asyncio
+import subprocess
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gke_local.cluster.registry import LocalRegistryManager, RegistryStatus
+from gke_local.cluster.registry_client import RegistryAPIClient
+from gke_local.config.models import GKELocalConfig
+
+
+def digest(name):
+    return "sha256:" + name.encode().hex().ljust(64, "0")[:64]
+
+
+class FakeRegistry:
+    """Registry v2 stand-in paginating with Link headers and recording deletes."""
+
+    def __init__(self):
+        # repository -> tag -> (manifest digest, created)
+        self.repositories = {
+            "alpha": {"v1": ("a1", "2024-01-01T00:00:00Z"), "v2": ("a2", "2024-02-01T00:00:00Z"),
+                      "v3": ("a3", "2024-03-01T00:00:00.123456789Z"), "latest": ("a3", "2024-03-01T00:00:00Z")},
+            "beta": {"v1": ("b1", "2024-01-01T00:00:00Z")},
+            "gamma": {}, "delta": {}, "epsilon": {},
+        }
+        self.catalog_pages = 0
+        self.tag_pages = 0
+        self.deleted = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.events = []
+
+    @staticmethod
+    def page(items, request, path):
+        count = int(request.query.get("n", 100))
+        last = request.query.get("last")
+        start = items.index(last) + 1 if last else 0
+        page = items[start:start + count]
+        headers = {}
+        if start + count < len(items):
+            headers["Link"] = f'<{path}?n={count}&last={page[-1]}>; rel="next"'
+        return page, headers
+
+    async def catalog(self, request):
+        self.catalog_pages += 1
+        repositories, headers = self.page(sorted(self.repositories), request, "/v2/_catalog")
+        return web.json_response({"repositories": repositories}, headers=headers)
+
+    async def tags(self, request):
+        repository = request.match_info["repository"]
+        self.tag_pages += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        tags, headers = self.page(sorted(self.repositories[repository]), request,
+                                  f"/v2/{repository}/tags/list")
+        return web.json_response({"name": repository, "tags": tags or None}, headers=headers)
+
+    async def manifest(self, request):
+        repository, tag = request.match_info["repository"], request.match_info["reference"]
+        if request.method == "DELETE":
+            self.deleted.append((repository, tag))
+            self.events.append("delete")
+            return web.Response(status=202)
+
+        if tag not in self.repositories[repository]:
+            return web.json_response({"errors": [{"code": "MANIFEST_UNKNOWN"}]}, status=404)
+        name, _ = self.repositories[repository][tag]
+        return web.json_response(
+            {"schemaVersion": 2, "mediaType": "application/vnd.oci.image.manifest.v1+json",
+             "config": {"digest": digest(f"config-{name}")}, "layers": [{"digest": digest(name), "size": 10}]},
+            headers={"Docker-Content-Digest": digest(name)},
+        )
+
+    async def blob(self, request):
+        config = request.match_info["digest"]
+        for tags in self.repositories.values():
+            for name, created in tags.values():
+                if digest(f"config-{name}") == config:
+                    return web.json_response({"created": created})
+        return web.Response(status=404)
+
+
+@pytest.fixture
+async def registry():
+    fake = FakeRegistry()
+    app = web.Application()
+    app.router.add_get("/v2/_catalog", fake.catalog)
+    app.router.add_get("/v2/{repository}/tags/list", fake.tags)
+    app.router.add_route("*", "/v2/{repository}/manifests/{reference}", fake.manifest)
+    app.router.add_get("/v2/{repository}/blobs/{digest}", fake.blob)
+    server = TestServer(app)
+    await server.start_server()
+    fake.endpoint = f"{server.host}:{server.port}"
+    yield fake
+    await server.close()
+
+
+class TestRegistryAPIClient:
+    """Test catalog traversal, concurrent tag fetches and manifest inspection."""
+
+    async def test_catalog_follows_link_pagination(self, registry):
+        """Test every catalog and tag page is followed via Link headers."""
+        async with RegistryAPIClient(registry.endpoint, page_size=2) as api:
+            assert await api.list_repositories() == ["alpha", "beta", "delta", "epsilon", "gamma"]
+            assert await api.list_tags("alpha") == ["latest", "v1", "v2", "v3"]
+        assert registry.catalog_pages == 3
+        assert registry.tag_pages == 2
+
+    async def test_tags_are_fetched_concurrently(self, registry):
+        """Test tag listings overlap up to max_concurrency on one session."""
+        async with RegistryAPIClient(registry.endpoint, max_concurrency=3) as api:
+            tags = await api.list_all_tags()
+            session = api._session
+
+        assert registry.peak_in_flight == 3
+        assert tags["alpha"] == ["latest", "v1", "v2", "v3"]
+        assert tags["gamma"] == []
+        assert session.closed
+
+    async def test_manifest_info_reads_creation_time(self, registry):
+        """Test the digest and config creation time are resolved, caching config blobs."""
+        async with RegistryAPIClient(registry.endpoint) as api:
+            infos = await api.get_manifest_infos([("alpha", "v3"), ("alpha", "missing")])
+            requests = api.request_count
+            latest = await api.get_manifest_info("alpha", "latest")
+
+            # The config blob is cached, so only the manifest is fetched again
+            assert api.request_count == requests + 1
+
+        assert [info.tag for info in infos] == ["v3"]
+        assert infos[0].digest == latest.digest == digest("a3")
+        assert infos[0].created.isoformat() == "2024-03-01T00:00:00.123456+00:00"
+        assert infos[0].layers == {digest("a3"): 10}
+
+
+class TestRegistryCleanup:
+    """Test cleanup ranks images by creation time and collects garbage last."""
+
+    async def test_cleanup_deletes_before_garbage_collection(self, registry):
+        """Test old digests are deleted and garbage collection runs after every delete."""
+        manager = LocalRegistryManager(GKELocalConfig(project_name="test-project"))
+        host, port = registry.endpoint.split(":")
+        status = RegistryStatus(name=manager.registry_name, running=True, port=int(port), host=host,
+                                container_id="registry")
+
+        async def run_command(cmd):
+            registry.events.append("gc")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch.object(manager, "get_registry_status", return_value=status), \
+                patch.object(manager, "run_command", side_effect=run_command) as mock_run:
+            assert await manager.cleanup_images(keep_latest=1)
+
+        # "latest" shares v3's digest, so only the two older images go
+        assert sorted(registry.deleted) == [("alpha", digest("a1")), ("alpha", digest("a2"))]
+        assert registry.events == ["delete", "delete", "gc"]
+        assert "garbage-collect" in mock_run.call_args.args[0]
+
+    async def test_nothing_deleted_skips_garbage_collection(self, registry):
+        """Test garbage collection only runs when manifests were deleted."""
+        manager = LocalRegistryManager(GKELocalConfig(project_name="test-project"))
+        host, port = registry.endpoint.split(":")
+        status = RegistryStatus(name=manager.registry_name, running=True, port=int(port), host=host,
+                                container_id="registry")
+
+        with patch.object(manager, "get_registry_status", return_value=status), \
+                patch.object(manager, "run_command") as mock_run:
+            assert await manager.cleanup_images(keep_latest=5)
+
+        assert registry.deleted == []
+        mock_run.assert_not_called()
@@ -0,0 +1,74 @@
+"""Tests for the persistent spec index."""
+
+import pytest
+
+from spec_index import SpecIndex
+
+
+@pytest.fixture
+def specs_dir(tmp_path):
+    """Two small specs sharing some vocabulary."""
+    specs = tmp_path / "specs"
+    (specs / "billing").mkdir(parents=True)
+    (specs / "billing" / "requirements.md").write_text(
+        "# Billing Export Pipeline\n\n_Requirements: R1.1, R1.2_\n"
+    )
+    (specs / "billing" / "tasks.md").write_text(
+        "- [ ] 1 Billing export\n"
+        "- [ ] 1.1 Stream billing records\n"
+        "  _Requirements: R1.1, R9.9_\n"
+    )
+    (specs / "costs").mkdir()
+    (specs / "costs" / "design.md").write_text("# Cost Streaming Pipeline\n\nSee R1.1 and Q7.\n")
+    return specs
+
+
+@pytest.fixture
+def index(specs_dir, tmp_path):
+    with SpecIndex(specs_dir, index_path=tmp_path / "index.sqlite", workers=1) as spec_index:
+        yield spec_index
+
+
+class TestSpecIndex:
+    """Test spec indexing, incremental refresh and queries."""
+
+    def test_audit_from_index(self, index):
+        """Test per-spec audits and missing requirements come from parsed files."""
+        stats = index.refresh()
+        assert (stats.specs, stats.files, stats.parsed) == (2, 3, 3)
+
+        audit = index.audit_spec("billing")
+        assert sorted(audit["requirements_found"]) == ["R1.1", "R1.2", "R9.9"]
+        assert audit["requirement_details"]["R9.9"] == "R1.1, R9.9"
+        assert audit["issues"] == []
+
+        # Q7 is only mentioned in a file without a Requirements: section
+        assert index.missing_requirements() == [{"requirement_id": "Q7", "status": "referenced_but_not_defined"}]
+        assert index.missing_requirements(["billing"]) == []
+        assert index.specs_referencing("R1.1") == ["billing", "costs"]
+
+    def test_incremental_refresh(self, index, specs_dir):
+        """Test only changed files are parsed again and removed files are dropped."""
+        index.refresh()
+        assert index.refresh().unchanged == 3
+
+        (specs_dir / "costs" / "design.md").write_text("# Cost Streaming Pipeline\n\n_Requirements: Q7_\n")
+        (specs_dir / "billing" / "requirements.md").unlink()
+        stats = index.refresh()
+
+        assert (stats.unchanged, stats.parsed, stats.removed) == (1, 1, 1)
+        assert index.missing_requirements() == []
+        assert "requirements.md" not in index.audit_spec("billing")["files_found"]
+
+    def test_overlap_and_task_dag(self, index):
+        """Test overlap is found through shared terms and task DAGs are indexed."""
+        index.refresh()
+
+        pairs = index.overlap(max_spec_fraction=1.0)
+        assert [pair["specs"] for pair in pairs] == [["billing", "costs"]]
+        assert index.shared_terms("billing", "costs") == ["pipeline"]
+
+        dag = index.task_dag("billing")
+        assert dag.dependencies == {"1": ["1.1"], "1.1": []}
+        assert dag.analysis.tiers == {"1": 1, "1.1": 0}
+        assert index.task_dag("costs") is None
@@ -0,0 +1,56 @@
+"""Tests for shared task DAG analysis."""
+
+from task_dag_analysis import TaskDAGCache, TaskIdIndex, compute_tiers, hierarchical_dependencies
+
+
+class TestTaskDAGAnalysis:
+    """Test tier computation, hierarchy indexing and the parsed DAG cache."""
+
+    def test_compute_tiers(self):
+        """Test tiers follow the longest dependency chain."""
+        analysis = compute_tiers({
+            "a": [],
+            "b": ["a"],
+            "c": ["a", "b"],
+            "d": ["c", "missing"],
+        })
+
+        assert analysis.tiers == {"a": 0, "b": 1, "c": 2, "d": 3}
+        assert analysis.by_tier() == {0: ["a"], 1: ["b"], 2: ["c"], 3: ["d"]}
+        assert analysis.critical_path_length == 3
+        assert analysis.cycles == []
+
+    def test_compute_tiers_reports_cycles(self):
+        """Test cycles are reported once and do not prevent tiering."""
+        analysis = compute_tiers({"x": ["z"], "y": ["x"], "z": ["y"], "w": ["x"]})
+
+        assert analysis.cycles == [["x", "z", "y"]]
+        assert set(analysis.tiers) == {"x", "y", "z", "w"}
+        assert analysis.tiers["w"] == analysis.tiers["x"] + 1
+
+    def test_hierarchy_index(self):
+        """Test parents depend on their nearest subtasks."""
+        index = TaskIdIndex(["1", "1.1", "1.1.1", "1.2.1", "10"])
+
+        assert index.children("1") == ["1.1", "1.2.1"]
+        assert index.children("1.1") == ["1.1.1"]
+        assert index.children("10") == []
+        assert hierarchical_dependencies(["2", "2.1", "2.2"]) == {"2": ["2.1", "2.2"], "2.1": [], "2.2": []}
+
+    def test_cache_keyed_by_content(self, tmp_path):
+        """Test parsed DAGs are reused until tasks.md changes."""
+        tasks_file = tmp_path / "tasks.md"
+        tasks_file.write_text("- [ ] 1 Parent\n- [ ] 1.1 Child\n  Does the work\n  _Requirements: R1, R2_\n")
+        cache = TaskDAGCache(tmp_path / "cache")
+
+        dag = cache.load(tasks_file)
+        assert not cache.cache_hit
+        assert dag.tasks["1.1"] == {"name": "Child", "description": "Does the work", "requirements": ["R1", "R2"]}
+        assert dag.analysis.tiers == {"1": 1, "1.1": 0}
+
+        assert cache.load(tasks_file).tasks == dag.tasks
+        assert cache.cache_hit
+
+        tasks_file.write_text("- [ ] 1 Parent\n")
+        assert cache.load(tasks_file).analysis.tiers == {"1": 0}
+        assert not cache.cache_hit
@@ -0,0 +1,167 @@
+"""Tests for the event-driven task DAG runner of the task execution engine."""
+
+import importlib.util
+import logging
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+ENGINE_PATH = Path(__file__).resolve().parent.parent / "task-execution-engine.py"
+
+
+class HealthStatus(Enum):
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+    UNHEALTHY = "unhealthy"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class HealthIndicator:
+    name: str
+    status: HealthStatus
+    value: Any
+    message: str
+    timestamp: float
+
+
+class ReflectiveModule:
+    """Stand-in for the interface the engine was written against."""
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.logger = logging.getLogger(module_name)
+        self._health_indicators = {}
+
+
+@pytest.fixture
+def engine_module(monkeypatch):
+    stub = types.ModuleType("beast_mode.core.reflective_module")
+    stub.ReflectiveModule = ReflectiveModule
+    stub.HealthStatus = HealthStatus
+    stub.HealthIndicator = HealthIndicator
+    monkeypatch.setitem(sys.modules, "beast_mode", types.ModuleType("beast_mode"))
+    monkeypatch.setitem(sys.modules, "beast_mode.core", types.ModuleType("beast_mode.core"))
+    monkeypatch.setitem(sys.modules, "beast_mode.core.reflective_module", stub)
+
+    spec = importlib.util.spec_from_file_location("task_execution_engine", ENGINE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def make_engine(engine_module, monkeypatch):
+    def make(dependencies, max_agents=3):
+        engine = engine_module.TaskExecutionEngine()
+        monkeypatch.setattr(engine, "_run_git_command", lambda command: pytest.fail(f"git {command} was run"))
+        engine.tasks = {
+            task_id: engine_module.Task(task_id, task_id, task_id, dependencies=list(deps))
+            for task_id, deps in dependencies.items()
+        }
+        engine.resize_agent_pool(max_agents)
+        return engine
+    return make
+
+
+class RecordingRunner:
+    """Task runner recording start/finish order and peak concurrency."""
+
+    def __init__(self, fail=(), seconds=0.05):
+        self.fail = set(fail)
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.events = []
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, task, agent):
+        with self.lock:
+            self.events.append(("start", task.id))
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+            self.events.append(("finish", task.id))
+        if task.id in self.fail:
+            raise RuntimeError(f"{task.id} failed")
+        return True
+
+    def index(self, kind, task_id):
+        return self.events.index((kind, task_id))
+
+
+class TestRunTaskDag:
+    """Test agent saturation, successor release and failure blocking."""
+
+    def test_agents_saturate_up_to_max(self, make_engine):
+        """Test independent tasks keep every agent busy but never exceed max_agents."""
+        engine = make_engine({f"t{i}": [] for i in range(7)}, max_agents=3)
+        runner = RecordingRunner()
+
+        stats = engine.run_task_dag(task_runner=runner)
+
+        assert runner.peak == 3
+        assert stats["peak_concurrency"] == 3
+        assert stats["max_agents"] == 3
+        assert engine.completed_tasks == set(engine.tasks)
+
+    def test_successors_released_when_dependencies_finish(self, make_engine):
+        """Test a task starts only after all its dependencies completed."""
+        engine = make_engine({"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []})
+        runner = RecordingRunner()
+
+        engine.run_task_dag(task_runner=runner)
+
+        assert runner.index("finish", "a") < min(runner.index("start", "b"), runner.index("start", "c"))
+        assert max(runner.index("finish", "b"), runner.index("finish", "c")) < runner.index("start", "d")
+        # The independent task runs alongside the root instead of waiting for a tier
+        assert runner.index("start", "e") < runner.index("finish", "a")
+        assert engine.completed_tasks == set(engine.tasks)
+
+    def test_failure_blocks_downstream_tasks(self, make_engine, engine_module):
+        """Test a failed task blocks its transitive successors and leaves other branches running."""
+        engine = make_engine({"a": [], "b": ["a"], "c": ["b"], "d": [], "e": ["d"]})
+        runner = RecordingRunner(fail={"a"})
+
+        stats = engine.run_task_dag(task_runner=runner)
+
+        status = {task_id: task.status for task_id, task in engine.tasks.items()}
+        assert status["a"] == engine_module.TaskStatus.FAILED
+        assert status["b"] == status["c"] == engine_module.TaskStatus.BLOCKED
+        assert status["d"] == status["e"] == engine_module.TaskStatus.COMPLETED
+        assert ("start", "b") not in runner.events
+        assert stats["unscheduled_tasks"] == []
+        assert {entry["task_id"] for entry in engine.execution_log if entry["action"] == "task_blocked"} == {"b", "c"}
+
+
+class TestTaskRunnerRequired:
+    """Test tasks are never reported complete without a task runner."""
+
+    def test_run_task_dag_requires_runner(self, make_engine, engine_module):
+        """Test running without a runner raises and leaves tasks not started."""
+        engine = make_engine({"a": []})
+
+        with pytest.raises(ValueError):
+            engine.run_task_dag()
+        assert engine.tasks["a"].status == engine_module.TaskStatus.NOT_STARTED
+
+    def test_execution_without_runner_creates_no_branch(self, make_engine, monkeypatch):
+        """Test recursive execution reports an error before touching Git."""
+        engine = make_engine({"a": []})
+        monkeypatch.setattr(engine, "_create_session_branch", lambda: pytest.fail("branch created"))
+
+        summary = engine.recursive_task_execution()
+
+        assert summary["success"] is False
+        assert "task runner" in summary["error"]
+        assert engine.completed_tasks == set()
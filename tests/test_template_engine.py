@@ -0,0 +1,82 @@
+"""Tests for manifest generation and the compiled template cache."""
+
+import os
+
+import pytest
+
+from gke_autopilot.src.core.template_engine import TemplateContext, TemplateEngine, TemplateError
+from gke_autopilot.src.models.app_config import AppConfig, IngressConfig
+
+
+CUSTOM_SERVICE = """
+apiVersion: v1
+kind: Service
+metadata:
+  name: {{ app.name }}-custom
+  namespace: {{ namespace }}
+spec:
+  ports:
+  - port: {{ app.port }}
+"""
+
+
+def make_context(name="web", namespace="default"):
+    app = AppConfig(name=name, image=f"gcr.io/demo/{name}:1.0", ingress_config=IngressConfig(enabled=False))
+    return TemplateContext(app_config=app, namespace=namespace)
+
+
+class TestTemplateEngine:
+    """Test built-in builders, custom overrides, render caching and batches."""
+
+    def test_builtin_manifests_built_directly(self):
+        """Test built-in manifests come from the builders without Jinja rendering."""
+        engine = TemplateEngine()
+        manifests = engine.generate_manifests(make_context())
+
+        assert [m["kind"] for m in manifests] == ["Deployment", "Service", "HorizontalPodAutoscaler"]
+        assert manifests[0]["metadata"]["labels"]["app"] == "web"
+        assert engine.get_cache_stats()["direct_builds"] == 3
+        assert engine.get_cache_stats()["template_renders"] == 0
+
+        with pytest.raises(TemplateError):
+            engine.render_template("deployment", make_context().to_dict())
+
+    def test_custom_template_overrides_builtin(self, tmp_path):
+        """Test a custom template with a built-in name replaces that builder."""
+        engine = TemplateEngine(tmp_path)
+        engine.create_custom_template("service", CUSTOM_SERVICE)
+
+        manifests = engine.generate_manifests(make_context())
+        service = next(m for m in manifests if m["kind"] == "Service")
+
+        assert service["metadata"]["name"] == "web-custom"
+        assert service["spec"]["ports"] == [{"port": 8080}]
+        assert "service" in engine.get_available_templates()
+
+    def test_render_cache_recompiles_on_edit(self, tmp_path):
+        """Test custom templates compile once and recompile when the file changes."""
+        engine = TemplateEngine(tmp_path)
+        path = engine.create_custom_template("configmap", "data: {{ value }}")
+
+        assert engine.render_template("configmap", {"value": 1}) == "data: 1"
+        assert engine.render_template("configmap", {"value": 2}) == "data: 2"
+        assert (engine.get_cache_stats()["hits"], engine.get_cache_stats()["misses"]) == (1, 1)
+
+        path.write_text("value: {{ value }}")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert engine.render_template("configmap", {"value": 3}) == "value: 3"
+        assert engine.get_cache_stats()["misses"] == 2
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_batch_matches_serial(self, tmp_path, max_workers):
+        """Test batch generation keeps order and honours custom templates in workers."""
+        engine = TemplateEngine(tmp_path)
+        engine.create_custom_template("service", CUSTOM_SERVICE)
+        contexts = [make_context(f"app-{i}") for i in range(4)]
+
+        batch = engine.generate_manifests_batch(contexts, max_workers=max_workers)
+
+        assert batch == [engine.generate_manifests(context) for context in contexts]
+        assert [manifests[1]["metadata"]["name"] for manifests in batch] == [f"app-{i}-custom" for i in range(4)]
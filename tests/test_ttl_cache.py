@@ -0,0 +1,93 @@
+"""Tests for the async per-key TTL cache."""
+
+import asyncio
+
+import pytest
+
+from gke_autopilot.src.core.ttl_cache import AsyncTTLCache
+
+
+class CountingLoader:
+    """Loader returning successive values and counting calls."""
+
+    def __init__(self, *values, delay=0.0):
+        self.values = list(values)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        value = self.values[min(self.calls, len(self.values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def expire(cache, key, seconds):
+    """Age a cached entry instead of sleeping."""
+    cache._entries[key].fetched_at -= seconds
+
+
+class TestAsyncTTLCache:
+    """Test TTL expiry, stale-while-revalidate, coalescing and LRU eviction."""
+
+    async def test_ttl_expiry_and_stale_refresh(self):
+        """Test fresh hits, stale serving with one background refresh, then a blocking reload."""
+        cache = AsyncTTLCache(ttl=10, stale_ttl=5)
+        loader = CountingLoader("v1", "v2", "v3")
+
+        assert await cache.get("cluster", loader) == "v1"
+        assert await cache.get("cluster", loader) == "v1"
+        assert loader.calls == 1
+
+        # Expired but inside the stale window: served stale, refreshed in the background
+        expire(cache, "cluster", 12)
+        assert await cache.get("cluster", loader) == "v1"
+        await asyncio.gather(*cache._refresh_tasks)
+        assert loader.calls == 2
+        assert await cache.get("cluster", loader) == "v2"
+
+        # Past the stale window: callers wait for a fresh load
+        expire(cache, "cluster", 20)
+        assert cache.peek("cluster") is None
+        assert await cache.get("cluster", loader) == "v3"
+        assert cache.get_stats()["stale_hits"] == 1
+
+    async def test_concurrent_misses_coalesce(self):
+        """Test concurrent misses for one key share a single loader call."""
+        cache = AsyncTTLCache()
+        loader = CountingLoader("value", delay=0.01)
+
+        results = await asyncio.gather(*(cache.get("image", loader) for _ in range(10)))
+
+        assert results == ["value"] * 10
+        assert loader.calls == 1
+        stats = cache.get_stats()
+        assert (stats["misses"], stats["coalesced"]) == (1, 9)
+
+    async def test_negative_caching(self):
+        """Test listed errors are cached for negative_ttl and re-raised."""
+        cache = AsyncTTLCache(negative_ttl=5, negative_errors=(LookupError,))
+        loader = CountingLoader(LookupError("missing"), "found")
+
+        for _ in range(2):
+            with pytest.raises(LookupError):
+                await cache.get("tag", loader)
+        assert loader.calls == 1
+
+        expire(cache, "tag", 6)
+        assert await cache.get("tag", loader) == "found"
+
+    async def test_lru_eviction(self):
+        """Test the least recently used entry is dropped at capacity."""
+        cache = AsyncTTLCache(max_entries=2)
+        await cache.get("a", CountingLoader("A"))
+        await cache.get("b", CountingLoader("B"))
+
+        # Reading "a" makes "b" the least recently used
+        assert await cache.get("a", CountingLoader("unused")) == "A"
+        cache.set("c", "C")
+
+        assert cache.keys() == ["a", "c"]
+        assert cache.peek("b") is None